@@ -14,6 +14,7 @@
 
 from model_navigator.__version__ import __version__  # noqa: F401
 from model_navigator.configuration import (  # noqa: F401  # noqa: F401
+    ArrivalDistribution,
     AutocastType,
     DeviceKind,
     Format,
@@ -22,10 +23,14 @@ from model_navigator.configuration import (  # noqa: F401  # noqa: F401
     MaxThroughputAndMinLatencyStrategy,
     MaxThroughputStrategy,
     MaxThroughputWithLatencyBudgetStrategy,
+    MaxThroughputWithMemoryBudgetStrategy,
     MinLatencyStrategy,
     OnnxConfig,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
     OptimizationProfile,
     SelectedRuntimeStrategy,
+    StabilityCriterion,
     TensorFlowConfig,
     TensorFlowTensorRTConfig,
     TensorRTConfig,
@@ -77,6 +82,8 @@ from model_navigator import (  # noqa: F401
 from model_navigator.commands.base import CommandStatus  # noqa: F401
 from model_navigator.reporting.optimize import initialize_optimize_reporting
 from model_navigator.reporting.profile import initialize_profile_reporting
+from model_navigator.reporting.trace import initialize_trace_reporting
 
 initialize_optimize_reporting()
 initialize_profile_reporting()
+initialize_trace_reporting()
@@ -43,6 +43,7 @@ class CommandOutput(DataObject):
     status: CommandStatus
     output: Optional[Dict[str, Any]] = None
     execution_time: Optional[float] = None
+    skip_reason: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data_dict: Dict) -> "CommandOutput":
@@ -58,6 +59,7 @@ class CommandOutput(DataObject):
             status=CommandStatus(data_dict["status"]),
             output=data_dict["output"],
             execution_time=data_dict.get("execution_time"),
+            skip_reason=data_dict.get("skip_reason"),
         )
 
 
@@ -82,12 +84,20 @@ class Command(metaclass=CommandMeta):
     """Base class for command definition."""
 
     _is_required: bool = False
+    _is_exclusive: bool = False
     _requires: Optional[List[str]] = None
 
-    def __init_subclass__(cls, is_required: bool = False, requires: Optional[List[str]] = None, **kwargs):
+    def __init_subclass__(
+        cls,
+        is_required: bool = False,
+        is_exclusive: bool = False,
+        requires: Optional[List[str]] = None,
+        **kwargs,
+    ):
         """Initialization of a command subclass."""
         super().__init_subclass__(**kwargs)
         cls._is_required = is_required
+        cls._is_exclusive = is_exclusive
         cls._requires = requires if requires is not None else []
 
     @classmethod
@@ -99,6 +109,18 @@ class Command(metaclass=CommandMeta):
         """
         return cls._is_required
 
+    @classmethod
+    def is_exclusive(cls):
+        """Indicates if Command has to be executed when no other command is running.
+
+        Exclusive commands measure the model performance or memory usage and are not executed
+        concurrently with other commands.
+
+        Returns:
+            True if exclusive, False otherwise
+        """
+        return cls._is_exclusive
+
     @classmethod
     def requires(cls):
         """Return required commands to execute current command.
@@ -191,14 +191,15 @@ class Convert2TensorRTWithMaxBatchSizeSearch(Command):
     ) -> Generator[int, None, None]:
         """Calculate the fallback batch size.
 
-        The strategy is to split the current max batch size // 2 until the threshold is exceeded or the value is
-        equal to dataloader provided by user.
+        The strategy is to bisect the range between the failed max batch size and the dataloader batch size,
+        which is expected to succeed, until the threshold is exceeded or the value is equal to dataloader
+        provided by user. Each yielded batch size becomes the failing upper bound for the next one.
         """
         max_batch_size_halving_left = DEFAULT_MAX_BATCH_SIZE_HALVING  # TODO what is the best value?
-        max_batch_size = device_max_batch_size // 2
+        max_batch_size = (device_max_batch_size + dataloader_max_batch_size) // 2
         while max_batch_size > dataloader_max_batch_size and max_batch_size_halving_left > 0:
             yield max_batch_size
-            max_batch_size //= 2
+            max_batch_size = (max_batch_size + dataloader_max_batch_size) // 2
             max_batch_size_halving_left -= 1
         yield dataloader_max_batch_size
 
@@ -0,0 +1,169 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Chunked comparison of model outputs."""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from model_navigator.commands.correctness.correctness import Tolerance
+from model_navigator.configuration.constants import DEFAULT_COMPARISON_CHUNK_SIZE, DEFAULT_ERROR_PERCENTILE
+from model_navigator.core.histogram import LatencyHistogram
+
+# Absolute errors are tracked down to the float64 resolution of values close to one
+_ERROR_HISTOGRAM_LOWEST_VALUE = 1e-12
+_ERROR_HISTOGRAM_HIGHEST_VALUE = 1e12
+
+
+class OutputErrorStatistics:
+    """Accumulates error statistics of a single output over compared samples.
+
+    Outputs are compared in chunks of flattened elements using preallocated float64 buffers, so the memory
+    overhead does not depend on the size of the outputs and the differences are computed without overflow
+    of integer types. Relative error is computed only for elements with non-zero compared value,
+    elements equal to zero are covered by the absolute error.
+
+    Example of use:
+
+        statistics = OutputErrorStatistics()
+        for original_output, comp_output in outputs:
+            statistics.update(original_output["output__0"], comp_output["output__0"])
+
+        tolerance = statistics.to_tolerance()
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_COMPARISON_CHUNK_SIZE,
+        percentile: float = DEFAULT_ERROR_PERCENTILE,
+    ) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            chunk_size: Number of elements compared at once.
+            percentile: Percentile of absolute error reported in the tolerance.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive. Got {chunk_size}.")
+
+        self._chunk_size = chunk_size
+        self._percentile = percentile
+        self._buffers: Dict[Tuple[str, str], np.ndarray] = {}
+        self._absdiff_histogram = LatencyHistogram(
+            lowest=_ERROR_HISTOGRAM_LOWEST_VALUE,
+            highest=_ERROR_HISTOGRAM_HIGHEST_VALUE,
+        )
+
+        self.max_absdiff = 0.0
+        self.max_reldiff = 0.0
+        self.max_ulp_diff: Optional[float] = None
+        self.contains_nan = False
+        self.contains_inf = False
+
+    @property
+    def count(self) -> int:
+        """Number of compared elements."""
+        return self._absdiff_histogram.count
+
+    def update(self, original: np.ndarray, comp: np.ndarray) -> None:
+        """Compare output with the reference and update statistics.
+
+        Comparison stops on the first chunk where the compared output is not finite.
+
+        Args:
+            original: Reference output.
+            comp: Compared output. Its shape must be broadcastable with the reference.
+        """
+        original, comp = np.broadcast_arrays(np.asarray(original), np.asarray(comp))
+        original = original.reshape(-1)
+        comp = comp.reshape(-1)
+        is_float = np.issubdtype(comp.dtype, np.floating)
+        if is_float and self.max_ulp_diff is None:
+            self.max_ulp_diff = 0.0
+
+        for start in range(0, comp.size, self._chunk_size):
+            stop = min(start + self._chunk_size, comp.size)
+            if is_float and not self._is_finite(comp[start:stop]):
+                return
+
+            self._update_chunk(original[start:stop], comp[start:stop], is_float)
+
+    def to_tolerance(self) -> Tolerance:
+        """Get tolerance with collected statistics.
+
+        Returns:
+            Tolerance
+        """
+        if self.count == 0:
+            return Tolerance(atol=0.0, rtol=0.0)
+
+        return Tolerance(
+            atol=self.max_absdiff,
+            rtol=self.max_reldiff,
+            mean_absdiff=self._absdiff_histogram.mean,
+            percentile_absdiff=self._absdiff_histogram.percentile(self._percentile),
+            percentile=self._percentile,
+            max_ulp_diff=self.max_ulp_diff,
+        )
+
+    def _is_finite(self, comp: np.ndarray) -> bool:
+        is_finite = self._get_buffer("is_finite", np.bool_, comp.size)
+        np.isfinite(comp, out=is_finite)
+        if is_finite.all():
+            return True
+
+        self.contains_nan = bool(np.isnan(comp).any())
+        self.contains_inf = bool(np.isinf(comp).any())
+        return False
+
+    def _update_chunk(self, original: np.ndarray, comp: np.ndarray, is_float: bool) -> None:
+        size = comp.size
+        absdiff = self._get_buffer("absdiff", np.float64, size)
+        abscomp = self._get_buffer("abscomp", np.float64, size)
+        ratio = self._get_buffer("ratio", np.float64, size)
+
+        np.subtract(original, comp, out=absdiff, dtype=np.float64)
+        np.abs(absdiff, out=absdiff)
+        np.abs(comp, out=abscomp, dtype=np.float64)
+
+        self.max_absdiff = max(self.max_absdiff, float(absdiff.max()))
+        self._absdiff_histogram.record_values(absdiff)
+
+        nonzero = self._get_buffer("nonzero", np.bool_, size)
+        np.greater(abscomp, 0, out=nonzero)
+        ratio.fill(0.0)
+        np.divide(absdiff, abscomp, out=ratio, where=nonzero)
+        self.max_reldiff = max(self.max_reldiff, float(ratio.max()))
+
+        if is_float:
+            # Spacing is taken at the larger magnitude, as spacing of zero is subnormal and distance
+            # of a difference to zero would overflow to infinity
+            spacing = self._get_buffer("spacing", comp.dtype, size)
+            absorig = self._get_buffer("absorig", comp.dtype, size)
+            np.abs(comp, out=spacing)
+            np.abs(original, out=absorig, casting="unsafe")
+            np.maximum(spacing, absorig, out=spacing)
+            np.spacing(spacing, out=spacing)
+            np.divide(absdiff, spacing, out=ratio, dtype=np.float64)
+            self.max_ulp_diff = max(self.max_ulp_diff, float(ratio.max()))
+
+    def _get_buffer(self, name: str, dtype, size: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        key = (name, dtype.str)
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[key] = buffer
+
+        return buffer[:size]
@@ -23,6 +23,7 @@ from model_navigator.commands.base import Command, CommandOutput, CommandStatus
 from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.configuration import Format
 from model_navigator.configuration.runner.runner_config import RunnerConfig
+from model_navigator.core.dataloader import get_inference_batch_size
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
@@ -33,10 +34,24 @@ from model_navigator.utils.format_helpers import is_source_format
 
 @dataclasses.dataclass
 class Tolerance(DataObject):
-    """Tolerance values."""
+    """Tolerance values.
+
+    Args:
+        atol: Maximal absolute difference between outputs
+        rtol: Maximal relative difference between outputs
+        mean_absdiff: Mean absolute difference between outputs
+        percentile_absdiff: Absolute difference for the `percentile` of compared elements
+        percentile: Percentile of compared elements used for `percentile_absdiff`
+        max_ulp_diff: Maximal difference in units in the last place of the compared output precision.
+            None for non floating point outputs.
+    """
 
     atol: float
     rtol: float
+    mean_absdiff: Optional[float] = None
+    percentile_absdiff: Optional[float] = None
+    percentile: Optional[float] = None
+    max_ulp_diff: Optional[float] = None
 
     @classmethod
     def from_dict(cls, tolerance_dict: Dict) -> "Tolerance":
@@ -51,6 +66,10 @@ class Tolerance(DataObject):
         return cls(
             atol=tolerance_dict["atol"],
             rtol=tolerance_dict["rtol"],
+            mean_absdiff=tolerance_dict.get("mean_absdiff"),
+            percentile_absdiff=tolerance_dict.get("percentile_absdiff"),
+            percentile=tolerance_dict.get("percentile"),
+            max_ulp_diff=tolerance_dict.get("max_ulp_diff"),
         )
 
 
@@ -96,6 +115,8 @@ class Correctness(Command):
         verbose: bool,
         model: Any = None,
         runner_config: Optional[RunnerConfig] = None,
+        correctness_batch_size: Optional[int] = None,
+        dataloader_max_batch_size: Optional[int] = None,
     ) -> CommandOutput:
         """Run correctness command.
 
@@ -110,6 +131,9 @@ class Correctness(Command):
             verbose: If True verbose logging.
             model: Model if correctness should be run on a source model. Defaults to None.
             runner_config: Additional runner arguments
+            correctness_batch_size: Maximal batch size of samples concatenated for inference.
+                When None inference is run per sample. Defaults to None.
+            dataloader_max_batch_size: Maximal batch size in the dataloader limiting `correctness_batch_size`.
 
         Returns:
             CommandOutput: Status OK and TolerancePerOutputName of the model with runner.
@@ -136,6 +160,7 @@ class Correctness(Command):
                 "input_metadata": input_metadata.to_json(),
                 "output_metadata": output_metadata.to_json(),
                 "runner_config": runner_config.to_dict(parse=True) if runner_config else None,
+                "batch_size": get_inference_batch_size(correctness_batch_size, batch_dim, dataloader_max_batch_size),
             }
 
             from model_navigator.commands.correctness import correctness_script
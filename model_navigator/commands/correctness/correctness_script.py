@@ -19,13 +19,14 @@ import sys
 from typing import Dict, Optional
 
 import fire
-import numpy as np
 
-from model_navigator.commands.correctness.correctness import Tolerance, TolerancePerOutputName
-from model_navigator.core.dataloader import load_samples
+from model_navigator.commands.correctness.comparison import OutputErrorStatistics
+from model_navigator.commands.correctness.correctness import TolerancePerOutputName
+from model_navigator.core.dataloader import are_samples_concatenable, concatenate_samples, load_samples
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.runners.registry import get_runner
+from model_navigator.runners.utils import infer_batches
 
 
 def get_model() -> object:
@@ -48,6 +49,7 @@ def correctness(
     navigator_workspace: Optional[str] = None,
     model_path: Optional[str] = None,
     runner_config: Optional[Dict] = None,
+    batch_size: Optional[int] = None,
 ) -> None:
     """Run correctness tests.
 
@@ -60,6 +62,8 @@ def correctness(
         navigator_workspace: Model Navigator workspace path. When None use current workdir. Defaults to None.
         model_path: Path to the model. When None use `get_model()` to load the model. Defaults to None.
         runner_config: Additional runner arguments
+        batch_size: Maximal batch size of correctness samples concatenated for inference.
+            When None inference is run per sample. Defaults to None.
     """
     if not navigator_workspace:
         navigator_workspace = pathlib.Path.cwd()
@@ -87,46 +91,56 @@ def correctness(
         **runner_config,
     )  # pytype: disable=not-instantiable
 
-    per_output_tolerance = TolerancePerOutputName({name: Tolerance(0.0, 0.0) for name in output_metadata})
+    per_output_statistics = {name: OutputErrorStatistics() for name in output_metadata}
     with runner:
-        for sample, original_output in zip(correctness_samples, correctness_samples_output):
-            comp_output = runner.infer(sample)
-
-            is_len_valid = len(original_output) == len(comp_output)
-            if not is_len_valid:
-                LOGGER.error(
-                    """Original model output length is different from exported model output"""
-                    f"""Original output: {original_output}"""
-                    f"""Computed output: {comp_output}"""
-                )
-                sys.exit(1)
-
-            for name in output_metadata:
-                if any(np.isnan(comp_output[name]).flatten()):
-                    LOGGER.error(f"Comparison output {name} contains NaN")
-                    sys.exit(1)
-
-                if any(np.isinf(comp_output[name]).flatten()):
-                    LOGGER.error(f"Comparison output {name} contains inf")
-                    sys.exit(1)
-
-                out0, out1 = original_output[name], comp_output[name]
-                absdiff = np.abs(out0 - out1)
-                absout1 = np.abs(out1)
-
-                reldiff = absdiff / absout1
-                max_reldiff = np.amax(reldiff)
-                max_absdiff = np.amax(absdiff)
-
-                if max_absdiff > per_output_tolerance[name].atol:
-                    per_output_tolerance[name].atol = float(max_absdiff)
-                if max_reldiff > per_output_tolerance[name].rtol:
-                    per_output_tolerance[name].rtol = float(max_reldiff)
-
+        for indices, comp_output in infer_batches(runner, correctness_samples, batch_dim, batch_size):
+            original_outputs = [correctness_samples_output[idx] for idx in indices]
+            if len(indices) == 1:
+                _compare_outputs(original_outputs[0], comp_output, output_metadata, per_output_statistics)
+            elif all(are_samples_concatenable(original_outputs[0], output, batch_dim) for output in original_outputs):
+                original_output = concatenate_samples(original_outputs, batch_dim)
+                _compare_outputs(original_output, comp_output, output_metadata, per_output_statistics)
+            else:
+                # Reference outputs do not share shapes, so outputs of the batch cannot be compared at once
+                for idx, original_output in zip(indices, original_outputs):
+                    comp_output = runner.infer(correctness_samples[idx])
+                    _compare_outputs(original_output, comp_output, output_metadata, per_output_statistics)
+
+    per_output_tolerance = TolerancePerOutputName({
+        name: statistics.to_tolerance() for name, statistics in per_output_statistics.items()
+    })
     results_path = pathlib.Path(results_path)
     with results_path.open("w") as f:
         json.dump(per_output_tolerance.to_json(), f)
 
 
+def _compare_outputs(
+    original_output: Dict,
+    comp_output: Dict,
+    output_metadata: TensorMetadata,
+    per_output_statistics: Dict[str, OutputErrorStatistics],
+) -> None:
+    is_len_valid = len(original_output) == len(comp_output)
+    if not is_len_valid:
+        LOGGER.error(
+            """Original model output length is different from exported model output"""
+            f"""Original output: {original_output}"""
+            f"""Computed output: {comp_output}"""
+        )
+        sys.exit(1)
+
+    for name in output_metadata:
+        statistics = per_output_statistics[name]
+        statistics.update(original_output[name], comp_output[name])
+
+        if statistics.contains_nan:
+            LOGGER.error(f"Comparison output {name} contains NaN")
+            sys.exit(1)
+
+        if statistics.contains_inf:
+            LOGGER.error(f"Comparison output {name} contains inf")
+            sys.exit(1)
+
+
 if __name__ == "__main__":
     fire.Fire(correctness)
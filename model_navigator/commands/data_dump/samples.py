@@ -13,19 +13,29 @@
 # limitations under the License.
 """Commands for fetching and dumping model IO."""
 
-from typing import Any, Optional, Type
+import pathlib
+from typing import Any, Optional, Set, Type
 
 import numpy as np
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
-from model_navigator.configuration import OptimizationProfile, SizedDataLoader, TensorRTProfile
+from model_navigator.configuration import OptimizationProfile, Sample, SizedDataLoader, TensorRTProfile
 from model_navigator.configuration.runner.runner_config import RunnerConfig
-from model_navigator.core.dataloader import IndiciesFilteredDataloader, extract_sample, load_samples, samples_to_npz
+from model_navigator.core.dataloader import (
+    BackgroundSamplesWriter,
+    IndiciesFilteredDataloader,
+    extract_sample,
+    get_inference_batch_size,
+    load_samples,
+    samples_to_npz,  # noqa: F401
+    samples_to_store,
+)
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
 from model_navigator.frameworks import Framework
 from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.utils import infer_batched
 
 
 class FetchInputModelData(Command, is_required=True):
@@ -76,54 +86,82 @@ class FetchInputModelData(Command, is_required=True):
 
         LOGGER.info("Collecting input samples for model.")
         np.random.seed(seed)
-        correctness_samples_ind = set(np.random.choice(num_samples, size=sample_count, replace=False))
-        profiling_sample_ind, conversion_samples_ind = self._collect_samples(
-            dataloader,
-            input_metadata,
-            dataloader_trt_profile,
-            framework,
-            correctness_samples_ind,
-        )
+        correctness_samples_ind = set(np.random.choice(num_samples, size=sample_count, replace=False).tolist())
 
         sample_data_path = workspace.path / "model_input"
-        sample_data_path.mkdir(parents=True, exist_ok=True)
+        profiling_path = sample_data_path / "profiling"
+        correctness_path = sample_data_path / "correctness"
+        conversion_path = sample_data_path / "conversion"
 
         LOGGER.info("Saving samples into the workspace.")
-        for samples_ind, dirname in [
-            ([profiling_sample_ind], "profiling"),
-            (correctness_samples_ind, "correctness"),
-            (conversion_samples_ind, "conversion"),
-        ]:
-            sample_path = sample_data_path / dirname
-            if dirname == "profiling" and optimization_profile.dataloader is not None:
+        with BackgroundSamplesWriter(batch_dim, raise_on_error=raise_on_error) as writer:
+            for path in [profiling_path, correctness_path, conversion_path]:
+                writer.open(path)
+
+            if optimization_profile.dataloader is not None:
                 LOGGER.info("Using performance dataloader for profiling sample. Collecting first item only.")
-                samples = IndiciesFilteredDataloader(optimization_profile.dataloader, [0])
-            else:
-                samples = IndiciesFilteredDataloader(dataloader, samples_ind)
-            samples_to_npz(
-                samples,
-                sample_path,
-                batch_dim,
-                metadata=input_metadata,
+                for sample in IndiciesFilteredDataloader(optimization_profile.dataloader, [0]):
+                    writer.write(profiling_path, extract_sample(sample, input_metadata, framework))
+
+            profiling_sample = self._collect_samples(
+                dataloader=dataloader,
+                num_samples=num_samples,
+                input_metadata=input_metadata,
+                trt_profile=dataloader_trt_profile,
                 framework=framework,
-                raise_on_error=raise_on_error,
+                correctness_samples_ind=correctness_samples_ind,
+                writer=writer,
+                correctness_path=correctness_path,
+                conversion_path=conversion_path,
             )
 
+            if optimization_profile.dataloader is None:
+                writer.write(profiling_path, profiling_sample)
+
         return CommandOutput(
             status=CommandStatus.OK,
         )
 
     @staticmethod
-    def _collect_samples(dataloader, input_metadata, trt_profile, framework, correctness_samples_ind):
-        profiling_sample_ind = None
-        correctness_samples_ind = []
-        conversion_samples_ind = []
-        conversion_min_max_sampled = {
-            name: {ax: {"min": False, "max": False} for ax in range(len(input_metadata[name].shape))}
+    def _collect_samples(
+        dataloader: SizedDataLoader,
+        num_samples: int,
+        input_metadata: TensorMetadata,
+        trt_profile: TensorRTProfile,
+        framework: Framework,
+        correctness_samples_ind: Set[int],
+        writer: BackgroundSamplesWriter,
+        correctness_path: pathlib.Path,
+        conversion_path: pathlib.Path,
+    ) -> Sample:
+        """Route samples to correctness and conversion stores in a single pass over the dataloader.
+
+        Conversion samples are the ones with a new minimal or maximal size of any profiled axis. The profiling sample
+        is the last one with a new maximal size. Iteration stops when all correctness samples were collected
+        and all axes sizes were seen.
+
+        Returns:
+            Profiling sample
+        """
+        profiling_sample = None
+        first_correctness_sample = None
+        conversion_samples_count = 0
+        remaining_correctness_samples_ind = set(correctness_samples_ind)
+
+        # Axes of inputs with profile are sampled at min and max size, scalar inputs without profile once
+        pending_conversion_axes = {
+            (name, ax, bound)
             for name in input_metadata
+            if name in trt_profile
+            for ax in range(len(trt_profile[name].min))
+            for bound in ["min", "max"]
         }
+        pending_conversion_inputs = {
+            name for name in input_metadata if name not in trt_profile and len(input_metadata[name].shape) == 0
+        }
+
         for i, sample in enumerate(dataloader):
-            if i >= len(dataloader):
+            if i >= num_samples:
                 break
             sample = extract_sample(sample, input_metadata, framework)
 
@@ -131,33 +169,44 @@ class FetchInputModelData(Command, is_required=True):
             do_sample_profiling = False
             for name in input_metadata:
                 if name not in trt_profile:
-                    if not conversion_min_max_sampled[name]:
+                    if name in pending_conversion_inputs:
                         do_sample_conversion = True
-                        conversion_min_max_sampled[name] = True
+                        pending_conversion_inputs.remove(name)
                 else:
                     for (ax, shapes), tensor_dim in zip(
                         enumerate(zip(trt_profile[name].min, trt_profile[name].opt, trt_profile[name].max)),
                         sample[name].shape,
                     ):
-                        if tensor_dim == shapes[0] and not conversion_min_max_sampled[name][ax]["min"]:
+                        if tensor_dim == shapes[0] and (name, ax, "min") in pending_conversion_axes:
                             do_sample_conversion = True
-                            conversion_min_max_sampled[name][ax]["min"] = True
-                        if tensor_dim == shapes[2] and not conversion_min_max_sampled[name][ax]["max"]:
+                            pending_conversion_axes.remove((name, ax, "min"))
+                        if tensor_dim == shapes[2] and (name, ax, "max") in pending_conversion_axes:
                             do_sample_conversion = True
-                            conversion_min_max_sampled[name][ax]["max"] = True
+                            pending_conversion_axes.remove((name, ax, "max"))
                             do_sample_profiling = True
 
+            # Dataloader may reuse its buffers, so samples kept until the end of iteration are copied
+            if i in remaining_correctness_samples_ind:
+                writer.write(correctness_path, sample)
+                remaining_correctness_samples_ind.remove(i)
+                if first_correctness_sample is None:
+                    first_correctness_sample = {name: np.array(tensor) for name, tensor in sample.items()}
             if do_sample_conversion:
-                conversion_samples_ind.append(i)
+                writer.write(conversion_path, sample)
+                conversion_samples_count += 1
             if do_sample_profiling:
-                profiling_sample_ind = i
+                profiling_sample = {name: np.array(tensor) for name, tensor in sample.items()}
+
+            if not remaining_correctness_samples_ind and not pending_conversion_axes and not pending_conversion_inputs:
+                LOGGER.debug(f"All samples collected after {i + 1} of {num_samples} dataloader items.")
+                break
 
-        if not conversion_samples_ind:
-            conversion_samples_ind = correctness_samples_ind[:1]
-        if profiling_sample_ind is None:
-            profiling_sample_ind = correctness_samples_ind[0]
+        if not conversion_samples_count and first_correctness_sample is not None:
+            writer.write(conversion_path, first_correctness_sample)
+        if profiling_sample is None:
+            profiling_sample = first_correctness_sample
 
-        return profiling_sample_ind, conversion_samples_ind
+        return profiling_sample
 
 
 class FetchOutputModelData(Command, is_required=True):
@@ -173,6 +222,8 @@ class FetchOutputModelData(Command, is_required=True):
         batch_dim: Optional[int],
         runner_config: Optional[RunnerConfig] = None,
         raise_on_error: Optional[bool] = True,
+        correctness_batch_size: Optional[int] = None,
+        dataloader_max_batch_size: Optional[int] = None,
     ) -> CommandOutput:
         """Run the command and save model outputs.
 
@@ -187,6 +238,9 @@ class FetchOutputModelData(Command, is_required=True):
             runner_config: Additional runner arguments.
             raise_on_error: If True raise an error when one of the samples is invalid.
                 Defaults to True.
+            correctness_batch_size: Maximal batch size of samples concatenated for inference.
+                When None inference is run per sample. Defaults to None.
+            dataloader_max_batch_size: Maximal batch size in the dataloader limiting `correctness_batch_size`.
 
         Returns:
             CommandOutput
@@ -194,6 +248,7 @@ class FetchOutputModelData(Command, is_required=True):
         output_data_path = workspace.path / "model_output"
         output_data_path.mkdir(parents=True, exist_ok=True)
 
+        batch_size = get_inference_batch_size(correctness_batch_size, batch_dim, dataloader_max_batch_size)
         runner_kwargs = runner_config.to_dict() if runner_config is not None else {}
         runner = runner_cls(
             model=model, input_metadata=input_metadata, output_metadata=output_metadata, **runner_kwargs
@@ -206,10 +261,10 @@ class FetchOutputModelData(Command, is_required=True):
         ]:
             samples = load_samples(samples_name=input_sample, workspace=workspace.path, batch_dim=batch_dim)
             with runner:
-                outputs = (runner.infer(sample) for sample in samples)
+                outputs = infer_batched(runner, samples, batch_dim, batch_size)
 
                 sample_path = output_data_path / sample_name
-                samples_to_npz(outputs, sample_path, batch_dim, raise_on_error=raise_on_error, num_samples=len(samples))
+                samples_to_store(outputs, sample_path, batch_dim, raise_on_error=raise_on_error)
 
         return CommandOutput(
             status=CommandStatus.OK,
@@ -21,16 +21,19 @@ import pathlib
 import shutil
 import subprocess
 import sys
+import tempfile
 import textwrap
 import traceback
 from typing import Callable, List, Optional, Union
 
 import fire
 
+from model_navigator.commands.worker_pool import get_worker_pool
 from model_navigator.core.logger import LOGGER
+from model_navigator.core.tracing import get_tracer, save_trace
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
-from model_navigator.utils.environment import use_multiprocessing
+from model_navigator.utils.environment import use_multiprocessing, use_worker_pool
 
 
 class ExecutionContext(contextlib.AbstractContextManager):
@@ -108,6 +111,7 @@ class ExecutionContext(contextlib.AbstractContextManager):
         args: List,
         allow_failure: bool = False,
         run_in_isolation: bool = False,
+        reuse_process: bool = True,
     ):
         """Execute Python script in current runtime.
 
@@ -117,8 +121,10 @@ class ExecutionContext(contextlib.AbstractContextManager):
             args: Additional arguments to be passed to function during execution
             allow_failure: if True, do not raise exception when script execution failed
             run_in_isolation: if True, command is run in a child process
+            reuse_process: if True, isolated command is run in a worker process from the pool, otherwise
+                in a new child process. Worker failing the command is not reused.
 
-        Note: isolation can be overridden by `use_multiprocessing`.
+        Note: isolation can be overridden by `use_multiprocessing` and reusing processes by `use_worker_pool`.
 
         Raises:
             ModelNavigatorUserInputError when command execution failed
@@ -131,29 +137,44 @@ class ExecutionContext(contextlib.AbstractContextManager):
         unwrapped_args = self._unwrap_args(args)
 
         if run_in_isolation and use_multiprocessing():
-            child_process = mp.Process(target=self._execute_function, args=(func, unwrapped_args, allow_failure, cmd))
-            child_process.start()
-            child_process.join()
-            if child_process.exitcode and not allow_failure:
-                raise ModelNavigatorUserInputError(
-                    f"Process exited with {child_process.exitcode}. Check previous logs for errors."
-                )
+            # child process saves its trace events to a file merged into the trace of this process
+            trace_path = self._create_trace_file() if get_tracer().enabled else None
+            function_args = (func, unwrapped_args, allow_failure, cmd, trace_path)
+            if reuse_process and use_worker_pool():
+                exitcode = get_worker_pool().execute(self._execute_function, function_args)
+            else:
+                child_process = mp.Process(target=self._execute_function, args=function_args)
+                child_process.start()
+                child_process.join()
+                exitcode = child_process.exitcode
+
+            if trace_path is not None:
+                get_tracer().load(trace_path)
+
+            if exitcode and not allow_failure:
+                raise ModelNavigatorUserInputError(f"Process exited with {exitcode}. Check previous logs for errors.")
         else:
             self._execute_function(func, unwrapped_args, allow_failure, cmd)
 
-    def _execute_function(self, func, unwrapped_args, allow_failure, cmd):
+    def _execute_function(self, func, unwrapped_args, allow_failure, cmd, trace_path=None):
         """Execute the given function using Fire and provided args.
 
         This can be run in the main or child process. For the latter the logging system
-        has to be configured (as the child is spawned i.e. no logging is configured).
+        has to be configured (as the child is spawned i.e. no logging is configured)
+        and trace events are saved to `trace_path` when provided.
         """
         process_name = mp.current_process().name
         if process_name != "MainProcess":
             self._workspace.configure_logging()
             LOGGER.debug("Running command: {} in the child process: {}", cmd, process_name)
 
+        tracer = get_tracer()
+        if trace_path is not None:
+            tracer.start(process_name=process_name)
+
         try:
-            fire.Fire(func, unwrapped_args)
+            with tracer.span(getattr(func, "__name__", "script"), category="script", args={"process": process_name}):
+                fire.Fire(func, unwrapped_args)
         except Exception as e:
             cmd_to_reproduce_error = f"Command to reproduce error: {' '.join(cmd)}"
             if allow_failure:
@@ -166,6 +187,13 @@ class ExecutionContext(contextlib.AbstractContextManager):
                     sys.stderr = open(os.devnull, "w")
 
                 raise ModelNavigatorUserInputError(cmd_to_reproduce_error) from e
+        finally:
+            if trace_path is not None:
+                tracer.record_memory()
+                try:
+                    save_trace(trace_path, tracer.stop())
+                except OSError as e:
+                    LOGGER.debug(f"Unable to save trace events: {e}")
 
     def execute_cmd(self, cmd: List, dry_run=False, allow_failure: bool = False):
         """Execute command as subprocess.
@@ -183,23 +211,24 @@ class ExecutionContext(contextlib.AbstractContextManager):
         if dry_run:
             return run_cmd
 
-        process = subprocess.Popen(
-            run_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            encoding="utf-8",
-            cwd=self._workspace.path,
-        )
-
-        process_output = ""
-        while True:
-            output_chunk = process.stdout.readline()
-            if output_chunk == "" and process.poll() is not None:
-                break
-            if output_chunk:
-                process_output += output_chunk
-
-        result = process.poll()
+        with get_tracer().span(pathlib.Path(str(cmd[0])).name, category="process"):
+            process = subprocess.Popen(
+                run_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                cwd=self._workspace.path,
+            )
+
+            process_output = ""
+            while True:
+                output_chunk = process.stdout.readline()
+                if output_chunk == "" and process.poll() is not None:
+                    break
+                if output_chunk:
+                    process_output += output_chunk
+
+            result = process.poll()
 
         if result != 0 or self._verbose:
             LOGGER.info("Command output:\n", textwrap.indent(process_output, "    "))
@@ -214,6 +243,11 @@ class ExecutionContext(contextlib.AbstractContextManager):
                     f"Processes exited with error code: {result}. Command to reproduce error: {' '.join(run_cmd)}"
                 )
 
+    def _create_trace_file(self) -> pathlib.Path:
+        fd, trace_path = tempfile.mkstemp(prefix="navigator_trace_", suffix=".json")
+        os.close(fd)
+        return pathlib.Path(trace_path)
+
     def _bake_command(self, cmd: List):
         LOGGER.info(f"Command: {' '.join(cmd)}")
 
@@ -45,7 +45,7 @@ class FindMaxBatchSizeConfig:
     model_path: Union[str, pathlib.Path, None] = None
 
 
-class FindMaxBatchSize(Command):
+class FindMaxBatchSize(Command, is_exclusive=True):
     """Command for searching maximal possible batch size that model can be loaded with."""
 
     def _run(
@@ -175,7 +175,14 @@ class FindMaxBatchSize(Command):
         reproduction_scripts_dir = workspace.path / reproduction_scripts_dir
         reproduction_scripts_dir.mkdir(exist_ok=True)
 
-        optimization_profile_copy = optimization_profile.clone()
+        # Search probes only closed-loop throughput of single requests
+        optimization_profile_copy = dataclasses.replace(
+            optimization_profile,
+            concurrency=None,
+            request_rates=None,
+            profile_memory=False,
+            trace_python_allocations=False,
+        )
         if optimization_profile_copy.throughput_cutoff_threshold is None:
             optimization_profile_copy.throughput_cutoff_threshold = DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD
             LOGGER.info(
@@ -218,6 +225,8 @@ class FindMaxBatchSize(Command):
                     args=parse_kwargs_to_cmd(kwargs),
                     allow_failure=True,
                     run_in_isolation=run_in_isolation,
+                    # search ends with out of memory error, so the device memory is released with the process
+                    reuse_process=False,
                 )
             except Exception:
                 pass
@@ -230,7 +239,7 @@ class FindMaxBatchSize(Command):
                 device_max_batch_size = None
             else:
                 batch_sizes = [result.batch_size for result in results]
-                device_max_batch_size = batch_sizes[-1]
+                device_max_batch_size = max(batch_sizes)
                 LOGGER.info(f"Found device max batch size: {batch_sizes}. Selected: {device_max_batch_size}")
 
             return device_max_batch_size
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Inputs and outputs metadata commands."""
 
+import collections
 import pathlib
 from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
@@ -51,9 +52,9 @@ def _extract_axes_shapes(
     framework: Framework,
     check_len: bool = True,
 ) -> Dict[str, Dict[int, List[int]]]:
-    assert not (check_len) or isinstance(
-        dataloader, (SizedIterable, Sequence)
-    ), "dataloader is not an instance of SizedDataLoader, unable to check length."
+    assert not (check_len) or isinstance(dataloader, (SizedIterable, Sequence)), (
+        "dataloader is not an instance of SizedDataLoader, unable to check length."
+    )
 
     axes_shapes = {name: {ax: [] for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
     for i, sample in enumerate(dataloader):
@@ -72,41 +73,135 @@ def _extract_axes_shapes(
     return axes_shapes
 
 
+class _AxisStatistics:
+    """Streaming minimum, maximum and median of axis sizes.
+
+    Sizes are counted per distinct value, so memory depends on the number of distinct sizes only
+    and the median is equal to the one computed from all sizes.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._counts = collections.Counter()
+
+    @classmethod
+    def from_sizes(cls, sizes: Sequence[int]) -> "_AxisStatistics":
+        statistics = cls()
+        for size in sizes:
+            statistics.add(size)
+        return statistics
+
+    def add(self, size: int) -> None:
+        self.count += 1
+        self.min = size if self.min is None else min(self.min, size)
+        self.max = size if self.max is None else max(self.max, size)
+        self._counts[size] += 1
+
+    @property
+    def median(self) -> int:
+        # Mean of the two middle sizes for even count, truncated as int(np.median(sizes))
+        lower_rank, upper_rank = (self.count - 1) // 2, self.count // 2
+        lower = upper = None
+        seen = 0
+        for size in sorted(self._counts):
+            seen += self._counts[size]
+            if lower is None and seen > lower_rank:
+                lower = size
+            if seen > upper_rank:
+                upper = size
+                break
+        return int((lower + upper) / 2)
+
+
+def _collect_axes_statistics(
+    dataloader: Union[SizedDataLoader, Iterator],
+    pytree_metadata: PyTreeMetadata,
+    input_names: Sequence[str],
+    input_ndims: Sequence[int],
+    num_samples: int,
+    framework: Framework,
+) -> Dict[str, Dict[int, _AxisStatistics]]:
+    # Single pass validates samples structure and reads shapes without copying tensors to the host
+    axes_statistics = {
+        name: {ax: _AxisStatistics() for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)
+    }
+    for i, sample in enumerate(dataloader):
+        _assert_sample_has_pytree_metadata(sample, pytree_metadata)
+        if i >= num_samples:
+            LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
+            break
+        validate_sample_input(sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
+        for name, tensor in pytree_metadata.flatten_sample(sample).items():
+            for k, dim in enumerate(np.shape(tensor)):
+                axes_statistics[name][k].add(int(dim))
+
+    assert i + 1 >= len(dataloader), f"{len(dataloader)=}, but only {i + 1} samples found."
+
+    return axes_statistics
+
+
+def _axes_statistics_from_shapes(axes_shapes: Dict[str, Dict[int, List[int]]]) -> Dict[str, Dict[int, _AxisStatistics]]:
+    return {
+        name: {ax: _AxisStatistics.from_sizes(shapes) for ax, shapes in axes.items()}
+        for name, axes in axes_shapes.items()
+    }
+
+
 def _get_metadata_from_axes_shapes(pytree_metadata, axes_shapes, batch_dim, dtypes):
+    return _get_metadata_from_axes_statistics(
+        pytree_metadata, _axes_statistics_from_shapes(axes_shapes), batch_dim, dtypes
+    )
+
+
+def _get_metadata_from_axes_statistics(pytree_metadata, axes_statistics, batch_dim, dtypes):
     metadata = TensorMetadata(pytree_metadata=pytree_metadata)
-    for name, axes in axes_shapes.items():
+    for name, axes in axes_statistics.items():
         tensor_shape = []
-        for ax, shapes in axes.items():
-            if ax == batch_dim or min(shapes) != max(shapes):
+        for ax, statistics in axes.items():
+            if ax == batch_dim or statistics.min != statistics.max:
                 tensor_shape.append(-1)
             else:
-                tensor_shape.append(shapes[0])
+                tensor_shape.append(statistics.min)
         metadata.add(name, tuple(tensor_shape), dtypes[name])
     return metadata
 
 
 def _extract_max_batch_size(axes_shapes: Dict[str, Dict[int, List[int]]], batch_dim: Optional[int]) -> int:
+    return _extract_max_batch_size_from_axes_statistics(_axes_statistics_from_shapes(axes_shapes), batch_dim)
+
+
+def _extract_max_batch_size_from_axes_statistics(
+    axes_statistics: Dict[str, Dict[int, _AxisStatistics]], batch_dim: Optional[int]
+) -> int:
     if batch_dim is not None:
-        return max(list(axes_shapes.values())[0][batch_dim])
+        return list(axes_statistics.values())[0][batch_dim].max
     return 0
 
 
 def _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim, config_max_batch_size=None):
+    return _get_trt_profile_from_axes_statistics(
+        _axes_statistics_from_shapes(axes_shapes), batch_dim, config_max_batch_size
+    )
+
+
+def _get_trt_profile_from_axes_statistics(axes_statistics, batch_dim, config_max_batch_size=None):
     trt_profile = TensorRTProfile()
-    for name, axes in axes_shapes.items():
+    for name, axes in axes_statistics.items():
         min_opt_max = []
-        for ax, shapes in axes.items():
+        for ax, statistics in axes.items():
             if ax == batch_dim:  # min bs = 1
-                if config_max_batch_size and (config_max_batch_size < max(shapes)):
+                if config_max_batch_size and (config_max_batch_size < statistics.max):
                     raise ModelNavigatorUserInputError(
                         f"Given configuration maximum batch size ({config_max_batch_size}) "
-                        f"is smaller than the encountered batch size ({max(shapes)})."
+                        f"is smaller than the encountered batch size ({statistics.max})."
                     )
-                max_batch_size = config_max_batch_size or max(shapes)
+                max_batch_size = config_max_batch_size or statistics.max
                 opt_shape = optimal_batch_size(max_batch_size)
                 min_opt_max.append((1, opt_shape, max_batch_size))
             else:
-                min_opt_max.append((min(shapes), int(np.median(shapes)), max(shapes)))
+                min_opt_max.append((statistics.min, statistics.median, statistics.max))
         if min_opt_max:
             trt_profile.add(name, *list(zip(*min_opt_max)))
     return trt_profile
@@ -117,12 +212,14 @@ def _assert_all_inputs_have_same_pytree_metadata(
     pytree_metadata: PyTreeMetadata,
 ) -> bool:
     for sample in dataloader:
-        if not pytree_metadata.is_compatible_with(sample):
-            raise ModelNavigatorUserInputError(
-                f"All inputs must have the same structure.\n"
-                f"Input structure: {pytree_metadata}\n"
-                f"Sample: {sample}."
-            )
+        _assert_sample_has_pytree_metadata(sample, pytree_metadata)
+
+
+def _assert_sample_has_pytree_metadata(sample, pytree_metadata: PyTreeMetadata) -> None:
+    if not pytree_metadata.is_compatible_with(sample):
+        raise ModelNavigatorUserInputError(
+            f"All inputs must have the same structure.\nInput structure: {pytree_metadata}\nSample: {sample}."
+        )
 
 
 class InferInputMetadata(Command, is_required=True):
@@ -162,7 +259,6 @@ class InferInputMetadata(Command, is_required=True):
         pytree_metadata = PyTreeMetadata.from_sample(
             sample, tensor_type=FRAMEWORK_TO_TENSOR_TYPE[framework], names=_input_names, prefix="input"
         )
-        _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
         input_sample = {}
         input_dtypes = {}
         for n, t in pytree_metadata.flatten_sample(sample).items():
@@ -177,12 +273,12 @@ class InferInputMetadata(Command, is_required=True):
 
         input_ndims = [t.ndim for t in input_sample.values()]
         num_samples = len(dataloader)
-        axes_shapes = _extract_axes_shapes(
+        axes_statistics = _collect_axes_statistics(
             dataloader, pytree_metadata, input_names, input_ndims, num_samples, framework
         )
-        dataloader_max_batch_size = _extract_max_batch_size(axes_shapes, batch_dim)
-        dataloader_trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim)
-        input_metadata = _get_metadata_from_axes_shapes(pytree_metadata, axes_shapes, batch_dim, input_dtypes)
+        dataloader_max_batch_size = _extract_max_batch_size_from_axes_statistics(axes_statistics, batch_dim)
+        dataloader_trt_profile = _get_trt_profile_from_axes_statistics(axes_statistics, batch_dim)
+        input_metadata = _get_metadata_from_axes_statistics(pytree_metadata, axes_statistics, batch_dim, input_dtypes)
 
         if optimization_profile.dataloader:
             pd_sample = next(iter(optimization_profile.dataloader))
@@ -0,0 +1,204 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache for profiling results."""
+
+import functools
+import hashlib
+import json
+import os
+import pathlib
+from typing import Any, List, Optional
+
+import numpy as np
+from jsonlines import jsonlines
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import Sample
+from model_navigator.configuration.constants import DEFAULT_PROFILING_CACHE_MAX_ENTRIES
+from model_navigator.core.logger import LOGGER
+from model_navigator.utils.environment import get_env
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def profiling_cache_dir() -> pathlib.Path:
+    """Get location of the profiling cache based on environment variables.
+
+    Returns:
+        Cache dir from `MODEL_NAVIGATOR_PROFILING_CACHE_DIR` or `profiling` subdirectory of the default cache dir.
+    """
+    cache_dir = os.environ.get("MODEL_NAVIGATOR_PROFILING_CACHE_DIR")
+    if cache_dir is not None:
+        return pathlib.Path(cache_dir)
+
+    default_cache_dir = pathlib.Path.home() / ".cache" / "model_navigator"
+    return pathlib.Path(os.environ.get("MODEL_NAVIGATOR_DEFAULT_CACHE_DIR", default_cache_dir)) / "profiling"
+
+
+def get_path_fingerprint(path: pathlib.Path) -> str:
+    """Compute hash of file or directory content.
+
+    Args:
+        path: Path to file or directory
+
+    Returns:
+        Hex digest of the content
+    """
+    digest = hashlib.sha256()
+    is_dir = path.is_dir()
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if is_dir else [path]
+    for file in files:
+        if is_dir:
+            digest.update(file.relative_to(path).as_posix().encode())
+        with file.open("rb") as f:
+            for chunk in iter(functools.partial(f.read, _HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def get_sample_fingerprint(sample: Sample) -> str:
+    """Compute hash of sample content.
+
+    Args:
+        sample: Sample with numpy tensors
+
+    Returns:
+        Hex digest of names, dtypes, shapes and data of the tensors
+    """
+    digest = hashlib.sha256()
+    for name in sorted(sample):
+        tensor = np.ascontiguousarray(sample[name])
+        digest.update(f"{name}:{tensor.dtype.str}:{tensor.shape}".encode())
+        digest.update(tensor.data)
+
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def get_environment_fingerprint() -> str:
+    """Compute hash of the current environment: hardware, OS, drivers and Python packages.
+
+    Returns:
+        Hex digest of the environment details
+    """
+    return _hash(get_env())
+
+
+class ProfilingCache:
+    """Content-addressed storage of profiling results.
+
+    Entries are stored as JSON lines files named by the key. The least recently used entries are evicted
+    when the number of entries exceeds `max_entries`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[pathlib.Path] = None,
+        max_entries: int = DEFAULT_PROFILING_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Location of the cache. Defaults to `profiling_cache_dir()`.
+            max_entries: Maximal number of entries stored in the cache.
+        """
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else profiling_cache_dir()
+        self.max_entries = max_entries
+
+    @staticmethod
+    def get_key(**components: Any) -> str:
+        """Create cache key from JSON serializable components.
+
+        Args:
+            components: Components identifying profiling - e.g. model fingerprint, runner, profile, environment
+
+        Returns:
+            Cache key
+        """
+        return _hash(components)
+
+    def get(self, key: str) -> Optional[List[ProfilingResults]]:
+        """Get profiling results stored under the key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            List of profiling results or None if entry does not exist
+        """
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        try:
+            with jsonlines.open(entry_path, "r") as f:
+                profiling_results = [ProfilingResults.from_dict(result) for result in f]
+        except Exception as e:
+            LOGGER.warning(f"Invalid profiling cache entry {entry_path.as_posix()!r} removed: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        entry_path.touch()
+        return profiling_results
+
+    def put(self, key: str, profiling_results: List[ProfilingResults]) -> None:
+        """Store profiling results under the key.
+
+        Args:
+            key: Cache key
+            profiling_results: Profiling results to store
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with jsonlines.open(tmp_path, "w") as f:
+            for result in profiling_results:
+                f.write(result.to_dict(parse=True))
+
+        tmp_path.replace(entry_path)
+        self._evict()
+
+    def invalidate(self, key: str) -> None:
+        """Remove entry stored under the key.
+
+        Args:
+            key: Cache key
+        """
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry_path in self._entries():
+            entry_path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.jsonl"
+
+    def _entries(self) -> List[pathlib.Path]:
+        if not self.cache_dir.exists():
+            return []
+
+        return list(self.cache_dir.glob("*.jsonl"))
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        for entry_path in entries[: max(len(entries) - self.max_entries, 0)]:
+            LOGGER.debug(f"Evicting profiling cache entry {entry_path.as_posix()!r}")
+            entry_path.unlink(missing_ok=True)
+
+
+def _hash(data: Any) -> str:
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
@@ -0,0 +1,132 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for sweeping threading configuration of CPU runners."""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from model_navigator.commands.performance.results import ProfilingResults
+
+
+def get_available_cpus() -> List[int]:
+    """Get logical CPUs available for the current process.
+
+    Returns:
+        Sorted list of CPU identifiers.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+
+    return list(range(os.cpu_count() or 1))
+
+
+def is_cpu_pinning_supported() -> bool:
+    """Check if the process can be pinned to selected CPUs on the current platform."""
+    return hasattr(os, "sched_setaffinity")
+
+
+def get_cpu_threading_candidates(
+    threads: List[int],
+    instances: Optional[List[int]],
+    available_cpus: List[int],
+    pinning: bool,
+) -> List[Dict[str, Any]]:
+    """Get threading configurations to profile.
+
+    The first candidate is empty and means the framework defaults. Single instance is profiled
+    with and without pinning. Multiple instances are pinned to disjoint sets of CPUs when pinning is supported.
+    Configurations requiring more CPUs than available are skipped.
+
+    Args:
+        threads: Numbers of intra-op threads per instance.
+        instances: Numbers of concurrent model instances. None mean a single instance.
+        available_cpus: Logical CPUs which can be used by the instances.
+        pinning: If True, configurations pinned to CPUs are generated.
+
+    Returns:
+        List of dictionaries with runner configuration threading parameters.
+    """
+    candidates = [{}]
+    for instance_count in sorted(set(instances or [1])):
+        for intra_op_threads in sorted(set(threads)):
+            required_cpus = instance_count * intra_op_threads
+            if required_cpus > len(available_cpus):
+                continue
+
+            candidate = {"intra_op_threads": intra_op_threads, "inter_op_threads": 1}
+            if instance_count > 1:
+                candidate["instance_count"] = instance_count
+
+            if instance_count == 1 or not pinning:
+                candidates.append(candidate)
+
+            if pinning:
+                candidates.append({**candidate, "cpu_affinity": available_cpus[:required_cpus]})
+
+    return candidates
+
+
+def get_instances_cpu_affinity(cpu_affinity: Optional[List[int]], instance_count: int) -> List[Optional[List[int]]]:
+    """Split CPUs between model instances.
+
+    Args:
+        cpu_affinity: CPUs assigned to all instances. None mean instances are not pinned.
+        instance_count: Number of model instances.
+
+    Returns:
+        List with CPUs of each instance.
+    """
+    if not cpu_affinity:
+        return [None] * instance_count
+
+    return [chunk.tolist() for chunk in np.array_split(np.asarray(cpu_affinity), instance_count)]
+
+
+def merge_instances_profiling_results(
+    instances_profiling_results: List[List[ProfilingResults]],
+) -> List[ProfilingResults]:
+    """Merge results of model instances profiled concurrently.
+
+    Results are matched by batch size, concurrency and request rate. Latencies are merged while
+    throughput and memory usage are summed over instances. Measurements not collected by all instances are dropped.
+
+    Args:
+        instances_profiling_results: Profiling results collected by each instance.
+
+    Returns:
+        List of merged profiling results.
+    """
+    results_by_key = {}
+    for instance_profiling_results in instances_profiling_results:
+        for result in instance_profiling_results:
+            key = (result.batch_size, result.concurrency, result.request_rate)
+            results_by_key.setdefault(key, []).append(result)
+
+    merged_results = []
+    for results in results_by_key.values():
+        if len(results) != len(instances_profiling_results):
+            continue
+
+        merged = ProfilingResults.from_profiling_results(results)
+        merged.throughput = float(sum(result.throughput for result in results))
+        merged.request_count = int(sum(result.request_count for result in results))
+        for field in ["peak_rss_memory", "avg_rss_memory", "uss_memory"]:
+            values = [getattr(result, field) for result in results]
+            if all(value is not None for value in values):
+                setattr(merged, field, float(sum(values)))
+        merged_results.append(merged)
+
+    return merged_results
@@ -0,0 +1,127 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process memory monitor."""
+
+import threading
+import tracemalloc
+from typing import ContextManager, List, Optional
+
+import numpy as np
+import psutil
+
+from model_navigator.configuration.constants import DEFAULT_MEMORY_SAMPLING_INTERVAL
+from model_navigator.core.logger import LOGGER
+
+_MB = 1024**2
+
+
+class MemoryMonitor(ContextManager):
+    """Context manager sampling memory of the current process during its lifetime.
+
+    Resident set size (RSS) is sampled in a background thread to capture its peak and steady state.
+    Unique set size (USS) requires reading all memory maps of the process, so it is collected once on exit.
+    When `trace_python_allocations` is enabled, the peak of Python allocations is collected with `tracemalloc`.
+
+    Example of use:
+
+        with MemoryMonitor(enabled=True) as memory_monitor:
+            runner.infer(sample)
+
+        peak_rss_memory = memory_monitor.peak_rss_memory
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        trace_python_allocations: bool = False,
+        sampling_interval: float = DEFAULT_MEMORY_SAMPLING_INTERVAL,
+    ) -> None:
+        """Creates memory monitor.
+
+        Args:
+            enabled: Flag indicating if memory is monitored. Disabled monitor reports no values.
+            trace_python_allocations: Collect peak of Python allocations with tracemalloc.
+                Tracing slows down allocations so it affects measured latency.
+            sampling_interval: Interval between RSS samples in seconds.
+        """
+        self.enabled = enabled
+        self._trace_python_allocations = trace_python_allocations
+        self._sampling_interval = sampling_interval
+
+        self._process = psutil.Process()
+        self._rss_samples: List[int] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracing = False
+
+        self.peak_rss_memory: Optional[float] = None  # MB
+        self.avg_rss_memory: Optional[float] = None  # MB
+        self.uss_memory: Optional[float] = None  # MB
+        self.peak_python_memory: Optional[float] = None  # MB
+
+    def __enter__(self) -> "MemoryMonitor":
+        """Starts sampling memory."""
+        if not self.enabled:
+            return self
+
+        if self._trace_python_allocations:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+        self._rss_samples = []
+        self._stop_event.clear()
+        self._sample_rss()
+        self._thread = threading.Thread(target=self._sampling_loop, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stops sampling memory and collects results."""
+        if not self.enabled:
+            return
+
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._sample_rss()
+
+        self.peak_rss_memory = max(self._rss_samples) / _MB
+        self.avg_rss_memory = float(np.mean(self._rss_samples)) / _MB
+        self.uss_memory = self._get_uss()
+
+        if self._trace_python_allocations:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_python_memory = peak / _MB
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def _sampling_loop(self) -> None:
+        while not self._stop_event.wait(self._sampling_interval):
+            self._sample_rss()
+
+    def _sample_rss(self) -> None:
+        self._rss_samples.append(self._process.memory_info().rss)
+
+    def _get_uss(self) -> Optional[float]:
+        try:
+            return self._process.memory_full_info().uss / _MB
+        except (psutil.Error, AttributeError) as e:
+            LOGGER.debug(f"Unable to collect USS memory: {str(e)}")
+            return None
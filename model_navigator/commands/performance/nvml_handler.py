@@ -13,7 +13,7 @@
 # limitations under the License.
 """NVML handler."""
 
-from typing import ContextManager, Optional
+from typing import ContextManager, Optional, Set
 
 import numpy as np
 from pynvml import (
@@ -84,6 +84,20 @@ class NvmlHandler(ContextManager):
         with np.errstate(invalid="ignore"):
             return np.divide(gpu_clocks_sum, gpus_running)
 
+    @property
+    def gpu_processes(self) -> Set[int]:
+        """Returns identifiers of processes with compute contexts on any gpu."""
+        pids = set()
+        for i in range(self.gpu_count):
+            try:
+                handle = nvmlDeviceGetHandleByIndex(i)
+                pids.update(process.pid for process in nvmlDeviceGetComputeRunningProcesses(handle))
+            except NVMLError as e:
+                LOGGER.debug(f"Unable to collect NVML data for GPU {i}: {str(e)}")
+                continue
+
+        return pids
+
     @property
     def gpu_count(self) -> int:
         """Returns number of available gpus."""
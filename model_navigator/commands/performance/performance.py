@@ -13,18 +13,33 @@
 # limitations under the License.
 """Command for performance measurement."""
 
+import dataclasses
 import pathlib
 import shutil
 import tempfile
-from typing import Any, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Type
 
 from jsonlines import jsonlines
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
 from model_navigator.commands.correctness import Correctness
 from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.commands.performance.cache import (
+    ProfilingCache,
+    get_environment_fingerprint,
+    get_path_fingerprint,
+)
+from model_navigator.commands.performance.cpu_threading import (
+    get_available_cpus,
+    get_cpu_threading_candidates,
+    get_instances_cpu_affinity,
+    is_cpu_pinning_supported,
+    merge_instances_profiling_results,
+)
 from model_navigator.commands.performance.results import ProfilingResults
-from model_navigator.configuration import Format, OptimizationProfile
+from model_navigator.commands.performance.utils import is_throughput_dominated
+from model_navigator.configuration import DeviceKind, Format, OptimizationProfile
 from model_navigator.configuration.runner.runner_config import RunnerConfig
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
@@ -32,10 +47,11 @@ from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorProfilingError
 from model_navigator.runners.base import NavigatorRunner
 from model_navigator.utils.common import parse_kwargs_to_cmd
+from model_navigator.utils.environment import use_multiprocessing
 from model_navigator.utils.format_helpers import is_source_format
 
 
-class Performance(Command, requires=[Correctness.name]):
+class Performance(Command, is_exclusive=True, requires=[Correctness.name]):
     """Performance command."""
 
     def _run(
@@ -51,6 +67,7 @@ class Performance(Command, requires=[Correctness.name]):
         runner_cls: Type[NavigatorRunner],
         model: Any = None,
         runner_config: Optional[RunnerConfig] = None,
+        pruning_reference: Optional[List[Dict[str, Any]]] = None,
     ) -> CommandOutput:
         """Run performance command.
 
@@ -66,28 +83,247 @@ class Performance(Command, requires=[Correctness.name]):
             runner_cls: Runner type to profile the model with.
             model: Model when profiling on a source format. Defaults to None.
             runner_config: Additional runner arguments.
+            pruning_reference: The highest throughput per batch size of already profiled runtimes. When provided,
+                profiling stops early if the first batch sizes are clearly dominated by the reference.
 
         Returns:
             CommandOutput: Output of the command containing profiling results.
         """
         model_path = workspace.path / path
-        model_dir = model_path.parent
 
         if not is_source_format(format) and not model_path.exists():
             LOGGER.warning(f"Model: {model_path.as_posix()!r} not found, command skipped.")
             return CommandOutput(status=CommandStatus.SKIPPED)
 
+        profiling_samples = workspace.path / "model_input" / "profiling"
+
+        sweep_cpu_threading = (
+            optimization_profile.cpu_threads is not None
+            and runner_config is not None
+            and runner_cls.devices_kind() == [DeviceKind.CPU]
+        )
+
+        # Source models are kept in memory and cannot be fingerprinted.
+        # Threading sweep results are stored in the runner configuration, so they cannot be restored from cache.
+        cache, cache_key = None, None
+        if optimization_profile.cache_results and not is_source_format(format) and not sweep_cpu_threading:
+            cache = ProfilingCache()
+            cache_key = ProfilingCache.get_key(
+                model=get_path_fingerprint(model_path),
+                samples=get_path_fingerprint(profiling_samples),
+                format=format.value,
+                runner_name=runner_cls.name(),
+                runner_config=runner_config.to_dict(parse=True) if runner_config else None,
+                optimization_profile=optimization_profile.to_dict(filter_fields=["cache_results"], parse=True),
+                input_metadata=input_metadata.to_json(),
+                batch_dim=batch_dim,
+                environment=get_environment_fingerprint(),
+            )
+            profiling_results = cache.get(cache_key)
+            if profiling_results:
+                LOGGER.info(f"Using cached profiling results for {runner_cls.name()}.")
+                return CommandOutput(status=CommandStatus.OK, output={"profiling_results": profiling_results})
+
         profiler_samples = workspace.path / "model_input" / "profiler"
         if profiler_samples.exists():
             shutil.rmtree(profiler_samples.as_posix())
 
-        profiling_samples = workspace.path / "model_input" / "profiling"
         shutil.copytree(profiling_samples, profiler_samples)
 
+        profile_kwargs = {
+            "workspace": workspace,
+            "path": path,
+            "format": format,
+            "input_metadata": input_metadata,
+            "output_metadata": output_metadata,
+            "batch_dim": batch_dim,
+            "verbose": verbose,
+            "runner_cls": runner_cls,
+            "model": model,
+        }
+
+        if sweep_cpu_threading:
+            self._sweep_cpu_threading(
+                optimization_profile=optimization_profile,
+                runner_config=runner_config,
+                **profile_kwargs,
+            )
+
+        profiling_results = self._profile(
+            optimization_profile=optimization_profile,
+            runner_config=runner_config.to_dict(parse=True) if runner_config else None,
+            pruning_reference=pruning_reference,
+            **profile_kwargs,
+        )
+        self._log_profiling_results(profiling_results)
+
+        if not profiling_results:
+            raise ModelNavigatorProfilingError("No profiling results found.")
+
+        if pruning_reference is not None and is_throughput_dominated(profiling_results, pruning_reference):
+            LOGGER.info(f"Profiling of {runner_cls.name()} pruned. Results are collected only for first batch sizes.")
+            return CommandOutput(
+                status=CommandStatus.OK,
+                output={"profiling_results": profiling_results, "pruned": True},
+            )
+
+        if cache is not None:
+            cache.put(cache_key, profiling_results)
+
+        return CommandOutput(status=CommandStatus.OK, output={"profiling_results": profiling_results})
+
+    def _sweep_cpu_threading(
+        self,
+        *,
+        optimization_profile: OptimizationProfile,
+        runner_config: RunnerConfig,
+        batch_dim: Optional[int],
+        format: Format,
+        runner_cls: Type[NavigatorRunner],
+        **profile_kwargs,
+    ) -> None:
+        """Profile threading configurations and store the best one in the runner configuration.
+
+        Candidates are profiled for a single batch size: the maximal requested one or 1 when batch sizes are searched.
+        Multiple instances require running each instance in a separate process.
+        """
+        if batch_dim is None:
+            batch_size = None
+        elif optimization_profile.max_batch_size:
+            batch_size = optimization_profile.max_batch_size
+        elif optimization_profile.batch_sizes:
+            batch_size = max(optimization_profile.batch_sizes)
+        else:
+            batch_size = 1
+
+        sweep_profile = dataclasses.replace(
+            optimization_profile,
+            max_batch_size=None,
+            batch_sizes=[batch_size] if batch_size is not None else None,
+            adaptive_batch_sizes=False,
+            concurrency=None,
+            request_rates=None,
+        )
+
+        multiple_processes = not is_source_format(format) and use_multiprocessing()
+        candidates = get_cpu_threading_candidates(
+            threads=optimization_profile.cpu_threads,
+            instances=optimization_profile.cpu_instances if multiple_processes else None,
+            available_cpus=get_available_cpus(),
+            pinning=is_cpu_pinning_supported(),
+        )
+
+        base_config = runner_config.to_dict(parse=True)
+        for key in runner_config.get_threading_dict():
+            base_config.pop(key)
+
+        LOGGER.info(f"Sweeping {len(candidates)} threading configurations for {runner_cls.name()}.")
+        best_candidate, best_throughput = None, 0.0
+        for candidate in candidates:
+            results = self._profile(
+                optimization_profile=sweep_profile,
+                runner_config={**base_config, **candidate},
+                batch_dim=batch_dim,
+                format=format,
+                runner_cls=runner_cls,
+                **profile_kwargs,
+            )
+            if not results:
+                LOGGER.warning(f"No profiling results for threading configuration: {candidate or 'defaults'}.")
+                continue
+
+            throughput = max(result.throughput for result in results)
+            LOGGER.info(
+                f"Threading configuration: {candidate or 'defaults'}, Throughput: {throughput:10.2f} [infer/sec]"
+            )
+            if best_candidate is None or throughput > best_throughput:
+                best_candidate, best_throughput = candidate, throughput
+
+        if best_candidate is None:
+            LOGGER.warning("Threading sweep did not collect any results. Framework defaults are used.")
+            best_candidate = {}
+
+        LOGGER.info(f"Selected threading configuration: {best_candidate or 'defaults'}.")
+        runner_config.update_threading(**best_candidate)
+
+    def _profile(
+        self,
+        *,
+        workspace: Workspace,
+        path: pathlib.Path,
+        format: Format,
+        optimization_profile: OptimizationProfile,
+        input_metadata: TensorMetadata,
+        output_metadata: TensorMetadata,
+        batch_dim: Optional[int],
+        verbose: bool,
+        runner_cls: Type[NavigatorRunner],
+        model: Any,
+        runner_config: Optional[Dict],
+        pruning_reference: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[ProfilingResults]:
+        """Profile the model with a single runner or with multiple concurrent instances.
+
+        Pruning is used only for a single instance, as throughput of each instance is a part of the total throughput.
+        """
+        instance_count = (runner_config or {}).get("instance_count") or 1
+        profile_kwargs = {
+            "workspace": workspace,
+            "path": path,
+            "format": format,
+            "optimization_profile": optimization_profile,
+            "input_metadata": input_metadata,
+            "output_metadata": output_metadata,
+            "batch_dim": batch_dim,
+            "verbose": verbose,
+            "runner_cls": runner_cls,
+            "model": model,
+        }
+        if instance_count == 1:
+            return self._profile_instance(
+                runner_config=runner_config,
+                pruning_reference=pruning_reference,
+                **profile_kwargs,
+            )
+
+        instances_cpu_affinity = get_instances_cpu_affinity(runner_config.get("cpu_affinity"), instance_count)
+        with ThreadPoolExecutor(max_workers=instance_count) as executor:
+            futures = [
+                executor.submit(
+                    self._profile_instance,
+                    runner_config={**runner_config, "cpu_affinity": cpu_affinity},
+                    instance=instance,
+                    **profile_kwargs,
+                )
+                for instance, cpu_affinity in enumerate(instances_cpu_affinity)
+            ]
+            instances_profiling_results = [future.result() for future in futures]
+
+        return merge_instances_profiling_results(instances_profiling_results)
+
+    def _profile_instance(
+        self,
+        *,
+        workspace: Workspace,
+        path: pathlib.Path,
+        format: Format,
+        optimization_profile: OptimizationProfile,
+        input_metadata: TensorMetadata,
+        output_metadata: TensorMetadata,
+        batch_dim: Optional[int],
+        verbose: bool,
+        runner_cls: Type[NavigatorRunner],
+        model: Any,
+        runner_config: Optional[Dict],
+        instance: Optional[int] = None,
+        pruning_reference: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[ProfilingResults]:
+        model_dir = (workspace.path / path).parent
+        suffix = f"-instance-{instance}" if instance is not None else ""
         with ExecutionContext(
             workspace=workspace,
-            script_path=model_dir / f"reproduce_profiling-{runner_cls.slug()}.py",
-            cmd_path=model_dir / f"reproduce_profiling-{runner_cls.slug()}.sh",
+            script_path=model_dir / f"reproduce_profiling-{runner_cls.slug()}{suffix}.py",
+            cmd_path=model_dir / f"reproduce_profiling-{runner_cls.slug()}{suffix}.sh",
             verbose=verbose,
         ) as context, tempfile.NamedTemporaryFile() as temp_file:
             kwargs = {
@@ -98,8 +334,10 @@ class Performance(Command, requires=[Correctness.name]):
                 "optimization_profile": optimization_profile.to_dict(parse=True),
                 "input_metadata": input_metadata.to_json(),
                 "output_metadata": output_metadata.to_json(),
-                "runner_config": runner_config.to_dict(parse=True) if runner_config else None,
+                "runner_config": runner_config,
             }
+            if pruning_reference is not None:
+                kwargs["pruning_reference"] = pruning_reference
 
             from model_navigator.commands.performance import profile_script
 
@@ -116,22 +354,24 @@ class Performance(Command, requires=[Correctness.name]):
                 parse_kwargs_to_cmd(kwargs),
                 allow_failure=True,
                 run_in_isolation=run_in_isolation,
+                # measurements in a reused worker are affected by heap, threads and CUDA context left by previous commands
+                reuse_process=False,
             )
 
             with jsonlines.open(temp_file.name, "r") as f:
-                profiling_results = [ProfilingResults.from_dict(res) for res in f]
-
-            results_str = []
-            for result in profiling_results:
-                batch_size = f"{result.batch_size:6}" if result.batch_size is not None else "-"
-                results_str.append(
-                    f"""Batch: {batch_size}, """
-                    f"""Throughput: {result.throughput:10.2f} [infer/sec], """
-                    f"""Avg Latency: {result.avg_latency:10.2f} [ms]"""
-                )
-            results_str = "\n".join(results_str)
-            LOGGER.info(f"Collected results: \n{results_str}")
+                return [ProfilingResults.from_dict(res) for res in f]
 
-        if not profiling_results:
-            raise ModelNavigatorProfilingError("No profiling results found.")
-        return CommandOutput(status=CommandStatus.OK, output={"profiling_results": profiling_results})
+    def _log_profiling_results(self, profiling_results: List[ProfilingResults]) -> None:
+        results_str = []
+        for result in profiling_results:
+            batch_size = f"{result.batch_size:6}" if result.batch_size is not None else "-"
+            request_rate = f"{result.request_rate:8.2f}" if result.request_rate is not None else "-"
+            results_str.append(
+                f"""Batch: {batch_size}, """
+                f"""Concurrency: {result.concurrency:3}, """
+                f"""Request rate: {request_rate} [req/sec], """
+                f"""Throughput: {result.throughput:10.2f} [infer/sec], """
+                f"""Avg Latency: {result.avg_latency:10.2f} [ms]"""
+            )
+        results_str = "\n".join(results_str)
+        LOGGER.info(f"Collected results: \n{results_str}")
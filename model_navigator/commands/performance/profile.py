@@ -21,12 +21,17 @@ from typing import Any, Optional, Type
 from jsonlines import jsonlines
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
-from model_navigator.commands.data_dump.samples import samples_to_npz
 from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.commands.performance.cache import (
+    ProfilingCache,
+    get_environment_fingerprint,
+    get_path_fingerprint,
+    get_sample_fingerprint,
+)
 from model_navigator.commands.performance.results import ProfilingResults
 from model_navigator.configuration import Format, OptimizationProfile, SizedDataLoader
 from model_navigator.configuration.runner.runner_config import RunnerConfig
-from model_navigator.core.dataloader import extract_bs1, extract_sample, load_samples
+from model_navigator.core.dataloader import BackgroundSamplesWriter, extract_bs1, extract_sample, load_samples
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
@@ -37,7 +42,7 @@ from model_navigator.utils.common import parse_kwargs_to_cmd
 from model_navigator.utils.format_helpers import is_source_format
 
 
-class Profile(Command):
+class Profile(Command, is_exclusive=True):
     """Profile command."""
 
     def _run(
@@ -83,37 +88,76 @@ class Profile(Command):
 
         profiling_results = []
         profiling_samples = []
+        sample_ids = []
 
-        for sample_id, sample_metadata in self._next_sample(
-            workspace=workspace,
-            framework=framework,
-            dataloader=dataloader,
-            input_metadata=input_metadata,
-            batch_dim=batch_dim,
-        ):
-            LOGGER.info(f"Profiling sample with idx: {sample_id}")
+        # Source models are kept in memory and cannot be fingerprinted
+        cache = ProfilingCache() if optimization_profile.cache_results and not is_source_format(format) else None
+        model_fingerprint = get_path_fingerprint(model_path) if cache is not None else None
+        cache_keys = {}
+
+        profiler_samples = workspace.path / "model_input" / "profiler"
+        if profiler_samples.exists():
+            shutil.rmtree(profiler_samples.as_posix())
+
+        # Samples are written in the background while next samples are pulled from the dataloader
+        with BackgroundSamplesWriter(batch_dim, raise_on_error=True) as writer:
+            writer.open(profiler_samples)
+            for sample_id, sample_metadata, profiler_sample in self._next_sample(
+                framework=framework,
+                dataloader=dataloader,
+                workspace=workspace,
+                input_metadata=input_metadata,
+                batch_dim=batch_dim,
+            ):
+                profiling_samples.append(sample_metadata)
+
+                if cache is not None:
+                    cache_keys[sample_id] = ProfilingCache.get_key(
+                        model=model_fingerprint,
+                        sample_id=sample_id,
+                        sample=get_sample_fingerprint(profiler_sample),
+                        format=format.value,
+                        runner_name=runner_cls.name(),
+                        runner_config=runner_config.to_dict(parse=True) if runner_config else None,
+                        optimization_profile=optimization_profile.to_dict(filter_fields=["cache_results"], parse=True),
+                        input_metadata=input_metadata.to_json(),
+                        batch_dim=batch_dim,
+                        environment=get_environment_fingerprint(),
+                    )
+                    sample_results = cache.get(cache_keys[sample_id])
+                    if sample_results:
+                        LOGGER.info(f"Using cached profiling results for sample with idx: {sample_id}")
+                        profiling_results.extend(sample_results)
+                        continue
+
+                writer.write(profiler_samples, profiler_sample)
+                sample_ids.append(sample_id)
+
+        if sample_ids:
+            LOGGER.info(f"Profiling samples with idx: {sample_ids}")
+
+            # Single worker loads the model once and profiles all samples
             with ExecutionContext(
                 workspace=workspace,
                 script_path=workspace.path / f"reproduce_profiler-{runner_cls.slug()}.py",
                 cmd_path=workspace.path / f"reproduce_profiler-{runner_cls.slug()}.sh",
                 verbose=verbose,
-            ) as context, tempfile.NamedTemporaryFile() as temp_file:
+            ) as context, tempfile.NamedTemporaryFile() as temp_file, tempfile.NamedTemporaryFile() as failures_file:
                 kwargs = {
                     "navigator_workspace": workspace.path.as_posix(),
                     "batch_dim": batch_dim,
                     "results_path": temp_file.name,
+                    "failures_path": failures_file.name,
                     "runner_name": runner_cls.name(),
                     "optimization_profile": optimization_profile.to_dict(parse=True),
                     "input_metadata": input_metadata.to_json(),
                     "output_metadata": output_metadata.to_json(),
-                    "sample_id": sample_id,
+                    "sample_ids": sample_ids,
                     "runner_config": runner_config.to_dict(parse=True) if runner_config else None,
                 }
 
                 from model_navigator.commands.performance import profile_script
 
-                profiling_samples.append(sample_metadata)
-
                 if is_source_format(format):
                     profile_script.get_model = lambda: model
                     run_in_isolation = False
@@ -127,14 +171,34 @@ class Profile(Command):
                     args=parse_kwargs_to_cmd(kwargs),
                     allow_failure=True,
                     run_in_isolation=run_in_isolation,
+                    # measurements in a reused worker are affected by heap, threads and CUDA context left by previous commands
+                    reuse_process=False,
                 )
 
                 with jsonlines.open(temp_file.name, "r") as f:
-                    profiling_results.extend([ProfilingResults.from_dict(res) for res in f])
+                    samples_results = [ProfilingResults.from_dict(res) for res in f]
+
+                with jsonlines.open(failures_file.name, "r") as f:
+                    failed_sample_ids = {failure["sample_id"] for failure in f}
+
+            if failed_sample_ids:
+                LOGGER.warning(f"Profiling failed for samples with idx: {sorted(failed_sample_ids)}")
+
+            if cache is not None:
+                # Results of failed samples are incomplete and are not stored
+                for sample_id in sample_ids:
+                    if sample_id in failed_sample_ids:
+                        continue
+                    sample_results = [result for result in samples_results if result.sample_id == sample_id]
+                    if sample_results:
+                        cache.put(cache_keys[sample_id], sample_results)
+
+            profiling_results.extend(samples_results)
 
         if not profiling_results:
             raise ModelNavigatorProfilingError("No profiling results found.")
 
+        profiling_results = sorted(profiling_results, key=lambda result: result.sample_id)
         return CommandOutput(
             status=CommandStatus.OK,
             output={"profiling_results": profiling_results, "profiling_samples": profiling_samples},
@@ -142,30 +206,20 @@ class Profile(Command):
 
     def _next_sample(
         self,
-        workspace: Workspace,
         framework: Framework,
         dataloader: Optional[SizedDataLoader],
+        workspace: Workspace,
         input_metadata: TensorMetadata,
         batch_dim: Optional[int],
     ):
-        profiler_samples = workspace.path / "model_input" / "profiler"
-        if profiler_samples.exists():
-            shutil.rmtree(profiler_samples.as_posix())
-
         if not dataloader:
             LOGGER.info("Using profiling sample from model optimization.")
-            profiling_samples = workspace.path / "model_input" / "profiling"
-            shutil.copytree(profiling_samples, profiler_samples)
             sample = load_samples("profiling_sample", workspace.path, batch_dim)[0]
             metadata = {n: t.shape for n, t in sample.items()}
-            yield 0, metadata
+            yield 0, metadata, sample
         else:
             LOGGER.info("Using profiling samples from dataloader provided in configuration.")
-            profiler_samples.mkdir(exist_ok=True, parents=True)
             for idx, sample in enumerate(dataloader):
                 sample = extract_sample(sample, input_metadata, framework)
                 metadata = {n: t.shape for n, t in sample.items()}
-                profiler_sample = extract_bs1(sample, batch_dim)
-                samples_to_npz([profiler_sample], profiler_samples, batch_dim, raise_on_error=True)
-
-                yield idx, metadata
+                yield idx, metadata, extract_bs1(sample, batch_dim)
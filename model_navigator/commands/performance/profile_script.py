@@ -14,13 +14,16 @@
 """Script for running profiling on a runner."""
 
 import pathlib
-from typing import Dict, Optional
+import traceback
+from typing import Dict, List, Optional
 
 import fire
+from jsonlines import jsonlines
 
 from model_navigator.commands.performance.profiler import Profiler
 from model_navigator.configuration import OptimizationProfile
 from model_navigator.core.dataloader import load_samples
+from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.runners.registry import get_runner
 
@@ -44,9 +47,12 @@ def profile(
     input_metadata: Dict,
     output_metadata: Dict,
     sample_id: int = 0,
+    sample_ids: Optional[List[int]] = None,
     navigator_workspace: Optional[str] = None,
     model_path: Optional[str] = None,
     runner_config: Optional[Dict] = None,
+    pruning_reference: Optional[List[Dict]] = None,
+    failures_path: Optional[str] = None,
 ) -> None:
     """Run profiling.
 
@@ -58,15 +64,26 @@ def profile(
         input_metadata: Input metadata.
         output_metadata: Output metadata.
         sample_id: Identifier of profiled sample.
+        sample_ids: Identifiers of profiled samples stored in the profiler samples directory. When provided,
+            the model is loaded once and all samples are profiled in order. Overrides `sample_id`.
         navigator_workspace: Path of the Model Navigator workspace. When None use current workdir. Defaults to None.
         model_path: Path to the model. When None use `get_model()` to load the model. Defaults to None.
         runner_config: Additional runner arguments.
+        pruning_reference: The highest throughput per batch size of already profiled runtimes used to stop
+            profiling of clearly slower runtimes early.
+        failures_path: Jsonlines path to store identifiers and errors of samples which profiling failed in.
+            When None failures are only logged. Defaults to None.
+
+    Raises:
+        Exception: Error of the first sample when profiling failed for all samples.
     """
     if not navigator_workspace:
         navigator_workspace = pathlib.Path.cwd()
     navigator_workspace = pathlib.Path(navigator_workspace)
 
-    profiling_sample = load_samples("profiler_sample", navigator_workspace, batch_dim)[0]
+    profiling_samples = load_samples("profiler_sample", navigator_workspace, batch_dim)
+    if sample_ids is None:
+        sample_ids = [sample_id]
 
     if model_path:
         model = navigator_workspace / model_path
@@ -86,17 +103,35 @@ def profile(
         **runner_config,
     )  # pytype: disable=not-instantiable
 
-    Profiler(
+    profiler = Profiler(
         profile=OptimizationProfile.from_dict(optimization_profile),
         input_metadata=TensorMetadata.from_json(input_metadata),
         batch_dim=batch_dim,
         results_path=pathlib.Path(results_path),
-    ).run(
-        runner=runner,
-        profiling_sample=profiling_sample,
-        sample_id=sample_id,
+        pruning_reference=pruning_reference,
     )
 
+    errors = []
+    with runner:
+        for idx, profiled_sample_id in enumerate(sample_ids):
+            # Failure of a single sample does not stop profiling of the remaining samples
+            try:
+                profiler.run(
+                    runner=runner,
+                    profiling_sample=profiling_samples[idx],
+                    sample_id=profiled_sample_id,
+                )
+            except Exception as e:
+                LOGGER.error(f"Profiling failed for sample with idx: {profiled_sample_id}.")
+                LOGGER.error(f"Traceback: {traceback.format_exc()}")
+                errors.append(e)
+                if failures_path:
+                    with jsonlines.open(failures_path, "a") as f:
+                        f.write({"sample_id": profiled_sample_id, "error": str(e)})
+
+    if errors and len(errors) == len(sample_ids):
+        raise errors[0]
+
 
 if __name__ == "__main__":
     fire.Fire(profile)
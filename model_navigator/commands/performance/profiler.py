@@ -13,23 +13,41 @@
 # limitations under the License.
 """Runners profiling."""
 
+import contextlib
 import math
 import pathlib
 import queue
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from jsonlines import jsonlines
 
+from model_navigator.commands.performance.memory_monitor import MemoryMonitor
 from model_navigator.commands.performance.nvml_handler import NvmlHandler
 from model_navigator.commands.performance.results import ProfilingResults
-from model_navigator.commands.performance.utils import is_measurement_stable, is_throughput_saturated
+from model_navigator.commands.performance.utils import (
+    MeasurementStability,
+    get_arrival_times,
+    get_knee_batch_size,
+    get_measurement_stability,
+    is_request_rate_sustained,
+    is_throughput_dominated,
+    is_throughput_saturated,
+)
 from model_navigator.configuration import OptimizationProfile, Sample
-from model_navigator.core.dataloader import expand_sample
+from model_navigator.configuration.constants import (
+    DEFAULT_ADAPTIVE_SEARCH_STEPS,
+    DEFAULT_REQUEST_RATE_TOLERANCE,
+    DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD,
+)
+from model_navigator.core.dataloader import SampleExpander
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.tracing import get_tracer
 from model_navigator.exceptions import ModelNavigatorError
-from model_navigator.runners.base import InferenceStep, NavigatorRunner, NavigatorStabilizedRunner
+from model_navigator.runners.base import InferenceStep, InferenceTime, NavigatorRunner, NavigatorStabilizedRunner
 
 
 class Profiler:
@@ -51,6 +69,7 @@ class Profiler:
         input_metadata: TensorMetadata,
         results_path: pathlib.Path,
         batch_dim: Optional[int] = 0,
+        pruning_reference: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
         """Initialize the Profiler.
 
@@ -59,6 +78,8 @@ class Profiler:
             input_metadata: Input metadata.
             results_path: Jsonlines path to store the results in.
             batch_dim: Batch dimension. Defaults to 0.
+            pruning_reference: The highest throughput per batch size of already profiled runtimes. When provided,
+                profiling stops after the first batch sizes if their throughput is clearly dominated by the reference.
 
         Raises:
             ValueError: When batch_dim is None, but profile.batch_sizes is not None.
@@ -67,6 +88,8 @@ class Profiler:
         self._input_metadata = input_metadata
         self._batch_dim = batch_dim
         self._results_path = results_path
+        self._pruning_reference = pruning_reference
+        self._tracer = get_tracer()
 
         if self._batch_dim is None:
             batch_sizes = [None]
@@ -81,6 +104,13 @@ class Profiler:
             batch_sizes = (2 ** np.arange(31, dtype=np.int32)).tolist()
 
         self._batch_sizes = batch_sizes
+        # Only automatically generated batch sizes grid is refined
+        self._adaptive_search = bool(
+            self._profile.adaptive_batch_sizes and self._batch_dim is not None and not self._profile.batch_sizes
+        )
+        self._concurrency = sorted(set(self._profile.concurrency)) if self._profile.concurrency else [1]
+        self._request_rates = sorted(set(self._profile.request_rates)) if self._profile.request_rates else []
+        self._sample_expander: Optional[SampleExpander] = None
 
     def run(
         self,
@@ -99,62 +129,246 @@ class Profiler:
             List[ProfilingResults]: Results for each of the batch sizes from profiler configuration.
         """
         results = []
-        prev_results = queue.Queue(maxsize=self._profile.throughput_backoff_limit + 1)
-        with runner, NvmlHandler() as nvml_handler:
+        # Expanded samples are shared by all measurements of the sample and released when profiling ends
+        self._sample_expander = SampleExpander(profiling_sample, self._input_metadata, self._batch_dim)
+        # Runner activated by the caller stays active to profile further samples without reloading the model
+        runner_context = contextlib.nullcontext(runner) if runner.is_active else runner
+        with runner_context, NvmlHandler() as nvml_handler:
             try:
-                for batch_size in self._batch_sizes:
-                    LOGGER.debug(f"Performance profiling for {runner.name()} started.")
-                    if batch_size:
-                        LOGGER.debug(f"Batch size: {batch_size}.")
-                    sample = expand_sample(profiling_sample, self._input_metadata, self._batch_dim, batch_size)
-                    profiling_result = self._run_measurement(runner, nvml_handler, sample, batch_size, sample_id)
-                    LOGGER.debug(
-                        f"Performance profiling result for {runner.name()} "
-                        f"and batch size: {batch_size}:\n{profiling_result}"
-                    )
-                    total_latency = profiling_result.avg_latency
-                    total_steps_latency = sum(
-                        result.avg_time
-                        for step_name, result in profiling_result.detailed_results.items()
-                        if step_name != InferenceStep.TOTAL.value
-                    )
-                    steps_coverage = total_steps_latency / total_latency
-                    LOGGER.debug(f"Inference steps coverage: {steps_coverage:.3f}")
-
-                    prev_result = sorted(
-                        (item for item in prev_results.queue), key=lambda x: x.throughput, reverse=True
-                    )
-                    prev_result = prev_result[0] if len(prev_result) > 0 else None
-
-                    if is_throughput_saturated(
-                        profiling_result, prev_result, self._profile.throughput_cutoff_threshold
-                    ):
-                        if self._profile.throughput_backoff_limit == 0:
-                            break
-
-                        prev_results.put(profiling_result)
+                for concurrency in self._concurrency:
+                    if concurrency > 1 and (runner.is_stabilized() or not runner.is_thread_safe):
+                        LOGGER.warning(
+                            f"Runner {runner.name()} does not support concurrent requests. "
+                            f"Skipping profiling with concurrency {concurrency}."
+                        )
+                        continue
 
-                        if prev_results.full():
+                    LOGGER.debug(f"Concurrency: {concurrency}.")
+                    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                        self._run_batch_sizes(
+                            runner=runner,
+                            nvml_handler=nvml_handler,
+                            profiling_sample=profiling_sample,
+                            sample_id=sample_id,
+                            concurrency=concurrency,
+                            executor=executor,
+                            results=results,
+                        )
+                        if self._is_dominated(results):
+                            LOGGER.info(
+                                f"Profiling of {runner.name()} stopped early. Throughput is clearly dominated "
+                                "by an already profiled runtime."
+                            )
                             break
 
-                    else:
-                        # Pop first element as is a valid result already recorded
-                        if not prev_results.empty():
-                            prev_results.get()
-
-                        while not prev_results.empty():
-                            prev_result = prev_results.get()
-                            results.append(prev_result)
-
-                        prev_results.put(profiling_result)
-                        results.append(profiling_result)
+                        if self._request_rates and not runner.is_stabilized():
+                            self._run_request_rates(
+                                runner=runner,
+                                nvml_handler=nvml_handler,
+                                profiling_sample=profiling_sample,
+                                sample_id=sample_id,
+                                concurrency=concurrency,
+                                executor=executor,
+                                results=results,
+                            )
             finally:
+                self._sample_expander = None
                 for result in results:
                     with jsonlines.open(self._results_path.as_posix(), "a") as f:
                         f.write(result.to_dict(parse=True))
 
         return results
 
+    def _run_batch_sizes(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        profiling_sample: Sample,
+        sample_id: int,
+        concurrency: int,
+        executor: ThreadPoolExecutor,
+        results: List[ProfilingResults],
+    ) -> None:
+        prev_results = queue.Queue(maxsize=self._profile.throughput_backoff_limit + 1)
+        results_start = len(results)
+        measured_results = {}
+        failed_batch_size = None
+        for batch_size in self._batch_sizes:
+            LOGGER.debug(f"Performance profiling for {runner.name()} started.")
+            if batch_size:
+                LOGGER.debug(f"Batch size: {batch_size}.")
+            try:
+                profiling_result = self._run_batch_size_measurement(
+                    runner, nvml_handler, profiling_sample, batch_size, sample_id, concurrency, executor
+                )
+            except Exception as e:
+                # Failure after a successfully profiled batch size is the boundary of adaptive search
+                if not self._adaptive_search or not measured_results:
+                    raise e
+                LOGGER.debug(f"Profiling failed for batch size {batch_size}: {e}")
+                failed_batch_size = batch_size
+                break
+
+            measured_results[batch_size] = profiling_result
+            LOGGER.debug(
+                f"Performance profiling result for {runner.name()} and batch size: {batch_size}:\n{profiling_result}"
+            )
+            total_latency = profiling_result.avg_latency
+            total_steps_latency = sum(
+                result.avg_time
+                for step_name, result in profiling_result.detailed_results.items()
+                if step_name not in (InferenceStep.TOTAL.value, InferenceStep.QUEUEING.value)
+            )
+            steps_coverage = total_steps_latency / total_latency
+            LOGGER.debug(f"Inference steps coverage: {steps_coverage:.3f}")
+
+            prev_result = sorted((item for item in prev_results.queue), key=lambda x: x.throughput, reverse=True)
+            prev_result = prev_result[0] if len(prev_result) > 0 else None
+
+            if is_throughput_saturated(profiling_result, prev_result, self._profile.throughput_cutoff_threshold):
+                if self._profile.throughput_backoff_limit == 0:
+                    break
+
+                prev_results.put(profiling_result)
+
+                if prev_results.full():
+                    break
+
+            else:
+                # Pop first element as is a valid result already recorded
+                if not prev_results.empty():
+                    prev_results.get()
+
+                while not prev_results.empty():
+                    prev_result = prev_results.get()
+                    results.append(prev_result)
+
+                prev_results.put(profiling_result)
+                results.append(profiling_result)
+
+            if concurrency == 1 and self._is_dominated(results[results_start:]):
+                break
+
+        if self._adaptive_search and measured_results and not self._is_dominated(results[results_start:]):
+            self._refine_batch_sizes(
+                runner=runner,
+                nvml_handler=nvml_handler,
+                profiling_sample=profiling_sample,
+                sample_id=sample_id,
+                concurrency=concurrency,
+                executor=executor,
+                measured_results=measured_results,
+                failed_batch_size=failed_batch_size,
+                results=results,
+            )
+            results[results_start:] = sorted(results[results_start:], key=lambda result: result.batch_size)
+
+    def _is_dominated(self, results: List[ProfilingResults]) -> bool:
+        if self._pruning_reference is None:
+            return False
+
+        return is_throughput_dominated(results, self._pruning_reference)
+
+    def _refine_batch_sizes(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        profiling_sample: Sample,
+        sample_id: int,
+        concurrency: int,
+        executor: ThreadPoolExecutor,
+        measured_results: Dict[int, ProfilingResults],
+        failed_batch_size: Optional[int],
+        results: List[ProfilingResults],
+    ) -> None:
+        def _measure(batch_size: int) -> Optional[ProfilingResults]:
+            LOGGER.debug(f"Adaptive search for {runner.name()}. Batch size: {batch_size}.")
+            try:
+                profiling_result = self._run_batch_size_measurement(
+                    runner, nvml_handler, profiling_sample, batch_size, sample_id, concurrency, executor
+                )
+            except Exception as e:
+                LOGGER.debug(f"Profiling failed for batch size {batch_size}: {e}")
+                return None
+
+            measured_results[batch_size] = profiling_result
+            results.append(profiling_result)
+            return profiling_result
+
+        # Bisect the boundary between the largest working and the first failing batch size
+        if failed_batch_size is not None:
+            lower, upper = max(measured_results), failed_batch_size
+            for _ in range(DEFAULT_ADAPTIVE_SEARCH_STEPS):
+                batch_size = (lower + upper) // 2
+                if batch_size <= lower:
+                    break
+                if _measure(batch_size) is None:
+                    upper = batch_size
+                else:
+                    lower = batch_size
+
+        # Probe the knee of throughput curve which usually lies between grid batch sizes
+        batch_sizes = sorted(measured_results)
+        throughput_cutoff_threshold = self._profile.throughput_cutoff_threshold or DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD
+        knee_batch_size = get_knee_batch_size(
+            batch_sizes=batch_sizes,
+            throughputs=[measured_results[batch_size].throughput for batch_size in batch_sizes],
+            throughput_cutoff_threshold=throughput_cutoff_threshold,
+        )
+        LOGGER.debug(f"Estimated throughput knee batch size for {runner.name()}: {knee_batch_size}")
+        if knee_batch_size is not None and batch_sizes[0] < knee_batch_size < batch_sizes[-1]:
+            if knee_batch_size not in measured_results:
+                _measure(knee_batch_size)
+
+        LOGGER.info(f"Adaptive search for {runner.name()} profiled batch sizes: {sorted(measured_results)}")
+
+    def _run_batch_size_measurement(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        profiling_sample: Sample,
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int,
+        executor: ThreadPoolExecutor,
+    ) -> ProfilingResults:
+        sample = self._sample_expander.expand(batch_size)
+        return self._run_measurement(runner, nvml_handler, sample, batch_size, sample_id, concurrency, executor)
+
+    def _run_request_rates(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        profiling_sample: Sample,
+        sample_id: int,
+        concurrency: int,
+        executor: ThreadPoolExecutor,
+        results: List[ProfilingResults],
+    ) -> None:
+        batch_size = self._batch_sizes[0]
+        sample = self._sample_expander.expand(batch_size)
+        max_sustained_rate = None
+        for request_rate in self._request_rates:
+            LOGGER.debug(f"Open-loop profiling for {runner.name()} with request rate: {request_rate} [requests/sec].")
+            profiling_result = self._run_measurement(
+                runner, nvml_handler, sample, batch_size, sample_id, concurrency, executor, request_rate
+            )
+            LOGGER.debug(
+                f"Open-loop profiling result for {runner.name()} and request rate: {request_rate}:\n{profiling_result}"
+            )
+            results.append(profiling_result)
+
+            if not is_request_rate_sustained(profiling_result, DEFAULT_REQUEST_RATE_TOLERANCE):
+                LOGGER.debug(f"Runner {runner.name()} is not able to sustain request rate: {request_rate}.")
+                break
+
+            max_sustained_rate = request_rate
+
+        LOGGER.info(
+            f"Max sustained request rate for {runner.name()} with concurrency {concurrency}: "
+            f"{max_sustained_rate} [requests/sec]."
+        )
+
     def _run_window_measurement(
         self,
         runner: NavigatorRunner,
@@ -172,14 +386,112 @@ class Profiler:
 
         return ProfilingResults.from_measurements(measurements, gpu_clocks, batch_size, sample_id)
 
-    def _measurements_result(self, profiling_results: List[ProfilingResults], last_n: int = 3) -> ProfilingResults:
-        if len(profiling_results) < last_n:
-            raise ModelNavigatorError(
-                f"Measurements results requires at least {last_n} consecutive stable measurements."
-            )
+    def _run_concurrent_window_measurement(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        sample: Sample,
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int,
+        executor: ThreadPoolExecutor,
+    ) -> ProfilingResults:
+        # Runner keeps only the last inference time, so requests sent from multiple threads are timed by the worker
+        def _worker():
+            worker_gpu_clocks = []
+            worker_measurements = []
+            for _ in range(self._profile.window_size):
+                start = time.monotonic()
+                runner.infer(sample)
+                end = time.monotonic()
+                inference_time = InferenceTime()
+                inference_time[InferenceStep.TOTAL.value] = (end - start) * 1000
+                worker_gpu_clocks.append(nvml_handler.gpu_clock)
+                worker_measurements.append(inference_time)
+            return worker_measurements, worker_gpu_clocks
 
-        profiling_results = profiling_results[-last_n:]
-        return ProfilingResults.from_profiling_results(profiling_results)
+        gpu_clocks = []
+        measurements = []
+        start = time.monotonic()
+        futures = [executor.submit(_worker) for _ in range(concurrency)]
+        for future in futures:
+            worker_measurements, worker_gpu_clocks = future.result()
+            measurements.extend(worker_measurements)
+            gpu_clocks.extend(worker_gpu_clocks)
+        duration = (time.monotonic() - start) * 1000
+
+        return ProfilingResults.from_measurements(
+            measurements, gpu_clocks, batch_size, sample_id, concurrency=concurrency, duration=duration
+        )
+
+    def _run_open_loop_window_measurement(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        sample: Sample,
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int,
+        executor: Optional[ThreadPoolExecutor],
+        request_rate: float,
+    ) -> ProfilingResults:
+        arrival_times = get_arrival_times(
+            request_rate=request_rate,
+            request_count=self._profile.window_size,
+            arrival_distribution=self._profile.arrival_distribution,
+        )
+
+        def _request(arrival_time: float):
+            start = time.monotonic()
+            runner.infer(sample)
+            end = time.monotonic()
+            if concurrency > 1:
+                inference_time = InferenceTime()
+                inference_time[InferenceStep.TOTAL.value] = (end - start) * 1000
+            else:
+                inference_time = runner.last_inference_time()
+            return inference_time, (start - arrival_time) * 1000, nvml_handler.gpu_clock
+
+        # Requests are sent according to the schedule no matter how many of them are still processed,
+        # with concurrency 1 requests arriving while the previous one is processed wait in the executor queue
+        assert executor is not None
+        window_start = time.monotonic()
+        pending = []
+        for arrival_time in window_start + arrival_times:
+            delay = arrival_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pending.append(executor.submit(_request, arrival_time))
+
+        completed = [future.result() for future in pending]
+        window_end = max(time.monotonic(), window_start + self._profile.window_size / request_rate)
+
+        measurements, queue_delays, gpu_clocks = zip(*completed)
+        return ProfilingResults.from_measurements(
+            list(measurements),
+            list(gpu_clocks),
+            batch_size,
+            sample_id,
+            concurrency=concurrency,
+            duration=(window_end - window_start) * 1000,
+            queue_delays=list(queue_delays),
+            request_rate=request_rate,
+        )
+
+    def _measurements_result(
+        self, profiling_results: List[ProfilingResults], stability: MeasurementStability
+    ) -> ProfilingResults:
+        profiling_results = profiling_results[stability.first_window :]  # noqa: E203
+        if not profiling_results:
+            raise ModelNavigatorError("Measurements results requires at least one stable measurement.")
+
+        profiling_result = ProfilingResults.from_profiling_results(profiling_results)
+        profiling_result.stability_criterion = self._profile.stability_criterion
+        profiling_result.stability_value = stability.stability_value
+        if stability.median_latency_ci is not None:
+            profiling_result.p50_latency_ci = list(stability.median_latency_ci)
+
+        return profiling_result
 
     def _run_measurement(
         self,
@@ -188,6 +500,9 @@ class Profiler:
         sample: Sample,
         batch_size: Optional[int],
         sample_id: int,
+        concurrency: int = 1,
+        executor: Optional[ThreadPoolExecutor] = None,
+        request_rate: Optional[float] = None,
     ) -> ProfilingResults:
         profiling_results = []
 
@@ -199,15 +514,46 @@ class Profiler:
         else:
             for idx in range(self._profile.max_trials):
                 measurement_id = idx + 1
-                profiling_result = self._run_window_measurement(runner, nvml_handler, sample, batch_size, sample_id)
+                memory_monitor = MemoryMonitor(
+                    enabled=self._profile.profile_memory,
+                    trace_python_allocations=self._profile.trace_python_allocations,
+                )
+                span_args = {"batch_size": batch_size, "concurrency": concurrency, "request_rate": request_rate}
+                window_span = self._tracer.span(f"measurement {measurement_id}", "profiling", span_args)
+                # inference steps are not traced in measurement windows to keep latencies free of tracing overhead
+                with memory_monitor, window_span, self._tracer.paused():
+                    if request_rate is not None:
+                        profiling_result = self._run_open_loop_window_measurement(
+                            runner, nvml_handler, sample, batch_size, sample_id, concurrency, executor, request_rate
+                        )
+                    elif concurrency > 1:
+                        assert executor is not None
+                        profiling_result = self._run_concurrent_window_measurement(
+                            runner, nvml_handler, sample, batch_size, sample_id, concurrency, executor
+                        )
+                    else:
+                        profiling_result = self._run_window_measurement(
+                            runner, nvml_handler, sample, batch_size, sample_id
+                        )
+                profiling_result.peak_rss_memory = memory_monitor.peak_rss_memory
+                profiling_result.avg_rss_memory = memory_monitor.avg_rss_memory
+                profiling_result.uss_memory = memory_monitor.uss_memory
+                profiling_result.peak_python_memory = memory_monitor.peak_python_memory
                 profiling_results.append(profiling_result)
+                self._tracer.counter("gpu clock [MHz]", {"avg": profiling_result.avg_gpu_clock})
+                self._tracer.record_memory()
                 LOGGER.debug(
                     f"Measurement [{measurement_id}]: {profiling_result.throughput} infer/sec, {profiling_result.avg_latency} ms"
                 )
                 last_n = min(self._profile.stabilization_windows, self._profile.max_trials)
-                is_stable = is_measurement_stable(profiling_results, last_n, self._profile.stability_percentage)
-                if measurement_id >= self._profile.min_trials and is_stable:
-                    return self._measurements_result(profiling_results, last_n)
+                stability = get_measurement_stability(
+                    profiling_results,
+                    last_n=last_n,
+                    stability_percentage=self._profile.stability_percentage,
+                    stability_criterion=self._profile.stability_criterion,
+                )
+                if measurement_id >= self._profile.min_trials and stability.is_stable:
+                    return self._measurements_result(profiling_results, stability)
 
         raise RuntimeError(
             "Unable to get stable performance results. Consider increasing "
@@ -16,10 +16,12 @@
 import collections
 import dataclasses
 import warnings
-from typing import Dict, List, Mapping, Optional
+from typing import Callable, Dict, List, Mapping, Optional
 
 import numpy as np
 
+from model_navigator.configuration import StabilityCriterion
+from model_navigator.core.histogram import LatencyHistogram
 from model_navigator.runners.base import InferenceStep, InferenceTime, NavigatorStabilizedRunner
 from model_navigator.utils.common import DataObject
 
@@ -34,6 +36,25 @@ class ProfilingStepResults(DataObject):
     p90_time: float  # ms
     p95_time: float  # ms
     p99_time: float  # ms
+    # Histogram of step times used to merge results of measurement windows, not serialized
+    histogram: Optional[LatencyHistogram] = dataclasses.field(default=None, repr=False, compare=False)
+
+    def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
+        """Serialize to a dictionary.
+
+        Append `histogram` field to filtered fields during dump.
+
+        Args:
+            filter_fields (Optional[List[str]], optional): List of fields to filter out.
+                Defaults to None.
+            parse (bool, optional): If True recursively parse field values to jsonable representation.
+                Defaults to False.
+
+        Returns:
+            Dict: Data serialized to a dictionary.
+        """
+        filter_fields = [*(filter_fields or []), "histogram"]
+        return super().to_dict(filter_fields=filter_fields, parse=parse)
 
     @classmethod
     def from_dict(cls, d: Mapping) -> "ProfilingStepResults":
@@ -54,6 +75,64 @@ class ProfilingStepResults(DataObject):
             p99_time=d["p99_time"],
         )
 
+    @classmethod
+    def from_measurements(cls, measurements: List[float]) -> "ProfilingStepResults":
+        """Instantiate ProfilingStepResults from a list of time measurements.
+
+        Args:
+            measurements: List of time measurements in milliseconds.
+
+        Returns:
+            ProfilingStepResults
+        """
+        return cls.from_histogram(LatencyHistogram.from_values(measurements))
+
+    @classmethod
+    def from_histogram(cls, histogram: LatencyHistogram) -> "ProfilingStepResults":
+        """Instantiate ProfilingStepResults from a histogram of time measurements.
+
+        Args:
+            histogram: Histogram of time measurements in milliseconds.
+
+        Returns:
+            ProfilingStepResults
+        """
+        p50_time, p90_time, p95_time, p99_time = histogram.percentiles([50, 90, 95, 99])
+        return cls(
+            avg_time=histogram.mean,
+            std_time=histogram.std,
+            p50_time=p50_time,
+            p90_time=p90_time,
+            p95_time=p95_time,
+            p99_time=p99_time,
+            histogram=histogram,
+        )
+
+    @classmethod
+    def from_step_results(cls, step_results: List["ProfilingStepResults"]) -> "ProfilingStepResults":
+        """Instantiate ProfilingStepResults by merging results of measurement windows.
+
+        When all results hold histograms, statistics are computed over all merged measurements.
+        Otherwise, the statistics of windows are averaged.
+
+        Args:
+            step_results: List of step results to merge.
+
+        Returns:
+            ProfilingStepResults
+        """
+        if all(result.histogram is not None for result in step_results):
+            return cls.from_histogram(LatencyHistogram.merged([result.histogram for result in step_results]))
+
+        return cls(
+            avg_time=float(np.mean([result.avg_time for result in step_results])),
+            std_time=float(np.std([result.std_time for result in step_results])),
+            p50_time=float(np.percentile([result.p50_time for result in step_results], 50)),
+            p90_time=float(np.percentile([result.p90_time for result in step_results], 90)),
+            p95_time=float(np.percentile([result.p95_time for result in step_results], 95)),
+            p99_time=float(np.percentile([result.p99_time for result in step_results], 99)),
+        )
+
 
 @dataclasses.dataclass
 class ProfilingResults(DataObject):
@@ -70,8 +149,37 @@ class ProfilingResults(DataObject):
     throughput: float  # infer / sec
     request_count: int
     avg_gpu_clock: Optional[float] = None  # MHz
+    concurrency: int = 1
+    request_rate: Optional[float] = None  # requests / sec
+    stability_criterion: Optional[StabilityCriterion] = None
+    stability_value: Optional[float] = None  # %
+    p50_latency_ci: Optional[List[float]] = None  # ms
+    peak_rss_memory: Optional[float] = None  # MB
+    avg_rss_memory: Optional[float] = None  # MB
+    uss_memory: Optional[float] = None  # MB
+    peak_python_memory: Optional[float] = None  # MB
 
     detailed_results: Dict[str, ProfilingStepResults] = dataclasses.field(default_factory=dict)
+    latency_histogram: Optional[LatencyHistogram] = dataclasses.field(default=None, repr=False, compare=False)
+    # Raw latencies of a measurement window used for stability verification, not serialized
+    latencies: Optional[np.ndarray] = dataclasses.field(default=None, repr=False, compare=False)
+
+    def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
+        """Serialize to a dictionary.
+
+        Append `latencies` field to filtered fields during dump.
+
+        Args:
+            filter_fields (Optional[List[str]], optional): List of fields to filter out.
+                Defaults to None.
+            parse (bool, optional): If True recursively parse field values to jsonable representation.
+                Defaults to False.
+
+        Returns:
+            Dict: Data serialized to a dictionary.
+        """
+        filter_fields = [*(filter_fields or []), "latencies"]
+        return super().to_dict(filter_fields=filter_fields, parse=parse)
 
     @classmethod
     def from_dict(cls, d: Mapping) -> "ProfilingResults":
@@ -97,6 +205,15 @@ class ProfilingResults(DataObject):
             batch_size=d.get("batch_size"),
             request_count=d["request_count"],
             avg_gpu_clock=d.get("avg_gpu_clock"),
+            concurrency=d.get("concurrency", 1),
+            request_rate=d.get("request_rate"),
+            stability_criterion=StabilityCriterion(d["stability_criterion"]) if d.get("stability_criterion") else None,
+            stability_value=d.get("stability_value"),
+            p50_latency_ci=d.get("p50_latency_ci"),
+            peak_rss_memory=d.get("peak_rss_memory"),
+            avg_rss_memory=d.get("avg_rss_memory"),
+            uss_memory=d.get("uss_memory"),
+            peak_python_memory=d.get("peak_python_memory"),
             avg_latency=d["avg_latency"],
             std_latency=d["std_latency"],
             p50_latency=d["p50_latency"],
@@ -105,11 +222,22 @@ class ProfilingResults(DataObject):
             p99_latency=d["p99_latency"],
             throughput=d["throughput"],
             detailed_results=detailed_results,
+            latency_histogram=LatencyHistogram.from_dict(d["latency_histogram"])
+            if d.get("latency_histogram")
+            else None,
         )
 
     @classmethod
     def from_measurements(
-        cls, measurements: List[InferenceTime], gpu_clocks: List[float], batch_size: Optional[int], sample_id: int
+        cls,
+        measurements: List[InferenceTime],
+        gpu_clocks: List[float],
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int = 1,
+        duration: Optional[float] = None,
+        queue_delays: Optional[List[float]] = None,
+        request_rate: Optional[float] = None,
     ) -> "ProfilingResults":
         """Instantiate ProfilingResults from a list of measurements.
 
@@ -118,6 +246,12 @@ class ProfilingResults(DataObject):
             gpu_clocks: List of GPU clocks.
             batch_size: Batch size.
             sample_id: Sample id
+            concurrency: Number of concurrent requests used during measurements.
+            duration: Wall time of the measurements in milliseconds. When provided the throughput is computed
+                from the number of requests completed in that time instead of the average latency.
+            queue_delays: Time in milliseconds each request waited before being processed. When provided the
+                latency includes the queueing delay and the delay is stored as a separate step in detailed results.
+            request_rate: Request rate used in open-loop measurements.
 
         Returns:
             ProfilingResults
@@ -132,37 +266,49 @@ class ProfilingResults(DataObject):
             for step_name, step_measurement in measurement.items():
                 step_measurements[step_name].append(step_measurement)
 
+        assert InferenceStep.TOTAL.value in step_measurements
+        latencies = np.array(step_measurements[InferenceStep.TOTAL.value])
+        if queue_delays is not None:
+            step_measurements[InferenceStep.QUEUEING.value] = list(queue_delays)
+            latencies = latencies + np.array(queue_delays)
+
         detailed_results = {
-            step_name: ProfilingStepResults(
-                avg_time=float(np.mean(detailed_results)),
-                std_time=float(np.std(detailed_results)),
-                p50_time=float(np.percentile(detailed_results, 50)),
-                p90_time=float(np.percentile(detailed_results, 90)),
-                p95_time=float(np.percentile(detailed_results, 95)),
-                p99_time=float(np.percentile(detailed_results, 99)),
-            )
+            step_name: ProfilingStepResults.from_measurements(detailed_results)
             for step_name, detailed_results in step_measurements.items()
         }
+        latency_histogram = LatencyHistogram.from_values(latencies)
+        latency_results = ProfilingStepResults.from_histogram(latency_histogram)
+
+        if duration is not None:
+            throughput = 1000 * (batch_size or 1) * len(measurements) / duration
+        else:
+            throughput = 1000 * (batch_size or 1) / latency_results.avg_time
 
-        assert InferenceStep.TOTAL.value in detailed_results
         return cls(
             sample_id=sample_id,
             batch_size=batch_size,
             avg_gpu_clock=float(avg_gpu_clock),
+            concurrency=concurrency,
+            request_rate=request_rate,
             request_count=len(measurements),
             detailed_results=detailed_results,
-            avg_latency=detailed_results[InferenceStep.TOTAL.value].avg_time,
-            std_latency=detailed_results[InferenceStep.TOTAL.value].std_time,
-            p50_latency=detailed_results[InferenceStep.TOTAL.value].p50_time,
-            p90_latency=detailed_results[InferenceStep.TOTAL.value].p90_time,
-            p95_latency=detailed_results[InferenceStep.TOTAL.value].p95_time,
-            p99_latency=detailed_results[InferenceStep.TOTAL.value].p99_time,
-            throughput=(1000 * (batch_size or 1) / detailed_results[InferenceStep.TOTAL.value].avg_time),
+            avg_latency=latency_results.avg_time,
+            std_latency=latency_results.std_time,
+            p50_latency=latency_results.p50_time,
+            p90_latency=latency_results.p90_time,
+            p95_latency=latency_results.p95_time,
+            p99_latency=latency_results.p99_time,
+            throughput=throughput,
+            latency_histogram=latency_histogram,
+            latencies=latencies,
         )
 
     @classmethod
     def from_profiling_results(cls, profiling_results: List["ProfilingResults"]) -> "ProfilingResults":
-        """Instantiate ProfilingResults as a mean of other profiling results.
+        """Instantiate ProfilingResults by merging other profiling results.
+
+        Latency statistics are computed from merged histograms of all measurements when available.
+        Otherwise, the statistics of the results are averaged.
 
         Args:
             profiling_results (List[ProfilingResults]): List of profiling results to average.
@@ -171,6 +317,8 @@ class ProfilingResults(DataObject):
             ProfilingResults
         """
         batch_size = profiling_results[0].batch_size
+        concurrency = profiling_results[0].concurrency
+        request_rate = profiling_results[0].request_rate
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
             avg_gpu_clock = np.nanmean([result.avg_gpu_clock for result in profiling_results])
@@ -178,35 +326,57 @@ class ProfilingResults(DataObject):
         step_measurements: Dict[str, List[ProfilingStepResults]] = collections.defaultdict(list)
         for result in profiling_results:
             assert result.batch_size == batch_size, "Batch size must be the same for all profiling results"
+            assert result.concurrency == concurrency, "Concurrency must be the same for all profiling results"
+            assert result.request_rate == request_rate, "Request rate must be the same for all profiling results"
             for step_name, step_result in result.detailed_results.items():
                 step_measurements[step_name].append(step_result)
 
         detailed_results = {
-            step_name: ProfilingStepResults(
-                avg_time=float(np.mean([result.avg_time for result in detailed_results])),
-                std_time=float(np.std([result.std_time for result in detailed_results])),
-                p50_time=float(np.percentile([result.p50_time for result in detailed_results], 50)),
-                p90_time=float(np.percentile([result.p90_time for result in detailed_results], 90)),
-                p95_time=float(np.percentile([result.p95_time for result in detailed_results], 95)),
-                p99_time=float(np.percentile([result.p99_time for result in detailed_results], 99)),
-            )
-            for step_name, detailed_results in step_measurements.items()
+            step_name: ProfilingStepResults.from_step_results(step_results)
+            for step_name, step_results in step_measurements.items()
         }
 
         assert InferenceStep.TOTAL.value in detailed_results
+        latency_histogram = None
+        if all(result.latency_histogram is not None for result in profiling_results):
+            latency_histogram = LatencyHistogram.merged([result.latency_histogram for result in profiling_results])
+            latency_results = ProfilingStepResults.from_histogram(latency_histogram)
+        else:
+            latency_results = ProfilingStepResults(
+                avg_time=float(np.mean([result.avg_latency for result in profiling_results])),
+                std_time=float(np.std([result.std_latency for result in profiling_results])),
+                p50_time=float(np.percentile([result.p50_latency for result in profiling_results], 50)),
+                p90_time=float(np.percentile([result.p90_latency for result in profiling_results], 90)),
+                p95_time=float(np.percentile([result.p95_latency for result in profiling_results], 95)),
+                p99_time=float(np.percentile([result.p99_latency for result in profiling_results], 99)),
+            )
+
+        avg_latency = latency_results.avg_time
+        if concurrency > 1 or request_rate is not None:
+            throughput = float(np.mean([result.throughput for result in profiling_results]))
+        else:
+            throughput = 1000 * (batch_size or 1) / avg_latency
+
         return cls(
             sample_id=profiling_results[0].sample_id,
             batch_size=batch_size,
             avg_gpu_clock=float(avg_gpu_clock),
+            concurrency=concurrency,
+            request_rate=request_rate,
             request_count=int(np.mean([result.request_count for result in profiling_results])),
             detailed_results=detailed_results,
-            avg_latency=detailed_results[InferenceStep.TOTAL.value].avg_time,
-            std_latency=detailed_results[InferenceStep.TOTAL.value].std_time,
-            p50_latency=detailed_results[InferenceStep.TOTAL.value].p50_time,
-            p90_latency=detailed_results[InferenceStep.TOTAL.value].p90_time,
-            p95_latency=detailed_results[InferenceStep.TOTAL.value].p95_time,
-            p99_latency=detailed_results[InferenceStep.TOTAL.value].p99_time,
-            throughput=(1000 * (batch_size or 1) / detailed_results[InferenceStep.TOTAL.value].avg_time),
+            avg_latency=avg_latency,
+            std_latency=latency_results.std_time,
+            p50_latency=latency_results.p50_time,
+            p90_latency=latency_results.p90_time,
+            p95_latency=latency_results.p95_time,
+            p99_latency=latency_results.p99_time,
+            throughput=throughput,
+            peak_rss_memory=_reduce_optional(max, [result.peak_rss_memory for result in profiling_results]),
+            avg_rss_memory=_reduce_optional(np.mean, [result.avg_rss_memory for result in profiling_results]),
+            uss_memory=_reduce_optional(np.mean, [result.uss_memory for result in profiling_results]),
+            peak_python_memory=_reduce_optional(max, [result.peak_python_memory for result in profiling_results]),
+            latency_histogram=latency_histogram,
         )
 
     @classmethod
@@ -240,9 +410,18 @@ class ProfilingResults(DataObject):
     def __str__(self) -> str:
         """Get string representation."""
         avg_gpu_clock = f"{self.avg_gpu_clock:.4f}" if self.avg_gpu_clock is not None else "-"
+        request_rate = f"{self.request_rate:.4f}" if self.request_rate is not None else "-"
+        peak_rss_memory = f"{self.peak_rss_memory:.4f}" if self.peak_rss_memory is not None else "-"
+        avg_rss_memory = f"{self.avg_rss_memory:.4f}" if self.avg_rss_memory is not None else "-"
+        uss_memory = f"{self.uss_memory:.4f}" if self.uss_memory is not None else "-"
+        stability = "-"
+        if self.stability_criterion is not None and self.stability_value is not None:
+            stability = f"{self.stability_value:.4f} [%] ({self.stability_criterion.value})"
         return (
             f"Sample ID: {self.sample_id}\n"
             f"Batch: {self.batch_size}\n"
+            f"Concurrency: {self.concurrency}\n"
+            f"Request rate: {request_rate} [requests/sec]\n"
             f"Request count: {self.request_count}\n"
             f"Throughput: {self.throughput:.4f} [infer/sec]\n"
             f"Avg Latency: {self.avg_latency:.4f} [ms]\n"
@@ -251,5 +430,14 @@ class ProfilingResults(DataObject):
             f"p90 Latency: {self.p90_latency:.4f} [ms]\n"
             f"p95 Latency: {self.p95_latency:.4f} [ms]\n"
             f"p99 Latency: {self.p99_latency:.4f} [ms]\n"
-            f"Avg GPU clock: {avg_gpu_clock} [MHz]"
+            f"Avg GPU clock: {avg_gpu_clock} [MHz]\n"
+            f"Peak RSS memory: {peak_rss_memory} [MB]\n"
+            f"Avg RSS memory: {avg_rss_memory} [MB]\n"
+            f"USS memory: {uss_memory} [MB]\n"
+            f"Stability: {stability}"
         )
+
+
+def _reduce_optional(func: Callable[[List[float]], float], values: List[Optional[float]]) -> Optional[float]:
+    values = [value for value in values if value is not None]
+    return float(func(values)) if values else None
@@ -13,10 +13,38 @@
 # limitations under the License.
 """Profiling utilities."""
 
-from typing import Any, List, Optional
+import dataclasses
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from model_navigator.configuration import ArrivalDistribution, StabilityCriterion
+from model_navigator.configuration.constants import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    DEFAULT_PRUNING_DOMINANCE_FACTOR,
+    DEFAULT_PRUNING_MIN_POINTS,
+)
+
+_BOOTSTRAP_CHUNK_SIZE = 100
+
+
+@dataclasses.dataclass
+class MeasurementStability:
+    """Result of measurement stability verification.
+
+    Args:
+        is_stable: True when measurement is stable.
+        stability_value: Achieved variation in percent compared with the stability percentage.
+        first_window: Index of the first window used in the estimate. Previous windows are rejected as warm-up.
+        median_latency_ci: Confidence interval of the median latency in ms. Provided only by bootstrap criterion.
+    """
+
+    is_stable: bool
+    stability_value: float
+    first_window: int
+    median_latency_ci: Optional[Tuple[float, float]] = None
+
 
 def is_measurement_stable(profiling_results: List, last_n: int, stability_percentage: float) -> bool:
     """Validate if measurement is stable.
@@ -40,6 +68,123 @@ def is_measurement_stable(profiling_results: List, last_n: int, stability_percen
     return np.all(deviation_perc < stability_percentage)
 
 
+def get_measurement_stability(
+    profiling_results: List,
+    last_n: int,
+    stability_percentage: float,
+    stability_criterion: StabilityCriterion,
+    rng: Optional[np.random.Generator] = None,
+) -> MeasurementStability:
+    """Verify measurement stability with selected criterion.
+
+    Args:
+        profiling_results: List of profiling results for consecutive windows.
+        last_n: Minimal number of windows used in the estimate.
+        stability_percentage: Allowed variation in percent.
+        stability_criterion: Criterion used to verify stability.
+        rng: Random numbers generator used by bootstrap. Defaults to a new generator.
+
+    Returns:
+        Stability of the measurement.
+    """
+    if stability_criterion == StabilityCriterion.WINDOW_MEAN:
+        first_window = max(len(profiling_results) - last_n, 0)
+        if len(profiling_results) < last_n:
+            return MeasurementStability(is_stable=False, stability_value=float("inf"), first_window=first_window)
+
+        avg_latencies = np.array([result.avg_latency for result in profiling_results[first_window:]])
+        avg_latency = np.mean(avg_latencies)
+        deviation_perc = float(np.max(np.abs((avg_latencies - avg_latency) / avg_latency * 100)))
+        return MeasurementStability(
+            is_stable=deviation_perc < stability_percentage,
+            stability_value=deviation_perc,
+            first_window=first_window,
+        )
+
+    first_window = get_first_stable_window(profiling_results, stability_percentage)
+    profiling_results = profiling_results[first_window:]
+    if len(profiling_results) < last_n:
+        return MeasurementStability(is_stable=False, stability_value=float("inf"), first_window=first_window)
+
+    if stability_criterion == StabilityCriterion.COEFFICIENT_OF_VARIATION:
+        avg_latencies = np.array([result.avg_latency for result in profiling_results])
+        cv_perc = float(np.std(avg_latencies) / np.mean(avg_latencies) * 100)
+        return MeasurementStability(
+            is_stable=cv_perc < stability_percentage,
+            stability_value=cv_perc,
+            first_window=first_window,
+        )
+
+    latencies = np.concatenate([result.latencies for result in profiling_results])
+    ci_low, ci_high = get_bootstrap_median_ci(latencies, DEFAULT_CONFIDENCE_LEVEL, DEFAULT_BOOTSTRAP_RESAMPLES, rng)
+    ci_half_width_perc = float((ci_high - ci_low) / 2 / np.median(latencies) * 100)
+    return MeasurementStability(
+        is_stable=ci_half_width_perc < stability_percentage,
+        stability_value=ci_half_width_perc,
+        first_window=first_window,
+        median_latency_ci=(ci_low, ci_high),
+    )
+
+
+def get_first_stable_window(profiling_results: List, stability_percentage: float) -> int:
+    """Find the first window after warm-up.
+
+    Leading windows with average latency deviating from the median of all windows by more than
+    stability percentage are rejected as warm-up.
+
+    Args:
+        profiling_results: List of profiling results for consecutive windows.
+        stability_percentage: Allowed variation in percent.
+
+    Returns:
+        Index of the first window after warm-up.
+    """
+    avg_latencies = np.array([result.avg_latency for result in profiling_results])
+    if len(avg_latencies) == 0:
+        return 0
+
+    median_latency = np.median(avg_latencies)
+    deviation_perc = np.abs((avg_latencies - median_latency) / median_latency * 100)
+
+    first_window = 0
+    while first_window < len(avg_latencies) - 1 and deviation_perc[first_window] >= stability_percentage:
+        first_window += 1
+
+    return first_window
+
+
+def get_bootstrap_median_ci(
+    latencies: np.ndarray,
+    confidence_level: float,
+    resamples: int,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[float, float]:
+    """Compute bootstrap percentile confidence interval of the median.
+
+    Args:
+        latencies: Measured latencies.
+        confidence_level: Confidence level of the interval.
+        resamples: Number of bootstrap resamples.
+        rng: Random numbers generator. Defaults to a new generator.
+
+    Returns:
+        Lower and upper bound of the confidence interval.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    latencies = np.asarray(latencies)
+    medians = []
+    for chunk_start in range(0, resamples, _BOOTSTRAP_CHUNK_SIZE):
+        chunk_size = min(_BOOTSTRAP_CHUNK_SIZE, resamples - chunk_start)
+        resampled = rng.choice(latencies, size=(chunk_size, len(latencies)), replace=True)
+        medians.append(np.median(resampled, axis=1))
+
+    alpha = (1 - confidence_level) / 2
+    ci_low, ci_high = np.quantile(np.concatenate(medians), [alpha, 1 - alpha])
+    return float(ci_low), float(ci_high)
+
+
 def is_throughput_saturated(
     profiling_result: Any,
     prev_profiling_result: Any,
@@ -62,3 +207,137 @@ def is_throughput_saturated(
         return False
 
     return profiling_result.throughput < prev_profiling_result.throughput * (1 + throughput_cutoff_threshold)
+
+
+def get_pruning_reference(profiling_results: List[Any]) -> List[Dict[str, Any]]:
+    """Collect the highest closed-loop throughput per batch size from profiling results of many runtimes.
+
+    Args:
+        profiling_results: Profiling results of already profiled runtimes.
+
+    Returns:
+        List of dictionaries with `batch_size` and `throughput` sorted by batch size. Batch size None is placed first.
+    """
+    throughputs = {}
+    for result in profiling_results:
+        if result.concurrency != 1 or result.request_rate is not None:
+            continue
+
+        throughputs[result.batch_size] = max(throughputs.get(result.batch_size, 0.0), result.throughput)
+
+    return [
+        {"batch_size": batch_size, "throughput": throughput}
+        for batch_size, throughput in sorted(throughputs.items(), key=lambda item: -1 if item[0] is None else item[0])
+    ]
+
+
+def is_throughput_dominated(
+    profiling_results: List[Any],
+    pruning_reference: List[Dict[str, Any]],
+    min_points: int = DEFAULT_PRUNING_MIN_POINTS,
+    dominance_factor: float = DEFAULT_PRUNING_DOMINANCE_FACTOR,
+) -> bool:
+    """Validate if the first profiling points are clearly dominated by an already profiled runtime.
+
+    Only the `min_points` smallest batch sizes of closed-loop results with concurrency 1 are verified, so once enough
+    points are collected the verification result does not change with further results.
+
+    Args:
+        profiling_results: Profiling results of the verified runtime.
+        pruning_reference: The highest throughput per batch size from `get_pruning_reference`.
+        min_points: Number of early profiling points which all have to be dominated.
+        dominance_factor: Minimal ratio of the reference throughput to the verified throughput.
+
+    Returns:
+        True when throughput for each of the first points is lower than the reference by the dominance factor.
+        False when there are not enough points or any of them has no reference throughput.
+    """
+    reference = {item["batch_size"]: item["throughput"] for item in pruning_reference}
+    results = [result for result in profiling_results if result.concurrency == 1 and result.request_rate is None]
+    results = sorted(results, key=lambda result: -1 if result.batch_size is None else result.batch_size)[:min_points]
+    if len(results) < min_points:
+        return False
+
+    return all(
+        result.batch_size in reference and result.throughput * dominance_factor < reference[result.batch_size]
+        for result in results
+    )
+
+
+def is_request_rate_sustained(profiling_result: Any, request_rate_tolerance: float) -> bool:
+    """Validate if runner sustained the request rate in open-loop profiling.
+
+    Args:
+        profiling_result: Open-loop profiling results.
+        request_rate_tolerance: Allowed fraction of the request rate by which the achieved rate can be lower.
+
+    Returns:
+        True when the achieved request rate is within tolerance of the requested one or result is not from open-loop
+        profiling, False otherwise.
+    """
+    if profiling_result.request_rate is None:
+        return True
+
+    achieved_request_rate = profiling_result.throughput / (profiling_result.batch_size or 1)
+    return achieved_request_rate >= profiling_result.request_rate * (1 - request_rate_tolerance)
+
+
+def get_arrival_times(
+    request_rate: float,
+    request_count: int,
+    arrival_distribution: ArrivalDistribution,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Generate arrival times of requests for open-loop profiling.
+
+    Requests arrive within the period `request_count / request_rate`. For the Poisson process the arrival times
+    are uniformly distributed in the period, which makes the offered rate exact for each window.
+
+    Args:
+        request_rate: Number of requests per second.
+        request_count: Number of requests to generate.
+        arrival_distribution: Distribution of arrival times.
+        rng: Random numbers generator. Defaults to a new generator.
+
+    Returns:
+        Sorted arrival times in seconds relative to the beginning of the period.
+    """
+    period = request_count / request_rate
+    if arrival_distribution == ArrivalDistribution.CONSTANT:
+        return np.arange(request_count) / request_rate
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    return np.sort(rng.uniform(0.0, period, size=request_count))
+
+
+def get_knee_batch_size(
+    batch_sizes: List[int],
+    throughputs: List[float],
+    throughput_cutoff_threshold: float,
+) -> Optional[int]:
+    """Estimate batch size where throughput saturates.
+
+    Throughput is fitted with the saturation curve `T(b) = T_max * b / (b + k)` using the linear form
+    `1 / T = 1 / T_max + k / T_max * 1 / b`. The knee is the batch size where doubling the batch size increases
+    the throughput by less than `throughput_cutoff_threshold` - the same criterion as `is_throughput_saturated`.
+
+    Args:
+        batch_sizes: Measured batch sizes.
+        throughputs: Throughput measured for each batch size.
+        throughput_cutoff_threshold: Minimum throughput increase when doubling the batch size.
+
+    Returns:
+        Estimated knee batch size or None when the curve cannot be fitted or does not saturate.
+    """
+    if len(batch_sizes) < 2 or len(set(batch_sizes)) < 2 or min(throughputs) <= 0:
+        return None
+
+    slope, intercept = np.polyfit(1 / np.array(batch_sizes), 1 / np.array(throughputs), 1)
+    if intercept <= 0 or slope <= 0:
+        return None
+
+    half_saturation_batch_size = slope / intercept
+    knee = half_saturation_batch_size * (1 - throughput_cutoff_threshold) / (2 * throughput_cutoff_threshold)
+    return max(int(round(knee)), 1)
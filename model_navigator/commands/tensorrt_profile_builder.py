@@ -127,6 +127,18 @@ class TensorRTProfileBuilder(Command):
         LOGGER.info(f"Batch dimension index: {batch_dim}")
         LOGGER.info(f"Using profile generated from dataloader as base profile: {str(dataloader_trt_profile)}")
 
+        # Shapes are selected from the closed-loop batch sizes sweep collected with the lowest concurrency,
+        # latencies of open-loop results include queueing delay
+        profiling_results = [
+            profiling_result for profiling_result in profiling_results if profiling_result.request_rate is None
+        ]
+        concurrency = min(profiling_result.concurrency for profiling_result in profiling_results)
+        profiling_results = [
+            profiling_result for profiling_result in profiling_results if profiling_result.concurrency == concurrency
+        ]
+        # Adaptive batch sizes search may profile batch sizes between the grid points
+        profiling_results = sorted(profiling_results, key=lambda profiling_result: profiling_result.batch_size)
+
         # TODO: Enable when multi-profile support is added.
         fallback_throughput_profiling_result = profiling_results[-1]
         current_throughput_profiling_result = profiling_results[0]
@@ -0,0 +1,286 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of pre-warmed worker processes executing isolated commands."""
+
+import atexit
+import gc
+import importlib
+import importlib.util
+import multiprocessing as mp
+import sys
+import threading
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import psutil
+
+from model_navigator.configuration.constants import (
+    DEFAULT_WORKER_MAX_MEMORY,
+    DEFAULT_WORKER_MAX_TASKS,
+    DEFAULT_WORKER_POOL_MAX_IDLE_WORKERS,
+)
+from model_navigator.core.logger import LOGGER
+from model_navigator.frameworks import Framework
+
+# Modules imported by workers before the first task, depending on the optimized framework
+_FRAMEWORK_MODULES = {
+    Framework.TORCH: ("torch",),
+    Framework.TENSORFLOW: ("tensorflow",),
+    Framework.JAX: ("jax", "tensorflow"),
+    Framework.ONNX: ("onnx",),
+    Framework.TENSORRT: ("tensorrt",),
+    Framework.NONE: (),
+}
+_COMMON_MODULES = ("onnxruntime",)
+
+_WORKER_SHUTDOWN_TIMEOUT = 5.0  # seconds
+
+
+def get_preload_modules(framework: Framework) -> List[str]:
+    """Get installed modules preloaded by workers for the framework.
+
+    Args:
+        framework: Framework of the optimized model
+
+    Returns:
+        List of modules names
+    """
+    modules = _FRAMEWORK_MODULES.get(framework, ()) + _COMMON_MODULES
+    return [module for module in modules if importlib.util.find_spec(module) is not None]
+
+
+class _Worker:
+    """Worker process executing tasks received through a pipe."""
+
+    def __init__(self, context, preload_modules: Sequence[str]):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_connection, list(preload_modules)),
+            name="NavigatorWorker",
+        )
+        self.process.start()
+        child_connection.close()
+        self.num_tasks = 0
+
+    def execute(self, target: Callable, args: Tuple) -> int:
+        self.num_tasks += 1
+        self.connection.send((target, args))
+        try:
+            return self.connection.recv()
+        except (EOFError, ConnectionError):
+            # worker crashed during the task
+            self.process.join()
+            return self.process.exitcode or 1
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def memory(self) -> int:
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    def uses_gpu(self) -> bool:
+        from model_navigator.commands.performance.nvml_handler import NvmlHandler
+
+        with NvmlHandler() as nvml_handler:
+            return self.process.pid in nvml_handler.gpu_processes
+
+    def close(self) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+
+        self.process.join(_WORKER_SHUTDOWN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+        self.connection.close()
+
+
+class WorkerPool:
+    """Pool of worker processes reused between isolated commands.
+
+    Workers are spawned ahead of time and import frameworks before the first task, so a command does not pay for
+    starting the interpreter and importing frameworks. Modules of executed functions are preloaded by workers
+    spawned later. Worker executing a task is not shared with other threads. Worker is recycled after failed task,
+    after `max_tasks` tasks, when its resident memory exceeds `max_memory` or when it holds a CUDA context,
+    so device memory and framework state are not carried over to the next task; a replacement is started
+    in background.
+
+    Example of use:
+
+        pool = WorkerPool()
+        pool.prewarm(preload_modules=["torch"])
+        exitcode = pool.execute(func, args)
+    """
+
+    def __init__(
+        self,
+        max_idle_workers: int = DEFAULT_WORKER_POOL_MAX_IDLE_WORKERS,
+        max_tasks: int = DEFAULT_WORKER_MAX_TASKS,
+        max_memory: int = DEFAULT_WORKER_MAX_MEMORY,
+    ):
+        """Initialize the pool.
+
+        Args:
+            max_idle_workers: Maximal number of idle workers kept in the pool
+            max_tasks: Number of tasks after which worker is recycled
+            max_memory: Resident memory in bytes after which worker is recycled
+        """
+        self.max_idle_workers = max_idle_workers
+        self.max_tasks = max_tasks
+        self.max_memory = max_memory
+        self._context = mp.get_context("spawn")
+        self._idle: List[_Worker] = []
+        self._preload_modules: List[str] = []
+        self._lock = threading.Lock()
+
+    def prewarm(self, num_workers: int = 1, preload_modules: Sequence[str] = ()) -> None:
+        """Start workers in background.
+
+        Args:
+            num_workers: Number of idle workers to have in the pool, limited by `max_idle_workers`
+            preload_modules: Additional modules imported by new workers
+        """
+        with self._lock:
+            self._add_preload_modules(preload_modules)
+            while len(self._idle) < min(num_workers, self.max_idle_workers):
+                self._idle.append(_Worker(self._context, self._preload_modules))
+
+    def execute(self, target: Callable, args: Tuple = ()) -> int:
+        """Execute function in a worker process.
+
+        Args:
+            target: Function to execute, must be picklable
+            args: Arguments of the function, must be picklable
+
+        Returns:
+            Exit code - 0 on success, 1 when function raised an exception, other values when the worker crashed
+        """
+        modules = [arg.__module__ for arg in (target, *args) if callable(arg) and hasattr(arg, "__module__")]
+        worker = self._acquire()
+        exitcode = 1
+        try:
+            exitcode = worker.execute(target, args)
+        finally:
+            self._release(worker, recycle=exitcode != 0, preload_modules=modules)
+
+        return exitcode
+
+    def shutdown(self) -> None:
+        """Stop all idle workers."""
+        with self._lock:
+            workers, self._idle = self._idle, []
+
+        for worker in workers:
+            worker.close()
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop(0)
+                if worker.is_alive():
+                    return worker
+
+                worker.close()
+
+            return _Worker(self._context, self._preload_modules)
+
+    def _release(self, worker: _Worker, recycle: bool, preload_modules: Sequence[str]) -> None:
+        if not recycle and worker.num_tasks >= self.max_tasks:
+            LOGGER.debug(f"Recycling worker {worker.process.pid} after {worker.num_tasks} tasks.")
+            recycle = True
+        elif not recycle and worker.memory() > self.max_memory:
+            LOGGER.debug(f"Recycling worker {worker.process.pid} exceeding memory limit.")
+            recycle = True
+        elif not recycle and worker.uses_gpu():
+            LOGGER.debug(f"Recycling worker {worker.process.pid} holding a CUDA context.")
+            recycle = True
+
+        with self._lock:
+            self._add_preload_modules(preload_modules)
+            if not recycle and worker.is_alive() and len(self._idle) < self.max_idle_workers:
+                self._idle.append(worker)
+                return
+
+            if not self._idle:
+                # warm replacement
+                self._idle.append(_Worker(self._context, self._preload_modules))
+
+        worker.close()
+
+    def _add_preload_modules(self, modules: Sequence[str]) -> None:
+        for module in modules:
+            if module not in self._preload_modules and module != "__main__":
+                self._preload_modules.append(module)
+
+
+_pool: Optional[WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """Get worker pool shared by commands of the current process.
+
+    Returns:
+        WorkerPool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool()
+            atexit.register(_pool.shutdown)
+
+        return _pool
+
+
+def _worker_main(connection, preload_modules: List[str]) -> None:
+    for module in preload_modules:
+        try:
+            importlib.import_module(module)
+        except Exception:  # noqa: S112
+            # the module is imported again by the task
+            continue
+
+    while True:
+        try:
+            task = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if task is None:
+            break
+
+        target, args = task
+        stdout, stderr = sys.stdout, sys.stderr
+        try:
+            target(*args)
+            exitcode = 0
+        except SystemExit as e:
+            exitcode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except BaseException:
+            exitcode = 1
+        finally:
+            # tasks may redirect standard streams, e.g. to hide exceptions
+            sys.stdout, sys.stderr = stdout, stderr
+            LOGGER.complete()
+            gc.collect()
+
+        connection.send(exitcode)
+
+    connection.close()
@@ -206,6 +206,62 @@ class TensorRTCompatibilityLevel(Enum):
     AMPERE_PLUS = "ampere_plus"
 
 
+class OnnxGraphOptimizationLevel(Enum):
+    """Graph optimization level applied by ONNX Runtime when creating inference session.
+
+    Args:
+        DISABLE (str): Disable all graph optimizations.
+        BASIC (str): Semantics preserving optimizations like constant folding and redundant nodes elimination.
+        EXTENDED (str): Basic optimizations and complex nodes fusions.
+        ALL (str): Extended optimizations and layout optimizations.
+    """
+
+    DISABLE = "disable"
+    BASIC = "basic"
+    EXTENDED = "extended"
+    ALL = "all"
+
+
+class OnnxExecutionMode(Enum):
+    """Execution mode of ONNX Runtime inference session.
+
+    Args:
+        SEQUENTIAL (str): Execute operators one after another.
+        PARALLEL (str): Execute independent operators in parallel using inter-op threads.
+    """
+
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
+class ArrivalDistribution(Enum):
+    """Distribution of requests arrival times used in open-loop profiling.
+
+    Args:
+        CONSTANT (str): Requests are sent in equal intervals.
+        POISSON (str): Requests are sent in random intervals following the Poisson process.
+    """
+
+    CONSTANT = "constant"
+    POISSON = "poisson"
+
+
+class StabilityCriterion(Enum):
+    """Criterion used to decide when measurement is stable.
+
+    Args:
+        WINDOW_MEAN (str): Average latency of the last windows deviates from their mean less than stability percentage.
+        BOOTSTRAP_MEDIAN (str): Half-width of the bootstrap confidence interval of the median latency is below
+            stability percentage of the median. Warm-up windows are rejected.
+        COEFFICIENT_OF_VARIATION (str): Coefficient of variation of average latency of the windows is below
+            stability percentage. Warm-up windows are rejected.
+    """
+
+    WINDOW_MEAN = "window_mean"
+    BOOTSTRAP_MEDIAN = "bootstrap_median"
+    COEFFICIENT_OF_VARIATION = "coefficient_of_variation"
+
+
 @dataclasses.dataclass
 class ShapeTuple(DataObject):
     """Represents a set of shapes for a single binding in a profile.
@@ -247,6 +303,21 @@ class OptimizationProfile(DataObject):
     If the measurements are not stable after `max_trials` trials, the profiler will stop with an error.
     Profiler will also stop profiling when the throughput does not increase at least by `throughput_cutoff_threshold`.
 
+    When `concurrency` is provided, the batch sizes sweep is repeated for each concurrency level. Levels above 1
+    are executed by multiple threads sending requests to the same runner, so only runners which are thread-safe
+    are profiled with them.
+
+    When `request_rates` are provided, the profiler additionally runs open-loop measurements for the first batch size.
+    Requests are sent at a given rate following `arrival_distribution` regardless of the pending requests,
+    and the reported latency includes the time request waited in the queue. The request rates are profiled
+    in the ascending order until the runner is not able to sustain the rate.
+
+    When `cpu_threads` are provided, runners executing only on CPU first sweep threading configurations for
+    a single batch size: framework defaults and each number of intra-op threads with and without pinning
+    the process to CPUs. With `cpu_instances`, the available CPUs are additionally split between multiple
+    concurrently running model instances and their throughput is summed. The best configuration is stored in
+    the model runner configuration and used for the full profiling, by `Package.get_runner` and in
+    the Triton model configuration.
 
     Args:
         max_batch_size: Maximal batch size used during conversion and profiling. None mean automatic search is enabled.
@@ -260,6 +331,22 @@ class OptimizationProfile(DataObject):
         throughput_backoff_limit: Back-off limit to run multiple more profiling steps to avoid stop at local minimum
                                   when throughput saturate based on `throughput_cutoff_threshold`.
         dataloader: Optional dataloader for profiling. Use only 1 sample.
+        concurrency: List of numbers of concurrent in-flight requests to profile. None mean single request at a time.
+        request_rates: List of request rates [requests/sec] used for open-loop profiling. None mean open-loop
+                       profiling is disabled.
+        arrival_distribution: Distribution of requests arrival times in open-loop profiling.
+        stability_criterion: Criterion used to decide when measurement is stable.
+        adaptive_batch_sizes: Refine automatic batch sizes search. Failures do not stop profiling, the boundary between
+                              working and failing batch sizes is bisected and the batch size where throughput
+                              saturates is estimated from the measured curve and profiled.
+        cache_results: Reuse profiling results stored in the profiling cache when the model, runner, profile,
+                       samples and environment did not change.
+        profile_memory: Sample resident and unique memory of the profiling process during measurement windows.
+        trace_python_allocations: Additionally collect peak of Python allocations with tracemalloc when memory is
+                                  profiled. Tracing slows down allocations so it affects measured latency.
+        cpu_threads: List of numbers of intra-op threads swept for CPU runners. None mean the sweep is disabled.
+        cpu_instances: List of numbers of concurrent model instances swept together with `cpu_threads`.
+                       None mean a single instance.
     """
 
     max_batch_size: Optional[int] = None
@@ -272,9 +359,22 @@ class OptimizationProfile(DataObject):
     throughput_cutoff_threshold: Optional[float] = DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD
     throughput_backoff_limit: int = DEFAULT_THROUGHPUT_BACKOFF_LIMIT
     dataloader: Optional[SizedDataLoader] = None
+    concurrency: Optional[List[int]] = None
+    request_rates: Optional[List[float]] = None
+    arrival_distribution: ArrivalDistribution = ArrivalDistribution.POISSON
+    stability_criterion: StabilityCriterion = StabilityCriterion.WINDOW_MEAN
+    adaptive_batch_sizes: bool = False
+    cache_results: bool = False
+    profile_memory: bool = False
+    trace_python_allocations: bool = False
+    cpu_threads: Optional[List[int]] = None
+    cpu_instances: Optional[List[int]] = None
 
     def __post_init__(self):
         """Validate OptimizationProfile definition to avoid unsupported configurations."""
+        self.arrival_distribution = ArrivalDistribution(self.arrival_distribution)
+        self.stability_criterion = StabilityCriterion(self.stability_criterion)
+
         if self.stability_percentage <= 0:
             raise ModelNavigatorConfigurationError("`stability_percentage` must be greater than 0.0.")
 
@@ -301,6 +401,21 @@ class OptimizationProfile(DataObject):
         if self.min_trials > self.max_trials:
             raise ModelNavigatorConfigurationError("`max_trials` must be greater or equal `min_trials`.")
 
+        if self.concurrency is not None and any(value < 1 for value in self.concurrency):
+            raise ModelNavigatorConfigurationError("`concurrency` values must be greater or equal 1.")
+
+        if self.request_rates is not None and any(value <= 0 for value in self.request_rates):
+            raise ModelNavigatorConfigurationError("`request_rates` values must be greater than 0.0.")
+
+        if self.cpu_threads is not None and any(value < 1 for value in self.cpu_threads):
+            raise ModelNavigatorConfigurationError("`cpu_threads` values must be greater or equal 1.")
+
+        if self.cpu_instances is not None and any(value < 1 for value in self.cpu_instances):
+            raise ModelNavigatorConfigurationError("`cpu_instances` values must be greater or equal 1.")
+
+        if self.cpu_instances is not None and self.cpu_threads is None:
+            raise ModelNavigatorConfigurationError("`cpu_instances` requires `cpu_threads` to be provided.")
+
     def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
         """Serialize to a dictionary.
 
@@ -345,6 +460,16 @@ class OptimizationProfile(DataObject):
             throughput_backoff_limit=optimization_profile_dict.get(
                 "throughput_backoff_limit", DEFAULT_THROUGHPUT_BACKOFF_LIMIT
             ),
+            concurrency=optimization_profile_dict.get("concurrency"),
+            request_rates=optimization_profile_dict.get("request_rates"),
+            arrival_distribution=optimization_profile_dict.get("arrival_distribution", ArrivalDistribution.POISSON),
+            stability_criterion=optimization_profile_dict.get("stability_criterion", StabilityCriterion.WINDOW_MEAN),
+            adaptive_batch_sizes=optimization_profile_dict.get("adaptive_batch_sizes", False),
+            cache_results=optimization_profile_dict.get("cache_results", False),
+            profile_memory=optimization_profile_dict.get("profile_memory", False),
+            trace_python_allocations=optimization_profile_dict.get("trace_python_allocations", False),
+            cpu_threads=optimization_profile_dict.get("cpu_threads"),
+            cpu_instances=optimization_profile_dict.get("cpu_instances"),
         )
 
     def clone(self) -> "OptimizationProfile":
@@ -876,6 +1001,13 @@ class OnnxConfig(CustomConfigForFormat):
         graph_surgeon_optimization: Enables polygraphy graph surgeon optimization: fold_constants, infer_shapes, toposort, cleanup.
         export_device: Device used for ONNX export.
         model_path: optional path to onnx model file, if provided the model will be loaded from the file instead of exporting to onnx
+        graph_optimization_levels: ONNX Runtime graph optimization levels. Each level creates separate ONNX model
+            variant, so the levels are compared during profiling. None mean ONNX Runtime default level.
+        execution_mode: ONNX Runtime session execution mode. None mean ONNX Runtime default mode.
+        enable_mem_arena: Enable or disable CPU memory arena. None mean ONNX Runtime default.
+        enable_mem_pattern: Enable or disable memory pattern optimization. None mean ONNX Runtime default.
+        cache_optimized_model: Store the graph optimized by ONNX Runtime in the workspace on the first session
+            creation and load it on the next ones without optimizing the graph again.
     """
 
     opset: Optional[int] = DEFAULT_ONNX_OPSET
@@ -886,6 +1018,20 @@ class OnnxConfig(CustomConfigForFormat):
     graph_surgeon_optimization: bool = True
     export_device: Optional[str] = None
     model_path: Optional[Union[str, pathlib.Path]] = None
+    graph_optimization_levels: Optional[List[OnnxGraphOptimizationLevel]] = None
+    execution_mode: Optional[OnnxExecutionMode] = None
+    enable_mem_arena: Optional[bool] = None
+    enable_mem_pattern: Optional[bool] = None
+    cache_optimized_model: bool = False
+
+    def __post_init__(self) -> None:
+        """Parse dataclass enums."""
+        if self.graph_optimization_levels is not None:
+            self.graph_optimization_levels = [
+                OnnxGraphOptimizationLevel(level) for level in self.graph_optimization_levels
+            ]
+        if self.execution_mode is not None:
+            self.execution_mode = OnnxExecutionMode(self.execution_mode)
 
     @property
     def format(self) -> Format:
@@ -1054,6 +1200,26 @@ class MaxThroughputWithLatencyBudgetStrategy(RuntimeSearchStrategy):
         return f"{self.__class__.__name__}({self.latency_budget}[ms])"
 
 
+class MaxThroughputWithMemoryBudgetStrategy(RuntimeSearchStrategy):
+    """Get runtime with the highest throughput within the peak memory budget.
+
+    Requires profiling with `OptimizationProfile.profile_memory` enabled. Results without memory data are skipped.
+    """
+
+    def __init__(self, memory_budget: float) -> None:
+        """Initialize the class.
+
+        Args:
+            memory_budget: Peak resident memory budget in megabytes.
+        """
+        super().__init__()
+        self.memory_budget = memory_budget
+
+    def __str__(self):
+        """Return name of strategy."""
+        return f"{self.__class__.__name__}({self.memory_budget}[MB])"
+
+
 class SelectedRuntimeStrategy(RuntimeSearchStrategy):
     """Get a selected runtime."""
 
@@ -24,6 +24,11 @@ from model_navigator.configuration import (
     SizedDataLoader,
     VerifyFunction,
 )
+from model_navigator.configuration.constants import (
+    DEFAULT_DATALOADER_PREFETCH_DEPTH,
+    DEFAULT_DATALOADER_WORKERS,
+    DEFAULT_PIPELINE_WORKERS,
+)
 from model_navigator.frameworks import Framework
 from model_navigator.utils.common import DataObject
 
@@ -48,6 +53,22 @@ class CommonConfig(DataObject):
     verify_func: Optional[VerifyFunction] = None
     custom_configs: Dict[str, CustomConfig] = dataclasses.field(default_factory=lambda: {})
 
+    # Maximal batch size of samples concatenated for generating reference outputs and correctness tests
+    correctness_batch_size: Optional[int] = None
+
+    # Samples loaded ahead from the dataloader and number of threads loading them
+    dataloader_prefetch_depth: int = DEFAULT_DATALOADER_PREFETCH_DEPTH
+    dataloader_workers: int = DEFAULT_DATALOADER_WORKERS
+
+    # Number of threads executing independent pipeline commands concurrently
+    pipeline_workers: int = DEFAULT_PIPELINE_WORKERS
+
+    # Reuse existing workspace and replay cached outputs of commands
+    resume: bool = False
+
+    # Maximal time in seconds spent on optimization
+    time_budget: Optional[float] = None
+
     # Verbose logging - enable debug mode in export and conversion paths
     verbose: bool = False
 
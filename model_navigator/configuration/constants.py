@@ -27,9 +27,43 @@ DEFAULT_STABILITY_PERCENTAGE: float = 10.0
 DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD = 0.05
 DEFAULT_LATENCY_CUTOFF_THRESHOLD = 0.1
 DEFAULT_THROUGHPUT_BACKOFF_LIMIT = 2
+DEFAULT_REQUEST_RATE_TOLERANCE = 0.1
+DEFAULT_PROFILING_CACHE_MAX_ENTRIES = 1024
+DEFAULT_ADAPTIVE_SEARCH_STEPS = 3
+DEFAULT_PRUNING_MIN_POINTS = 2
+DEFAULT_PRUNING_DOMINANCE_FACTOR = 2.0
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+DEFAULT_BOOTSTRAP_RESAMPLES = 1000
+DEFAULT_HISTOGRAM_LOWEST_VALUE = 1e-3  # ms
+DEFAULT_HISTOGRAM_HIGHEST_VALUE = 3.6e6  # ms
+DEFAULT_HISTOGRAM_PRECISION = 0.005
+DEFAULT_MEMORY_SAMPLING_INTERVAL = 0.01  # sec
 
 # Dataloader related
 DEFAULT_SAMPLE_COUNT = 100
+DEFAULT_SAMPLES_WRITER_WORKERS = 4
+DEFAULT_SAMPLES_WRITER_MAX_PENDING = 8
+DEFAULT_EXPANDED_SAMPLES_CACHE_SIZE = 4
+DEFAULT_DATALOADER_PREFETCH_DEPTH = 0  # disabled
+DEFAULT_DATALOADER_WORKERS = 1
+
+# Correctness related
+DEFAULT_COMPARISON_CHUNK_SIZE = 2**20  # elements
+DEFAULT_ERROR_PERCENTILE = 99.0
+
+# Pipelines execution related
+DEFAULT_PIPELINE_WORKERS = 1  # sequential execution
+DEFAULT_CUDA_DEVICE_TOKENS = 1
+
+# Worker pool related
+DEFAULT_WORKER_POOL_MAX_IDLE_WORKERS = 2
+DEFAULT_WORKER_MAX_TASKS = 32
+DEFAULT_WORKER_MAX_MEMORY = 4 * 2**30  # bytes
+
+# Tracing related
+DEFAULT_TRACE_MAX_EVENTS = 200_000
+NAVIGATOR_TRACE_FILENAME = "trace.json"
+NAVIGATOR_PROFILING_TRACE_FILENAME = "profiling_trace.json"
 
 # TensorRT conversion related
 DEFAULT_MAX_WORKSPACE_SIZE = 8589934592
@@ -58,6 +92,10 @@ DEFAULT_COMPARISON_REPORT_FILE = "report.yaml"
 
 # Subcommands isolation
 NAVIGATOR_USE_MULTIPROCESSING = "NAVIGATOR_USE_MULTIPROCESSING"
+NAVIGATOR_USE_WORKER_POOL = "NAVIGATOR_USE_WORKER_POOL"
+
+# Tracing
+NAVIGATOR_USE_TRACING = "NAVIGATOR_USE_TRACING"
 
 # ONNX Opset
 _DEFAULT_ONNX_OPSET_TORCH_2_4 = 17
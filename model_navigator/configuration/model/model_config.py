@@ -21,12 +21,18 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from model_navigator.configuration import (
     Format,
     JitType,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
     TensorRTCompatibilityLevel,
     TensorRTPrecision,
     TensorRTPrecisionMode,
     TensorRTProfile,
 )
-from model_navigator.configuration.runner.runner_config import DeviceRunnerConfig, TorchRunnerConfig
+from model_navigator.configuration.runner.runner_config import (
+    DeviceRunnerConfig,
+    OnnxRunnerConfig,
+    TorchRunnerConfig,
+)
 from model_navigator.utils.common import DataObject
 from model_navigator.utils.format_helpers import FORMAT2SUFFIX, is_source_format
 
@@ -84,7 +90,14 @@ class ModelConfig(ABC, DataObject):
         Returns:
             Subclass of ModelConfig representing particular model configuration
         """
-        return cls._subclasses[Format(data_dict["format"])]._from_dict(data_dict)
+        model_config = cls._subclasses[Format(data_dict["format"])]._from_dict(data_dict)
+
+        # Threading parameters are tuned during profiling, so they are restored for every runner configuration
+        runner_config = getattr(model_config, "runner_config", None)
+        if runner_config is not None:
+            runner_config.update_threading(**runner_config.parse_threading_dict(data_dict))
+
+        return model_config
 
     def to_dict(self, *_, **__) -> dict:
         """Returns dictionary representation of the object.
@@ -302,6 +315,7 @@ class TensorFlowSavedModelConfig(_SerializedModelConfig, format=Format.TF_SAVEDM
         super().__init__(parent=parent, custom_args=custom_args)
         self.jit_compile = jit_compile
         self.enable_xla = enable_xla
+        self.runner_config = DeviceRunnerConfig(device=None)
 
     def _get_path_params_as_array_of_strings(self) -> List[str]:
         params = []
@@ -424,6 +438,11 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
         device: Optional[str] = None,
         export_device: Optional[str] = None,
         model_path: Optional[Union[str, pathlib.Path]] = None,
+        graph_optimization_level: Optional[OnnxGraphOptimizationLevel] = None,
+        execution_mode: Optional[OnnxExecutionMode] = None,
+        enable_mem_arena: Optional[bool] = None,
+        enable_mem_pattern: Optional[bool] = None,
+        cache_optimized_model: bool = False,
     ) -> None:
         """Initializes ONNX model configuration class.
 
@@ -438,6 +457,11 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
             device: runtime device e.g. "cuda:0"
             export_device: Device used for export
             model_path: optional path to onnx model file, if provided the model will be loaded from the file instead of exporting to ONNX
+            graph_optimization_level: ONNX Runtime graph optimization level
+            execution_mode: ONNX Runtime session execution mode
+            enable_mem_arena: Enable or disable ONNX Runtime CPU memory arena
+            enable_mem_pattern: Enable or disable ONNX Runtime memory pattern optimization
+            cache_optimized_model: Store graph optimized by ONNX Runtime and reuse it on next session creation
         """
         super().__init__(parent=parent)
         self.opset = opset
@@ -447,11 +471,21 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
         self.dynamo_dynamic_shapes = dynamo_dynamic_shapes
         self.custom_args = custom_args
         self.export_device = export_device
-        self.runner_config = DeviceRunnerConfig(device=device)
+        self.runner_config = OnnxRunnerConfig(
+            device=device,
+            graph_optimization_level=graph_optimization_level,
+            execution_mode=execution_mode,
+            enable_mem_arena=enable_mem_arena,
+            enable_mem_pattern=enable_mem_pattern,
+            cache_optimized_model=cache_optimized_model,
+        )
         self.model_path = model_path
 
     def _get_path_params_as_array_of_strings(self) -> List[str]:
-        return ["dynamo"] if self.dynamo_export else []
+        params = ["dynamo"] if self.dynamo_export else []
+        if self.runner_config.graph_optimization_level is not None:
+            params.append(f"ort-{self.runner_config.graph_optimization_level.value}")
+        return params
 
     @classmethod
     def _from_dict(cls, data_dict: Dict):
@@ -465,6 +499,11 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
             device=data_dict.get("device"),
             export_device=data_dict.get("export_device"),
             model_path=data_dict.get("model_path"),
+            graph_optimization_level=data_dict.get("graph_optimization_level"),
+            execution_mode=data_dict.get("execution_mode"),
+            enable_mem_arena=data_dict.get("enable_mem_arena"),
+            enable_mem_pattern=data_dict.get("enable_mem_pattern"),
+            cache_optimized_model=data_dict.get("cache_optimized_model", False),
         )
 
 
@@ -49,6 +49,12 @@ def _get_custom_config(
     return custom_config_cls()
 
 
+def _get_onnx_graph_optimization_levels(
+    onnx_config: config_api.OnnxConfig,
+) -> List[Optional[config_api.OnnxGraphOptimizationLevel]]:
+    return list(onnx_config.graph_optimization_levels or [None])
+
+
 class ModelConfigBuilder:
     """Class used for generating model configurations."""
 
@@ -377,8 +383,11 @@ class ModelConfigBuilder:
             model_configs: Dictionary mapping model formats to lists of model configs
         """
         onnx_config = _get_custom_config(custom_configs=custom_configs, custom_config_cls=config_api.OnnxConfig)
+        graph_optimization_levels = _get_onnx_graph_optimization_levels(onnx_config)
         if framework in (Framework.TENSORFLOW, Framework.JAX):
-            for model_configuration in model_configs[Format.TF_SAVEDMODEL]:
+            for model_configuration, graph_optimization_level in product(
+                model_configs[Format.TF_SAVEDMODEL], graph_optimization_levels
+            ):
                 model_configs[Format.ONNX].append(
                     model_config.ONNXModelConfig(
                         parent=model_configuration,
@@ -389,23 +398,35 @@ class ModelConfigBuilder:
                         custom_args=onnx_config.custom_args,
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
+                        graph_optimization_level=graph_optimization_level,
+                        execution_mode=onnx_config.execution_mode,
+                        enable_mem_arena=onnx_config.enable_mem_arena,
+                        enable_mem_pattern=onnx_config.enable_mem_pattern,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                     )
                 )
         if framework == Framework.ONNX:
-            model_configs[Format.ONNX].append(
-                model_config.ONNXModelConfig(
-                    parent=None,
-                    opset=onnx_config.opset,
-                    dynamo_export=False,
-                    graph_surgeon_optimization=onnx_config.graph_surgeon_optimization,
-                    dynamic_axes=onnx_config.dynamic_axes,
-                    custom_args=onnx_config.custom_args,
-                    device=onnx_config.device,
-                    export_device=onnx_config.export_device,
+            for graph_optimization_level in graph_optimization_levels:
+                model_configs[Format.ONNX].append(
+                    model_config.ONNXModelConfig(
+                        parent=None,
+                        opset=onnx_config.opset,
+                        dynamo_export=False,
+                        graph_surgeon_optimization=onnx_config.graph_surgeon_optimization,
+                        dynamic_axes=onnx_config.dynamic_axes,
+                        custom_args=onnx_config.custom_args,
+                        device=onnx_config.device,
+                        export_device=onnx_config.export_device,
+                        graph_optimization_level=graph_optimization_level,
+                        execution_mode=onnx_config.execution_mode,
+                        enable_mem_arena=onnx_config.enable_mem_arena,
+                        enable_mem_pattern=onnx_config.enable_mem_pattern,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
+                    )
                 )
-            )
         if framework == Framework.TORCH:
-            for dynamo_export in (True, False) if onnx_config.dynamo_export else (False,):
+            dynamo_exports = (True, False) if onnx_config.dynamo_export else (False,)
+            for dynamo_export, graph_optimization_level in product(dynamo_exports, graph_optimization_levels):
                 model_configs[Format.ONNX].append(
                     model_config.ONNXModelConfig(
                         parent=None,
@@ -417,11 +438,18 @@ class ModelConfigBuilder:
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
                         model_path=onnx_config.model_path,
+                        graph_optimization_level=graph_optimization_level,
+                        execution_mode=onnx_config.execution_mode,
+                        enable_mem_arena=onnx_config.enable_mem_arena,
+                        enable_mem_pattern=onnx_config.enable_mem_pattern,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                     )
                 )
 
         if framework == Framework.TORCH and onnx_config.onnx_extended_conversion:
-            for model_configuration in model_configs[Format.TORCHSCRIPT]:
+            for model_configuration, graph_optimization_level in product(
+                model_configs[Format.TORCHSCRIPT], graph_optimization_levels
+            ):
                 model_configs[Format.ONNX].append(
                     model_config.ONNXModelConfig(
                         parent=model_configuration,
@@ -432,6 +460,11 @@ class ModelConfigBuilder:
                         custom_args=onnx_config.custom_args,
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
+                        graph_optimization_level=graph_optimization_level,
+                        execution_mode=onnx_config.execution_mode,
+                        enable_mem_arena=onnx_config.enable_mem_arena,
+                        enable_mem_pattern=onnx_config.enable_mem_pattern,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                     )
                 )
 
@@ -467,7 +500,15 @@ class ModelConfigBuilder:
                 )
             )
         else:
-            for model_configuration, precision in product(model_configs[Format.ONNX], trt_config.precision):
+            # ONNX Runtime graph optimization levels do not change the ONNX model used for TensorRT conversion
+            onnx_config = _get_custom_config(custom_configs=custom_configs, custom_config_cls=config_api.OnnxConfig)
+            graph_optimization_level = _get_onnx_graph_optimization_levels(onnx_config)[0]
+            onnx_model_configs = [
+                model_configuration
+                for model_configuration in model_configs[Format.ONNX]
+                if model_configuration.runner_config.graph_optimization_level == graph_optimization_level
+            ]
+            for model_configuration, precision in product(onnx_model_configs, trt_config.precision):
                 model_configs[Format.TENSORRT].append(
                     model_config.TensorRTModelConfig(
                         parent=model_configuration,
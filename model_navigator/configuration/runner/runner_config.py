@@ -15,14 +15,93 @@
 """This module contains classes representing runner configurations."""
 
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 
+from model_navigator.configuration import OnnxExecutionMode, OnnxGraphOptimizationLevel
 from model_navigator.utils.common import DataObject
 
 
 class RunnerConfig(ABC, DataObject):
     """Abstract runner configuration class."""
 
+    def __init__(
+        self,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cpu_affinity: Optional[List[int]] = None,
+        instance_count: Optional[int] = None,
+    ) -> None:
+        """Initializes runner configuration class.
+
+        Threading parameters are applied only by runners executing on CPU.
+        None means the framework defaults are used.
+
+        Args:
+            intra_op_threads: Number of threads used to parallelize execution of a single operator
+            inter_op_threads: Number of threads used to execute independent operators in parallel
+            cpu_affinity: Logical CPUs the runner process is pinned to
+            instance_count: Number of model instances executed concurrently, each on its share of `cpu_affinity`
+        """
+        self.update_threading(
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=inter_op_threads,
+            cpu_affinity=cpu_affinity,
+            instance_count=instance_count,
+        )
+
+    def update_threading(
+        self,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cpu_affinity: Optional[List[int]] = None,
+        instance_count: Optional[int] = None,
+    ) -> None:
+        """Overrides threading parameters of the runner.
+
+        Args:
+            intra_op_threads: Number of threads used to parallelize execution of a single operator
+            inter_op_threads: Number of threads used to execute independent operators in parallel
+            cpu_affinity: Logical CPUs the runner process is pinned to
+            instance_count: Number of model instances executed concurrently, each on its share of `cpu_affinity`
+        """
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.cpu_affinity = list(cpu_affinity) if cpu_affinity is not None else None
+        self.instance_count = instance_count
+
+    def get_threading_dict(self) -> Dict:
+        """Returns threading parameters which differ from the framework defaults.
+
+        Returns:
+            Dictionary with configured threading parameters
+        """
+        threading = {
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+            "cpu_affinity": self.cpu_affinity,
+            "instance_count": self.instance_count,
+        }
+        return {key: value for key, value in threading.items() if value is not None}
+
+    @classmethod
+    def parse_threading_dict(cls, data_dict: Dict) -> Dict:
+        """Parses threading parameters from dictionary.
+
+        Args:
+            data_dict: Dictionary with runner or model configuration data
+
+        Returns:
+            Dictionary with threading parameters accepted by `update_threading`
+        """
+        cpu_affinity = data_dict.get("cpu_affinity")
+        return {
+            "intra_op_threads": cls._parse_string(int, data_dict.get("intra_op_threads")),
+            "inter_op_threads": cls._parse_string(int, data_dict.get("inter_op_threads")),
+            "cpu_affinity": [int(cpu) for cpu in cpu_affinity] if cpu_affinity is not None else None,
+            "instance_count": cls._parse_string(int, data_dict.get("instance_count")),
+        }
+
     @classmethod
     @abstractmethod
     def from_dict(cls, data_dict: Dict):
@@ -80,6 +159,7 @@ class TorchRunnerConfig(RunnerConfig):
         device: Optional[str],
         autocast_dtype: Optional[str] = None,
         custom_args: Optional[Dict[str, Any]] = None,
+        **threading,
     ) -> None:
         """Initializes Torch runner configuration class.
 
@@ -89,8 +169,9 @@ class TorchRunnerConfig(RunnerConfig):
             device: The target device on which mode has to be loaded
             autocast_dtype: The dtype to use for autocast
             custom_args: Additional keyword arguments used for model export and conversions
+            threading: Threading parameters, see `RunnerConfig`
         """
-        super().__init__()
+        super().__init__(**threading)
         self.autocast = autocast
         self.inference_mode = inference_mode
         self.device = device
@@ -113,6 +194,7 @@ class TorchRunnerConfig(RunnerConfig):
             autocast_dtype=data_dict.get("autocast_dtype"),
             device=data_dict.get("device"),
             custom_args=data_dict.get("custom_args"),  # TODO(kn): parse_string int ?
+            **cls.parse_threading_dict(data_dict),
         )
 
     def to_dict(self, parse: bool = False, *_, **__) -> Dict:
@@ -130,19 +212,21 @@ class TorchRunnerConfig(RunnerConfig):
             "device": self.device,
             "autocast_dtype": self.autocast_dtype,
             "custom_args": self.custom_args,
+            **self.get_threading_dict(),
         }
 
 
 class DeviceRunnerConfig(RunnerConfig):
     """Device supported runner configuration class."""
 
-    def __init__(self, device: Optional[str]) -> None:
+    def __init__(self, device: Optional[str], **threading) -> None:
         """Initializes device based runner configuration class.
 
         Args:
             device: The target device on which mode has to be loaded
+            threading: Threading parameters, see `RunnerConfig`
         """
-        super().__init__()
+        super().__init__(**threading)
         self.device = device
 
     @classmethod
@@ -150,6 +234,7 @@ class DeviceRunnerConfig(RunnerConfig):
         """Initializes device based runner."""
         return cls(
             device=data_dict.get("device"),
+            **cls.parse_threading_dict(data_dict),
         )
 
     def to_dict(self, *_, **__) -> Dict:
@@ -160,4 +245,77 @@ class DeviceRunnerConfig(RunnerConfig):
         """
         return {
             "device": self.device,
+            **self.get_threading_dict(),
         }
+
+
+class OnnxRunnerConfig(DeviceRunnerConfig):
+    """ONNX Runtime runner configuration class."""
+
+    def __init__(
+        self,
+        device: Optional[str],
+        graph_optimization_level: Optional[OnnxGraphOptimizationLevel] = None,
+        execution_mode: Optional[OnnxExecutionMode] = None,
+        enable_mem_arena: Optional[bool] = None,
+        enable_mem_pattern: Optional[bool] = None,
+        cache_optimized_model: bool = False,
+        **threading,
+    ) -> None:
+        """Initializes ONNX Runtime runner configuration class.
+
+        Args:
+            device: The target device on which mode has to be loaded
+            graph_optimization_level: Graph optimization level of the session
+            execution_mode: Execution mode of the session
+            enable_mem_arena: Enable or disable CPU memory arena
+            enable_mem_pattern: Enable or disable memory pattern optimization
+            cache_optimized_model: Store optimized graph in the workspace and reuse it on next session creation
+            threading: Threading parameters, see `RunnerConfig`
+        """
+        super().__init__(device=device, **threading)
+        self.graph_optimization_level = (
+            OnnxGraphOptimizationLevel(graph_optimization_level) if graph_optimization_level is not None else None
+        )
+        self.execution_mode = OnnxExecutionMode(execution_mode) if execution_mode is not None else None
+        self.enable_mem_arena = enable_mem_arena
+        self.enable_mem_pattern = enable_mem_pattern
+        self.cache_optimized_model = cache_optimized_model
+
+    @classmethod
+    def from_dict(cls, data_dict: Dict):
+        """Initializes ONNX Runtime runner."""
+        return cls(
+            device=data_dict.get("device"),
+            graph_optimization_level=data_dict.get("graph_optimization_level"),
+            execution_mode=data_dict.get("execution_mode"),
+            enable_mem_arena=data_dict.get("enable_mem_arena"),
+            enable_mem_pattern=data_dict.get("enable_mem_pattern"),
+            cache_optimized_model=data_dict.get("cache_optimized_model", False),
+            **cls.parse_threading_dict(data_dict),
+        )
+
+    def to_dict(self, parse: bool = False, *_, **__) -> Dict:
+        """Returns dictionary representation of the object.
+
+        Args:
+            parse: if True, converts parsable fields to string representation
+
+        Returns:
+            Dictionary representation of OnnxRunnerConfig
+        """
+        return {
+            "device": self.device,
+            "graph_optimization_level": self._parse_enum(self.graph_optimization_level, parse),
+            "execution_mode": self._parse_enum(self.execution_mode, parse),
+            "enable_mem_arena": self.enable_mem_arena,
+            "enable_mem_pattern": self.enable_mem_pattern,
+            "cache_optimized_model": self.cache_optimized_model,
+            **self.get_threading_dict(),
+        }
+
+    @staticmethod
+    def _parse_enum(value: Optional[Enum], parse: bool):
+        if parse and value is not None:
+            return value.value
+        return value
@@ -13,15 +13,37 @@
 # limitations under the License.
 """Dataloader and samples core functionality."""
 
+import collections
+import copy
+import functools
+import itertools
 import math
 import pathlib
-from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import queue
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from model_navigator.configuration import Sample, TensorType
+from model_navigator.configuration.constants import (
+    DEFAULT_DATALOADER_PREFETCH_DEPTH,
+    DEFAULT_DATALOADER_WORKERS,
+    DEFAULT_EXPANDED_SAMPLES_CACHE_SIZE,
+    DEFAULT_SAMPLES_WRITER_MAX_PENDING,
+    DEFAULT_SAMPLES_WRITER_WORKERS,
+)
 from model_navigator.core.logger import LOGGER
-from model_navigator.core.tensor import TensorMetadata, is_tensor
+from model_navigator.core.samples_store import (
+    SamplesStoreReader,
+    SamplesStoreWriter,
+    TensorStatistics,
+    is_samples_store,
+)
+from model_navigator.core.tensor import TensorMetadata, TensorSpec, is_tensor
+from model_navigator.core.writer_pool import WriterPool
 from model_navigator.exceptions import ModelNavigatorUserInputError
 from model_navigator.frameworks import Framework
 from model_navigator.utils import module
@@ -33,31 +55,158 @@ SAMPLE_FILE_SUFFIX = ".npz"
 
 
 class IndiciesFilteredDataloader:
-    """Dataloader that filters indices."""
+    """Dataloader that filters indices.
 
-    def __init__(self, dataloader: Any, indicies: List[int]):
+    Iteration over the wrapped dataloader stops once all requested indices were yielded.
+    """
+
+    def __init__(self, dataloader: Any, indicies: Iterable[int]):
         """Initialize IndiciesFilteredDataloader.
 
         Args:
             dataloader: A dataloader to filter
-            indicies: A list of indices to filter
+            indicies: Indices to filter
         """
         self._dataloader = dataloader
-        self._indicies = indicies
+        self._indicies = set(indicies)
 
     def __iter__(self):
         """Iterate over samples."""
+        if not self._indicies:
+            return
+
+        last_idx = max(self._indicies)
         for idx, sample in enumerate(self._dataloader):
             if idx in self._indicies:
                 yield sample
+            if idx >= last_idx:
+                break
 
     def __len__(self):
         """Get number of samples."""
         return len(self._indicies)
 
 
+class PrefetchingDataloader:
+    """Dataloader that loads samples ahead of the consumer in background threads.
+
+    Samples are yielded in the dataloader order. Dataloaders with `__getitem__` and `__len__` are loaded by index
+    on a pool of `num_workers` threads, other dataloaders are iterated by a single background thread.
+    At most `prefetch_depth` samples are loaded ahead, so dataloaders reusing buffers between samples
+    have to be used without prefetching. Zero `prefetch_depth` iterates the dataloader in the calling thread.
+
+    Example of use:
+
+        for sample in PrefetchingDataloader(dataloader, prefetch_depth=4, num_workers=2):
+            runner.infer(sample)
+    """
+
+    _END = object()
+
+    def __init__(
+        self,
+        dataloader: Any,
+        prefetch_depth: int = DEFAULT_DATALOADER_PREFETCH_DEPTH,
+        num_workers: int = DEFAULT_DATALOADER_WORKERS,
+    ):
+        """Initialize PrefetchingDataloader.
+
+        Args:
+            dataloader: A dataloader to prefetch samples from
+            prefetch_depth: Maximal number of samples loaded ahead of the consumer
+            num_workers: Number of threads loading samples from dataloaders supporting indexing
+        """
+        if prefetch_depth < 0:
+            raise ModelNavigatorUserInputError(f"Dataloader prefetch depth must be non-negative. Got {prefetch_depth}.")
+        if num_workers < 1:
+            raise ModelNavigatorUserInputError(f"Dataloader workers number must be positive. Got {num_workers}.")
+
+        self._dataloader = dataloader
+        self._prefetch_depth = prefetch_depth
+        self._num_workers = num_workers
+
+    def __iter__(self):
+        """Iterate over samples."""
+        if self._prefetch_depth == 0:
+            yield from self._dataloader
+        elif self._num_workers > 1 and _is_indexable(self._dataloader):
+            yield from self._iter_indexed()
+        else:
+            yield from self._iter_background()
+
+    def __len__(self):
+        """Get number of samples."""
+        return len(self._dataloader)
+
+    def _iter_indexed(self):
+        indices = iter(range(len(self._dataloader)))
+        with ThreadPoolExecutor(max_workers=self._num_workers, thread_name_prefix="nav-dataloader") as executor:
+            pending = collections.deque(
+                executor.submit(self._dataloader.__getitem__, idx)
+                for idx in itertools.islice(indices, self._prefetch_depth)
+            )
+            try:
+                while pending:
+                    sample = pending.popleft().result()
+                    for idx in itertools.islice(indices, 1):
+                        pending.append(executor.submit(self._dataloader.__getitem__, idx))
+                    yield sample
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _iter_background(self):
+        samples = queue.Queue(maxsize=self._prefetch_depth)
+        stop_event = threading.Event()
+
+        def _put(item) -> bool:
+            while not stop_event.is_set():
+                try:
+                    samples.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _produce():
+            try:
+                for sample in self._dataloader:
+                    if not _put((sample, None)):
+                        return
+                _put((self._END, None))
+            except Exception as e:
+                _put((None, e))
+
+        thread = threading.Thread(target=_produce, name="nav-dataloader", daemon=True)
+        thread.start()
+        try:
+            while True:
+                sample, error = samples.get()
+                if error is not None:
+                    raise error
+                if sample is self._END:
+                    break
+                yield sample
+        finally:
+            # Consumer may stop early, so producer is released from waiting on the full queue
+            stop_event.set()
+            thread.join()
+
+
 class SortedSamplesLoader:
-    """Dataloader that loads samples from directory."""
+    """Dataloader that loads samples from directory.
+
+    Samples are read from the memory-mapped samples store when directory contains its index.
+    Otherwise, samples are read from per sample `.npz` files stored by previous versions.
+
+    Indexing with a slice and sharding return loaders of the selected samples without loading them.
+
+    Example of use:
+
+        samples = load_samples("profiling_sample", workspace, batch_dim=0)
+        for sample in samples.shard(worker_id=1, num_workers=4):
+            runner.infer(sample)
+    """
 
     def __init__(self, samples_dirpath: pathlib.Path, batch_dim: Optional[int] = None):
         """Initialize SamplesLoader.
@@ -66,25 +215,38 @@ class SortedSamplesLoader:
             samples_dirpath: Path to samples directory
             batch_dim: Batch dimension
         """
-        self._samples_paths = self._samples_files(samples_dirpath)
+        self._store = None
+        self._samples_paths = []
+        if is_samples_store(samples_dirpath):
+            self._store = SamplesStoreReader(samples_dirpath)
+            self._indices = range(len(self._store))
+        else:
+            self._samples_paths = self._samples_files(samples_dirpath)
+            self._indices = range(len(self._samples_paths))
         self._batch_dim = batch_dim
 
-    def __getitem__(self, idx: int) -> Sample:
-        """Get sample for given index.
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Sample, "SortedSamplesLoader"]:
+        """Get sample for given index or loader of samples selected with a slice.
 
         Args:
-            idx: Index of sample to get
+            idx: Index of sample to get or slice of samples
 
         Returns:
-            Sample data
+            Sample data or loader of selected samples
         """
+        if isinstance(idx, slice):
+            return self._subset(self._indices[idx])
+
+        idx = self._indices[idx]
+        if self._store is not None:
+            data = self._store[idx]
+            return {k: self._expand_batch_dim(v) for k, v in data.items()}
+
         sample_filepath = self._samples_paths[idx]
         sample = {}
         with np.load(sample_filepath.as_posix()) as data:
             for k, v in data.items():
-                if self._batch_dim is not None:
-                    v = np.expand_dims(v, self._batch_dim)
-                sample[k] = v
+                sample[k] = self._expand_batch_dim(v)
         return sample
 
     def __len__(self) -> int:
@@ -93,7 +255,75 @@ class SortedSamplesLoader:
         Returns:
             Number of samples
         """
-        return len(self._samples_paths)
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[Sample]:
+        """Iterate over samples."""
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def shard(self, worker_id: int, num_workers: int) -> "SortedSamplesLoader":
+        """Get loader of samples processed by the worker when samples are distributed between workers.
+
+        Samples are assigned to workers in round-robin order.
+
+        Args:
+            worker_id: Index of the worker in range [0, num_workers)
+            num_workers: Number of workers
+
+        Returns:
+            Loader of samples assigned to the worker
+        """
+        if not 0 <= worker_id < num_workers:
+            raise ValueError(f"Worker id must be in range [0, {num_workers}). Got {worker_id}.")
+
+        return self._subset(self._indices[worker_id::num_workers])
+
+    def get_sample_metadata(self, idx: int) -> Dict[str, TensorSpec]:
+        """Get shapes and data types of sample tensors without loading their data.
+
+        Args:
+            idx: Index of sample
+
+        Returns:
+            Specification of each tensor in the sample, including batch dimension
+        """
+        idx = self._indices[idx]
+        if self._store is not None:
+            metadata = self._store.get_metadata(idx)
+        else:
+            metadata = _read_npz_metadata(self._samples_paths[idx])
+
+        return {
+            name: TensorSpec(name=name, shape=self._expand_batch_dim_shape(spec.shape), dtype=spec.dtype)
+            for name, spec in metadata.items()
+        }
+
+    def get_statistics(self) -> Dict[str, TensorStatistics]:
+        """Get statistics of tensor values collected over all samples when they were written.
+
+        Returns:
+            Statistics per tensor name. Empty for samples stored as `.npz` files.
+        """
+        if self._store is None:
+            return {}
+
+        return self._store.get_statistics()
+
+    def _subset(self, indices: range) -> "SortedSamplesLoader":
+        loader = copy.copy(self)
+        loader._indices = indices
+        return loader
+
+    def _expand_batch_dim_shape(self, shape: Tuple[int, ...]) -> Tuple[int, ...]:
+        if self._batch_dim is not None:
+            shape = (*shape[: self._batch_dim], 1, *shape[self._batch_dim :])
+        return shape
+
+    def _expand_batch_dim(self, tensor: np.ndarray) -> np.ndarray:
+        if self._batch_dim is not None:
+            tensor = np.expand_dims(tensor, self._batch_dim)
+        return tensor
 
     def _samples_files(self, samples_dirpath: pathlib.Path):
         """Collect sample files from directory in sorted order.
@@ -142,6 +372,9 @@ def samples_to_npz(
 ) -> None:
     """Save samples to .npz files. Each sample is saved to `path/{sample index}.npz` file.
 
+    The layout is kept for compatibility with packages created by previous versions.
+    Use `samples_to_store` for the memory-mapped samples store.
+
     Args:
         samples: Samples to save.
         path: Output directory.
@@ -156,25 +389,142 @@ def samples_to_npz(
         assert hasattr(samples, "__len__")
         num_samples = len(samples)
 
-    for i, sample in enumerate(samples):
-        if metadata is not None:
-            assert framework is not None
-            sample = extract_sample(sample, metadata, framework)
-        sample = extract_bs1(sample, batch_dim)
-        squeezed_sample = {}
-        for name, tensor in sample.items():
-            if batch_dim is not None:
-                tensor = tensor.squeeze(batch_dim)
-
-            _validate_tensor(tensor, raise_on_error=raise_on_error)
-
-            squeezed_sample[name] = tensor
-
+    squeezed_samples = _squeezed_samples(
+        samples, batch_dim, metadata=metadata, framework=framework, raise_on_error=raise_on_error
+    )
+    for i, squeezed_sample in enumerate(squeezed_samples):
         filename = _sample_filename(idx=i, num_samples=num_samples)
         file_path = path / filename
         np.savez(file_path.as_posix(), **squeezed_sample)
 
 
+def samples_to_store(
+    samples: Iterable[Sample],
+    path: pathlib.Path,
+    batch_dim: Optional[int],
+    *,
+    metadata: Optional[TensorMetadata] = None,
+    framework: Optional[Framework] = None,
+    raise_on_error: bool = True,
+) -> None:
+    """Save samples to the memory-mapped samples store in `path` directory.
+
+    Tensors of each name are stored in a contiguous `.npy` file and read without copying by `load_samples`.
+    Samples are written in background threads, so a lazily evaluated iterable, e.g. of model outputs,
+    is consumed while previous samples are written.
+
+    Args:
+        samples: Samples to save.
+        path: Output directory.
+        batch_dim: Batch dimension
+        metadata: Metadata of the samples. Defaults to None.
+        framework: Model framework. Defaults to None.
+        raise_on_error: If True raise an error when sample is invalid. Defaults to True.
+    """
+    with BackgroundSamplesWriter(batch_dim, raise_on_error=raise_on_error) as writer:
+        writer.open(path)
+        for sample in samples:
+            if metadata is not None:
+                assert framework is not None
+                sample = extract_sample(sample, metadata, framework)
+            writer.write(path, sample)
+
+
+class BackgroundSamplesWriter(ContextManager):
+    """Writes samples to the samples stores in background threads.
+
+    Batch of size one is taken from the sample on the calling thread, so the producer can reuse its buffers.
+    Validation and serialization run concurrently in the writer pool, while samples are appended to the stores
+    in the order of `write` calls. The producer is blocked when the number of pending samples exceeds `max_pending`.
+    Stores are closed concurrently and flushed to the disk when `fsync` is enabled.
+
+    Example of use:
+
+        with BackgroundSamplesWriter(batch_dim=0) as writer:
+            writer.open(path)
+            for sample in samples:
+                writer.write(path, sample)
+    """
+
+    def __init__(
+        self,
+        batch_dim: Optional[int],
+        *,
+        raise_on_error: bool = True,
+        num_workers: int = DEFAULT_SAMPLES_WRITER_WORKERS,
+        max_pending: int = DEFAULT_SAMPLES_WRITER_MAX_PENDING,
+        fsync: bool = True,
+    ):
+        """Initialize writer.
+
+        Args:
+            batch_dim: Batch dimension
+            raise_on_error: If True raise an error when sample is invalid. Defaults to True.
+            num_workers: Number of threads validating and serializing samples.
+            max_pending: Maximal number of samples waiting to be written.
+            fsync: Flush stores to the disk when writer is closed.
+        """
+        self._batch_dim = batch_dim
+        self._raise_on_error = raise_on_error
+        self._fsync = fsync
+        self._writers: Dict[pathlib.Path, SamplesStoreWriter] = {}
+        self._pool = WriterPool(num_workers=num_workers, max_pending=max_pending)
+
+    def __enter__(self) -> "BackgroundSamplesWriter":
+        """Enter the writer context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Wait for pending samples and write indices of the stores when no error occurred."""
+        if exc_type is not None:
+            self._pool.shutdown(cancel=True)
+            for writer in self._writers.values():
+                writer.abort()
+            return
+
+        try:
+            self._pool.wait()
+            for writer in self._writers.values():
+                self._pool.submit(writer.close)
+            self._pool.wait()
+        except Exception:
+            for writer in self._writers.values():
+                writer.abort()
+            raise
+        finally:
+            self._pool.shutdown()
+
+    def open(self, path: pathlib.Path) -> None:
+        """Open samples store in a directory.
+
+        Args:
+            path: Output directory
+        """
+        self._writers[path] = SamplesStoreWriter(path, fsync=self._fsync)
+
+    def write(self, path: pathlib.Path, sample: Sample) -> None:
+        """Schedule write of the sample to the store opened in `path`.
+
+        Args:
+            path: Output directory of opened store
+            sample: Sample with numpy tensors
+        """
+        if self._batch_dim is None:
+            sample = {name: np.array(tensor) for name, tensor in sample.items()}
+        else:
+            sample = extract_bs1(sample, self._batch_dim)
+
+        writer = self._writers[path]
+        self._pool.submit(functools.partial(self._serialize, sample), lambda result: writer.append(*result))
+
+    def _serialize(self, sample: Sample) -> Tuple[Dict[str, np.ndarray], Dict[str, Optional[TensorStatistics]]]:
+        statistics = {}
+        squeezed_sample = _squeeze_sample(
+            sample, self._batch_dim, raise_on_error=self._raise_on_error, statistics=statistics
+        )
+        return {name: np.ascontiguousarray(tensor) for name, tensor in squeezed_sample.items()}, statistics
+
+
 def sample_to_tuple(input: Any) -> Tuple[Any, ...]:
     """Convert sample to tuple.
 
@@ -222,6 +572,111 @@ def extract_bs1(sample: Sample, batch_dim: Optional[int]) -> Sample:
     return sample
 
 
+def get_sample_batch_size(sample: Sample, batch_dim: Optional[int]) -> Optional[int]:
+    """Get batch size of the sample.
+
+    Args:
+        sample: A sample with numpy tensors
+        batch_dim: A place where batch is stored in sample
+
+    Returns:
+        Size of batch dimension shared by all tensors or None when tensors are not batched
+    """
+    if batch_dim is None or not sample:
+        return None
+
+    batch_sizes = {tensor.shape[batch_dim] if tensor.ndim > batch_dim else None for tensor in sample.values()}
+    if len(batch_sizes) != 1:
+        return None
+
+    return batch_sizes.pop()
+
+
+def are_samples_concatenable(sample: Sample, other: Sample, batch_dim: Optional[int]) -> bool:
+    """Check if samples can be concatenated along the batch dimension.
+
+    Args:
+        sample: A sample with numpy tensors
+        other: Other sample with numpy tensors
+        batch_dim: A place where batch is stored in sample
+
+    Returns:
+        True if samples have the same tensors names, data types and shapes except the batch dimension
+    """
+    if get_sample_batch_size(sample, batch_dim) is None or get_sample_batch_size(other, batch_dim) is None:
+        return False
+
+    if list(sample) != list(other):
+        return False
+
+    for name, tensor in sample.items():
+        other_tensor = other[name]
+        if tensor.dtype != other_tensor.dtype or tensor.ndim != other_tensor.ndim:
+            return False
+        if any(
+            dim != other_dim
+            for ax, (dim, other_dim) in enumerate(zip(tensor.shape, other_tensor.shape))
+            if ax != batch_dim
+        ):
+            return False
+
+    return True
+
+
+def concatenate_samples(samples: Sequence[Sample], batch_dim: int) -> Sample:
+    """Concatenate samples along the batch dimension.
+
+    Args:
+        samples: Samples for which `are_samples_concatenable` holds
+        batch_dim: A place where batch is stored in sample
+
+    Returns:
+        A sample with batch size equal to the sum of samples batch sizes
+    """
+    return {name: np.concatenate([sample[name] for sample in samples], axis=batch_dim) for name in samples[0]}
+
+
+def split_sample(sample: Sample, batch_sizes: Sequence[int], batch_dim: int) -> Optional[List[Sample]]:
+    """Split sample along the batch dimension.
+
+    Args:
+        sample: A sample with numpy tensors
+        batch_sizes: Batch sizes of resulting samples
+        batch_dim: A place where batch is stored in sample
+
+    Returns:
+        Samples being views of the provided one or None when batch size of sample does not match `batch_sizes`
+    """
+    if get_sample_batch_size(sample, batch_dim) != sum(batch_sizes):
+        return None
+
+    split_indices = np.cumsum(batch_sizes)[:-1]
+    splits = {name: np.split(tensor, split_indices, axis=batch_dim) for name, tensor in sample.items()}
+    return [{name: splits[name][idx] for name in sample} for idx in range(len(batch_sizes))]
+
+
+def get_inference_batch_size(
+    batch_size: Optional[int], batch_dim: Optional[int], dataloader_max_batch_size: Optional[int] = None
+) -> Optional[int]:
+    """Get batch size of samples concatenated for inference.
+
+    Args:
+        batch_size: Requested batch size
+        batch_dim: A place where batch is stored in sample
+        dataloader_max_batch_size: Maximal batch size in the dataloader, which is supported by all models
+
+    Returns:
+        Batch size limited to the dataloader maximal batch size or None when samples are not concatenated
+    """
+    if batch_dim is None or batch_size is None or batch_size <= 1:
+        return None
+
+    if dataloader_max_batch_size is not None:
+        batch_size = min(batch_size, dataloader_max_batch_size)
+
+    return batch_size if batch_size > 1 else None
+
+
 def expand_sample(
     sample: Sample, input_metadata: TensorMetadata, batch_dim: Optional[int], batch_size: Optional[int]
 ) -> Sample:
@@ -253,6 +708,106 @@ def expand_sample(
     return expanded_sample
 
 
+class SampleExpander:
+    """Expands sample to multiple batch sizes reusing memory between them.
+
+    Numpy tensors with single element on the batch dimension equal to 0 are expanded into a preallocated buffer
+    filled by doubling copies, so all smaller batch sizes are views of the buffer prefix and the buffer is
+    reallocated only when a larger batch size is requested. Other tensors are expanded with `expand_sample`.
+    Expanded samples are kept in LRU cache keyed by batch size.
+
+    Example of use:
+
+        sample_expander = SampleExpander(sample, input_metadata, batch_dim=0)
+        for batch_size in [1, 2, 4]:
+            runner.infer(sample_expander.expand(batch_size))
+    """
+
+    def __init__(
+        self,
+        sample: Sample,
+        input_metadata: TensorMetadata,
+        batch_dim: Optional[int],
+        cache_size: int = DEFAULT_EXPANDED_SAMPLES_CACHE_SIZE,
+    ) -> None:
+        """Initialize SampleExpander.
+
+        Args:
+            sample: Sample to be expanded.
+            input_metadata: Model input metadata
+            batch_dim: Batch dimension.
+            cache_size: Number of expanded samples kept in the cache.
+        """
+        self._sample = sample
+        self._input_metadata = input_metadata
+        self._batch_dim = batch_dim
+        self._cache_size = cache_size
+        self._cache: collections.OrderedDict = collections.OrderedDict()
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def expand(self, batch_size: Optional[int]) -> Sample:
+        """Expand sample to a given batch size.
+
+        Returned tensors may share memory with each other and with tensors returned for other batch sizes,
+        so they must not be modified.
+
+        Args:
+            batch_size: Batch size.
+
+        Returns:
+            Sample: Expanded Sample.
+        """
+        if batch_size in self._cache:
+            self._cache.move_to_end(batch_size)
+            return self._cache[batch_size]
+
+        if self._batch_dim is None:
+            expanded_sample = expand_sample(self._sample, self._input_metadata, self._batch_dim, batch_size)
+        else:
+            expanded_sample = {}
+            for name, tensor in self._sample.items():
+                tensor_metadata = self._input_metadata.get(name)
+                if not tensor_metadata:
+                    continue
+
+                if len(tensor_metadata.shape) == 0:
+                    expanded_sample[name] = tensor
+                elif self._is_bufferable(tensor):
+                    expanded_sample[name] = self._get_buffer(name, tensor, batch_size)[:batch_size]
+                else:
+                    expanded_sample[name] = tensor.repeat(batch_size, axis=self._batch_dim)
+
+        self._cache[batch_size] = expanded_sample
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return expanded_sample
+
+    def _is_bufferable(self, tensor: Any) -> bool:
+        # Repeating single element is equal to tiling, so expanded tensors of smaller batch sizes are buffer prefixes
+        return isinstance(tensor, np.ndarray) and self._batch_dim == 0 and tensor.ndim > 0 and tensor.shape[0] == 1
+
+    def _get_buffer(self, name: str, tensor: np.ndarray, batch_size: int) -> np.ndarray:
+        buffer = self._buffers.get(name)
+        if buffer is not None and len(buffer) >= batch_size:
+            return buffer
+
+        # Views of the previous buffer are dropped from the cache, so its memory can be released
+        self._buffers.pop(name, None)
+        self._cache.clear()
+
+        buffer = np.empty((batch_size, *tensor.shape[1:]), dtype=tensor.dtype)
+        buffer[:1] = tensor
+        filled = 1
+        while filled < batch_size:
+            count = min(filled, batch_size - filled)
+            buffer[filled : filled + count] = buffer[:count]
+            filled += count
+
+        self._buffers[name] = buffer
+        return buffer
+
+
 def get_tensor_type_name(tensor_type: TensorType) -> str:
     """Obtain name of tensor type for given framework.
 
@@ -347,6 +902,27 @@ def get_default_output_names(num_output: int) -> List:
     return [f"output__{i}" for i in range(num_output)]
 
 
+def _is_indexable(dataloader: Any) -> bool:
+    return hasattr(dataloader, "__getitem__") and hasattr(dataloader, "__len__") and not isinstance(dataloader, Mapping)
+
+
+def _read_npz_metadata(sample_filepath: pathlib.Path) -> Dict[str, TensorSpec]:
+    # Only headers of arrays are read from the archive
+    metadata = {}
+    with zipfile.ZipFile(sample_filepath) as archive:
+        for member in archive.namelist():
+            name = member[: -len(".npy")] if member.endswith(".npy") else member
+            with archive.open(member) as f:
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+            metadata[name] = TensorSpec(name=name, shape=shape, dtype=dtype)
+
+    return metadata
+
+
 def _sample_filename(idx: int, num_samples: int) -> str:
     """Create filename for data sample with given index.
 
@@ -367,8 +943,56 @@ def _sample_filename(idx: int, num_samples: int) -> str:
     return filename
 
 
-def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
-    if any(np.isnan(tensor.flatten())):
+def _squeezed_samples(
+    samples: Iterable[Sample],
+    batch_dim: Optional[int],
+    *,
+    metadata: Optional[TensorMetadata],
+    framework: Optional[Framework],
+    raise_on_error: bool,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Extract and validate samples with batch size 1 and squeeze the batch dimension."""
+    for sample in samples:
+        if metadata is not None:
+            assert framework is not None
+            sample = extract_sample(sample, metadata, framework)
+        sample = extract_bs1(sample, batch_dim)
+        yield _squeeze_sample(sample, batch_dim, raise_on_error=raise_on_error)
+
+
+def _squeeze_sample(
+    sample: Sample,
+    batch_dim: Optional[int],
+    *,
+    raise_on_error: bool,
+    statistics: Optional[Dict[str, Optional[TensorStatistics]]] = None,
+) -> Dict[str, np.ndarray]:
+    """Validate sample with batch size 1 and squeeze the batch dimension.
+
+    Statistics of tensors collected during validation are stored in `statistics` when provided.
+    """
+    squeezed_sample = {}
+    for name, tensor in sample.items():
+        if batch_dim is not None:
+            tensor = tensor.squeeze(batch_dim)
+
+        tensor_statistics = _validate_tensor(tensor, raise_on_error=raise_on_error)
+        if statistics is not None:
+            statistics[name] = tensor_statistics
+
+        squeezed_sample[name] = tensor
+
+    return squeezed_sample
+
+
+def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True) -> Optional[TensorStatistics]:
+    tensor = np.asarray(tensor)
+    statistics = TensorStatistics.from_tensor(tensor)
+    if statistics is None or statistics.is_finite:
+        return statistics
+
+    # Exact checks run only for invalid tensors to report all kinds of invalid values
+    if np.isnan(tensor).any():
         message = "Tensor data contains `NaN` value. Please verify the dataloader and model. Consider disabling autocast or inference mode in TorchConfig custom configuration."
         if raise_on_error:
             LOGGER.warning(message)
@@ -376,13 +1000,15 @@ def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
         else:
             LOGGER.warning(message)
 
-    if any(np.isinf(tensor.flatten())):
+    if np.isinf(tensor).any():
         message = "Tensor data contains `inf` value. Please verify the dataloader and model."
         if raise_on_error:
             raise ModelNavigatorUserInputError(message)
         else:
             LOGGER.warning(message)
 
+    return statistics
+
 
 def _is_valid_io(sample: Any, tensor_type: TensorType) -> bool:
     """Validate if provided sample is correct I/O object.
@@ -0,0 +1,270 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Constant memory latency histogram."""
+
+import math
+from typing import Dict, Iterable, List, Mapping
+
+import numpy as np
+
+from model_navigator.configuration.constants import (
+    DEFAULT_HISTOGRAM_HIGHEST_VALUE,
+    DEFAULT_HISTOGRAM_LOWEST_VALUE,
+    DEFAULT_HISTOGRAM_PRECISION,
+)
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of latencies with constant memory footprint.
+
+    Buckets grow geometrically, so every value reported from the histogram is within `precision` relative
+    error from the recorded one. Count, sum, minimum and maximum are tracked exactly. Histograms with the same
+    configuration can be merged, which gives exact (to the precision) percentiles of all merged measurements.
+
+    Example of use:
+
+        histogram = LatencyHistogram()
+        histogram.record_values([10.0, 12.5, 11.0])
+        p99 = histogram.percentile(99)
+
+    Args:
+        lowest: Lowest value tracked with the given precision. Smaller values are counted in the first bucket.
+        highest: Highest value tracked with the given precision. Larger values are counted in the last bucket.
+        precision: Relative precision of values reported from the histogram.
+    """
+
+    def __init__(
+        self,
+        lowest: float = DEFAULT_HISTOGRAM_LOWEST_VALUE,
+        highest: float = DEFAULT_HISTOGRAM_HIGHEST_VALUE,
+        precision: float = DEFAULT_HISTOGRAM_PRECISION,
+    ) -> None:
+        """Initialize empty histogram."""
+        if lowest <= 0 or highest <= lowest:
+            raise ValueError(
+                f"Histogram range must satisfy 0 < lowest < highest. Got lowest={lowest}, highest={highest}."
+            )
+        if not 0 < precision < 1:
+            raise ValueError(f"Histogram precision must be in range (0, 1). Got {precision}.")
+
+        self.lowest = float(lowest)
+        self.highest = float(highest)
+        self.precision = float(precision)
+
+        # Geometric middle of bucket [b, b * growth) is within precision from any value in the bucket
+        self._log_growth = math.log1p(2 * self.precision)
+        bucket_count = int(math.log(self.highest / self.lowest) / self._log_growth) + 2
+        self._counts = np.zeros(bucket_count, dtype=np.int64)
+
+        self.count = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], **kwargs) -> "LatencyHistogram":
+        """Create histogram with recorded values.
+
+        Args:
+            values: Values to record.
+            kwargs: Histogram configuration passed to the constructor.
+
+        Returns:
+            LatencyHistogram
+        """
+        histogram = cls(**kwargs)
+        histogram.record_values(values)
+        return histogram
+
+    @classmethod
+    def merged(cls, histograms: List["LatencyHistogram"]) -> "LatencyHistogram":
+        """Create new histogram with all values from provided histograms.
+
+        Args:
+            histograms: Histograms to merge. All must have the same configuration.
+
+        Returns:
+            LatencyHistogram
+        """
+        if not histograms:
+            raise ValueError("At least one histogram is required to merge.")
+
+        first = histograms[0]
+        histogram = cls(lowest=first.lowest, highest=first.highest, precision=first.precision)
+        for other in histograms:
+            histogram.merge(other)
+
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        """Mean of recorded values."""
+        self._validate_not_empty()
+        return self.sum / self.count
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of recorded values."""
+        self._validate_not_empty()
+        variance = self.sum_sq / self.count - self.mean**2
+        return math.sqrt(max(variance, 0.0))
+
+    def record(self, value: float) -> None:
+        """Record single value.
+
+        Args:
+            value: Value to record.
+        """
+        self.record_values([value])
+
+    def record_values(self, values: Iterable[float]) -> None:
+        """Record multiple values.
+
+        Args:
+            values: Values to record.
+        """
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+
+        indices = self._get_bucket_indices(values)
+        self._counts += np.bincount(indices, minlength=len(self._counts))
+        self.count += int(values.size)
+        self.sum += float(np.sum(values))
+        self.sum_sq += float(np.sum(values**2))
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add values recorded in other histogram.
+
+        Args:
+            other: Histogram with the same configuration.
+
+        Returns:
+            Self to allow chaining.
+        """
+        if (other.lowest, other.highest, other.precision) != (self.lowest, self.highest, self.precision):
+            raise ValueError("Only histograms with the same lowest, highest and precision can be merged.")
+
+        self._counts += other._counts
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_sq += other.sum_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        return self
+
+    def percentile(self, q: float) -> float:
+        """Get percentile of recorded values.
+
+        The nearest-rank value is returned, represented with the histogram precision.
+
+        Args:
+            q: Percentile in range [0, 100].
+
+        Returns:
+            Value of percentile.
+        """
+        return self.percentiles([q])[0]
+
+    def percentiles(self, qs: List[float]) -> List[float]:
+        """Get multiple percentiles of recorded values with single pass over buckets.
+
+        Args:
+            qs: Percentiles in range [0, 100].
+
+        Returns:
+            Values of percentiles in the same order as requested.
+        """
+        self._validate_not_empty()
+        qs = np.asarray(qs, dtype=np.float64)
+        if np.any((qs < 0) | (qs > 100)):
+            raise ValueError(f"Percentiles must be in range [0, 100]. Got {qs.tolist()}.")
+
+        ranks = np.maximum(np.ceil(qs / 100 * self.count), 1)
+        indices = np.searchsorted(np.cumsum(self._counts), ranks)
+        values = np.clip(self._get_bucket_values(indices), self.min, self.max)
+
+        return [float(value) for value in values]
+
+    def to_json(self) -> Dict:
+        """Serialize histogram with non-empty buckets only.
+
+        Returns:
+            Jsonable dictionary.
+        """
+        bucket_indices = np.flatnonzero(self._counts)
+        return {
+            "lowest": self.lowest,
+            "highest": self.highest,
+            "precision": self.precision,
+            "count": self.count,
+            "sum": self.sum,
+            "sum_sq": self.sum_sq,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "bucket_indices": bucket_indices.tolist(),
+            "bucket_counts": self._counts[bucket_indices].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Mapping) -> "LatencyHistogram":
+        """Instantiate LatencyHistogram from a json dictionary.
+
+        Args:
+            d: Data dictionary.
+
+        Returns:
+            LatencyHistogram
+        """
+        histogram = cls(lowest=d["lowest"], highest=d["highest"], precision=d["precision"])
+        histogram._counts[np.asarray(d["bucket_indices"], dtype=np.int64)] = d["bucket_counts"]
+        histogram.count = d["count"]
+        histogram.sum = d["sum"]
+        histogram.sum_sq = d["sum_sq"]
+        histogram.min = d["min"] if d["min"] is not None else math.inf
+        histogram.max = d["max"] if d["max"] is not None else -math.inf
+
+        return histogram
+
+    def __eq__(self, other: object) -> bool:
+        """Compare histograms configuration and recorded values."""
+        if not isinstance(other, LatencyHistogram):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __repr__(self) -> str:
+        """Get string representation."""
+        return f"LatencyHistogram(count={self.count}, lowest={self.lowest}, highest={self.highest}, precision={self.precision})"
+
+    def _get_bucket_indices(self, values: np.ndarray) -> np.ndarray:
+        # Values below the lowest one land in the first bucket, above the highest one in the last bucket
+        clipped = np.maximum(values, self.lowest / 2)
+        indices = np.floor(np.log(clipped / self.lowest) / self._log_growth) + 1
+        return np.clip(indices, 0, len(self._counts) - 1).astype(np.int64)
+
+    def _get_bucket_values(self, indices: np.ndarray) -> np.ndarray:
+        # Out of range buckets are represented by the exact extreme values
+        values = self.lowest * np.exp((indices - 0.5) * self._log_growth)
+        values = np.where(indices == 0, self.min, values)
+        return np.where(indices == len(self._counts) - 1, self.max, values)
+
+    def _validate_not_empty(self) -> None:
+        if self.count == 0:
+            raise ValueError("Histogram is empty.")
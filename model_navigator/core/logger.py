@@ -21,6 +21,7 @@ import multiprocessing as mp
 import os
 import pathlib
 import sys
+import threading
 from functools import lru_cache
 from multiprocessing import current_process
 from typing import Dict, Optional, TextIO, Tuple, Union
@@ -110,6 +111,13 @@ def third_party_record_predicate(record: Dict) -> bool:
     return not navigator_record_predicate(record)
 
 
+def _thread_record_predicate(predicate, thread_id: Optional[int]):
+    if thread_id is None:
+        return predicate
+
+    return lambda record: record["thread"].id == thread_id and predicate(record)
+
+
 def forward_python_logging_to_loguru() -> None:
     """Use intercept handler to capture all holds and forward to loguru."""
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
@@ -123,20 +131,28 @@ def forward_polygraphy_logging_to_python_logging() -> None:
     ...
 
 
-def configure_logging_sink(sink: Union[TextIO, str, pathlib.Path]) -> Tuple[int, int]:
-    """Configures given sink for the loguru."""
+def configure_logging_sink(
+    sink: Union[TextIO, str, pathlib.Path],
+    thread_id: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Configures given sink for the loguru.
+
+    Args:
+        sink: Sink where logs are written.
+        thread_id: Optional identifier of the thread which logs are written to the sink. All threads by default.
+    """
     navigator_sink_id = logger.add(
         sink,
         level=get_navigator_log_level(),
         format=get_log_format(),
-        filter=navigator_record_predicate,
+        filter=_thread_record_predicate(navigator_record_predicate, thread_id),
         enqueue=True,
     )
     third_party_sink_id = logger.add(
         sink,
         level=get_third_party_log_level(),
         format=get_log_format(),
-        filter=third_party_record_predicate,
+        filter=_thread_record_predicate(third_party_record_predicate, thread_id),
         enqueue=True,
     )
     return navigator_sink_id, third_party_sink_id
@@ -246,15 +262,18 @@ class LoggingContext(contextlib.AbstractContextManager):
         self,
         *,
         log_dir: Optional[pathlib.Path] = None,
+        current_thread_only: bool = False,
     ):
         """Initialize the context.
 
         Args:
             log_dir: Optional path to directory where log file is stored.
+            current_thread_only: Store only logs emitted by the thread entering the context.
         """
         if log_dir:
             log_dir.mkdir(parents=True, exist_ok=True)
-            self.sink_ids = configure_logging_sink(log_dir / "format.log")
+            thread_id = threading.get_ident() if current_thread_only else None
+            self.sink_ids = configure_logging_sink(log_dir / "format.log", thread_id=thread_id)
         else:
             self.sink_ids = None
 
@@ -0,0 +1,444 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory-mapped columnar store of samples."""
+
+import dataclasses
+import json
+import math
+import os
+import pathlib
+import struct
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from model_navigator.core.tensor import TensorSpec
+
+SAMPLES_INDEX_FILENAME = "samples_index.json"
+SAMPLES_TABLE_FILENAME = "samples_table.npy"
+SAMPLES_STORE_VERSION = 2
+
+_ARENA_FILE_PREFIX = "tensor_"
+_ARENA_FILE_SUFFIX = ".npy"
+_NPY_VERSION = (1, 0)
+_NPY_ALIGNMENT = 64
+_NPY_MAX_LENGTH = 2**63 - 1
+
+
+def is_samples_store(path: pathlib.Path) -> bool:
+    """Check if directory contains the samples store.
+
+    Args:
+        path: Path to samples directory
+
+    Returns:
+        True if the index of samples store exists in directory
+    """
+    return (path / SAMPLES_INDEX_FILENAME).is_file()
+
+
+@dataclasses.dataclass
+class TensorStatistics:
+    """Statistics of tensor values.
+
+    Args:
+        count: Number of elements
+        min: Minimal value
+        max: Maximal value
+        mean: Mean value
+    """
+
+    count: int
+    min: float
+    max: float
+    mean: float
+
+    @property
+    def abs_max(self) -> float:
+        """Maximal absolute value."""
+        return max(abs(self.min), abs(self.max))
+
+    @property
+    def is_finite(self) -> bool:
+        """True if tensor contains neither `NaN` nor `inf` values."""
+        # NaN and inf values propagate to the minimum or maximum
+        return math.isfinite(self.min) and math.isfinite(self.max)
+
+    @classmethod
+    def from_tensor(cls, tensor: np.ndarray) -> Optional["TensorStatistics"]:
+        """Collect statistics with reductions which do not allocate temporary arrays.
+
+        Args:
+            tensor: Numpy tensor
+
+        Returns:
+            Statistics of tensor values or None when tensor is empty or not numeric
+        """
+        if tensor.size == 0 or not (np.issubdtype(tensor.dtype, np.number) or tensor.dtype == np.bool_):
+            return None
+
+        return cls(
+            count=int(tensor.size),
+            min=float(np.min(tensor)),
+            max=float(np.max(tensor)),
+            mean=float(np.mean(tensor, dtype=np.float64)),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "TensorStatistics":
+        """Instantiate TensorStatistics from a dictionary.
+
+        Args:
+            data: Dictionary with statistics
+
+        Returns:
+            TensorStatistics
+        """
+        return cls(count=data["count"], min=data["min"], max=data["max"], mean=data["mean"])
+
+    def to_dict(self) -> Dict:
+        """Serialize statistics to a dictionary."""
+        return {"count": self.count, "min": self.min, "max": self.max, "mean": self.mean, "abs_max": self.abs_max}
+
+    def merge(self, other: "TensorStatistics") -> "TensorStatistics":
+        """Get statistics of values from both tensors.
+
+        Args:
+            other: Statistics of other tensor
+
+        Returns:
+            Merged statistics
+        """
+        count = self.count + other.count
+        return TensorStatistics(
+            count=count,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            mean=(self.mean * self.count + other.mean * other.count) / count,
+        )
+
+
+class _Arena:
+    """Contiguous one dimensional `.npy` file with tensors of a single name and data type."""
+
+    def __init__(self, filepath: pathlib.Path, dtype: np.dtype):
+        self.filepath = filepath
+        self.dtype = dtype
+        self.length = 0
+        self._header_size = _npy_header_size(dtype)
+        self._file: BinaryIO = open(filepath, "wb")  # noqa: SIM115
+        self._file.write(_npy_header(dtype, length=0, header_size=self._header_size))
+
+    def append(self, tensor: np.ndarray) -> int:
+        offset = self.length
+        self._file.write(np.ascontiguousarray(tensor).data)
+        self.length += tensor.size
+        return offset
+
+    def close(self, fsync: bool = False) -> None:
+        # Header has constant size, so it is rewritten in place when the final length is known
+        self._file.seek(0)
+        self._file.write(_npy_header(self.dtype, length=self.length, header_size=self._header_size))
+        if fsync:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+    def abort(self) -> None:
+        self._file.close()
+
+
+class SamplesStoreWriter:
+    """Writes samples to a directory as a columnar store.
+
+    Tensors with the same name and data type are appended to a single contiguous `.npy` file (arena).
+    Arena, offset and shape of each tensor are stored in a table with a row per sample, so samples and their
+    metadata can be read without parsing entries of all samples. The table and the index file with arenas and
+    tensors description are written when the writer is closed, so the directory contains a valid store only
+    after all samples were written.
+
+    Example of use:
+
+        with SamplesStoreWriter(path) as writer:
+            for sample in samples:
+                writer.append(sample)
+    """
+
+    def __init__(self, path: pathlib.Path, fsync: bool = False):
+        """Initialize writer and remove index of a store previously written to the directory.
+
+        Args:
+            path: Output directory
+            fsync: Flush arenas and index to the disk when the writer is closed
+        """
+        self._path = path
+        self._fsync = fsync
+        self._path.mkdir(parents=True, exist_ok=True)
+        (self._path / SAMPLES_INDEX_FILENAME).unlink(missing_ok=True)
+
+        self._arenas: Dict[Tuple[str, str], int] = {}
+        self._arenas_list: List[_Arena] = []
+        self._arenas_names: List[str] = []
+        self._tensors_ndims: Dict[str, int] = {}
+        self._tensors_statistics: Dict[str, TensorStatistics] = {}
+        self._samples: List[Dict[str, Tuple[int, int, Tuple[int, ...]]]] = []
+
+    def __enter__(self) -> "SamplesStoreWriter":
+        """Enter the writer context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Write the index when no error occurred, otherwise leave directory without valid store."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __len__(self) -> int:
+        """Get number of written samples."""
+        return len(self._samples)
+
+    def append(
+        self,
+        sample: Mapping[str, np.ndarray],
+        statistics: Optional[Mapping[str, Optional[TensorStatistics]]] = None,
+    ) -> None:
+        """Append sample to the store.
+
+        Args:
+            sample: Sample with numpy tensors
+            statistics: Statistics of sample tensors merged into statistics of all samples stored in the index
+        """
+        sample_entry = {}
+        for name, tensor in sample.items():
+            tensor = np.asarray(tensor)
+            if tensor.dtype.hasobject:
+                raise ValueError(f"Tensor `{name}` has object data type which cannot be stored in samples store.")
+            if self._tensors_ndims.setdefault(name, tensor.ndim) != tensor.ndim:
+                raise ValueError(
+                    f"Tensor `{name}` has {tensor.ndim} dimensions, but {self._tensors_ndims[name]} dimensions "
+                    "were stored for previous samples."
+                )
+
+            arena_idx = self._get_arena(name, tensor.dtype)
+            offset = self._arenas_list[arena_idx].append(tensor)
+            sample_entry[name] = (arena_idx, offset, tensor.shape)
+
+            tensor_statistics = (statistics or {}).get(name)
+            if tensor_statistics is not None:
+                previous_statistics = self._tensors_statistics.get(name)
+                self._tensors_statistics[name] = (
+                    tensor_statistics if previous_statistics is None else previous_statistics.merge(tensor_statistics)
+                )
+
+        self._samples.append(sample_entry)
+
+    def close(self) -> None:
+        """Finalize arenas and write the index."""
+        for arena in self._arenas_list:
+            arena.close(fsync=self._fsync)
+
+        tensors = [
+            {
+                "name": name,
+                "ndim": ndim,
+                "statistics": self._tensors_statistics[name].to_dict() if name in self._tensors_statistics else None,
+            }
+            for name, ndim in self._tensors_ndims.items()
+        ]
+        table = np.zeros(len(self._samples), dtype=_table_dtype(tensors))
+        for idx, name in enumerate(self._tensors_ndims):
+            table[f"arena_{idx}"] = -1
+            for row, sample_entry in zip(table, self._samples):
+                if name in sample_entry:
+                    row[f"arena_{idx}"], row[f"offset_{idx}"], row[f"shape_{idx}"] = sample_entry[name]
+
+        table_path = self._path / SAMPLES_TABLE_FILENAME
+        tmp_table_path = table_path.with_name(f"{table_path.name}.{os.getpid()}.tmp")
+        with tmp_table_path.open("wb") as f:
+            np.save(f, table)
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_table_path, table_path)
+
+        index = {
+            "version": SAMPLES_STORE_VERSION,
+            "num_samples": len(self._samples),
+            "arenas": [
+                {"file": arena.filepath.name, "name": name, "dtype": arena.dtype.str, "length": arena.length}
+                for name, arena in zip(self._arenas_names, self._arenas_list)
+            ],
+            "tensors": tensors,
+            "table": SAMPLES_TABLE_FILENAME,
+        }
+
+        index_path = self._path / SAMPLES_INDEX_FILENAME
+        tmp_index_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        with tmp_index_path.open("w") as f:
+            json.dump(index, f)
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_index_path, index_path)
+
+    def abort(self) -> None:
+        """Close arenas without writing the index."""
+        for arena in self._arenas_list:
+            arena.abort()
+
+    def _get_arena(self, name: str, dtype: np.dtype) -> int:
+        key = (name, dtype.str)
+        if key not in self._arenas:
+            arena_idx = len(self._arenas_list)
+            filepath = self._path / f"{_ARENA_FILE_PREFIX}{arena_idx}{_ARENA_FILE_SUFFIX}"
+            self._arenas[key] = arena_idx
+            self._arenas_list.append(_Arena(filepath, dtype))
+            self._arenas_names.append(name)
+
+        return self._arenas[key]
+
+
+class SamplesStoreReader:
+    """Reads samples from a columnar store without copying the data.
+
+    Opening the store reads only the index with arenas and tensors description. The table of samples and arenas
+    are memory-mapped on first access, arenas in copy-on-write mode. Returned tensors are views of the mapped
+    files, so only pages that are read are loaded from the disk and in-place modifications are never written back.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        """Initialize reader.
+
+        Args:
+            path: Path to samples directory
+        """
+        self._path = path
+        with (path / SAMPLES_INDEX_FILENAME).open("r") as f:
+            self._index = json.load(f)
+
+        version = self._index.get("version")
+        if version != SAMPLES_STORE_VERSION:
+            raise ValueError(f"Unsupported samples store version: {version}. Expected: {SAMPLES_STORE_VERSION}.")
+
+        self._arenas: Dict[int, np.ndarray] = {}
+        self._table: Optional[np.ndarray] = None
+
+    def __getstate__(self) -> Dict:
+        """Drop memory-mapped table and arenas when reader is pickled."""
+        state = self.__dict__.copy()
+        state["_arenas"] = {}
+        state["_table"] = None
+        return state
+
+    def __len__(self) -> int:
+        """Get number of samples."""
+        return self._index["num_samples"]
+
+    def __getitem__(self, idx: int) -> Dict[str, np.ndarray]:
+        """Get sample for given index.
+
+        Args:
+            idx: Index of sample to get
+
+        Returns:
+            Sample with tensors being views of the memory-mapped arenas
+        """
+        sample = {}
+        for name, arena_idx, offset, shape in self._get_entries(idx):
+            arena = self._get_arena(arena_idx)
+            sample[name] = arena[offset : offset + math.prod(shape)].reshape(shape)
+
+        return sample
+
+    def get_metadata(self, idx: int) -> Dict[str, TensorSpec]:
+        """Get shapes and data types of sample tensors without reading their data.
+
+        Args:
+            idx: Index of sample
+
+        Returns:
+            Specification of each tensor in the sample
+        """
+        return {
+            name: TensorSpec(name=name, shape=shape, dtype=np.dtype(self._index["arenas"][arena_idx]["dtype"]))
+            for name, arena_idx, _, shape in self._get_entries(idx)
+        }
+
+    def get_statistics(self) -> Dict[str, TensorStatistics]:
+        """Get statistics of tensor values collected over all samples.
+
+        Returns:
+            Statistics for tensors which had statistics collected when samples were written
+        """
+        return {
+            tensor["name"]: TensorStatistics.from_dict(tensor["statistics"])
+            for tensor in self._index["tensors"]
+            if tensor.get("statistics") is not None
+        }
+
+    def _get_entries(self, idx: int) -> List[Tuple[str, int, int, Tuple[int, ...]]]:
+        if not -len(self) <= idx < len(self):
+            raise IndexError(f"Sample index {idx} out of range for store with {len(self)} samples.")
+
+        if self._table is None:
+            self._table = np.load((self._path / self._index["table"]).as_posix(), mmap_mode="r")
+
+        row = self._table[idx]
+        entries = []
+        for tensor_idx, tensor in enumerate(self._index["tensors"]):
+            arena_idx = int(row[f"arena_{tensor_idx}"])
+            if arena_idx < 0:
+                continue
+            shape = tuple(int(dim) for dim in row[f"shape_{tensor_idx}"])
+            entries.append((tensor["name"], arena_idx, int(row[f"offset_{tensor_idx}"]), shape))
+
+        return entries
+
+    def _get_arena(self, arena_idx: int) -> np.ndarray:
+        if arena_idx not in self._arenas:
+            arena_filepath = self._path / self._index["arenas"][arena_idx]["file"]
+            # Base ndarray view of the memory map, so the returned tensors are not `np.memmap` instances
+            self._arenas[arena_idx] = np.asarray(np.load(arena_filepath.as_posix(), mmap_mode="c"))
+
+        return self._arenas[arena_idx]
+
+
+def _table_dtype(tensors: List[Dict]) -> np.dtype:
+    fields = []
+    for idx, tensor in enumerate(tensors):
+        fields.extend([
+            (f"arena_{idx}", np.int32),
+            (f"offset_{idx}", np.int64),
+            (f"shape_{idx}", np.int64, (tensor["ndim"],)),
+        ])
+    return np.dtype(fields)
+
+
+def _npy_header_size(dtype: np.dtype) -> int:
+    header = _npy_header_dict(dtype, _NPY_MAX_LENGTH)
+    size = len(np.lib.format.MAGIC_PREFIX) + 2 + 2 + len(header) + 1
+    return math.ceil(size / _NPY_ALIGNMENT) * _NPY_ALIGNMENT
+
+
+def _npy_header(dtype: np.dtype, length: int, header_size: int) -> bytes:
+    prefix = np.lib.format.MAGIC_PREFIX + bytes(_NPY_VERSION)
+    header = _npy_header_dict(dtype, length)
+    padding = header_size - len(prefix) - 2 - len(header) - 1
+    header = f"{header}{' ' * padding}\n"
+    return prefix + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _npy_header_dict(dtype: np.dtype, length: int) -> str:
+    return repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)})
@@ -0,0 +1,253 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Timeline tracing in the Chrome Trace Event format."""
+
+import contextlib
+import json
+import os
+import pathlib
+import threading
+import time
+from typing import Any, Dict, Generator, List, Optional, Union
+
+import psutil
+
+from model_navigator.configuration.constants import DEFAULT_TRACE_MAX_EVENTS
+from model_navigator.core.logger import LOGGER
+
+
+def timestamp() -> float:
+    """Return current time in microseconds used as timestamp of trace events.
+
+    Wall clock is used, so events recorded by child processes are placed on the same timeline.
+    """
+    return time.time_ns() / 1000
+
+
+class Tracer:
+    """Collects spans and counters of a timeline in the Chrome Trace Event format.
+
+    The trace can be opened in Perfetto UI or chrome://tracing. Spans are stored as complete events of the process
+    and thread recording them, so spans of the same thread are nested by their time ranges. Events are recorded only
+    between `start` and `stop`, and at most `max_events` events are kept.
+
+    Example of use:
+
+        tracer = get_tracer()
+        tracer.start(process_name="Optimize")
+        with tracer.span("Performance", category="command"):
+            ...
+        save_trace(path, tracer.stop())
+    """
+
+    def __init__(self, max_events: int = DEFAULT_TRACE_MAX_EVENTS):
+        """Initialize the tracer.
+
+        Args:
+            max_events: Maximal number of recorded events, further events are dropped
+        """
+        self.max_events = max_events
+        self._events: List[Dict[str, Any]] = []
+        self._threads = set()
+        self._dropped_events = 0
+        self._enabled = False
+        self._paused = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True when events are recorded."""
+        return self._enabled and not self._paused
+
+    @contextlib.contextmanager
+    def paused(self) -> Generator[None, None, None]:
+        """Do not record events in the context, e.g. to keep measurements free of tracing overhead."""
+        with self._lock:
+            self._paused += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._paused -= 1
+
+    def start(self, process_name: Optional[str] = None) -> None:
+        """Clear events and start recording.
+
+        Args:
+            process_name: Name of the process presented in the timeline
+        """
+        with self._lock:
+            self._events = []
+            self._threads = set()
+            self._dropped_events = 0
+            self._pid = os.getpid()
+            self._enabled = True
+
+        if process_name is not None:
+            self._append({"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": process_name}})
+
+    def stop(self) -> List[Dict[str, Any]]:
+        """Stop recording.
+
+        Returns:
+            Recorded events
+        """
+        with self._lock:
+            self._enabled = False
+            events, self._events = self._events, []
+            dropped_events, self._dropped_events = self._dropped_events, 0
+
+        if dropped_events:
+            LOGGER.debug(f"Trace is limited to {self.max_events} events, {dropped_events} events were dropped.")
+
+        return events
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> Generator[None, None, None]:
+        """Record time range of the context as a span.
+
+        Args:
+            name: Name of the span
+            category: Category of the span, e.g. `command`
+            args: Additional data presented with the span
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = timestamp()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start=start, duration=(time.perf_counter() - start_time) * 1e6, args=args)
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record span of the current thread.
+
+        Args:
+            name: Name of the span
+            category: Category of the span
+            start: Start timestamp in microseconds obtained from `timestamp`
+            duration: Duration in microseconds
+            args: Additional data presented with the span
+        """
+        if not self.enabled:
+            return
+
+        event = {"name": name, "cat": category, "ph": "X", "ts": start, "dur": duration, "pid": self._pid}
+        event["tid"] = self._get_thread_id()
+        if args:
+            event["args"] = args
+        self._append(event)
+
+    def counter(self, name: str, values: Dict[str, Optional[float]]) -> None:
+        """Record values of a counter at the current time.
+
+        Args:
+            name: Name of the counter
+            values: Values of the counter series, None values are omitted
+        """
+        values = {key: float(value) for key, value in values.items() if value is not None}
+        if not self.enabled or not values:
+            return
+
+        self._append({"name": name, "ph": "C", "ts": timestamp(), "pid": self._pid, "args": values})
+
+    def record_memory(self) -> None:
+        """Record resident memory of the current process in MB."""
+        if not self.enabled:
+            return
+
+        try:
+            rss = psutil.Process().memory_info().rss / 2**20
+        except psutil.Error:
+            return
+
+        self.counter("memory [MB]", {"rss": rss})
+
+    def load(self, path: Union[str, pathlib.Path]) -> None:
+        """Merge events saved by another process and remove the file.
+
+        Args:
+            path: Path to the trace file
+        """
+        path = pathlib.Path(path)
+        events = []
+        try:
+            if path.stat().st_size > 0:
+                with path.open("r") as f:
+                    events = json.load(f)["traceEvents"]
+        except (OSError, ValueError, KeyError) as e:
+            LOGGER.debug(f"Unable to load trace events from {path.as_posix()!r}: {e}")
+        finally:
+            path.unlink(missing_ok=True)
+
+        if self._enabled:
+            for event in events:
+                self._append(event)
+
+    def _get_thread_id(self) -> int:
+        thread_id = threading.get_native_id()
+        if thread_id not in self._threads:
+            self._threads.add(thread_id)
+            self._append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": thread_id,
+                "args": {"name": threading.current_thread().name},
+            })
+
+        return thread_id
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._events) < self.max_events:
+                self._events.append(event)
+            else:
+                self._dropped_events += 1
+
+
+def save_trace(path: Union[str, pathlib.Path], events: List[Dict[str, Any]]) -> None:
+    """Save events as a trace file in the Chrome Trace Event format.
+
+    Args:
+        path: Path to the trace file
+        events: Events recorded by `Tracer`
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get tracer of the current process.
+
+    Returns:
+        Tracer
+    """
+    return _tracer
@@ -0,0 +1,129 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of background writers."""
+
+import collections
+import os
+import pathlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, Deque, Optional, Tuple, Union
+
+from model_navigator.configuration.constants import DEFAULT_SAMPLES_WRITER_MAX_PENDING, DEFAULT_SAMPLES_WRITER_WORKERS
+
+
+class WriterPool(ContextManager):
+    """Runs write tasks in background threads with a bounded number of pending tasks.
+
+    Each task has a serialize stage run concurrently in a thread pool and an optional commit stage run
+    in a single thread in the order of submission, e.g. to append serialized data to a shared file.
+    The caller is blocked when the number of pending tasks exceeds `max_pending`, and errors raised
+    by tasks are propagated to the caller on next submission or when waiting for the tasks.
+
+    Example of use:
+
+        with WriterPool() as pool:
+            for sample in samples:
+                pool.submit(lambda sample=sample: serialize(sample), writer.append)
+    """
+
+    def __init__(
+        self,
+        num_workers: int = DEFAULT_SAMPLES_WRITER_WORKERS,
+        max_pending: int = DEFAULT_SAMPLES_WRITER_MAX_PENDING,
+    ):
+        """Initialize pool.
+
+        Args:
+            num_workers: Number of threads running serialize stage of tasks.
+            max_pending: Maximal number of tasks not yet finished.
+        """
+        if num_workers < 1 or max_pending < 1:
+            raise ValueError(
+                f"Number of workers and pending tasks must be positive. Got {num_workers} and {max_pending}."
+            )
+
+        self._max_pending = max_pending
+        # Futures of the serialize stage and of the last stage of each task
+        self._pending: Deque[Tuple[Future, Future]] = collections.deque()
+        self._serialize_executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="writer_pool")
+        self._commit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer_pool_commit")
+
+    def __enter__(self) -> "WriterPool":
+        """Enter the pool context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Wait for pending tasks unless an error occurred and shutdown the pool."""
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            self.shutdown(cancel=exc_type is not None)
+
+    def submit(self, serialize: Callable[[], Any], commit: Optional[Callable[[Any], None]] = None) -> None:
+        """Submit write task.
+
+        Args:
+            serialize: Function run in the thread pool.
+            commit: Function called with result of `serialize` in the order of submission.
+        """
+        self._wait(self._max_pending - 1)
+        serialize_future = self._serialize_executor.submit(serialize)
+        if commit is None:
+            self._pending.append((serialize_future, serialize_future))
+        else:
+            self._pending.append((serialize_future, self._commit_executor.submit(_commit, serialize_future, commit)))
+
+    def wait(self) -> None:
+        """Wait for all pending tasks."""
+        self._wait(0)
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Stop threads of the pool.
+
+        Args:
+            cancel: Cancel tasks which have not started.
+        """
+        # `cancel_futures` of `shutdown` is not available in Python 3.8
+        if cancel:
+            for serialize_future, future in self._pending:
+                future.cancel()
+                serialize_future.cancel()
+        self._serialize_executor.shutdown(wait=True)
+        self._commit_executor.shutdown(wait=True)
+        self._pending.clear()
+
+    def _wait(self, max_pending: int) -> None:
+        while len(self._pending) > max_pending:
+            _, future = self._pending.popleft()
+            future.result()
+
+
+def write_file(path: pathlib.Path, data: Union[bytes, memoryview], fsync: bool = False) -> None:
+    """Write data to file.
+
+    Args:
+        path: Path to file.
+        data: Data to write.
+        fsync: Flush the file to the disk before returning.
+    """
+    with path.open("wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _commit(serialize_future: Future, commit: Callable[[Any], None]) -> None:
+    commit(serialize_future.result())
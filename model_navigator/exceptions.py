@@ -156,6 +156,12 @@ class ModelNavigatorCommandNotExecutable(ModelNavigatorError):
     pass
 
 
+class ModelNavigatorTimeBudgetExceeded(ModelNavigatorCommandNotExecutable):
+    """Raised when command does not fit in the remaining optimization time budget."""
+
+    pass
+
+
 class ModelNavigatorModuleNotOptimizedError(ModelNavigatorError):
     """Raised when the module is not optimized and is required to be optimized."""
 
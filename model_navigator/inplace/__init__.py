@@ -27,8 +27,10 @@ from model_navigator.commands.performance.performance import Performance
 from model_navigator.commands.performance.utils import is_throughput_saturated
 from model_navigator.configuration import (
     DEFAULT_TORCH_TARGET_FORMATS_FOR_PROFILING,
+    ArrivalDistribution,
     Format,
     SelectedRuntimeStrategy,
+    StabilityCriterion,
     TensorRTPrecision,
 )
 from model_navigator.configuration.constants import (
@@ -140,6 +142,9 @@ def profile(
     max_trials: int = DEFAULT_MAX_TRIALS,
     throughput_cutoff_threshold: Optional[float] = DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD,
     throughput_backoff_limit: int = DEFAULT_THROUGHPUT_BACKOFF_LIMIT,
+    request_rate: Optional[float] = None,
+    arrival_distribution: ArrivalDistribution = ArrivalDistribution.POISSON,
+    stability_criterion: StabilityCriterion = StabilityCriterion.WINDOW_MEAN,
     device: str = "cuda",
     initialize: bool = True,
     verbose: bool = False,
@@ -160,6 +165,10 @@ def profile(
                                      profiling run through whole dataloader
         throughput_backoff_limit: Back-off limit to run multiple more profiling steps to avoid stop at local minimum
                                   when throughput saturate based on `throughput_cutoff_threshold`.
+        request_rate: When provided, requests are sent in open-loop mode at given rate [req/sec] and the latency
+                      includes the queueing delay.
+        arrival_distribution: Distribution of request arrival times used in open-loop mode.
+        stability_criterion: Criterion used to decide when measurement is stable.
         device: Default device used for loading unoptimized model.
         initialize: Whether to initialize pipeline on device before profiling.
         verbose: Provide verbose logging
@@ -173,6 +182,7 @@ def profile(
         runners = list(runner_registry.values())
 
     event_emitter = profile_event_emitter()
+    event_emitter.emit(ProfileEvent.WORKSPACE_INITIALIZED, path=inplace_config.cache_dir)
     event_emitter.emit(ProfileEvent.PROFILING_STARTED)
 
     validate_device_string(device)
@@ -212,6 +222,9 @@ def profile(
                     stability_percentage=stability_percentage,
                     throughput_cutoff_threshold=throughput_cutoff_threshold,
                     throughput_backoff_limit=throughput_backoff_limit,
+                    request_rate=request_rate,
+                    arrival_distribution=arrival_distribution,
+                    stability_criterion=stability_criterion,
                 ):
                     runner_profiling_results.detailed[sample_id] = result
 
@@ -280,6 +293,9 @@ def _profile_runner(
     max_trials: int,
     throughput_cutoff_threshold: Optional[float],
     throughput_backoff_limit: int,
+    request_rate: Optional[float] = None,
+    arrival_distribution: ArrivalDistribution = ArrivalDistribution.POISSON,
+    stability_criterion: StabilityCriterion = StabilityCriterion.WINDOW_MEAN,
 ):
     if is_torch_available():
         torch = lazy_import("torch")
@@ -304,6 +320,9 @@ def _profile_runner(
                     stabilization_windows=stabilization_windows,
                     window_size=window_size,
                     stability_percentage=stability_percentage,
+                    request_rate=request_rate,
+                    arrival_distribution=arrival_distribution,
+                    stability_criterion=stability_criterion,
                 )
 
             LOGGER.debug(
@@ -391,7 +410,7 @@ def _load_modules(model_key: str, runner_name: str, device: str, verbose: bool =
                 )
 
         except (ModelNavigatorModuleNotOptimizedError, ModelNavigatorRuntimeAnalyzerError) as e:
-            LOGGER.info(f"{str(e)}" f"Loading eager module for `{module_name}` on device: `{device}`.")
+            LOGGER.info(f"{str(e)}Loading eager module for `{module_name}` on device: `{device}`.")
             m.load_eager(device=device)
         except Exception as e:
             LOGGER.warning(f"Failed to load module {module_name} for model key {model_key} and runner {runner_name}.")
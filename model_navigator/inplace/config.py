@@ -29,7 +29,12 @@ from model_navigator.configuration import (
     RuntimeSearchStrategy,
     VerifyFunction,
 )
-from model_navigator.configuration.constants import DEFAULT_SAMPLE_COUNT
+from model_navigator.configuration.constants import (
+    DEFAULT_DATALOADER_PREFETCH_DEPTH,
+    DEFAULT_DATALOADER_WORKERS,
+    DEFAULT_PIPELINE_WORKERS,
+    DEFAULT_SAMPLE_COUNT,
+)
 from model_navigator.runners.base import NavigatorRunner
 
 DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "model_navigator"
@@ -108,6 +113,18 @@ class OptimizeConfig:
         debug: Enable debug logging from commands
         verify_func: Function for additional model verification
         custom_configs: Sequence of CustomConfigs used to control produced artifacts
+        correctness_batch_size: Maximal batch size of samples concatenated for generating reference outputs
+            and correctness tests, limited by the dataloader maximal batch size. None runs inference per sample.
+        dataloader_prefetch_depth: Number of samples loaded ahead from the dataloader in background threads.
+            Dataloaders reusing buffers between samples require 0, which disables prefetching.
+        dataloader_workers: Number of threads loading samples from dataloaders supporting indexing.
+        pipeline_workers: Number of threads executing independent commands concurrently, e.g. exports
+            and conversions to different formats. Commands running on the GPU are not executed concurrently.
+        resume: Reuse existing workspace and replay outputs of commands stored in the workspace cache whose
+            inputs and upstream models have not changed. Only invalidated commands are executed.
+        time_budget: Maximal time in seconds spent on optimization. Cheap commands are executed first, commands which
+            do not fit in the remaining budget are skipped and profiling of runners clearly slower than already
+            profiled runtimes is stopped early. None means no limit.
     """
 
     sample_count: int = DEFAULT_SAMPLE_COUNT
@@ -123,6 +140,12 @@ class OptimizeConfig:
     debug: Optional[bool] = False
     verify_func: Optional[VerifyFunction] = None
     custom_configs: Optional[Sequence[CustomConfig]] = None
+    correctness_batch_size: Optional[int] = None
+    dataloader_prefetch_depth: int = DEFAULT_DATALOADER_PREFETCH_DEPTH
+    dataloader_workers: int = DEFAULT_DATALOADER_WORKERS
+    pipeline_workers: int = DEFAULT_PIPELINE_WORKERS
+    resume: bool = False
+    time_budget: Optional[float] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert OptimizeConfig to dictionary."""
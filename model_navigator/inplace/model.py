@@ -16,8 +16,10 @@
 import abc
 import collections
 import copy
+import functools
 import gc
 import inspect
+import io
 import pathlib
 import tempfile
 from typing import Any, Callable, List, Optional
@@ -31,6 +33,7 @@ from model_navigator.configuration import (
 from model_navigator.core.dataloader import to_numpy
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import PyTreeMetadata
+from model_navigator.core.writer_pool import WriterPool, write_file
 from model_navigator.frameworks import is_torch2_available
 from model_navigator.package import Package, load_from_workspace
 from model_navigator.utils.module import lazy_import
@@ -155,6 +158,7 @@ class RecordingModule(BaseModule):
         self._temp_dir = tempfile.TemporaryDirectory(prefix=f"{self._name}_")
         self._samples_dir = pathlib.Path(self._temp_dir.name)
         self._min_batch_sizes = {}
+        self._writer_pool = WriterPool()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Record a sample and run the module."""
@@ -187,6 +191,8 @@ class RecordingModule(BaseModule):
         if not self.optimize_config:
             raise ModelNavigatorRuntimeError(f"The module `{self.name}` has no optimize configuration")
 
+        self._writer_pool.wait()
+
         batch_dim = 0 if self.optimize_config.batching else None
         if self.optimize_config.batching:
             self._update_max_batch_size()
@@ -213,7 +219,10 @@ class RecordingModule(BaseModule):
         if len(self._samples[pytree_metadata]) < inplace_config.max_num_samples_stored:
             ind = self.get_total_num_samples()
             sample_path = self._samples_dir / f"{ind}.pt"
-            torch.save(sample, sample_path)
+            # Tensors may be reused by the caller, so only writing the serialized sample is done in background
+            buffer = io.BytesIO()
+            torch.save(sample, buffer)
+            self._writer_pool.submit(functools.partial(write_file, sample_path, buffer.getbuffer()))
             self._samples[pytree_metadata].append(sample_path)
 
         shapes = {n: to_numpy(t, Framework.TORCH).shape for n, t in pytree_metadata.flatten_sample(sample).items()}
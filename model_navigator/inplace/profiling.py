@@ -24,7 +24,13 @@ import yaml
 
 from model_navigator.commands.base import CommandStatus
 from model_navigator.commands.performance.nvml_handler import NvmlHandler
-from model_navigator.commands.performance.utils import is_measurement_stable
+from model_navigator.commands.performance.utils import (
+    MeasurementStability,
+    get_arrival_times,
+    get_measurement_stability,
+)
+from model_navigator.configuration import ArrivalDistribution, StabilityCriterion
+from model_navigator.core.histogram import LatencyHistogram
 from model_navigator.core.logger import LOGGER
 from model_navigator.exceptions import ModelNavigatorError
 from model_navigator.frameworks import is_torch_available
@@ -48,10 +54,39 @@ class ProfilingResult(DataObject):
     throughput: float  # infer / sec
     request_count: int
     avg_gpu_clock: Optional[float] = None  # MHz
+    request_rate: Optional[float] = None  # requests / sec
+    avg_queue_delay: Optional[float] = None  # ms
+    stability_criterion: Optional[StabilityCriterion] = None
+    stability_value: Optional[float] = None  # %
+    p50_latency_ci: Optional[List[float]] = None  # ms
+    latency_histogram: Optional[LatencyHistogram] = dataclasses.field(default=None, repr=False, compare=False)
+    # Raw latencies of a measurement window used for stability verification, not serialized
+    latencies: Optional[np.ndarray] = dataclasses.field(default=None, repr=False, compare=False)
+
+    def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
+        """Serialize to a dictionary.
+
+        Append `latencies` field to filtered fields during dump.
+
+        Args:
+            filter_fields: List of fields to filter out.
+            parse: If True recursively parse field values to jsonable representation.
+
+        Returns:
+            Data serialized to a dictionary.
+        """
+        filter_fields = [*(filter_fields or []), "latencies"]
+        return super().to_dict(filter_fields=filter_fields, parse=parse)
 
     @classmethod
     def from_measurements(
-        cls, measurements: List[float], batch_size: int, gpu_clocks: Optional[List[float]] = None
+        cls,
+        measurements: List[float],
+        batch_size: int,
+        gpu_clocks: Optional[List[float]] = None,
+        queue_delays: Optional[List[float]] = None,
+        duration: Optional[float] = None,
+        request_rate: Optional[float] = None,
     ) -> "ProfilingResult":
         """Create profiling results from measurements.
 
@@ -59,6 +94,9 @@ class ProfilingResult(DataObject):
             measurements: List of time measurements.
             batch_size: Batch size.
             gpu_clocks: List of GPU clocks.
+            queue_delays: List of queueing delays in open-loop measurements. Latencies include the delays.
+            duration: Wall time of the measurements in milliseconds used to compute throughput.
+            request_rate: Request rate used in open-loop measurements.
 
         Returns:
             Profiling result.
@@ -71,24 +109,43 @@ class ProfilingResult(DataObject):
             else:
                 avg_gpu_clock = None
 
-        avg_latency = float(np.mean(measurements))
+        avg_queue_delay = None
+        if queue_delays is not None:
+            avg_queue_delay = float(np.mean(queue_delays))
+            measurements = np.array(measurements) + np.array(queue_delays)
+
+        latency_histogram = LatencyHistogram.from_values(measurements)
+        avg_latency = latency_histogram.mean
+        if duration is not None:
+            throughput = 1000 * (batch_size or 1) * len(measurements) / duration
+        else:
+            throughput = 1000 * (batch_size or 1) / avg_latency
+
+        p50_latency, p90_latency, p95_latency, p99_latency = latency_histogram.percentiles([50, 90, 95, 99])
         return cls(
             avg_latency=avg_latency,
-            std_latency=float(np.std(measurements)),
-            p50_latency=float(np.percentile(measurements, 50)),
-            p90_latency=float(np.percentile(measurements, 90)),
-            p95_latency=float(np.percentile(measurements, 95)),
-            p99_latency=float(np.percentile(measurements, 99)),
-            throughput=(1000 * (batch_size or 1) / avg_latency),
+            std_latency=latency_histogram.std,
+            p50_latency=p50_latency,
+            p90_latency=p90_latency,
+            p95_latency=p95_latency,
+            p99_latency=p99_latency,
+            throughput=throughput,
             batch_size=batch_size,
             request_count=len(measurements),
             avg_gpu_clock=avg_gpu_clock,
+            request_rate=request_rate,
+            avg_queue_delay=avg_queue_delay,
+            latency_histogram=latency_histogram,
+            latencies=np.asarray(measurements),
         )
 
     @classmethod
     def from_profiling_results(cls, profiling_results: List["ProfilingResult"]) -> "ProfilingResult":
         """Create profiling results from list of profiling results.
 
+        Latency statistics are computed from merged histograms of all measurements when available.
+        Otherwise, the statistics of the results are averaged.
+
         Args:
             profiling_results: List of profiling results.
 
@@ -96,9 +153,13 @@ class ProfilingResult(DataObject):
             Profiling result.
         """
         batch_size = profiling_results[0].batch_size
-        assert all(
-            result.batch_size == batch_size for result in profiling_results
-        ), "Batch size must be the same for all profiling results"
+        assert all(result.batch_size == batch_size for result in profiling_results), (
+            "Batch size must be the same for all profiling results"
+        )
+        request_rate = profiling_results[0].request_rate
+        assert all(result.request_rate == request_rate for result in profiling_results), (
+            "Request rate must be the same for all profiling results"
+        )
         if profiling_results[0].avg_gpu_clock:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", category=RuntimeWarning)
@@ -106,18 +167,42 @@ class ProfilingResult(DataObject):
         else:
             avg_gpu_clock = None
 
-        avg_latency = float(np.mean([result.avg_latency for result in profiling_results]))
+        latency_histogram = None
+        if all(result.latency_histogram is not None for result in profiling_results):
+            latency_histogram = LatencyHistogram.merged([result.latency_histogram for result in profiling_results])
+            avg_latency = latency_histogram.mean
+            std_latency = latency_histogram.std
+            p50_latency, p90_latency, p95_latency, p99_latency = latency_histogram.percentiles([50, 90, 95, 99])
+        else:
+            avg_latency = float(np.mean([result.avg_latency for result in profiling_results]))
+            std_latency = float(np.std([result.std_latency for result in profiling_results]))
+            p50_latency = float(np.percentile([result.p50_latency for result in profiling_results], 50))
+            p90_latency = float(np.percentile([result.p90_latency for result in profiling_results], 90))
+            p95_latency = float(np.percentile([result.p95_latency for result in profiling_results], 95))
+            p99_latency = float(np.percentile([result.p99_latency for result in profiling_results], 99))
+
+        if request_rate is not None:
+            # In open-loop mode latency includes queueing delay and does not determine the throughput
+            throughput = float(np.mean([result.throughput for result in profiling_results]))
+            avg_queue_delay = float(np.mean([result.avg_queue_delay for result in profiling_results]))
+        else:
+            throughput = 1000 * (batch_size or 1) / avg_latency
+            avg_queue_delay = None
+
         return cls(
             avg_latency=avg_latency,
-            std_latency=float(np.std([result.std_latency for result in profiling_results])),
-            p50_latency=float(np.percentile([result.p50_latency for result in profiling_results], 50)),
-            p90_latency=float(np.percentile([result.p90_latency for result in profiling_results], 90)),
-            p95_latency=float(np.percentile([result.p95_latency for result in profiling_results], 95)),
-            p99_latency=float(np.percentile([result.p99_latency for result in profiling_results], 99)),
-            throughput=(1000 * (batch_size or 1) / avg_latency),
+            std_latency=std_latency,
+            p50_latency=p50_latency,
+            p90_latency=p90_latency,
+            p95_latency=p95_latency,
+            p99_latency=p99_latency,
+            throughput=throughput,
             batch_size=batch_size,
             request_count=int(np.mean([result.request_count for result in profiling_results])),
             avg_gpu_clock=avg_gpu_clock,
+            request_rate=request_rate,
+            avg_queue_delay=avg_queue_delay,
+            latency_histogram=latency_histogram,
         )
 
     @classmethod
@@ -131,14 +216,22 @@ class ProfilingResult(DataObject):
             ProfilingResult: Profiling results.
 
         """
+        if data.get("stability_criterion") is not None:
+            data = {**data, "stability_criterion": StabilityCriterion(data["stability_criterion"])}
+        if data.get("latency_histogram") is not None:
+            data = {**data, "latency_histogram": LatencyHistogram.from_dict(data["latency_histogram"])}
         return cls(**data)
 
     def __str__(self) -> str:
         """Get string representation."""
         avg_gpu_clock = f"{self.avg_gpu_clock:.4f}" if self.avg_gpu_clock is not None else "-"
+        request_rate = f"{self.request_rate:.4f}" if self.request_rate is not None else "-"
+        avg_queue_delay = f"{self.avg_queue_delay:.4f}" if self.avg_queue_delay is not None else "-"
         return (
             f"Batch: {self.batch_size}\n"
             f"Request count: {self.request_count}\n"
+            f"Request rate: {request_rate} [req/sec]\n"
+            f"Avg Queue delay: {avg_queue_delay} [ms]\n"
             f"Throughput: {self.throughput:.4f} [infer/sec]\n"
             f"Avg Latency: {self.avg_latency:.4f} [ms]\n"
             f"Std Latency: {self.std_latency:.4f} [ms]\n"
@@ -207,6 +300,9 @@ def run_measurement(
     stabilization_windows: int,
     window_size: int,
     stability_percentage: float,
+    request_rate: Optional[float] = None,
+    arrival_distribution: ArrivalDistribution = ArrivalDistribution.POISSON,
+    stability_criterion: StabilityCriterion = StabilityCriterion.WINDOW_MEAN,
 ) -> ProfilingResult:
     """Run profiling measurement.
 
@@ -219,6 +315,9 @@ def run_measurement(
         stabilization_windows: Number of stabilization windows.
         window_size: Number of inference queries performed in measurement window
         stability_percentage: Allowed percentage of variation from the mean in three consecutive windows.
+        request_rate: When provided, requests are sent in open-loop mode at given rate [req/sec].
+        arrival_distribution: Distribution of request arrival times used in open-loop mode.
+        stability_criterion: Criterion used to decide when measurement is stable.
 
     Returns:
         ProfilingResult: Profiling results.
@@ -228,21 +327,36 @@ def run_measurement(
     _, sample = sample  # skip first element - batch_size
     for idx in range(max_trials):
         measurement_id = idx + 1
-        profiling_result = _run_window_measurement(
-            func=func, sample=sample, batch_size=batch_size, window_size=window_size, nvml_handler=nvml_handler
-        )
+        if request_rate is not None:
+            profiling_result = _run_open_loop_window_measurement(
+                func=func,
+                sample=sample,
+                batch_size=batch_size,
+                window_size=window_size,
+                nvml_handler=nvml_handler,
+                request_rate=request_rate,
+                arrival_distribution=arrival_distribution,
+            )
+        else:
+            profiling_result = _run_window_measurement(
+                func=func, sample=sample, batch_size=batch_size, window_size=window_size, nvml_handler=nvml_handler
+            )
 
         profiling_results.append(profiling_result)
         LOGGER.debug(f"Measurement [{measurement_id}], avg_latency: {profiling_result.avg_latency} ms")
 
         last_n = min(stabilization_windows, max_trials)
-        is_stable = is_measurement_stable(profiling_results, last_n=last_n, stability_percentage=stability_percentage)
-        if measurement_id >= min_trials and is_stable:
-            return _measurements_result(profiling_results, last_n)
+        stability = get_measurement_stability(
+            profiling_results,
+            last_n=last_n,
+            stability_percentage=stability_percentage,
+            stability_criterion=stability_criterion,
+        )
+        if measurement_id >= min_trials and stability.is_stable:
+            return _measurements_result(profiling_results, stability, stability_criterion)
 
     raise RuntimeError(
-        "Unable to get stable performance results. Consider increasing "
-        "window_size | stability_percentage | max_trials"
+        "Unable to get stable performance results. Consider increasing window_size | stability_percentage | max_trials"
     )
 
 
@@ -253,11 +367,7 @@ def _run_window_measurement(
     nvml_handler: NvmlHandler,
     window_size: int,
 ) -> ProfilingResult:
-    if not isinstance(sample, (list, tuple)):
-        sample = (sample,)
-    if not isinstance(sample[-1], dict):
-        sample = (*sample, {})
-    *args, kwargs = sample
+    args, kwargs = _unpack_sample(sample)
 
     measurements = []
     gpu_clocks = []
@@ -272,14 +382,76 @@ def _run_window_measurement(
     return ProfilingResult.from_measurements(measurements=measurements, batch_size=batch_size, gpu_clocks=gpu_clocks)
 
 
+def _run_open_loop_window_measurement(
+    func: Callable,
+    sample: Any,
+    batch_size: int,
+    nvml_handler: NvmlHandler,
+    window_size: int,
+    request_rate: float,
+    arrival_distribution: ArrivalDistribution,
+) -> ProfilingResult:
+    args, kwargs = _unpack_sample(sample)
+    arrival_times = get_arrival_times(
+        request_rate=request_rate,
+        request_count=window_size,
+        arrival_distribution=arrival_distribution,
+    )
+
+    measurements = []
+    queue_delays = []
+    gpu_clocks = []
+    window_start = time.monotonic()
+    for arrival_time in window_start + arrival_times:
+        delay = arrival_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        start = time.monotonic()
+        func(*args, **kwargs)
+        _synchronize()
+        end = time.monotonic()
+        gpu_clocks.append(nvml_handler.gpu_clock)
+        measurements.append((end - start) * 1000.0)  # ms
+        queue_delays.append((start - arrival_time) * 1000.0)  # ms
+
+    window_end = max(time.monotonic(), window_start + window_size / request_rate)
+    return ProfilingResult.from_measurements(
+        measurements=measurements,
+        batch_size=batch_size,
+        gpu_clocks=gpu_clocks,
+        queue_delays=queue_delays,
+        duration=(window_end - window_start) * 1000.0,
+        request_rate=request_rate,
+    )
+
+
+def _unpack_sample(sample: Any):
+    if not isinstance(sample, (list, tuple)):
+        sample = (sample,)
+    if not isinstance(sample[-1], dict):
+        sample = (*sample, {})
+    *args, kwargs = sample
+    return args, kwargs
+
+
 def _synchronize():
     if is_torch_available():
         torch.cuda.synchronize()
 
 
-def _measurements_result(profiling_results: List[ProfilingResult], last_n: int = 3) -> ProfilingResult:
-    if len(profiling_results) < last_n:
-        raise ModelNavigatorError(f"Measurements results requires at least {last_n} consecutive stable measurements.")
+def _measurements_result(
+    profiling_results: List[ProfilingResult],
+    stability: MeasurementStability,
+    stability_criterion: StabilityCriterion,
+) -> ProfilingResult:
+    profiling_results = profiling_results[stability.first_window :]  # noqa: E203
+    if not profiling_results:
+        raise ModelNavigatorError("Measurements results requires at least one stable measurement.")
+
+    profiling_result = ProfilingResult.from_profiling_results(profiling_results)
+    profiling_result.stability_criterion = stability_criterion
+    profiling_result.stability_value = stability.stability_value
+    if stability.median_latency_ci is not None:
+        profiling_result.p50_latency_ci = list(stability.median_latency_ci)
 
-    profiling_results = profiling_results[-last_n:]
-    return ProfilingResult.from_profiling_results(profiling_results)
+    return profiling_result
@@ -27,6 +27,7 @@ import yaml
 
 from model_navigator.configuration import Format
 from model_navigator.configuration.constants import DEFAULT_COMPARISON_REPORT_FILE
+from model_navigator.core.histogram import LatencyHistogram
 from model_navigator.inplace.registry import module_registry
 from model_navigator.utils.environment import get_env
 
@@ -52,6 +53,34 @@ class RuntimeResults:
     average_time_ms: Optional[float] = None
     total_time_ms: Optional[float] = None
     call_count: Optional[int] = None
+    p50_time_ms: Optional[float] = None
+    p90_time_ms: Optional[float] = None
+    p99_time_ms: Optional[float] = None
+
+    @classmethod
+    def from_measurements(cls, times: List[float], histogram: Optional[Dict[str, Any]] = None) -> "RuntimeResults":
+        """Create runtime results from serialized histogram or from list of times when histogram is not available.
+
+        Args:
+            times: List of time measurements in milliseconds.
+            histogram: Serialized histogram of time measurements.
+
+        Returns:
+            Runtime results.
+        """
+        latency_histogram = LatencyHistogram.from_dict(histogram) if histogram else LatencyHistogram.from_values(times)
+        if not latency_histogram.count:
+            return cls(total_time_ms=0, average_time_ms=0, call_count=0)
+
+        p50_time_ms, p90_time_ms, p99_time_ms = latency_histogram.percentiles([50, 90, 99])
+        return cls(
+            total_time_ms=latency_histogram.sum,
+            average_time_ms=latency_histogram.mean,
+            call_count=latency_histogram.count,
+            p50_time_ms=p50_time_ms,
+            p90_time_ms=p90_time_ms,
+            p99_time_ms=p99_time_ms,
+        )
 
 
 @dataclasses.dataclass(order=True)
@@ -63,6 +92,7 @@ class ModuleTimeData:
     runners: List[str]
     runtime_results: Optional[RuntimeResults] = None
     times: Optional[List[float]] = dataclasses.field(default_factory=list)
+    histogram: Optional[Dict[str, Any]] = None
 
     @property
     def total_time_ms(self) -> float:
@@ -81,11 +111,7 @@ class ModuleTimeData:
 
     def __post_init__(self):
         """Post init."""
-        self.runtime_results = RuntimeResults(
-            total_time_ms=sum(self.times),
-            average_time_ms=sum(self.times) / len(self.times) if self.times else 0,
-            call_count=len(self.times),
-        )
+        self.runtime_results = RuntimeResults.from_measurements(self.times, self.histogram)
 
     @classmethod
     def from_dict(cls, data_dict: Dict):
@@ -101,15 +127,12 @@ class TimeData:
     info: Optional[Dict[str, str]] = None
     runtime_results: Optional[RuntimeResults] = None
     times: Optional[List[float]] = dataclasses.field(default_factory=list)
+    histogram: Optional[Dict[str, Any]] = None
     modules: Optional[Dict[str, ModuleTimeData]] = None
 
     def __post_init__(self):
         """Post init."""
-        self.runtime_results = RuntimeResults(
-            total_time_ms=sum(self.times),
-            average_time_ms=sum(self.times) / len(self.times) if self.times else 0,
-            call_count=len(self.times),
-        )
+        self.runtime_results = RuntimeResults.from_measurements(self.times, self.histogram)
 
     @property
     def total_time_ms(self) -> float:
@@ -139,12 +162,12 @@ class TimeData:
     @property
     def modules_measurements_count(self) -> Dict[str, int]:
         """Get number of measurements for each module."""
-        return {name: len(module_stats.times) for name, module_stats in self.modules.items()}
+        return {name: module_stats.call_count for name, module_stats in self.modules.items()}
 
     @property
     def measurements_count(self) -> int:
         """Get number of measurements."""
-        return len(self.times)
+        return self.call_count
 
     @property
     def module_timers(self) -> Dict[str, ModuleTimeData]:
@@ -191,7 +214,7 @@ class ModuleTimer(contextlib.AbstractContextManager):
         super().__init__()
         self._enabled = False
         self._module_name = module_name
-        self._times = []
+        self._histogram = LatencyHistogram()
 
     def __enter__(self) -> Any:
         """Enter context."""
@@ -201,7 +224,7 @@ class ModuleTimer(contextlib.AbstractContextManager):
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: F841
         """Exit context."""
         if self._enabled:
-            self._times.append((time.monotonic() - self._start) * 1000)  # convert to ms
+            self._histogram.record((time.monotonic() - self._start) * 1000)  # convert to ms
 
     def enable(self):
         """Enable module timers."""
@@ -247,14 +270,14 @@ class ModuleTimer(contextlib.AbstractContextManager):
         """Get module timer data."""
         return ModuleTimeData(
             module_name=self._module_name,
-            times=self._times,
+            histogram=self._histogram.to_json(),
             formats=self.module_formats,
             runners=self.module_runners,
         )
 
     def reset(self):
         """Reset the total time spent in the __call__ method."""
-        self._times = []
+        self._histogram = LatencyHistogram()
 
 
 class Timer(contextlib.AbstractContextManager):
@@ -274,7 +297,7 @@ class Timer(contextlib.AbstractContextManager):
         """Initialize Timer."""
         super().__init__()
         self._module_timers = {}
-        self._times = []
+        self._histogram = LatencyHistogram()
         self._name = name
         self._info = info
 
@@ -287,7 +310,7 @@ class Timer(contextlib.AbstractContextManager):
 
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: F841
         """Exit context."""
-        self._times.append((time.monotonic() - self._start) * 1000)  # convert to ms
+        self._histogram.record((time.monotonic() - self._start) * 1000)  # convert to ms
         for module_timer in self._module_timers.values():
             module_timer.disable()
         self.save()
@@ -303,7 +326,7 @@ class Timer(contextlib.AbstractContextManager):
         return TimeData(
             name=self._name,
             modules={name: module_timer.time_data for name, module_timer in self._module_timers.items()},
-            times=self._times,
+            histogram=self._histogram.to_json(),
             info=self._info,
         )
 
@@ -335,7 +358,7 @@ class Timer(contextlib.AbstractContextManager):
 
     def reset(self):
         """Reset the total time spent in the context."""
-        self._times = []
+        self._histogram = LatencyHistogram()
         for module_timer in self._module_timers.values():
             module_timer.reset()
 
@@ -419,6 +442,7 @@ class TimerComparator:
         not_covered = 1 - sum(self.framework_coverage.values())
         d["runtime_results"]["not_covered"] = f"{float(not_covered * 100):.2f}%"
         self._remove_key_from_nested_dict(d, "times")
+        self._remove_key_from_nested_dict(d, "histogram")
         d["environment"] = get_env()
 
         t = self.format_dict_recursive(d)
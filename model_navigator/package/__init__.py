@@ -20,12 +20,14 @@ from model_navigator.commands.base import CommandStatus
 from model_navigator.commands.verification.verify import VerifyModel
 from model_navigator.configuration import (
     SOURCE_FORMATS,
+    ArrivalDistribution,
     CustomConfig,
     DeviceKind,
     Format,
     OptimizationProfile,
     RuntimeSearchStrategy,
     SizedDataLoader,
+    StabilityCriterion,
     VerifyFunction,
     map_custom_configs,
 )
@@ -120,6 +122,7 @@ def save(
     path: Union[str, pathlib.Path],
     override: bool = False,
     save_data: bool = True,
+    save_trace: bool = False,
 ) -> None:
     """Save export results into the .nav package at given path.
 
@@ -128,6 +131,7 @@ def save(
         path: A path to file where the package has to be saved
         override: flag to override existing package in provided path
         save_data: disable saving samples from the dataloader
+        save_trace: enable saving trace of the optimization recorded with `NAVIGATOR_USE_TRACING=True`
     """
     builder = PackageBuilder()
     builder.save(
@@ -135,6 +139,7 @@ def save(
         path=path,
         override=override,
         save_data=save_data,
+        save_trace=save_trace,
     )
 
 
@@ -257,6 +262,13 @@ def profile(
     max_trials: int = DEFAULT_MAX_TRIALS,
     throughput_cutoff_threshold: float = DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD,
     throughput_backoff_limit: int = DEFAULT_THROUGHPUT_BACKOFF_LIMIT,
+    concurrency: Optional[List[int]] = None,
+    request_rates: Optional[List[float]] = None,
+    arrival_distribution: ArrivalDistribution = ArrivalDistribution.POISSON,
+    stability_criterion: StabilityCriterion = StabilityCriterion.WINDOW_MEAN,
+    adaptive_batch_sizes: bool = False,
+    cache_results: bool = False,
+    profile_memory: bool = False,
     verbose: bool = False,
 ) -> ProfilingResults:
     """Profile provided package.
@@ -282,6 +294,15 @@ def profile(
         throughput_cutoff_threshold: Minimum throughput increase to continue profiling.
         throughput_backoff_limit: Back-off limit to run multiple more profiling steps to avoid stop at local minimum
                                   when throughput saturate based on `throughput_cutoff_threshold`.
+        concurrency: List of numbers of concurrent in-flight requests to profile. Default: None
+        request_rates: List of request rates [req/sec] to profile in open-loop mode. Default: None
+        arrival_distribution: Distribution of request arrival times used in open-loop mode. Default: Poisson
+        stability_criterion: Criterion used to decide when measurement is stable. Default: window mean
+        adaptive_batch_sizes: If True refine automatic batch sizes search with failure boundary bisection and
+                              profiling of the batch size where throughput saturates. Defaults to False.
+        cache_results: If True reuse results from the profiling cache when model, runner, profile, samples
+                       and environment did not change. Defaults to False.
+        profile_memory: If True sample peak and steady state memory of the profiling process. Defaults to False.
         verbose: If True enable verbose logging. Defaults to False.
 
     Returns:
@@ -314,6 +335,13 @@ def profile(
         max_trials=max_trials,
         throughput_cutoff_threshold=throughput_cutoff_threshold,
         throughput_backoff_limit=throughput_backoff_limit,
+        concurrency=concurrency,
+        request_rates=request_rates,
+        arrival_distribution=arrival_distribution,
+        stability_criterion=stability_criterion,
+        adaptive_batch_sizes=adaptive_batch_sizes,
+        cache_results=cache_results,
+        profile_memory=profile_memory,
     )
 
     _update_config(
@@ -19,7 +19,7 @@ import uuid
 import zipfile
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from model_navigator.commands.base import CommandStatus
+from model_navigator.commands.base import CommandOutput, CommandStatus
 from model_navigator.commands.infer_metadata import InferInputMetadata, InferOutputMetadata
 from model_navigator.commands.load import LoadMetadata
 from model_navigator.commands.verification.verify import VerifyModel
@@ -29,6 +29,7 @@ from model_navigator.configuration import (
     TensorRTProfile,
 )
 from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.configuration.constants import NAVIGATOR_TRACE_FILENAME
 from model_navigator.core.constants import NAVIGATOR_PACKAGE_VERSION
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
@@ -76,7 +77,14 @@ class PackageBuilder:
 
         return package
 
-    def save(self, package: Package, path: pathlib.Path, override: bool = False, save_data: bool = True):
+    def save(
+        self,
+        package: Package,
+        path: pathlib.Path,
+        override: bool = False,
+        save_data: bool = True,
+        save_trace: bool = False,
+    ):
         """Save export results into the .nav package at given path.
 
         Args:
@@ -84,6 +92,7 @@ class PackageBuilder:
             path: A path to file where the package has to be saved
             override: flag to override existing package in provided path
             save_data: disable saving samples from the dataloader
+            save_trace: enable saving trace of the optimization when it exists in the workspace
         """
         path = pathlib.Path(path)
         if path.exists():
@@ -106,6 +115,9 @@ class PackageBuilder:
             + models_files_to_save
             + reproduction_files_to_save
         )
+        trace_path = package.workspace.path / NAVIGATOR_TRACE_FILENAME
+        if save_trace and trace_path.exists():
+            files_to_save.append(trace_path)
         dirs_to_save = []
         if save_data:
             dirs_to_save.extend([package.workspace.path / "model_output", package.workspace.path / "model_input"])
@@ -197,12 +209,19 @@ class PackageBuilder:
         result = {}
         for command_name, command_output in commands.commands.items():
             status[command_name] = command_output.status
-            result[command_name] = {"execution_time": command_output.execution_time}
-            if command_output.output:
-                result[command_name].update(command_output.output)
+            result[command_name] = self._get_command_result(command_output)
 
         return status, result
 
+    def _get_command_result(self, command_output: CommandOutput) -> Dict[str, Any]:
+        result = {"execution_time": command_output.execution_time}
+        if command_output.skip_reason:
+            result["skip_reason"] = command_output.skip_reason
+        if command_output.output:
+            result.update(command_output.output)
+
+        return result
+
     def _get_model_status(self, commands: PipelineCommands) -> Dict[str, ModelStatus]:
         model_commands = commands.models_commands
         model_status = {}
@@ -213,9 +232,7 @@ class PackageBuilder:
                 result = {}
                 for command_name, command_output in runner_command.commands.items():
                     status[command_name] = command_output.status
-                    result[command_name] = {"execution_time": command_output.execution_time}
-                    if command_output.output:
-                        result[command_name].update(command_output.output)
+                    result[command_name] = self._get_command_result(command_output)
 
                 runners_status[runner_name] = RunnerStatus(
                     runner_name=runner_name,
@@ -227,9 +244,7 @@ class PackageBuilder:
             result = {}
             for command_name, command_output in model_command.commands.items():
                 status[command_name] = command_output.status
-                result[command_name] = {"execution_time": command_output.execution_time}
-                if command_output.output:
-                    result[command_name].update(command_output.output)
+                result[command_name] = self._get_command_result(command_output)
 
             model_status[model_key] = ModelStatus(
                 model_config=model_command.model_config,
@@ -15,7 +15,7 @@
 
 import dataclasses
 import pathlib
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import yaml
 
@@ -37,6 +37,11 @@ class ProfilingResult:
         p99_latency: 99th percentile of measured latency
         throughput: Inferences per second
         request_count: Number of inference requests
+        concurrency: Number of concurrent inference requests
+        request_rate: Offered request rate in open-loop profiling, None for closed-loop profiling
+        peak_rss_memory: Peak resident memory of the profiling process, None when memory was not profiled
+        avg_rss_memory: Steady state resident memory of the profiling process, None when memory was not profiled
+        uss_memory: Unique memory of the profiling process, None when memory was not profiled
     """
 
     batch_size: int
@@ -49,6 +54,11 @@ class ProfilingResult:
     throughput: float  # infer / sec
     avg_gpu_clock: float  # MHz
     request_count: int
+    concurrency: int = 1
+    request_rate: Optional[float] = None  # requests / sec
+    peak_rss_memory: Optional[float] = None  # MB
+    avg_rss_memory: Optional[float] = None  # MB
+    uss_memory: Optional[float] = None  # MB
 
 
 @dataclasses.dataclass
@@ -0,0 +1,314 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time budget of the optimization with cost-aware ordering of commands."""
+
+import heapq
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.performance import Performance
+from model_navigator.commands.performance.utils import get_pruning_reference
+from model_navigator.exceptions import ModelNavigatorTimeBudgetExceeded
+from model_navigator.package.status import Status
+from model_navigator.pipelines.pipeline_context import PipelineCommands, PipelineContext
+from model_navigator.pipelines.scheduler import get_execution_units_dependencies
+
+# Commands with these statuses were executed, so their execution time is the cost of the command
+_MEASURED_STATUSES = (CommandStatus.OK, CommandStatus.FAIL)
+
+
+class CommandCostEstimator:
+    """Estimates execution time of commands from execution times of already executed commands.
+
+    Execution times are collected from the status of the optimized package, the context of the previous run stored
+    in the workspace and commands executed in the current run. Estimate is the mean execution time found for the most
+    specific key: the same command for the same model and runner, the same command and runner, the same command
+    and model format, and finally the same command.
+
+    Example of use:
+
+        estimator = CommandCostEstimator()
+        estimator.update_from_status(package.status)
+        estimator.estimate(execution_unit)
+    """
+
+    def __init__(self):
+        """Initialize estimator without execution times."""
+        self._execution_times: Dict[Tuple, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def update_from_status(self, status: Status) -> None:
+        """Collect execution times persisted in the package status.
+
+        Args:
+            status: Status of the package
+        """
+        for command_name, command_status in status.status.items():
+            self._add(command_name, command_status, status.result.get(command_name))
+
+        for model_key, model_status in status.models_status.items():
+            model_format = model_status.model_config.format.value
+            for command_name, command_status in model_status.status.items():
+                result = model_status.result.get(command_name)
+                self._add(command_name, command_status, result, model_key, model_format)
+
+            for runner_name, runner_status in model_status.runners_status.items():
+                for command_name, command_status in runner_status.status.items():
+                    result = runner_status.result.get(command_name)
+                    self._add(command_name, command_status, result, model_key, model_format, runner_name)
+
+    def update_from_commands(self, commands: PipelineCommands) -> None:
+        """Collect execution times persisted in the pipeline context.
+
+        Args:
+            commands: Commands executed in the pipeline
+        """
+        for command_name, command_output in commands.commands.items():
+            self._add_output(command_name, command_output)
+
+        for model_key, model_command in commands.models_commands.items():
+            model_format = model_command.model_config.format.value
+            for command_name, command_output in model_command.commands.items():
+                self._add_output(command_name, command_output, model_key, model_format)
+
+            for runner_name, runner_command in model_command.runners_commands.items():
+                for command_name, command_output in runner_command.commands.items():
+                    self._add_output(command_name, command_output, model_key, model_format, runner_name)
+
+    def record(self, execution_unit: ExecutionUnit, command_output: CommandOutput) -> None:
+        """Collect execution time of the executed unit.
+
+        Args:
+            execution_unit: Executed unit
+            command_output: Output of the unit
+        """
+        self._add_output(execution_unit.command.name, command_output, *_get_unit_properties(execution_unit))
+
+    def estimate(self, execution_unit: ExecutionUnit) -> Optional[float]:
+        """Estimate execution time of the unit.
+
+        Args:
+            execution_unit: Unit to estimate
+
+        Returns:
+            Estimated execution time in seconds or None when the command was never executed
+        """
+        keys = _get_keys(execution_unit.command.name, *_get_unit_properties(execution_unit))
+        with self._lock:
+            for key in keys:
+                execution_times = self._execution_times.get(key)
+                if execution_times:
+                    return sum(execution_times) / len(execution_times)
+
+        return None
+
+    def _add_output(self, command_name: str, command_output: CommandOutput, *properties) -> None:
+        result = {"execution_time": command_output.execution_time}
+        self._add(command_name, command_output.status, result, *properties)
+
+    def _add(
+        self,
+        command_name: str,
+        status: CommandStatus,
+        result: Optional[Dict],
+        model_key: Optional[str] = None,
+        model_format: Optional[str] = None,
+        runner_name: Optional[str] = None,
+    ) -> None:
+        execution_time = (result or {}).get("execution_time")
+        if execution_time is None or CommandStatus(status) not in _MEASURED_STATUSES:
+            return
+
+        with self._lock:
+            for key in _get_keys(command_name, model_key, model_format, runner_name):
+                self._execution_times.setdefault(key, []).append(execution_time)
+
+
+class TimeBudget:
+    """Time budget of the optimization.
+
+    Commands which do not fit in the remaining time are skipped, with exception of required commands and commands
+    without model config, which are needed by all models. Commands are skipped when the budget is exceeded
+    or their estimated execution time is longer than the remaining time.
+
+    Budget also provides the throughput of already profiled runtimes, used by the `Performance` command
+    to stop profiling of runtimes clearly slower than the fastest one.
+
+    Example of use:
+
+        budget = TimeBudget(time_budget=1200.0)
+        pipeline.execution_units = budget.order(pipeline.execution_units)
+        budget.validate_execution(execution_unit)
+    """
+
+    def __init__(self, time_budget: float, estimator: Optional[CommandCostEstimator] = None):
+        """Initialize budget. Time is measured from initialization.
+
+        Args:
+            time_budget: Budget in seconds
+            estimator: Estimator of commands execution time. New estimator is created when not provided.
+        """
+        self.time_budget = time_budget
+        self.estimator = estimator if estimator is not None else CommandCostEstimator()
+        self._start_time = time.perf_counter()
+        self._lock = threading.Lock()
+        self._profiling_results: Optional[List[Any]] = None
+        self._pruning_reference: List[Dict[str, Any]] = []
+
+    @property
+    def remaining(self) -> float:
+        """Remaining time in seconds. Negative when the budget is exceeded."""
+        return self.time_budget - (time.perf_counter() - self._start_time)
+
+    def order(self, execution_units: Sequence[ExecutionUnit]) -> List[ExecutionUnit]:
+        """Order execution units so cheap and high-value units are executed first.
+
+        Unit is executed after all units it depends on, as in `get_execution_units_dependencies`. From units ready
+        to execute, the one with the lowest estimated cost per value is selected. Value of the unit is the number
+        of units which depend on it, so units unlocking further commands are preferred. Units never executed
+        before are assumed to be as expensive as the most expensive estimated unit.
+
+        Args:
+            execution_units: Execution units in the order of sequential execution
+
+        Returns:
+            Ordered execution units
+        """
+        dependencies = get_execution_units_dependencies(execution_units, exclusive_barriers=False)
+        dependents: List[List[int]] = [[] for _ in execution_units]
+        for idx, unit_dependencies in enumerate(dependencies):
+            for dependency in unit_dependencies:
+                dependents[dependency].append(idx)
+
+        estimates = [self.estimator.estimate(execution_unit) for execution_unit in execution_units]
+        default_cost = max((estimate for estimate in estimates if estimate is not None), default=0.0)
+        priorities = []
+        for idx, estimate in enumerate(estimates):
+            cost = estimate if estimate is not None else default_cost
+            priorities.append(cost / (1 + len(dependents[idx])))
+
+        pending = [len(unit_dependencies) for unit_dependencies in dependencies]
+        ready = [(priorities[idx], idx) for idx, count in enumerate(pending) if count == 0]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            _, idx = heapq.heappop(ready)
+            ordered.append(execution_units[idx])
+            for dependent in dependents[idx]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    heapq.heappush(ready, (priorities[dependent], dependent))
+
+        return ordered
+
+    def validate_execution(self, execution_unit: ExecutionUnit) -> None:
+        """Validate if execution unit fits in the remaining time.
+
+        Args:
+            execution_unit: An execution unit to validate
+
+        Raises:
+            ModelNavigatorTimeBudgetExceeded when the unit does not fit in the remaining time
+        """
+        if execution_unit.model_config is None or execution_unit.command.is_required():
+            return
+
+        remaining = self.remaining
+        if remaining <= 0:
+            raise ModelNavigatorTimeBudgetExceeded(f"Time budget of {self.time_budget:.2f}[s] exceeded.")
+
+        estimate = self.estimator.estimate(execution_unit)
+        if estimate is not None and estimate > remaining:
+            raise ModelNavigatorTimeBudgetExceeded(
+                f"Estimated execution time {estimate:.2f}[s] exceeds remaining time budget {remaining:.2f}[s]."
+            )
+
+    def record(self, execution_unit: ExecutionUnit, command_output: CommandOutput) -> None:
+        """Collect execution time of the executed unit for further estimates.
+
+        Args:
+            execution_unit: Executed unit
+            command_output: Output of the unit
+        """
+        self.estimator.record(execution_unit, command_output)
+        if execution_unit.command.name == Performance.name:
+            with self._lock:
+                if self._profiling_results is not None:
+                    self._add_profiling_results(command_output)
+
+    def command_args(self, context: PipelineContext) -> Dict[str, Any]:
+        """Prepare command arguments provided by the budget.
+
+        Profiling results are collected from the context on the first call and updated when `Performance`
+        command is recorded.
+
+        Args:
+            context: Pipeline execution context
+
+        Returns:
+            Dictionary with `pruning_reference` when any runtime was profiled
+        """
+        with self._lock:
+            if self._profiling_results is None:
+                self._profiling_results = []
+                for model_command in context.commands.models_commands.values():
+                    for runner_command in model_command.runners_commands.values():
+                        command_output = runner_command.commands.get(Performance.name)
+                        if command_output is not None:
+                            self._add_profiling_results(command_output)
+
+            if not self._pruning_reference:
+                return {}
+
+            return {"pruning_reference": self._pruning_reference}
+
+    def _add_profiling_results(self, command_output: CommandOutput) -> None:
+        if command_output.status != CommandStatus.OK or not command_output.output:
+            return
+
+        profiling_results = command_output.output.get("profiling_results")
+        if not profiling_results:
+            return
+
+        self._profiling_results.extend(profiling_results)
+        self._pruning_reference = get_pruning_reference(self._profiling_results)
+
+
+def _get_unit_properties(execution_unit: ExecutionUnit) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    if execution_unit.model_config is None:
+        return None, None, None
+
+    runner_cls = execution_unit.runner_cls or execution_unit.results_lookup_runner_cls
+    return (
+        execution_unit.model_config.key,
+        execution_unit.model_config.format.value,
+        runner_cls.name() if runner_cls else None,
+    )
+
+
+def _get_keys(
+    command_name: str,
+    model_key: Optional[str],
+    model_format: Optional[str],
+    runner_name: Optional[str],
+) -> List[Tuple]:
+    keys = [("model", command_name, model_key, runner_name)]
+    if runner_name is not None:
+        keys.append(("runner", command_name, runner_name))
+    if model_format is not None:
+        keys.append(("format", command_name, model_format))
+    keys.append(("command", command_name))
+    return keys
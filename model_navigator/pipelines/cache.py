@@ -0,0 +1,284 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed cache of command outputs stored in the workspace."""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import shutil
+import threading
+from enum import Enum
+from inspect import getfullargspec
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.performance.cache import get_environment_fingerprint, get_path_fingerprint
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.constants import PIPELINE_CACHE_DIRNAME
+from model_navigator.pipelines.scheduler import get_execution_units_dependencies
+
+# Parameters which do not identify the command result. Model and data are identified by the collected samples.
+_IGNORED_PARAMETERS = ("workspace", "model", "dataloader", "verbose", "debug")
+
+# Directories with samples collected and generated by commands without model config
+_SAMPLES_DIRNAMES = ("model_input", "model_output")
+
+
+class PipelineCache:
+    """Content-addressed cache of command outputs stored in the workspace.
+
+    Outputs of commands executed for model configs are stored under a key computed from the command name,
+    model config key, runners, command input parameters resolved by `PipelineContext.command_args` and digests
+    of units the command depends on. Digest of a unit is computed from its key and the fingerprint of the model
+    right after the unit is executed, and digest of a command without model config from its output and collected samples,
+    so changing an upstream artifact invalidates all dependent units.
+
+    Commands without model config are always executed. Only successful outputs are stored. Cached output of
+    the command producing the model is replayed only when the model in the workspace has not changed.
+    Model left in the workspace by the previous run is removed before the command producing it is executed,
+    so exporters do not reuse an outdated model.
+
+    Example of use:
+
+        cache = PipelineCache(workspace=workspace, execution_units=execution_units)
+        command_output = cache.run(
+            execution_unit=execution_unit,
+            input_parameters=input_parameters,
+            run_command=lambda: execution_unit.command().run(**input_parameters),
+        )
+    """
+
+    def __init__(self, workspace: Workspace, execution_units: Sequence[ExecutionUnit], replay: bool = True):
+        """Initialize the cache.
+
+        Args:
+            workspace: Workspace where the cache is stored
+            execution_units: Execution units of all pipelines in the order of sequential execution
+            replay: Replay outputs stored in the cache. When False, outputs are only stored.
+        """
+        self.cache_dir = workspace.path / PIPELINE_CACHE_DIRNAME
+        self.replay = replay
+        self._workspace = workspace
+        self._units_indices = {id(execution_unit): idx for idx, execution_unit in enumerate(execution_units)}
+        self._dependencies = get_execution_units_dependencies(execution_units)
+        self._digests: Dict[int, str] = {}
+        self._producers_keys: Dict[str, List[str]] = {}
+        self._files_fingerprints: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        execution_unit: ExecutionUnit,
+        input_parameters: Dict[str, Any],
+        run_command: Callable[[], CommandOutput],
+    ) -> CommandOutput:
+        """Replay cached command output or run the command and store its output.
+
+        Args:
+            execution_unit: Executed unit
+            input_parameters: Input parameters of the command resolved from the context
+            run_command: Function running the command
+
+        Returns:
+            Command output
+        """
+        if execution_unit.model_config is None:
+            command_output = run_command()
+            self._set_digest(
+                execution_unit,
+                _hash({
+                    "command": execution_unit.command.name,
+                    "output": _get_fingerprint(command_output.output),
+                    "samples": [self._get_artifact_fingerprint(self._workspace.path / d) for d in _SAMPLES_DIRNAMES],
+                }),
+            )
+            return command_output
+
+        key = self._get_key(execution_unit, input_parameters)
+        is_producer = _is_producer(execution_unit)
+        artifact_path = self._workspace.path / execution_unit.model_config.path
+        first_producer = is_producer and execution_unit.model_config.key not in self._producers_keys
+
+        entry = self._get(key, artifact_path if is_producer else None) if self.replay else None
+        if entry is not None:
+            LOGGER.info(f"Command output restored from the pipeline cache `{key}`.")
+            command_output, produced = entry["command_output"], entry["produced"]
+        else:
+            if self.replay and first_producer and artifact_path.exists():
+                LOGGER.info(f"Removing outdated model {artifact_path.as_posix()!r}.")
+                _remove(artifact_path)
+
+            command_output = run_command()
+            produced = self._get_artifact_fingerprint(artifact_path) if is_producer else None
+            if command_output.status == CommandStatus.OK:
+                self._write_entry(key, {"command_output": command_output, "produced": produced, "artifact": produced})
+
+        if is_producer:
+            self._update_producers(execution_unit.model_config.key, key, self._get_artifact_fingerprint(artifact_path))
+
+        self._set_digest(execution_unit, _hash({"key": key, "produced": produced}))
+        return command_output
+
+    def _get_key(self, execution_unit: ExecutionUnit, input_parameters: Dict[str, Any]) -> str:
+        command = execution_unit.command
+        arguments = set()
+        for func in (command._pre_run, command._run, command._post_run):
+            arguments.update(getfullargspec(func).args)
+
+        parameters = {
+            name: _get_fingerprint(value)
+            for name, value in input_parameters.items()
+            if name in arguments and name not in _IGNORED_PARAMETERS
+        }
+        runner_cls = execution_unit.runner_cls
+        results_lookup_runner_cls = execution_unit.results_lookup_runner_cls
+        idx = self._units_indices[id(execution_unit)]
+        return _hash({
+            "command": command.name,
+            "model_key": execution_unit.model_config.key,
+            "runner": runner_cls.name() if runner_cls else None,
+            "results_lookup_runner": results_lookup_runner_cls.name() if results_lookup_runner_cls else None,
+            "parameters": parameters,
+            "dependencies": [self._digests.get(dependency) for dependency in sorted(self._dependencies[idx])],
+            "environment": get_environment_fingerprint(),
+        })
+
+    def _get(self, key: str, artifact_path: Optional[pathlib.Path]) -> Optional[Dict[str, Any]]:
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+
+        if artifact_path is not None and entry["artifact"] != self._get_artifact_fingerprint(artifact_path):
+            LOGGER.debug(f"Model {artifact_path.as_posix()!r} changed since the cache entry `{key}` was stored.")
+            return None
+
+        return entry
+
+    def _update_producers(self, model_key: str, key: str, artifact: Optional[str]) -> None:
+        # Commands like graph optimizations modify the model produced by preceding commands. Fingerprint
+        # of the final model is stored for all of them, so they are replayed when the model is unchanged.
+        producers_keys = self._producers_keys.setdefault(model_key, [])
+        for producer_key in producers_keys + [key]:
+            entry = self._read_entry(producer_key)
+            if entry is not None and entry["artifact"] != artifact:
+                entry["artifact"] = artifact
+                self._write_entry(producer_key, entry)
+
+        producers_keys.append(key)
+
+    def _set_digest(self, execution_unit: ExecutionUnit, digest: str) -> None:
+        self._digests[self._units_indices[id(execution_unit)]] = digest
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        try:
+            with entry_path.open("rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            LOGGER.warning(f"Invalid pipeline cache entry {entry_path.as_posix()!r} removed: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(entry, f)
+
+        tmp_path.replace(entry_path)
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def _get_artifact_fingerprint(self, path: pathlib.Path) -> Optional[str]:
+        if not path.exists():
+            return None
+
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        return _hash([(file.relative_to(path).as_posix(), self._get_file_fingerprint(file)) for file in files])
+
+    def _get_file_fingerprint(self, path: pathlib.Path) -> str:
+        # Files are hashed once as long as their size and modification time are not changed
+        stat = path.stat()
+        memo_key = (path.as_posix(), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            fingerprint = self._files_fingerprints.get(memo_key)
+        if fingerprint is None:
+            fingerprint = get_path_fingerprint(path)
+            with self._lock:
+                self._files_fingerprints[memo_key] = fingerprint
+
+        return fingerprint
+
+
+def _is_producer(execution_unit: ExecutionUnit) -> bool:
+    return execution_unit.runner_cls is None and execution_unit.results_lookup_runner_cls is None
+
+
+def _get_fingerprint(value: Any) -> Any:
+    """Convert value to JSON serializable data identifying its content."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return _get_fingerprint(value.value)
+    if isinstance(value, pathlib.Path):
+        return value.as_posix()
+    if isinstance(value, np.ndarray):
+        return {"dtype": value.dtype.str, "shape": value.shape, "data": hashlib.sha256(value.tobytes()).hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "to_json"):
+        return _get_fingerprint(value.to_json())
+    if isinstance(value, dict):
+        return {str(k): _get_fingerprint(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_get_fingerprint(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_get_fingerprint(v) for v in value), key=_hash)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "type": _get_type_name(value),
+            "fields": {f.name: _get_fingerprint(getattr(value, f.name)) for f in dataclasses.fields(value)},
+        }
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    # content of other objects is not inspected
+    return _get_type_name(value)
+
+
+def _get_type_name(value: Any) -> str:
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def _remove(path: pathlib.Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _hash(data: Any) -> str:
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
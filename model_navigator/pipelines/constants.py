@@ -13,6 +13,9 @@
 # limitations under the License.
 """Constants definition of pipelines."""
 
+# Directory in the workspace with cached commands outputs
+PIPELINE_CACHE_DIRNAME = "pipeline_cache"
+
 # Pipeline names
 PIPELINE_CORRECTNESS = "Correctness"
 PIPELINE_FIND_MAX_BATCH_SIZE = "Finding max batch size for fixed shapes based pipelines"
@@ -14,20 +14,26 @@
 """Definition of Pipeline module - Direct Acyclic Graph (DAG) of commands execution."""
 
 import contextlib
+import threading
 import time
 import traceback
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
 from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.core.logger import LOGGER, LoggingContext, StdoutLogger, pad_string
+from model_navigator.core.tracing import get_tracer, timestamp
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import (
     ModelNavigatorCommandNotExecutable,
     ModelNavigatorRuntimeError,
+    ModelNavigatorTimeBudgetExceeded,
     ModelNavigatorUserInputError,
 )
+from model_navigator.pipelines.budget import TimeBudget
+from model_navigator.pipelines.cache import PipelineCache
 from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.pipelines.scheduler import ExecutionUnitsScheduler
 from model_navigator.reporting.optimize.events import (
     OptimizeEvent,
     default_event_emitter,
@@ -53,13 +59,22 @@ class Pipeline:
         self.execution_units = execution_units
         self.event_emitter = default_event_emitter()
 
-    def run(self, workspace: Workspace, config: CommonConfig, context: PipelineContext) -> None:
+    def run(
+        self,
+        workspace: Workspace,
+        config: CommonConfig,
+        context: PipelineContext,
+        cache: Optional[PipelineCache] = None,
+        budget: Optional[TimeBudget] = None,
+    ) -> None:
         """Execute pipeline.
 
         Args:
             workspace: Workspace where unit is executed
             config: A global config provided by user
             context: Context of pipeline execution
+            cache: Optional cache of commands outputs
+            budget: Optional time budget of the optimization
         """
         LOGGER.info(pad_string(f"Pipeline {self.name!r} started"))
         self.event_emitter.emit(OptimizeEvent.PIPELINE_STARTED, name=self.name)
@@ -70,6 +85,8 @@ class Pipeline:
                 execution_unit=execution_unit,
                 config=config,
                 context=context,
+                cache=cache,
+                budget=budget,
             )
             context.update(
                 execution_unit=execution_unit,
@@ -79,12 +96,85 @@ class Pipeline:
 
         self.event_emitter.emit(OptimizeEvent.PIPELINE_FINISHED)
 
+    @classmethod
+    def run_concurrently(
+        cls,
+        pipelines: Sequence["Pipeline"],
+        workspace: Workspace,
+        config: CommonConfig,
+        context: PipelineContext,
+        cache: Optional[PipelineCache] = None,
+        budget: Optional[TimeBudget] = None,
+    ) -> None:
+        """Execute independent execution units of pipelines concurrently.
+
+        Execution units are executed by `ExecutionUnitsScheduler` using `config.pipeline_workers` threads.
+        Context updates and events are applied in the order of sequential execution of the pipelines.
+
+        Args:
+            pipelines: Pipelines to execute
+            workspace: Workspace where units are executed
+            config: A global config provided by user
+            context: Context of pipelines execution
+            cache: Optional cache of commands outputs
+            budget: Optional time budget of the optimization
+        """
+        units = [(pipeline, execution_unit) for pipeline in pipelines for execution_unit in pipeline.execution_units]
+        scheduler = ExecutionUnitsScheduler(
+            execution_units=[execution_unit for _, execution_unit in units],
+            max_workers=config.pipeline_workers,
+            target_device=config.target_device,
+        )
+        context_lock = threading.Lock()
+        current_pipeline = None
+
+        def _execute(idx: int) -> CommandOutput:
+            pipeline, execution_unit = units[idx]
+            return pipeline._run_unit(
+                workspace=workspace,
+                execution_unit=execution_unit,
+                config=config,
+                context=context,
+                cache=cache,
+                budget=budget,
+                context_lock=context_lock,
+            )
+
+        def _commit(idx: int, command_output: CommandOutput) -> None:
+            nonlocal current_pipeline
+            pipeline, execution_unit = units[idx]
+            if pipeline is not current_pipeline:
+                if current_pipeline is not None:
+                    current_pipeline.event_emitter.emit(OptimizeEvent.PIPELINE_FINISHED)
+                LOGGER.info(pad_string(f"Pipeline {pipeline.name!r} started"))
+                pipeline.event_emitter.emit(OptimizeEvent.PIPELINE_STARTED, name=pipeline.name)
+                current_pipeline = pipeline
+
+            pipeline._emit_command_started_event(execution_unit)
+            pipeline.emit_command_finished_event(command_output)
+            pipeline._validate_required_command(execution_unit, command_output)
+            with context_lock:
+                context.update(
+                    execution_unit=execution_unit,
+                    command_output=command_output,
+                )
+                context.save()
+
+        redirect_stdout_context = StdoutLogger(LOGGER) if config.debug else contextlib.nullcontext()
+        with redirect_stdout_context:
+            scheduler.run(execute=_execute, commit=_commit)
+
+        if current_pipeline is not None:
+            current_pipeline.event_emitter.emit(OptimizeEvent.PIPELINE_FINISHED)
+
     def _execute_unit(
         self,
         workspace: Workspace,
         execution_unit: ExecutionUnit,
         config: CommonConfig,
         context: PipelineContext,
+        cache: Optional[PipelineCache] = None,
+        budget: Optional[TimeBudget] = None,
     ) -> CommandOutput:
         """Execute a single unit.
 
@@ -93,34 +183,87 @@ class Pipeline:
             execution_unit: A unit to execute
             config: Common configuration parameters
             context: Pipeline execution context
+            cache: Optional cache of commands outputs
+            budget: Optional time budget of the optimization
 
         Returns:
             Command execution result
         """
-        log_dir = None
-        if execution_unit.model_config:
-            log_dir = workspace.path / execution_unit.model_config.path.parent
-
         if config.debug:
             redirect_stdout_context = StdoutLogger(LOGGER)
         else:
             redirect_stdout_context = contextlib.nullcontext()
 
-        with LoggingContext(log_dir=log_dir), redirect_stdout_context:
-            start_time = time.perf_counter()
+        with redirect_stdout_context:
             self._emit_command_started_event(execution_unit)
+            command_output = self._run_unit(
+                workspace=workspace,
+                execution_unit=execution_unit,
+                config=config,
+                context=context,
+                cache=cache,
+                budget=budget,
+            )
+            self.emit_command_finished_event(command_output)
+            self._validate_required_command(execution_unit, command_output)
+
+            return command_output
+
+    def _run_unit(
+        self,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        config: CommonConfig,
+        context: PipelineContext,
+        cache: Optional[PipelineCache] = None,
+        budget: Optional[TimeBudget] = None,
+        context_lock=None,
+    ) -> CommandOutput:
+        """Run command of a single unit.
+
+        Args:
+            workspace: Workspace where unit is executed
+            execution_unit: A unit to execute
+            config: Common configuration parameters
+            context: Pipeline execution context
+            cache: Optional cache of commands outputs, replayed instead of running the command when matching
+            budget: Optional time budget of the optimization. Units which do not fit in the budget are skipped.
+            context_lock: Optional lock held while the context is read, used when units are executed concurrently.
+                Logs of the unit are stored only from the current thread when the lock is provided.
+
+        Returns:
+            Command execution result
+        """
+        log_dir = None
+        if execution_unit.model_config:
+            log_dir = workspace.path / execution_unit.model_config.path.parent
+
+        concurrent = context_lock is not None
+        if context_lock is None:
+            context_lock = contextlib.nullcontext()
+
+        with LoggingContext(log_dir=log_dir, current_thread_only=concurrent):
+            start_timestamp = timestamp()
+            start_time = time.perf_counter()
             try:
-                context.validate_execution(execution_unit=execution_unit)
+                with context_lock:
+                    context.validate_execution(execution_unit=execution_unit)
+                if budget is not None:
+                    budget.validate_execution(execution_unit=execution_unit)
                 try:
                     LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} started"))
-                    input_parameters = context.command_args(
-                        workspace=workspace,
-                        config=config,
+                    with context_lock:
+                        input_parameters = context.command_args(
+                            workspace=workspace,
+                            config=config,
+                            execution_unit=execution_unit,
+                            extra_args=budget.command_args(context=context) if budget is not None else None,
+                        )
+                    command_output = self._run_command(
                         execution_unit=execution_unit,
+                        input_parameters=input_parameters,
+                        cache=cache,
                     )
-                    command_output = execution_unit.command().run(
-                        **input_parameters
-                    )  # pytype: disable=not-instantiable
                 except ModelNavigatorUserInputError as e:
                     command_output = CommandOutput(status=CommandStatus.FAIL)
 
@@ -140,22 +283,67 @@ class Pipeline:
                     command_output = CommandOutput(status=CommandStatus.FAIL)
                     error = traceback.format_exc()
                     LOGGER.error(f"Command finished with unexpected error: {error}")
+            except ModelNavigatorTimeBudgetExceeded as e:
+                LOGGER.warning(f"Command skipped. {e.message}")
+                command_output = CommandOutput(status=CommandStatus.SKIPPED, skip_reason=e.message)
             except ModelNavigatorCommandNotExecutable:
                 command_output = CommandOutput(status=CommandStatus.SKIPPED)
 
             end_time = time.perf_counter()
             command_output.execution_time = end_time - start_time
             LOGGER.info(f"Execution time: {command_output.execution_time:.2f}[s]")
+            if budget is not None:
+                budget.record(execution_unit, command_output)
 
-            self.emit_command_finished_event(command_output)
-            if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
-                raise ModelNavigatorRuntimeError(
-                    "The required command has failed. Please, review the log and verify the reported problems: \n"
-                    f"{command_output.output}."
-                )
+            self._trace_command(execution_unit, command_output, start_timestamp)
 
             return command_output
 
+    def _run_command(
+        self,
+        execution_unit: ExecutionUnit,
+        input_parameters: Dict[str, Any],
+        cache: Optional[PipelineCache] = None,
+    ) -> CommandOutput:
+        """Run command or replay its output from the cache."""
+
+        def _run() -> CommandOutput:
+            return execution_unit.command().run(**input_parameters)  # pytype: disable=not-instantiable
+
+        if cache is None:
+            return _run()
+
+        return cache.run(execution_unit=execution_unit, input_parameters=input_parameters, run_command=_run)
+
+    def _trace_command(self, execution_unit: ExecutionUnit, command_output: CommandOutput, start: float) -> None:
+        """Record span of the executed command in the trace."""
+        tracer = get_tracer()
+        if not tracer.enabled:
+            return
+
+        args = {"pipeline": self.name, "status": command_output.status.value}
+        if execution_unit.model_config is not None:
+            args["config_key"] = execution_unit.model_config.key
+        if execution_unit.runner_cls is not None:
+            args["runner_name"] = execution_unit.runner_cls.name()
+
+        tracer.record_memory()
+        tracer.complete(
+            execution_unit.command.name,
+            category="command",
+            start=start,
+            duration=command_output.execution_time * 1e6,
+            args=args,
+        )
+
+    def _validate_required_command(self, execution_unit: ExecutionUnit, command_output: CommandOutput) -> None:
+        """Raise error when the required command has failed."""
+        if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
+            raise ModelNavigatorRuntimeError(
+                "The required command has failed. Please, review the log and verify the reported problems: \n"
+                f"{command_output.output}."
+            )
+
     def _emit_command_started_event(self, execution_unit: ExecutionUnit):
         """Emit command started event with execution unit properties."""
         kwargs = {
@@ -16,7 +16,7 @@
 import collections
 import dataclasses
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 from tabulate import tabulate
@@ -26,6 +26,7 @@ from model_navigator.configuration import Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
 from model_navigator.core.constants import NAVIGATOR_VERSION
+from model_navigator.core.dataloader import PrefetchingDataloader
 from model_navigator.core.logger import LOGGER, pad_string
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorCommandNotExecutable, ModelNavigatorRuntimeError
@@ -235,13 +236,20 @@ class PipelineContext:
         with self._file.open("w") as fp:
             yaml.safe_dump(data=data, stream=fp, sort_keys=False)
 
-    def command_args(self, workspace: Workspace, config: CommonConfig, execution_unit: ExecutionUnit) -> Dict[str, Any]:
+    def command_args(
+        self,
+        workspace: Workspace,
+        config: CommonConfig,
+        execution_unit: ExecutionUnit,
+        extra_args: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Prepare command arguments from config and current context.
 
         Args:
             workspace: Workspace argument passed to commands
             config: Common configuration passed execution
             execution_unit: Command with additional arguments to execute
+            extra_args: Additional arguments provided outside of the context, e.g. by the time budget
 
         Return:
             Dictionary with arguments for command
@@ -250,6 +258,12 @@ class PipelineContext:
             **config.__dict__,
             "workspace": workspace,
         }
+        if config.dataloader_prefetch_depth > 0:
+            input_args["dataloader"] = PrefetchingDataloader(
+                config.dataloader,
+                prefetch_depth=config.dataloader_prefetch_depth,
+                num_workers=config.dataloader_workers,
+            )
 
         def _update_args(data):
             if not data:
@@ -293,6 +307,8 @@ class PipelineContext:
         for command_output in self._commands.commands.values():
             _update_args(data=command_output.output)
 
+        _update_args(data=extra_args)
+
         return input_args
 
     def validate_execution(self, execution_unit: ExecutionUnit):
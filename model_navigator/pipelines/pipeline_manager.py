@@ -15,16 +15,20 @@
 
 from typing import Dict, List, Optional, Sequence
 
+from model_navigator.commands.worker_pool import get_preload_modules, get_worker_pool
 from model_navigator.configuration import Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
 from model_navigator.core.logger import LOGGER, log_dict
 from model_navigator.core.workspace import Workspace
 from model_navigator.package.package import Package
+from model_navigator.pipelines.budget import CommandCostEstimator, TimeBudget
 from model_navigator.pipelines.builders import PipelineBuilder
+from model_navigator.pipelines.cache import PipelineCache
 from model_navigator.pipelines.pipeline import Pipeline
 from model_navigator.pipelines.pipeline_context import PipelineContext
 from model_navigator.pipelines.validation import PipelineManagerConfigurationValidator
+from model_navigator.utils.environment import use_multiprocessing, use_worker_pool
 
 
 class PipelineManager:
@@ -75,6 +79,9 @@ class PipelineManager:
 
         PipelineManagerConfigurationValidator.run(config, package)
 
+        # Context of the previous run is read before it is overridden
+        budget = self._get_time_budget(config, package) if config.time_budget is not None else None
+
         context = PipelineContext(workspace=self._workspace)
         context.initialize()
 
@@ -83,9 +90,38 @@ class PipelineManager:
             models_config=models_config,
             config=config,
         )
+        if budget is not None:
+            for pipeline in pipelines:
+                pipeline.execution_units = budget.order(pipeline.execution_units)
+
+        # outputs are stored and replayed only when resuming, otherwise the workspace is initialized from scratch
+        cache = None
+        if config.resume:
+            cache = PipelineCache(
+                workspace=workspace,
+                execution_units=[
+                    execution_unit for pipeline in pipelines for execution_unit in pipeline.execution_units
+                ],
+            )
+        if use_multiprocessing() and use_worker_pool():
+            # workers import frameworks while the first commands are executed
+            get_worker_pool().prewarm(
+                num_workers=config.pipeline_workers,
+                preload_modules=get_preload_modules(config.framework),
+            )
 
-        for pipeline in pipelines:
-            pipeline.run(workspace=workspace, config=config, context=context)
+        if config.pipeline_workers > 1:
+            Pipeline.run_concurrently(
+                pipelines=pipelines,
+                workspace=workspace,
+                config=config,
+                context=context,
+                cache=cache,
+                budget=budget,
+            )
+        else:
+            for pipeline in pipelines:
+                pipeline.run(workspace=workspace, config=config, context=context, cache=cache, budget=budget)
 
         LOGGER.warning(
             "Initially models are not verified. Validate exported models and use "
@@ -94,6 +130,22 @@ class PipelineManager:
 
         return context
 
+    def _get_time_budget(self, config: CommonConfig, package: Optional[Package]) -> TimeBudget:
+        """Create time budget with costs estimated from the package status and the previous run in the workspace."""
+        estimator = CommandCostEstimator()
+        if package is not None:
+            estimator.update_from_status(package.status)
+
+        previous_context = PipelineContext(workspace=self._workspace)
+        try:
+            previous_context.load()
+            estimator.update_from_commands(previous_context.commands)
+        except Exception as e:
+            LOGGER.debug(f"Execution times of the previous run not loaded: {e}")
+
+        LOGGER.info(f"Optimization time budget: {config.time_budget:.2f}[s]")
+        return TimeBudget(time_budget=config.time_budget, estimator=estimator)
+
     def _build_pipelines(
         self,
         builders: Sequence[PipelineBuilder],
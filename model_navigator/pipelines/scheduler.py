@@ -0,0 +1,271 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrent execution of independent execution units."""
+
+import concurrent.futures
+from inspect import getfullargspec
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+from model_navigator.commands.base import ExecutionUnit
+from model_navigator.configuration import DeviceKind, Format
+from model_navigator.configuration.constants import DEFAULT_CUDA_DEVICE_TOKENS
+from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.utils.format_helpers import is_source_format
+
+# Formats which are built on the GPU during conversion
+_CUDA_FORMATS = (Format.TENSORRT, Format.TORCH_TRT, Format.TF_TRT)
+
+# Resource held by units using the model object provided by the user, executed one at a time
+_SOURCE_MODEL = "source_model"
+
+
+def get_execution_units_dependencies(
+    execution_units: Sequence[ExecutionUnit],
+    exclusive_barriers: bool = True,
+) -> List[Set[int]]:
+    """Collect indices of preceding execution units which each unit depends on.
+
+    Unit depends on a preceding unit when:
+        - any of them has no model config - such units produce or consume outputs shared by all models
+        - any of them is required or exclusive - failure of required unit stops the pipeline and
+          exclusive unit cannot be executed concurrently with other units, unless `exclusive_barriers` is False
+        - model config of one of them is the same or is an ancestor of the other - the command uses model
+          or outputs of commands produced for the same model or its parents, as in `Command.requires()`
+
+    Args:
+        execution_units: Execution units in the order of sequential execution
+        exclusive_barriers: Exclusive units depend on all units. False when only the order of units matters.
+
+    Returns:
+        List with set of dependencies indices for each execution unit
+    """
+    lineages = [_get_lineage(execution_unit.model_config) for execution_unit in execution_units]
+    dependencies = []
+    for idx, execution_unit in enumerate(execution_units):
+        unit_dependencies = set()
+        for dependency_idx in range(idx):
+            dependency = execution_units[dependency_idx]
+            if (
+                _is_barrier(execution_unit, exclusive_barriers)
+                or _is_barrier(dependency, exclusive_barriers)
+                or dependency.model_config.key in lineages[idx]
+                or execution_unit.model_config.key in lineages[dependency_idx]
+            ):
+                unit_dependencies.add(dependency_idx)
+
+        dependencies.append(unit_dependencies)
+
+    return dependencies
+
+
+def get_execution_unit_device(execution_unit: ExecutionUnit, target_device: DeviceKind) -> DeviceKind:
+    """Get kind of device occupied by the execution unit.
+
+    Args:
+        execution_unit: Execution unit to check
+        target_device: Target device selected by the user
+
+    Returns:
+        DeviceKind.CUDA when the unit runs the model or builds the model on the GPU, DeviceKind.CPU otherwise
+    """
+    if target_device != DeviceKind.CUDA:
+        return DeviceKind.CPU
+
+    runner_cls = execution_unit.runner_cls or execution_unit.results_lookup_runner_cls
+    if runner_cls is not None:
+        return DeviceKind.CUDA if DeviceKind.CUDA in runner_cls.devices_kind() else DeviceKind.CPU
+
+    if execution_unit.model_config is not None and execution_unit.model_config.format in _CUDA_FORMATS:
+        return DeviceKind.CUDA
+
+    return DeviceKind.CPU
+
+
+def uses_source_model(execution_unit: ExecutionUnit) -> bool:
+    """Check if the execution unit uses the model object provided by the user in the current process.
+
+    Exporters move the model between devices and trace it, and runners of source formats run it in place,
+    so such units must not be executed concurrently.
+
+    Args:
+        execution_unit: Execution unit to check
+
+    Returns:
+        True when the command accepts the model and exports it or runs it with a source format runner
+    """
+    if "model" not in getfullargspec(execution_unit.command._run).args:
+        return False
+
+    if execution_unit.runner_cls is None:
+        return True
+
+    return execution_unit.model_config is not None and is_source_format(execution_unit.model_config.format)
+
+
+class ExecutionUnitsScheduler:
+    """Executes independent execution units concurrently in a pool of threads.
+
+    Units are submitted as soon as all units they depend on are committed and a token of the device
+    they occupy is available. Units using the model object provided by the user are executed one at a time. Results are committed in the order of execution units, so the state built
+    by the commit function is the same as in sequential execution. When the unit raises an exception,
+    no further units are submitted and the exception is propagated after the preceding units are committed.
+
+    Threads are used because commands share the model object provided by the user and run heavy
+    workloads like exports and conversions in separate processes.
+
+    Example of use:
+
+        scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=4)
+        scheduler.run(
+            execute=lambda idx: execute_unit(execution_units[idx]),
+            commit=lambda idx, output: context.update(execution_units[idx], output),
+        )
+    """
+
+    def __init__(
+        self,
+        execution_units: Sequence[ExecutionUnit],
+        max_workers: int,
+        target_device: DeviceKind = DeviceKind.CPU,
+        device_tokens: Optional[Dict[DeviceKind, int]] = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            execution_units: Execution units in the order of sequential execution
+            max_workers: Maximal number of units executed concurrently
+            target_device: Target device selected by the user
+            device_tokens: Maximal number of units executed concurrently on the given kind of device.
+                Kinds missing in the dictionary are limited only by the number of workers.
+                By default, units running on CUDA device are not executed concurrently.
+        """
+        if max_workers < 1:
+            raise ModelNavigatorUserInputError(f"Number of pipeline workers must be positive. Got {max_workers}.")
+
+        if device_tokens is None:
+            device_tokens = {DeviceKind.CUDA: DEFAULT_CUDA_DEVICE_TOKENS}
+
+        for device, tokens in device_tokens.items():
+            if tokens < 1:
+                raise ModelNavigatorUserInputError(
+                    f"Number of tokens for device `{device.value}` must be positive. Got {tokens}."
+                )
+
+        self._execution_units = execution_units
+        self._max_workers = max_workers
+        self._dependencies = get_execution_units_dependencies(execution_units)
+        self._resources: List[List[Union[DeviceKind, str]]] = [
+            [get_execution_unit_device(execution_unit, target_device)]
+            + ([_SOURCE_MODEL] if uses_source_model(execution_unit) else [])
+            for execution_unit in execution_units
+        ]
+        self._device_tokens: Dict[Union[DeviceKind, str], int] = {**device_tokens, _SOURCE_MODEL: 1}
+
+    def run(self, execute: Callable[[int], Any], commit: Callable[[int, Any], None]) -> None:
+        """Execute all units.
+
+        Args:
+            execute: Function executing unit with given index in the worker thread
+            commit: Function called in the calling thread with index and result of the unit, in the units order
+        """
+        num_units = len(self._execution_units)
+        available_tokens = dict(self._device_tokens)
+        pending = list(range(num_units))
+        running: Dict[concurrent.futures.Future, int] = {}
+        results: Dict[int, concurrent.futures.Future] = {}
+        failed_idx = num_units
+        committed = 0
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="pipeline-worker",
+        )
+        try:
+            while committed < num_units:
+                for idx in self._get_ready(pending, committed, available_tokens, len(running)):
+                    if idx > failed_idx:
+                        break
+                    pending.remove(idx)
+                    self._acquire(idx, available_tokens)
+                    running[executor.submit(execute, idx)] = idx
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    idx = running.pop(future)
+                    self._release(idx, available_tokens)
+                    results[idx] = future
+                    if future.exception() is not None:
+                        failed_idx = min(failed_idx, idx)
+
+                while committed in results:
+                    commit(committed, results.pop(committed).result())
+                    committed += 1
+        finally:
+            # `cancel_futures` of `shutdown` is not available in Python 3.8
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _get_ready(
+        self,
+        pending: List[int],
+        committed: int,
+        available_tokens: Dict[Union[DeviceKind, str], int],
+        num_running: int,
+    ) -> List[int]:
+        ready = []
+        tokens = dict(available_tokens)
+        for idx in pending:
+            if num_running + len(ready) >= self._max_workers:
+                break
+
+            # all units preceding the committed index are committed
+            if any(dependency >= committed for dependency in self._dependencies[idx]):
+                continue
+
+            if any(tokens.get(resource, 1) < 1 for resource in self._resources[idx]):
+                continue
+
+            self._acquire(idx, tokens)
+            ready.append(idx)
+
+        return ready
+
+    def _acquire(self, idx: int, available_tokens: Dict[Union[DeviceKind, str], int]) -> None:
+        for resource in self._resources[idx]:
+            if resource in available_tokens:
+                available_tokens[resource] -= 1
+
+    def _release(self, idx: int, available_tokens: Dict[Union[DeviceKind, str], int]) -> None:
+        for resource in self._resources[idx]:
+            if resource in available_tokens:
+                available_tokens[resource] += 1
+
+
+def _is_barrier(execution_unit: ExecutionUnit, exclusive_barriers: bool = True) -> bool:
+    return (
+        execution_unit.model_config is None
+        or execution_unit.command.is_required()
+        or (exclusive_barriers and execution_unit.command.is_exclusive())
+    )
+
+
+def _get_lineage(model_config: Optional[ModelConfig]) -> Set[str]:
+    lineage = set()
+    while model_config is not None:
+        lineage.add(model_config.key)
+        model_config = model_config.parent
+
+    return lineage
@@ -50,6 +50,8 @@ class PipelineManagerConfigurationValidator:
             package: Package to be optimized, if None package is yet to be built. Defaults to None.
         """
         cls._validate_if_runners_are_not_empty(config)
+        cls._validate_pipeline_workers(config)
+        cls._validate_time_budget(config)
         cls._validate_config_types(config)
         cls._validate_if_custom_configs_match_target_formats(config)
         cls._validate_if_target_formats_match_framework(config)
@@ -75,6 +77,18 @@ class PipelineManagerConfigurationValidator:
                 f"or selected target device {config.target_device}."
             )
 
+    @classmethod
+    def _validate_pipeline_workers(cls, config: CommonConfig):
+        if config.pipeline_workers < 1:
+            raise ModelNavigatorConfigurationError(
+                f"Number of pipeline workers must be positive. Got {config.pipeline_workers}."
+            )
+
+    @classmethod
+    def _validate_time_budget(cls, config: CommonConfig):
+        if config.time_budget is not None and config.time_budget <= 0:
+            raise ModelNavigatorConfigurationError(f"Time budget must be positive. Got {config.time_budget}.")
+
     @classmethod
     def _validate_if_custom_configs_match_target_formats(cls, config: CommonConfig):
         for custom_config in config.custom_configs.values():
@@ -22,6 +22,7 @@ from model_navigator.configuration import DEFAULT_RUNTIME_STRATEGIES, Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model import model_config
 from model_navigator.core.context import INPLACE_OPTIMIZE_KEY, INPLACE_OPTIMIZE_STRATEGIES_CONTEXT_KEY, global_context
+from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorRuntimeError
 from model_navigator.package.builder import PackageBuilder
@@ -61,7 +62,11 @@ def optimize_pipeline(
     event_emitter = default_event_emitter()
 
     workspace = Workspace(workspace)
-    if not package or workspace.path != package.workspace.path:
+    if config.resume and workspace.exists():
+        LOGGER.info(f"Resuming optimization in the existing workspace at {workspace.path}")
+        workspace.configure_logging()
+        event_emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=workspace.path)
+    elif not package or workspace.path != package.workspace.path:
         workspace.initialize()
         event_emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=workspace.path)
 
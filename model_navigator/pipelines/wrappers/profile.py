@@ -113,6 +113,11 @@ class ProfilingResultsBuilder:
                         throughput=result.throughput,
                         avg_gpu_clock=result.avg_gpu_clock,
                         request_count=result.request_count,
+                        concurrency=result.concurrency,
+                        request_rate=result.request_rate,
+                        peak_rss_memory=result.peak_rss_memory,
+                        avg_rss_memory=result.avg_rss_memory,
+                        uss_memory=result.uss_memory,
                     )
                     res = detailed.get(result.sample_id, [])
                     res.append(profiling_result)
@@ -26,7 +26,12 @@ from model_navigator.configuration import (
     map_custom_configs,
 )
 from model_navigator.configuration.common_config import CommonConfig
-from model_navigator.configuration.constants import DEFAULT_SAMPLE_COUNT
+from model_navigator.configuration.constants import (
+    DEFAULT_DATALOADER_PREFETCH_DEPTH,
+    DEFAULT_DATALOADER_WORKERS,
+    DEFAULT_PIPELINE_WORKERS,
+    DEFAULT_SAMPLE_COUNT,
+)
 from model_navigator.configuration.model.model_config_builder import ModelConfigBuilder
 from model_navigator.frameworks import Framework
 from model_navigator.package.package import Package
@@ -55,6 +60,12 @@ def optimize(
     debug: bool = False,
     verify_func: Optional[VerifyFunction] = None,
     custom_configs: Optional[Sequence[CustomConfig]] = None,
+    correctness_batch_size: Optional[int] = None,
+    dataloader_prefetch_depth: int = DEFAULT_DATALOADER_PREFETCH_DEPTH,
+    dataloader_workers: int = DEFAULT_DATALOADER_WORKERS,
+    pipeline_workers: int = DEFAULT_PIPELINE_WORKERS,
+    resume: bool = False,
+    time_budget: Optional[float] = None,
 ) -> Package:
     """Entrypoint for Python model optimize.
 
@@ -73,6 +84,18 @@ def optimize(
         debug: Enable debug logging from commands
         verify_func: Function for additional model verification
         custom_configs: Sequence of CustomConfigs used to control produced artifacts
+        correctness_batch_size: Maximal batch size of samples concatenated for generating reference outputs
+            and correctness tests, limited by the dataloader maximal batch size. None runs inference per sample.
+        dataloader_prefetch_depth: Number of samples loaded ahead from the dataloader in background threads.
+            Dataloaders reusing buffers between samples require 0, which disables prefetching.
+        dataloader_workers: Number of threads loading samples from dataloaders supporting indexing.
+        pipeline_workers: Number of threads executing independent commands concurrently, e.g. exports
+            and conversions to different formats. Commands running on the GPU are not executed concurrently.
+        resume: Reuse existing workspace and replay outputs of commands stored in the workspace cache whose
+            inputs and upstream models have not changed. Only invalidated commands are executed.
+        time_budget: Maximal time in seconds spent on optimization. Cheap commands are executed first, commands which
+            do not fit in the remaining budget are skipped and profiling of runners clearly slower than already
+            profiled runtimes is stopped early. None means no limit.
 
     Returns:
         Package descriptor representing created package.
@@ -104,6 +127,12 @@ def optimize(
         debug=debug,
         verify_func=verify_func,
         custom_configs=map_custom_configs(custom_configs=custom_configs),
+        correctness_batch_size=correctness_batch_size,
+        dataloader_prefetch_depth=dataloader_prefetch_depth,
+        dataloader_workers=dataloader_workers,
+        pipeline_workers=pipeline_workers,
+        resume=resume,
+        time_budget=time_budget,
     )
 
     models_config = ModelConfigBuilder.generate_model_config(
@@ -21,6 +21,8 @@ from pyee import EventEmitter
 class ProfileEvent(str, Enum):
     """All navigator events."""
 
+    WORKSPACE_INITIALIZED = "workspace initialized"
+
     PROFILING_STARTED = "profiling started"
     PROFILING_FINISHED = "profiling finished"
 
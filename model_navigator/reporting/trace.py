@@ -0,0 +1,182 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Timeline trace of optimize and profile runs."""
+
+import pathlib
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyee import EventEmitter
+
+from model_navigator.configuration.constants import NAVIGATOR_PROFILING_TRACE_FILENAME, NAVIGATOR_TRACE_FILENAME
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.tracing import Tracer, get_tracer, save_trace, timestamp
+from model_navigator.reporting.optimize.events import OptimizeEvent
+from model_navigator.reporting.optimize.events import default_event_emitter as optimize_event_emitter
+from model_navigator.reporting.profile.events import ProfileEvent
+from model_navigator.reporting.profile.events import default_event_emitter as profile_event_emitter
+from model_navigator.utils.environment import use_tracing
+
+
+class TraceReport:
+    """Records timeline of optimize and profile runs and saves it in the workspace.
+
+    Optimization, pipelines and profiled runtimes are recorded as spans from events. Commands, scripts executed
+    in child processes, measurement windows and inference steps are recorded by the tracer where they are executed.
+    Trace is saved to `trace.json` in the optimize workspace and to `profiling_trace.json` in the profiling workspace.
+    Recording is enabled with `NAVIGATOR_USE_TRACING=True`.
+    When pipelines are executed concurrently, pipeline spans cover the ordered commit of their commands.
+    """
+
+    def __init__(
+        self,
+        optimize_emitter: Optional[EventEmitter] = None,
+        profile_emitter: Optional[EventEmitter] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            optimize_emitter: optional emitter of optimize events
+            profile_emitter: optional emitter of profile events
+            tracer: optional tracer recording the events
+        """
+        self.optimize_emitter = optimize_emitter or optimize_event_emitter()
+        self.profile_emitter = profile_emitter or profile_event_emitter()
+        self.tracer = tracer or get_tracer()
+        self.workspace: Optional[pathlib.Path] = None
+        self.profiling_workspace: Optional[pathlib.Path] = None
+        self.current_module_name = None
+        self._open_spans: List[Tuple[str, str, float, float, Dict[str, Any]]] = []
+        self.listen_for_events()
+
+    def listen_for_events(self):
+        """Register listener on events."""
+        self.optimize_emitter.on(OptimizeEvent.WORKSPACE_INITIALIZED, self.on_workspace_initialized)
+        self.optimize_emitter.on(
+            OptimizeEvent.MODULE_PICKED_FOR_OPTIMIZATION,
+            self.on_module_picked_for_optimization,
+        )
+        self.optimize_emitter.on(OptimizeEvent.OPTIMIZATION_STARTED, self.on_optimization_started)
+        self.optimize_emitter.on(OptimizeEvent.OPTIMIZATION_FINISHED, self.on_optimization_finished)
+        self.optimize_emitter.on(OptimizeEvent.PIPELINE_STARTED, self.on_pipeline_started)
+        self.optimize_emitter.on(OptimizeEvent.PIPELINE_FINISHED, self.on_pipeline_finished)
+
+        self.profile_emitter.on(ProfileEvent.WORKSPACE_INITIALIZED, self.on_profiling_workspace_initialized)
+        self.profile_emitter.on(ProfileEvent.PROFILING_STARTED, self.on_profiling_started)
+        self.profile_emitter.on(ProfileEvent.PROFILING_FINISHED, self.on_profiling_finished)
+        self.profile_emitter.on(ProfileEvent.RUNTIME_PROFILING_STARTED, self.on_runtime_profiling_started)
+        self.profile_emitter.on(ProfileEvent.RUNTIME_PROFILING_FINISHED, self.on_runtime_profiling_finished)
+        self.profile_emitter.on(ProfileEvent.RUNTIME_PROFILING_ERROR, self.on_runtime_profiling_error)
+
+    def on_workspace_initialized(self, path):
+        """Action on workspace initialized event."""
+        self.workspace = pathlib.Path(path)
+
+    def on_module_picked_for_optimization(self, name: str):
+        """Action on module picked for optimization event."""
+        self.current_module_name = name
+
+    def on_optimization_started(self):
+        """Action on optimization started event."""
+        self._start("Optimize")
+        args = {"module": self.current_module_name} if self.current_module_name else None
+        self._begin("optimize", category="optimize", args=args)
+
+    def on_optimization_finished(self):
+        """Action on optimization finished event."""
+        self._finish(self.workspace, NAVIGATOR_TRACE_FILENAME)
+        self.workspace = None
+        self.current_module_name = None
+
+    def on_pipeline_started(self, name: str):
+        """Action on pipeline started event."""
+        self._begin(name, category="pipeline")
+
+    def on_pipeline_finished(self):
+        """Action on pipeline finished event."""
+        self._end()
+
+    def on_profiling_workspace_initialized(self, path):
+        """Action on profiling workspace initialized event."""
+        self.profiling_workspace = pathlib.Path(path)
+
+    def on_profiling_started(self):
+        """Action on profiling started event."""
+        self._start("Profile")
+        self._begin("profile", category="profile")
+
+    def on_profiling_finished(self):
+        """Action on profiling finished event."""
+        self._finish(self.profiling_workspace, NAVIGATOR_PROFILING_TRACE_FILENAME)
+        self.profiling_workspace = None
+
+    def on_runtime_profiling_started(self, name: str):
+        """Action on runtime profiling started event."""
+        self._begin(name, category="runtime")
+
+    def on_runtime_profiling_finished(self):
+        """Action on runtime profiling finished event."""
+        self._end(args={"status": "OK"})
+
+    def on_runtime_profiling_error(self):
+        """Action on runtime profiling error event."""
+        self._end(args={"status": "FAIL"})
+
+    def _start(self, process_name: str) -> None:
+        self._open_spans = []
+        if use_tracing():
+            self.tracer.start(process_name=process_name)
+
+    def _finish(self, workspace: Optional[pathlib.Path], filename: str) -> None:
+        while self._open_spans:
+            self._end()
+
+        self.tracer.record_memory()
+        events = self.tracer.stop()
+        if workspace is None or not events:
+            return
+
+        trace_path = workspace / filename
+        try:
+            save_trace(trace_path, events)
+            LOGGER.debug(f"Trace saved to {trace_path.as_posix()!r}.")
+        except OSError as e:
+            LOGGER.warning(f"Unable to save trace to {trace_path.as_posix()!r}: {e}")
+
+    def _begin(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None:
+        self._open_spans.append((name, category, timestamp(), time.perf_counter(), args or {}))
+
+    def _end(self, args: Optional[Dict[str, Any]] = None) -> None:
+        if not self._open_spans:
+            return
+
+        name, category, start, start_time, span_args = self._open_spans.pop()
+        self.tracer.record_memory()
+        self.tracer.complete(
+            name,
+            category,
+            start=start,
+            duration=(time.perf_counter() - start_time) * 1e6,
+            args={**span_args, **(args or {})},
+        )
+
+
+_reporter = None
+
+
+def initialize_trace_reporting():
+    """Initialize recording of traces."""
+    global _reporter
+    _reporter = TraceReport()
@@ -16,6 +16,8 @@
 import abc
 import collections
 import contextlib
+import os
+import threading
 import time
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -27,6 +29,7 @@ from model_navigator.configuration import DeviceKind, Format, TensorType
 from model_navigator.core.dataloader import validate_sample_output
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata, TensorSpec, get_tensor_type
+from model_navigator.core.tracing import get_tracer, timestamp
 
 
 class InferenceStep(Enum):
@@ -40,6 +43,8 @@ class InferenceStep(Enum):
     D2D_MEMCPY = "d2d_memcpy"
     POSTPROCESSING = "postprocessing"
     TOTAL = "total"
+    # Time the request waited before the runner started processing it - collected only in open-loop profiling
+    QUEUEING = "queueing"
 
 
 class InferenceTime(collections.defaultdict):
@@ -52,7 +57,12 @@ class InferenceTime(collections.defaultdict):
 
 
 class InferenceStepTimer:
-    """Context manager for measuring inference step time."""
+    """Context manager for measuring inference step time.
+
+    Measured time is stored per thread, so steps of inferences run concurrently from multiple threads
+    are not mixed. When tracing is enabled, steps are recorded as spans after the outermost step is measured,
+    so recording does not add to the measured time.
+    """
 
     def __init__(self, inference_time: InferenceTime, enabled: bool = False, callbacks: Optional[List] = None):
         """Initialize object.
@@ -62,15 +72,29 @@ class InferenceStepTimer:
             enabled: Flag indicating if timer is enabled.
             callbacks: List of callbacks to call after each step. E.g. to synchronize CUDA streams.
         """
-        self.inference_time = inference_time
+        self._default_inference_time = inference_time
+        self._local = threading.local()
         self.enabled = enabled
         self._callbacks = callbacks or []
 
+    @property
+    def inference_time(self) -> InferenceTime:
+        """InferenceTime object storing time measured in the current thread."""
+        return getattr(self._local, "inference_time", self._default_inference_time)
+
+    @inference_time.setter
+    def inference_time(self, inference_time: InferenceTime) -> None:
+        """Set InferenceTime object storing time measured in the current thread."""
+        self._local.inference_time = inference_time
+
     @contextlib.contextmanager
     def measure_step(self, step_name: Union[str, InferenceStep]):
         """Context manager for measuring nested inference step time."""
         step_name = step_name.value if isinstance(step_name, InferenceStep) else step_name
         if self.enabled:
+            tracing = get_tracer().enabled
+            if tracing:
+                self._local.depth = getattr(self._local, "depth", 0) + 1
             start_time = time.monotonic()
             yield
             for callback in self._callbacks:
@@ -78,9 +102,24 @@ class InferenceStepTimer:
             end_time = time.monotonic()
             runtime = (end_time - start_time) * 1000
             self.inference_time[step_name] += runtime
+            if tracing:
+                self._trace_step(step_name, start_time, end_time)
         else:
             yield
 
+    def _trace_step(self, step_name: str, start_time: float, end_time: float) -> None:
+        steps = self._local.__dict__.setdefault("steps", [])
+        steps.append((step_name, start_time, end_time))
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+
+        tracer = get_tracer()
+        offset = timestamp() - time.monotonic() * 1e6
+        for name, start, end in steps:
+            tracer.complete(name, category="inference", start=start * 1e6 + offset, duration=(end - start) * 1e6)
+        steps.clear()
+
 
 class NavigatorRunner(abc.ABC):
     """Base abstract runner.
@@ -95,6 +134,7 @@ class NavigatorRunner(abc.ABC):
     is_experimental = False
     is_inplace = True
     is_native = False
+    is_thread_safe = False
 
     def __init__(
         self,
@@ -104,6 +144,9 @@ class NavigatorRunner(abc.ABC):
         return_type: TensorType = TensorType.NUMPY,
         enable_timer: bool = False,
         inplace: bool = False,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cpu_affinity: Optional[List[int]] = None,
         **_kwargs,
     ) -> None:
         """Initialize object.
@@ -115,6 +158,9 @@ class NavigatorRunner(abc.ABC):
             return_type: A type of return value
             enable_timer: Flag indicating if timer should be enabled
             inplace: Indicate the runner is in inplace mode
+            intra_op_threads: Number of threads used by a single operator. Applied only by CPU runners.
+            inter_op_threads: Number of threads running independent operators. Applied only by CPU runners.
+            cpu_affinity: Logical CPUs the process is pinned to while runner is active. Applied only by CPU runners.
         """
         self._model = model
         self._input_metadata = input_metadata
@@ -125,6 +171,11 @@ class NavigatorRunner(abc.ABC):
 
         self._inplace = inplace
 
+        self._intra_op_threads = intra_op_threads
+        self._inter_op_threads = inter_op_threads
+        self._cpu_affinity = cpu_affinity
+        self._previous_cpu_affinity = None
+
         self._enable_timer = enable_timer
         self._inference_time = InferenceTime()
         self.is_active = False
@@ -258,6 +309,9 @@ class NavigatorRunner(abc.ABC):
             )
             return
 
+        if self.devices_kind() == [DeviceKind.CPU]:
+            self._configure_cpu_threading()
+
         self.activate_impl()
         self.is_active = True
 
@@ -321,8 +375,8 @@ class NavigatorRunner(abc.ABC):
                         f"Note: Expected a shape compatible with: {meta.shape}"
                     )
 
-        self._inference_time = InferenceTime()
-        self._inference_step_timer.inference_time = self._inference_time
+        # each call measures time in a new object, so concurrent calls do not share it
+        self._inference_step_timer.inference_time = InferenceTime()
         with self._inference_step_timer.measure_step(InferenceStep.TOTAL):
             output = self.infer_impl(feed_dict, *args, **kwargs)
 
@@ -338,14 +392,15 @@ class NavigatorRunner(abc.ABC):
 
         Returns:
             Inference time in seconds split into preprocessing, host-to-device, compute, device-to-host, and
-            postprocessing times.
+            postprocessing times of the last call in the current thread.
         """
-        if not self._inference_time:
+        inference_time = self._inference_step_timer.inference_time
+        if not inference_time:
             raise RuntimeError(
                 f"{self.name()} | Inference time not available. "
                 "Make sure to call `infer()` before calling `last_inference_time()`."
             )
-        return self._inference_time
+        return inference_time
 
     def deactivate(self):
         """Deactivate the runner. For example, this may involve freeing CPU or GPU memory."""
@@ -360,8 +415,32 @@ class NavigatorRunner(abc.ABC):
         self.is_active = None
 
         self.deactivate_impl()
+        self._restore_cpu_threading()
         self.is_active = False
 
+    def _configure_cpu_threading(self):
+        """Apply threading parameters before the runner is activated.
+
+        Pinning is applied to the whole process and restored on deactivation.
+        Derived classes extend the method to configure framework thread pools.
+        """
+        if not self._cpu_affinity:
+            return
+
+        if not hasattr(os, "sched_setaffinity"):
+            LOGGER.warning(f"{self.name()} | CPU affinity is not supported on this platform; ignoring it.")
+            return
+
+        self._previous_cpu_affinity = os.sched_getaffinity(0)
+        LOGGER.debug(f"{self.name()} | Pinning process to CPUs: {self._cpu_affinity}")
+        os.sched_setaffinity(0, self._cpu_affinity)
+
+    def _restore_cpu_threading(self):
+        """Restore process state modified by `_configure_cpu_threading`."""
+        if self._previous_cpu_affinity is not None:
+            os.sched_setaffinity(0, self._previous_cpu_affinity)
+            self._previous_cpu_affinity = None
+
     def get_available_return_types(self) -> List[TensorType]:
         """Returns a list of available return types.
 
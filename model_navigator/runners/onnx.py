@@ -13,11 +13,13 @@
 # limitations under the License.
 """ONNX runners."""
 
+import os
+import pathlib
 from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import model_navigator.utils.common as utils
-from model_navigator.configuration import Format, TensorType
+from model_navigator.configuration import Format, OnnxExecutionMode, OnnxGraphOptimizationLevel, TensorType
 from model_navigator.configuration.device import get_id_from_device_string, validate_device_string
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata, get_tensor_type
@@ -39,6 +41,18 @@ provider2device = {
     "TensorrtExecutionProvider": DeviceKind.CUDA,
 }
 
+ORT_GRAPH_OPTIMIZATION_LEVELS = {
+    OnnxGraphOptimizationLevel.DISABLE: "ORT_DISABLE_ALL",
+    OnnxGraphOptimizationLevel.BASIC: "ORT_ENABLE_BASIC",
+    OnnxGraphOptimizationLevel.EXTENDED: "ORT_ENABLE_EXTENDED",
+    OnnxGraphOptimizationLevel.ALL: "ORT_ENABLE_ALL",
+}
+
+ORT_EXECUTION_MODES = {
+    OnnxExecutionMode.SEQUENTIAL: "ORT_SEQUENTIAL",
+    OnnxExecutionMode.PARALLEL: "ORT_PARALLEL",
+}
+
 
 class SessionFromOnnx:
     """ONNX session wrapper.
@@ -51,6 +65,8 @@ class SessionFromOnnx:
         model_bytes: Union[bytes, str],
         providers: Optional[Sequence[str]] = None,
         provider_options: Optional[Sequence[Dict[Any, Any]]] = None,
+        session_options: Optional[Dict[str, Any]] = None,
+        optimized_model_path: Optional[Union[str, pathlib.Path]] = None,
     ):
         """Builds an ONNX-Runtime inference session.
 
@@ -63,10 +79,16 @@ class SessionFromOnnx:
                     match the "CPUExecutionProvider".
                     Defaults to ``["CUDA"]``.
             provider_options: A dictionary of options to pass to the execution provider.
+            session_options: Attributes of `onnxruntime.SessionOptions` used to create the session.
+            optimized_model_path: Path where the graph optimized by ONNX-Runtime is stored when the session is created
+                    for the first time. When the stored graph is up to date with the model, it is loaded
+                    without optimizing the graph again.
         """
         self._model_bytes_or_path = model_bytes
         self.providers = utils.default(providers, ["cuda"])
         self.provider_options = provider_options
+        self.session_options = session_options or {}
+        self.optimized_model_path = pathlib.Path(optimized_model_path) if optimized_model_path else None
 
     def __call__(self, *args, **kwargs):
         """Invokes ``call_impl``.
@@ -95,16 +117,85 @@ class SessionFromOnnx:
                 )
             providers.append(matched_prov)
 
-        LOGGER.info(f"Creating ONNX-Runtime Inference Session with providers: {providers}")
-        return onnxrt.InferenceSession(model_bytes, providers=providers, provider_options=self.provider_options)
+        sess_options = onnxrt.SessionOptions()
+        for name, value in self.session_options.items():
+            setattr(sess_options, name, value)
+
+        if self.optimized_model_path is None:
+            LOGGER.info(f"Creating ONNX-Runtime Inference Session with providers: {providers}")
+            return onnxrt.InferenceSession(
+                model_bytes, sess_options=sess_options, providers=providers, provider_options=self.provider_options
+            )
+
+        return self._create_session_with_optimized_model(model_bytes, sess_options, providers)
+
+    def _create_session_with_optimized_model(self, model_bytes, sess_options, providers):
+        if self._is_optimized_model_valid(model_bytes):
+            LOGGER.info(f"Loading ONNX-Runtime optimized model: {self.optimized_model_path}")
+            # Graph is already optimized, so the optimization is skipped to reduce the session creation time
+            sess_options.graph_optimization_level = onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return onnxrt.InferenceSession(
+                self.optimized_model_path.as_posix(),
+                sess_options=sess_options,
+                providers=providers,
+                provider_options=self.provider_options,
+            )
+
+        # Concurrent sessions store the graph in separate files and the last one replaces the cached model
+        self.optimized_model_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.optimized_model_path.with_name(f"{self.optimized_model_path.name}.{os.getpid()}.tmp")
+        sess_options.optimized_model_filepath = tmp_path.as_posix()
+
+        LOGGER.info(
+            f"Creating ONNX-Runtime Inference Session with providers: {providers} "
+            f"and storing optimized model: {self.optimized_model_path}"
+        )
+        session = onnxrt.InferenceSession(
+            model_bytes, sess_options=sess_options, providers=providers, provider_options=self.provider_options
+        )
+        if tmp_path.exists():
+            os.replace(tmp_path, self.optimized_model_path)
+        else:
+            LOGGER.warning(f"ONNX-Runtime did not store optimized model: {self.optimized_model_path}")
+
+        return session
+
+    def _is_optimized_model_valid(self, model_bytes) -> bool:
+        if not self.optimized_model_path.exists():
+            return False
+
+        if not isinstance(model_bytes, (str, pathlib.Path)):
+            return True
+
+        return self.optimized_model_path.stat().st_mtime >= pathlib.Path(model_bytes).stat().st_mtime
 
 
 class _BaseOnnxrtRunner(NavigatorRunner):
     _provider: str
+    _supports_optimized_model_cache = True
+    is_thread_safe = True
 
-    def __init__(self, disable_fallback=True, device: Optional[str] = None, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        disable_fallback=True,
+        device: Optional[str] = None,
+        graph_optimization_level: Optional[Union[OnnxGraphOptimizationLevel, str]] = None,
+        execution_mode: Optional[Union[OnnxExecutionMode, str]] = None,
+        enable_mem_arena: Optional[bool] = None,
+        enable_mem_pattern: Optional[bool] = None,
+        cache_optimized_model: bool = False,
+        *args,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self._disable_fallback = disable_fallback
+        self._graph_optimization_level = (
+            OnnxGraphOptimizationLevel(graph_optimization_level) if graph_optimization_level is not None else None
+        )
+        self._execution_mode = OnnxExecutionMode(execution_mode) if execution_mode is not None else None
+        self._enable_mem_arena = enable_mem_arena
+        self._enable_mem_pattern = enable_mem_pattern
+        self._cache_optimized_model = cache_optimized_model
 
         if device:
             validate_device_string(device)
@@ -114,15 +205,52 @@ class _BaseOnnxrtRunner(NavigatorRunner):
         else:
             self.device_id = 0
 
+        session_options = self._get_session_options()
         if provider2device[self._provider] == DeviceKind.CUDA:
             provider_options = [{"device_id": self.device_id}]
         else:
             provider_options = None
+            if self._intra_op_threads is not None:
+                session_options["intra_op_num_threads"] = self._intra_op_threads
+            if self._inter_op_threads is not None:
+                session_options["inter_op_num_threads"] = self._inter_op_threads
 
         self._sess = SessionFromOnnx(
-            self._model.as_posix(), providers=[self._provider], provider_options=provider_options
+            self._model.as_posix(),
+            providers=[self._provider],
+            provider_options=provider_options,
+            session_options=session_options,
+            optimized_model_path=self._get_optimized_model_path(),
         )
 
+    def _get_session_options(self) -> Dict[str, Any]:
+        session_options = {}
+        if self._graph_optimization_level is not None:
+            level = ORT_GRAPH_OPTIMIZATION_LEVELS[self._graph_optimization_level]
+            session_options["graph_optimization_level"] = getattr(onnxrt.GraphOptimizationLevel, level)
+        if self._execution_mode is not None:
+            mode = ORT_EXECUTION_MODES[self._execution_mode]
+            session_options["execution_mode"] = getattr(onnxrt.ExecutionMode, mode)
+        if self._enable_mem_arena is not None:
+            session_options["enable_cpu_mem_arena"] = self._enable_mem_arena
+        if self._enable_mem_pattern is not None:
+            session_options["enable_mem_pattern"] = self._enable_mem_pattern
+
+        return session_options
+
+    def _get_optimized_model_path(self) -> Optional[pathlib.Path]:
+        if not self._cache_optimized_model:
+            return None
+
+        if not self._supports_optimized_model_cache:
+            LOGGER.warning(f"{self.name()} does not support storing optimized model; the model is optimized on load.")
+            return None
+
+        # Optimized graph depends on the execution provider, optimization level and ONNX Runtime version
+        level = self._graph_optimization_level.value if self._graph_optimization_level else "default"
+        model_path = pathlib.Path(self._model)
+        return model_path.parent / "ort_optimized" / f"{self.slug()}-{level}-{onnxrt.__version__}.onnx"
+
     @classmethod
     def format(cls) -> Format:
         return Format.ONNX
@@ -338,6 +466,8 @@ class OnnxrtTensorRTRunner(OnnxrtCUDARunner):
     """ONNX runner for TensorRT runtime provider."""
 
     _provider = "TensorrtExecutionProvider"
+    # TensorRT execution provider compiles the graph into engines which cannot be stored in ONNX model
+    _supports_optimized_model_cache = False
 
     @classmethod
     def name(cls) -> str:
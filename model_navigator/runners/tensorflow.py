@@ -22,6 +22,7 @@ from packaging.version import Version
 
 from model_navigator.configuration import Format
 from model_navigator.core.dataloader import get_default_output_names
+from model_navigator.core.logger import LOGGER
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
 from model_navigator.runners.registry import register_runner
 from model_navigator.utils import module
@@ -33,6 +34,8 @@ keras = module.lazy_import("keras")
 class _BaseTFRunner(NavigatorRunner):
     """Runs inference using TensorFlow2."""
 
+    is_thread_safe = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         """Runner initialization implementation."""
@@ -42,6 +45,18 @@ class _BaseTFRunner(NavigatorRunner):
         """Runner deactivation implementation."""
         self._loaded_model = None
 
+    def _configure_cpu_threading(self):
+        """Configure TensorFlow thread pools."""
+        super()._configure_cpu_threading()
+        try:
+            if self._intra_op_threads is not None:
+                tf.config.threading.set_intra_op_parallelism_threads(self._intra_op_threads)
+            if self._inter_op_threads is not None:
+                tf.config.threading.set_inter_op_parallelism_threads(self._inter_op_threads)
+        except RuntimeError as e:
+            # Thread pools can be configured only before TensorFlow runtime is initialized
+            LOGGER.warning(f"{self.name()} | Unable to configure TensorFlow threads: {str(e)}")
+
     def infer_impl(self, feed_dict: Dict, *args, **kwargs):
         """Runner inference implementation override."""
         outputs = self._infer_impl(feed_dict)
@@ -37,6 +37,7 @@ class _BaseTorchRunner(NavigatorRunner):
 
     _target_device = None
     is_native = True
+    is_thread_safe = True
 
     @classmethod
     def format(cls) -> Format:
@@ -87,6 +88,7 @@ class _BaseTorchRunner(NavigatorRunner):
             self._inference_time, enabled=self._enable_timer, callbacks=[lambda: torch.cuda.synchronize()]
         )
         self._input_module_device = None
+        self._previous_num_threads = None
 
     def activate_impl(self):
         """Activation implementation."""
@@ -99,6 +101,27 @@ class _BaseTorchRunner(NavigatorRunner):
         """Deactivation implementation."""
         self._loaded_model = None
 
+    def _configure_cpu_threading(self):
+        """Configure PyTorch thread pools."""
+        super()._configure_cpu_threading()
+        if self._intra_op_threads is not None:
+            self._previous_num_threads = torch.get_num_threads()
+            torch.set_num_threads(self._intra_op_threads)
+
+        if self._inter_op_threads is not None and torch.get_num_interop_threads() != self._inter_op_threads:
+            try:
+                torch.set_num_interop_threads(self._inter_op_threads)
+            except RuntimeError as e:
+                # Inter-op pool can be resized only before the first parallel work is started
+                LOGGER.warning(f"{self.name()} | Unable to set number of inter-op threads: {str(e)}")
+
+    def _restore_cpu_threading(self):
+        """Restore PyTorch intra-op thread pool."""
+        super()._restore_cpu_threading()
+        if self._previous_num_threads is not None:
+            torch.set_num_threads(self._previous_num_threads)
+            self._previous_num_threads = None
+
     def infer_impl(self, feed_dict, *args, **kwargs):
         """Inference handler implementation."""
         outputs = self._infer(feed_dict=feed_dict)
@@ -332,6 +355,7 @@ class TorchCompileCUDARunner(_BaseTorchRunner):
     """Torch Compile model CUDA based runner."""
 
     _target_device = DeviceKind.CUDA
+    is_thread_safe = False
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialization implementation."""
@@ -389,6 +413,7 @@ class TorchCompileCPURunner(_BaseTorchRunner):
     """Torch Compile model CPU based runner."""
 
     _target_device = DeviceKind.CPU
+    is_thread_safe = False
 
     @classmethod
     def devices_kind(cls) -> List[DeviceKind]:
@@ -465,6 +490,7 @@ class TorchTensorRTRunner(_BaseTorchExportedProgramRunner):
     """TorchScript-TensorRT model runner."""
 
     _target_device = DeviceKind.CUDA
+    is_thread_safe = False
 
     @classmethod
     def format(cls) -> Format:
@@ -13,9 +13,15 @@
 # limitations under the License.
 """Helper function for runners."""
 
-from typing import Iterable, List, Type, Union
-
-from model_navigator.configuration import Format
+from typing import Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from model_navigator.configuration import Format, Sample
+from model_navigator.core.dataloader import (
+    are_samples_concatenable,
+    concatenate_samples,
+    get_sample_batch_size,
+    split_sample,
+)
 from model_navigator.core.logger import LOGGER
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
 from model_navigator.runners.registry import runner_registry
@@ -123,3 +129,89 @@ def filter_runners(runners: Iterable[Union[str, Type[NavigatorRunner]]], device_
         filtered_runners.add(runner_name)
 
     return list(filtered_runners)
+
+
+def infer_batches(
+    runner: NavigatorRunner,
+    samples: Iterable[Sample],
+    batch_dim: Optional[int],
+    batch_size: Optional[int],
+) -> Iterator[Tuple[List[int], Sample]]:
+    """Run inference on consecutive samples concatenated along the batch dimension.
+
+    Samples are concatenated while they have compatible shapes and their total batch size does not exceed
+    `batch_size`. When the outputs of concatenated samples do not share their batch dimension,
+    the samples are inferred one by one.
+
+    Args:
+        runner: Activated runner
+        samples: Samples to infer
+        batch_dim: A place where batch is stored in sample
+        batch_size: Maximal batch size of concatenated samples. None infers samples one by one.
+
+    Yields:
+        Indices of inferred samples and their outputs concatenated along the batch dimension
+    """
+    for indices, _, outputs in _infer_batches(runner, samples, batch_dim, batch_size):
+        yield indices, outputs
+
+
+def infer_batched(
+    runner: NavigatorRunner,
+    samples: Iterable[Sample],
+    batch_dim: Optional[int],
+    batch_size: Optional[int],
+) -> Iterator[Sample]:
+    """Run inference on consecutive samples concatenated along the batch dimension and yield outputs per sample.
+
+    Args:
+        runner: Activated runner
+        samples: Samples to infer
+        batch_dim: A place where batch is stored in sample
+        batch_size: Maximal batch size of concatenated samples. None infers samples one by one.
+
+    Yields:
+        Outputs of each sample in the order of samples
+    """
+    for indices, batch_sizes, outputs in _infer_batches(runner, samples, batch_dim, batch_size):
+        if len(indices) == 1:
+            yield outputs
+        else:
+            yield from split_sample(outputs, batch_sizes, batch_dim)
+
+
+def _infer_batches(runner, samples, batch_dim, batch_size):
+    if batch_dim is None or batch_size is None or batch_size <= 1:
+        for idx, sample in enumerate(samples):
+            yield [idx], None, runner.infer(sample)
+        return
+
+    batch, indices, batch_sizes = [], [], []
+    for idx, sample in enumerate(samples):
+        sample_batch_size = get_sample_batch_size(sample, batch_dim)
+        if batch and (
+            not are_samples_concatenable(batch[0], sample, batch_dim)
+            or sum(batch_sizes) + sample_batch_size > batch_size
+        ):
+            yield from _infer_batch(runner, batch, indices, batch_sizes, batch_dim)
+            batch, indices, batch_sizes = [], [], []
+
+        batch.append(sample)
+        indices.append(idx)
+        batch_sizes.append(sample_batch_size)
+
+    if batch:
+        yield from _infer_batch(runner, batch, indices, batch_sizes, batch_dim)
+
+
+def _infer_batch(runner, batch, indices, batch_sizes, batch_dim):
+    if len(batch) > 1:
+        outputs = runner.infer(concatenate_samples(batch, batch_dim))
+        if get_sample_batch_size(outputs, batch_dim) == sum(batch_sizes):
+            yield indices, batch_sizes, outputs
+            return
+
+        LOGGER.debug(f"Outputs of samples {indices} do not share batch dimension. Running inference per sample.")
+
+    for idx, sample_batch_size, sample in zip(indices, batch_sizes, batch):
+        yield [idx], [sample_batch_size], runner.infer(sample)
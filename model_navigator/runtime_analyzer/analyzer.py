@@ -15,18 +15,22 @@
 
 import dataclasses
 from math import inf
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from model_navigator.commands.correctness.correctness import Correctness
 from model_navigator.commands.performance.performance import Performance
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.commands.performance.utils import is_request_rate_sustained
 from model_navigator.configuration import (
     MaxThroughputAndMinLatencyStrategy,
     MaxThroughputStrategy,
     MaxThroughputWithLatencyBudgetStrategy,
+    MaxThroughputWithMemoryBudgetStrategy,
     MinLatencyStrategy,
     RuntimeSearchStrategy,
     SelectedRuntimeStrategy,
 )
+from model_navigator.configuration.constants import DEFAULT_REQUEST_RATE_TOLERANCE
 from model_navigator.core.logger import LOGGER
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorUserInputError
 from model_navigator.package.status import CommandStatus, ModelStatus, RunnerStatus
@@ -41,12 +45,14 @@ class RuntimeAnalyzerResult:
         throughput: in samples/second for selected result
         model_status: details of selected model
         runner_status: details of selected runner
+        concurrency: number of concurrent requests for selected result
     """
 
     latency: float
     throughput: float
     model_status: ModelStatus
     runner_status: RunnerStatus
+    concurrency: int = 1
 
 
 class RuntimeAnalyzer:
@@ -110,6 +116,13 @@ class RuntimeAnalyzer:
                 runners=runners,
                 latency_budget=strategy.latency_budget,
             )
+        elif isinstance(strategy, MaxThroughputWithMemoryBudgetStrategy):
+            result = cls._get_max_throughput_runtime(
+                models_status=models_status,
+                formats=formats,
+                runners=runners,
+                memory_budget=strategy.memory_budget,
+            )
         elif isinstance(strategy, SelectedRuntimeStrategy):
             result = cls._get_selected_runtime(
                 models_status=models_status,
@@ -127,6 +140,7 @@ class RuntimeAnalyzer:
             f"Strategy: {strategy}\n"
             f"  Latency: {result.latency:.4f} [ms]\n"
             f"  Throughput: {result.throughput:.4f} [infer/sec]\n"
+            f"  Concurrency: {result.concurrency}\n"
             f"  Runner: {result.runner_status.runner_name}\n"
             f"  Model: {result.model_status.model_config.path.as_posix()}"
         )
@@ -167,10 +181,12 @@ class RuntimeAnalyzer:
                     assert runner_status.result[Performance.__name__]["profiling_results"] is not None
                     latency = inf
                     throughput = None
-                    for perf in runner_status.result[Performance.__name__]["profiling_results"]:
+                    concurrency = 1
+                    for perf in _get_closed_loop_results(runner_status):
                         if perf.p50_latency < latency:
                             latency = perf.p50_latency
                             throughput = perf.throughput
+                            concurrency = perf.concurrency
 
                     if best_latency is None or latency < best_latency:
                         best_latency = latency
@@ -179,6 +195,7 @@ class RuntimeAnalyzer:
                             throughput=throughput,
                             model_status=model_status,
                             runner_status=runner_status,
+                            concurrency=concurrency,
                         )
 
         return best_runtime
@@ -189,6 +206,7 @@ class RuntimeAnalyzer:
         *,
         models_status: Dict[str, ModelStatus],
         latency_budget: Optional[float] = None,
+        memory_budget: Optional[float] = None,
         formats: Optional[Sequence[str]] = None,
         runners: Optional[Sequence[str]] = None,
     ) -> Optional[RuntimeAnalyzerResult]:
@@ -200,6 +218,7 @@ class RuntimeAnalyzer:
                 if models_status.model_config.format.value in formats
             }
 
+        candidates = []
         for model_status in models_status.values():
             runners_status = model_status.runners_status
             if runners is not None:
@@ -216,23 +235,46 @@ class RuntimeAnalyzer:
                     == CommandStatus.OK
                 ):
                     assert runner_status.result[Performance.__name__]["profiling_results"] is not None
-                    latency = None
-                    throughput = -inf
-                    for perf in runner_status.result[Performance.__name__]["profiling_results"]:
-                        if perf.throughput > throughput and (
-                            latency_budget is None or perf.p50_latency <= latency_budget
-                        ):
-                            latency = perf.p50_latency
-                            throughput = perf.throughput
+                    candidates.append((model_status, runner_status))
 
-                    if best_throughput is None or throughput > best_throughput:
-                        best_throughput = throughput
-                        best_runtime = RuntimeAnalyzerResult(
-                            latency=latency,
-                            throughput=throughput,
-                            model_status=model_status,
-                            runner_status=runner_status,
-                        )
+        # When runners were profiled in open-loop, results rank runners by the highest sustained load with tail
+        # latency in the budget. Runners without sustained open-loop results, e.g. stabilized runners, are ranked
+        # on tail latency of closed-loop results, so all runners are compared with the same latency metric.
+        use_open_loop = latency_budget is not None and any(
+            _get_sustained_open_loop_results(runner_status) for _, runner_status in candidates
+        )
+        for model_status, runner_status in candidates:
+            profiling_results = _get_closed_loop_results(runner_status)
+            if use_open_loop:
+                profiling_results = _get_sustained_open_loop_results(runner_status) or profiling_results
+
+            # Results without memory data cannot be verified against the memory budget
+            if memory_budget is not None:
+                profiling_results = [
+                    perf
+                    for perf in profiling_results
+                    if perf.peak_rss_memory is not None and perf.peak_rss_memory <= memory_budget
+                ]
+
+            latency = None
+            throughput = -inf
+            concurrency = 1
+            for perf in profiling_results:
+                perf_latency = perf.p99_latency if use_open_loop else perf.p50_latency
+                if perf.throughput > throughput and (latency_budget is None or perf_latency <= latency_budget):
+                    latency = perf_latency
+                    throughput = perf.throughput
+                    concurrency = perf.concurrency
+
+            if best_throughput is None or throughput > best_throughput:
+                best_throughput = throughput
+                best_runtime = RuntimeAnalyzerResult(
+                    latency=latency,
+                    throughput=throughput,
+                    model_status=model_status,
+                    runner_status=runner_status,
+                    concurrency=concurrency,
+                )
 
         return best_runtime
 
@@ -291,7 +333,7 @@ class RuntimeAnalyzer:
                 f"Model {model_key} has not evaluated successfully on runner {runner_name}"
             )
 
-        profiling_results = runner_status.result[Performance.__name__]["profiling_results"]
+        profiling_results = _get_closed_loop_results(runner_status)
         if len(profiling_results) == 0:
             raise ModelNavigatorRuntimeAnalyzerError(
                 f"No profiling results for model {model_key} and runner {runner_name} not found"
@@ -304,5 +346,20 @@ class RuntimeAnalyzer:
             throughput=perf.throughput,
             model_status=model_status,
             runner_status=runner_status,
+            concurrency=perf.concurrency,
         )
         return result
+
+
+def _get_closed_loop_results(runner_status: RunnerStatus) -> List[ProfilingResults]:
+    profiling_results = runner_status.result[Performance.__name__]["profiling_results"]
+    return [perf for perf in profiling_results if perf.request_rate is None]
+
+
+def _get_sustained_open_loop_results(runner_status: RunnerStatus) -> List[ProfilingResults]:
+    profiling_results = runner_status.result[Performance.__name__]["profiling_results"]
+    return [
+        perf
+        for perf in profiling_results
+        if perf.request_rate is not None and is_request_rate_sustained(perf, DEFAULT_REQUEST_RATE_TOLERANCE)
+    ]
@@ -27,7 +27,7 @@ Example of use:
 
 import pathlib
 import shutil
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from loguru import logger
@@ -546,8 +546,15 @@ def _onnx_config_from_runtime_result(
     if runtime_result.runner_status.runner_name == OnnxrtTensorRTRunner.name():
         optimization = ONNXOptimization(accelerator=TensorRTAccelerator())
 
+    parameters = {}
     if runtime_result.runner_status.runner_name in [OnnxrtCUDARunner.name(), OnnxrtTensorRTRunner.name()]:
         instance_groups = [InstanceGroup(kind=DeviceKind.KIND_GPU)]
+    elif runtime_result.runner_status.runner_name == OnnxrtCPURunner.name():
+        instance_groups, parameters = _cpu_threading_from_runtime_result(
+            runtime_result=runtime_result,
+            intra_op_parameter="intra_op_thread_count",
+            inter_op_parameter="inter_op_thread_count",
+        )
 
     config = ONNXModelConfig(
         batching=batching,
@@ -557,6 +564,7 @@ def _onnx_config_from_runtime_result(
         response_cache=response_cache,
         optimization=optimization,
         instance_groups=instance_groups,
+        parameters=parameters,
         warmup=warmup,
     )
     return config
@@ -574,6 +582,9 @@ def _tensorflow_config_from_runtime_result(
     instance_groups = []
     if runtime_result.runner_status.runner_name == TensorFlowTensorRTRunner.name():
         instance_groups = [InstanceGroup(kind=DeviceKind.KIND_GPU)]
+    elif runtime_result.runner_status.runner_name == TensorFlowSavedModelCPURunner.name():
+        # TensorFlow backend configures thread pools only with server command line options
+        instance_groups, _ = _cpu_threading_from_runtime_result(runtime_result=runtime_result)
 
     # TODO: check runner for savedmodel when available
 
@@ -599,8 +610,15 @@ def _pytorch_config_from_runtime_result(
     warmup: Dict[str, ModelWarmup],
 ):
     instance_groups = []
+    parameters = {}
     if runtime_result.runner_status.runner_name in [TorchTensorRTRunner.name(), TorchScriptCUDARunner.name()]:
         instance_groups = [InstanceGroup(kind=DeviceKind.KIND_GPU)]
+    elif runtime_result.runner_status.runner_name == TorchScriptCPURunner.name():
+        instance_groups, parameters = _cpu_threading_from_runtime_result(
+            runtime_result=runtime_result,
+            intra_op_parameter="INTRA_OP_THREAD_COUNT",
+            inter_op_parameter="INTER_OP_THREAD_COUNT",
+        )
 
     config = PyTorchModelConfig(
         batching=batching,
@@ -609,11 +627,32 @@ def _pytorch_config_from_runtime_result(
         outputs=outputs,
         response_cache=response_cache,
         instance_groups=instance_groups,
+        parameters=parameters,
         warmup=warmup,
     )
     return config
 
 
+def _cpu_threading_from_runtime_result(
+    runtime_result: RuntimeAnalyzerResult,
+    intra_op_parameter: Optional[str] = None,
+    inter_op_parameter: Optional[str] = None,
+) -> Tuple[List[InstanceGroup], Dict[str, str]]:
+    """Map threading configuration selected during profiling to CPU instance group and backend parameters."""
+    runner_config = getattr(runtime_result.model_status.model_config, "runner_config", None)
+    if runner_config is None or not runner_config.get_threading_dict():
+        return [], {}
+
+    instance_groups = [InstanceGroup(kind=DeviceKind.KIND_CPU, count=runner_config.instance_count or 1)]
+    parameters = {}
+    if intra_op_parameter and runner_config.intra_op_threads is not None:
+        parameters[intra_op_parameter] = str(runner_config.intra_op_threads)
+    if inter_op_parameter and runner_config.inter_op_threads is not None:
+        parameters[inter_op_parameter] = str(runner_config.inter_op_threads)
+
+    return instance_groups, parameters
+
+
 def _tensorrt_config_from_runtime_result(
     batching: bool,
     max_batch_size: int,
@@ -28,6 +28,8 @@ from loguru import logger
 from model_navigator.configuration.constants import (
     NAVIGATOR_CONSOLE_OUTPUT_ENV,
     NAVIGATOR_USE_MULTIPROCESSING,
+    NAVIGATOR_USE_TRACING,
+    NAVIGATOR_USE_WORKER_POOL,
     OUTPUT_SIMPLE_REPORT,
 )
 
@@ -213,6 +215,17 @@ def use_multiprocessing() -> bool:
     return os.environ.get(NAVIGATOR_USE_MULTIPROCESSING, "True").upper() == "TRUE"
 
 
+@lru_cache
+def use_worker_pool() -> bool:
+    """Return flag whether to reuse pre-warmed worker processes for isolated subcommands."""
+    return os.environ.get(NAVIGATOR_USE_WORKER_POOL, "False").upper() == "TRUE"
+
+
+def use_tracing() -> bool:
+    """Return flag whether to record timeline trace of optimize and profile runs."""
+    return os.environ.get(NAVIGATOR_USE_TRACING, "False").upper() == "TRUE"
+
+
 @lru_cache
 def get_console_output() -> str:
     """Returns what should be put on the console."""
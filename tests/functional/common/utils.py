@@ -41,10 +41,18 @@ EVALUATION_FILES = [
 COMMON_FILES = [
     r"navigator\.log",
     r"status\.yaml",
-    r"model\_input/correctness/0*\.npz",
-    r"model\_input/profiling/0*\.npz",
-    r"model\_output/correctness/0*\.npz",
-    r"model\_output/profiling/0*\.npz",
+    r"model\_input/correctness/samples\_index\.json",
+    r"model\_input/correctness/samples\_table\.npy",
+    r"model\_input/correctness/tensor\_[0-9]+\.npy",
+    r"model\_input/profiling/samples\_index\.json",
+    r"model\_input/profiling/samples\_table\.npy",
+    r"model\_input/profiling/tensor\_[0-9]+\.npy",
+    r"model\_output/correctness/samples\_index\.json",
+    r"model\_output/correctness/samples\_table\.npy",
+    r"model\_output/correctness/tensor\_[0-9]+\.npy",
+    r"model\_output/profiling/samples\_index\.json",
+    r"model\_output/profiling/samples\_table\.npy",
+    r"model\_output/profiling/tensor\_[0-9]+\.npy",
 ]
 
 
@@ -345,3 +345,19 @@ def test_get_conversion_profiles_return_correct_arguments_when_batch_dim_and_max
         max=(128, 256),
     )
     assert result == expected_result
+
+
+def test_get_conversion_fallback_batch_sizes_bisect_range_when_dataloader_batch_size_is_large():
+    fallback_batch_sizes = ConvertONNX2TRT._get_conversion_fallback_batch_sizes(
+        device_max_batch_size=128, dataloader_max_batch_size=64
+    )
+
+    assert list(fallback_batch_sizes) == [96, 80, 64]
+
+
+def test_get_conversion_fallback_batch_sizes_halve_batch_size_when_dataloader_batch_size_is_1():
+    fallback_batch_sizes = ConvertONNX2TRT._get_conversion_fallback_batch_sizes(
+        device_max_batch_size=128, dataloader_max_batch_size=1
+    )
+
+    assert list(fallback_batch_sizes) == [64, 32, 1]
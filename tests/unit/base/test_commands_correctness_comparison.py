@@ -0,0 +1,82 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from model_navigator.commands.correctness.comparison import OutputErrorStatistics
+from model_navigator.commands.correctness.correctness import Tolerance, TolerancePerOutputName
+
+
+def test_output_error_statistics_return_same_values_when_compared_in_chunks():
+    rng = np.random.default_rng(0)
+    original = rng.standard_normal((4, 100)).astype(np.float32)
+    comp = original + rng.standard_normal((4, 100)).astype(np.float32) * 1e-3
+
+    chunked = OutputErrorStatistics(chunk_size=7)
+    chunked.update(original, comp)
+    single = OutputErrorStatistics()
+    single.update(original, comp)
+
+    absdiff = np.abs(original.astype(np.float64) - comp.astype(np.float64))
+    tolerance = chunked.to_tolerance()
+    assert tolerance == single.to_tolerance()
+    assert tolerance.atol == pytest.approx(absdiff.max())
+    assert tolerance.rtol == pytest.approx((absdiff / np.abs(comp)).max())
+    assert tolerance.mean_absdiff == pytest.approx(absdiff.mean())
+    assert tolerance.percentile_absdiff == pytest.approx(np.percentile(absdiff, 99), rel=0.05)
+    assert tolerance.max_ulp_diff > 0
+
+
+def test_output_error_statistics_skip_relative_error_when_compared_value_is_zero():
+    statistics = OutputErrorStatistics()
+    with np.errstate(all="raise"):
+        statistics.update(np.array([0.5, 0.0, 2.0]), np.array([0.0, 0.0, 1.0]))
+
+    tolerance = statistics.to_tolerance()
+    assert tolerance.atol == 1.0
+    assert tolerance.rtol == 1.0
+
+
+def test_output_error_statistics_return_finite_ulp_diff_when_compared_value_is_zero():
+    statistics = OutputErrorStatistics()
+    with np.errstate(all="raise"):
+        statistics.update(np.array([1e-3, 0.0, 2.0]), np.array([0.0, 0.0, 2.0]))
+
+    tolerance = statistics.to_tolerance()
+    assert np.isfinite(tolerance.max_ulp_diff)
+    assert tolerance.max_ulp_diff == pytest.approx(1e-3 / np.spacing(1e-3))
+
+
+def test_output_error_statistics_does_not_overflow_when_outputs_are_unsigned_integers():
+    statistics = OutputErrorStatistics()
+    statistics.update(np.array([0, 255], dtype=np.uint8), np.array([255, 0], dtype=np.uint8))
+
+    tolerance = statistics.to_tolerance()
+    assert tolerance.atol == 255.0
+    assert tolerance.max_ulp_diff is None
+
+
+def test_output_error_statistics_flag_not_finite_values_when_compared_output_contains_them():
+    statistics = OutputErrorStatistics(chunk_size=2)
+    statistics.update(np.ones(4), np.array([1.0, 1.0, np.inf, 1.0]))
+
+    assert statistics.contains_inf
+    assert not statistics.contains_nan
+
+
+def test_tolerance_per_output_name_from_json_return_defaults_when_statistics_are_missing():
+    tolerances = TolerancePerOutputName.from_json([{"output_name": "output__0", "atol": 0.1, "rtol": 0.2}])
+
+    assert tolerances["output__0"] == Tolerance(atol=0.1, rtol=0.2)
+    assert TolerancePerOutputName.from_json(tolerances.to_json()) == tolerances
@@ -0,0 +1,96 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+
+import numpy as np
+import pytest
+
+from model_navigator.commands.base import CommandStatus
+from model_navigator.commands.data_dump.samples import FetchInputModelData
+from model_navigator.configuration import OptimizationProfile, TensorRTProfile, TensorType
+from model_navigator.core.dataloader import BackgroundSamplesWriter, IndiciesFilteredDataloader, load_samples
+from model_navigator.core.samples_store import is_samples_store
+from model_navigator.core.tensor import PyTreeMetadata, TensorMetadata
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+
+
+class CountingDataloader:
+    def __init__(self, samples):
+        self.samples = samples
+        self.iterated_count = 0
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __iter__(self):
+        for sample in self.samples:
+            self.iterated_count += 1
+            yield sample
+
+
+def test_indicies_filtered_dataloader_stop_iteration_when_all_indices_consumed():
+    dataloader = CountingDataloader(list(range(10)))
+
+    assert list(IndiciesFilteredDataloader(dataloader, [4, 1])) == [1, 4]
+    assert dataloader.iterated_count == 5
+
+
+def test_fetch_input_model_data_iterate_dataloader_once_when_all_samples_collected_early():
+    sizes = [2, 1, 4, 3] + [2] * 16
+    dataloader = CountingDataloader([np.full((1, size), idx, dtype=np.float32) for idx, size in enumerate(sizes)])
+    input_metadata = TensorMetadata(pytree_metadata=PyTreeMetadata("input__0", TensorType.NUMPY)).add(
+        "input__0", shape=(-1, -1), dtype=np.float32
+    )
+    trt_profile = TensorRTProfile().add("input__0", min=(1, 1), opt=(1, 2), max=(1, 4))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        command_output = FetchInputModelData().run(
+            workspace=Workspace(workspace),
+            framework=Framework.NONE,
+            dataloader=dataloader,
+            sample_count=2,
+            input_metadata=input_metadata,
+            batch_dim=0,
+            seed=5,
+            dataloader_trt_profile=trt_profile,
+            optimization_profile=OptimizationProfile(),
+        )
+
+        correctness_samples = load_samples("correctness_samples", workspace, batch_dim=0)
+        conversion_samples = load_samples("conversion_samples", workspace, batch_dim=0)
+        profiling_sample = load_samples("profiling_sample", workspace, batch_dim=0)[0]
+
+        assert command_output.status == CommandStatus.OK
+        assert dataloader.iterated_count == 6
+        assert all(is_samples_store(workspace / "model_input" / name) for name in ["profiling", "correctness"])
+        assert [int(sample["input__0"][0, 0]) for sample in correctness_samples] == [2, 5]
+        assert [int(sample["input__0"][0, 0]) for sample in conversion_samples] == [0, 1, 2]
+        assert profiling_sample["input__0"].shape == (1, 4)
+
+
+def test_background_samples_writer_raise_error_and_not_write_index_when_sample_is_invalid():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "samples"
+        with pytest.raises(ModelNavigatorUserInputError):
+            with BackgroundSamplesWriter(batch_dim=None, raise_on_error=True, max_pending=1) as writer:
+                writer.open(path)
+                writer.write(path, {"input__0": np.zeros((2,), dtype=np.float32)})
+                writer.write(path, {"input__0": np.full((2,), np.nan, dtype=np.float32)})
+                writer.write(path, {"input__0": np.zeros((2,), dtype=np.float32)})
+
+        assert not is_samples_store(path)
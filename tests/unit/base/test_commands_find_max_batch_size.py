@@ -263,3 +263,69 @@ def test_find_max_batch_size_return_max_batch_when_batch_sizes_provided_in_optim
             assert result.status == CommandStatus.OK
             assert result.output == {"device_max_batch_size": 4}
             assert ExecutionContext.execute_python_script.called is False  # pytype: disable=attribute-error
+
+
+def test_find_max_batch_size_profile_without_concurrency_open_loop_and_memory_when_set_in_optimization_profile(mocker):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+
+        model_path = tmpdir / "model.onnx"
+        model_path.touch()
+
+        results_file = tmpdir / "results.json"
+        with jsonlines.open(results_file.as_posix(), "a") as f:
+            f.write({
+                "batch_size": 16,
+                "avg_latency": 1,
+                "std_latency": 1,
+                "p50_latency": 1,
+                "p90_latency": 1,
+                "p95_latency": 1,
+                "p99_latency": 1,
+                "throughput": 1,
+                "avg_gpu_clock": 1,
+                "request_count": 1,
+            })
+
+        mock = MagicMock()
+        mock.__enter__.return_value.name = results_file.as_posix()
+        parse_kwargs_to_cmd = mocker.patch(
+            "model_navigator.commands.find_max_batch_size.find_max_batch_size.parse_kwargs_to_cmd", return_value=[]
+        )
+
+        with mocker.patch.object(
+            ExecutionContext,
+            "execute_python_script",
+        ), mocker.patch("tempfile.NamedTemporaryFile", return_value=mock):
+            result = FindMaxBatchSize().run(
+                configurations=[
+                    FindMaxBatchSizeConfig(
+                        format=Format.ONNX,
+                        model_path=model_path,
+                        runner_cls=OnnxrtCPURunner,
+                        reproduction_scripts_dir=model_path.parent,
+                    )
+                ],
+                workspace=Workspace(workspace),
+                input_metadata=TensorMetadata({
+                    "input__1": TensorSpec(name="input__1", shape=(-1,), dtype=np.dtype("float32"))
+                }),
+                output_metadata=TensorMetadata({
+                    "output__1": TensorSpec(name="output__1", shape=(-1,), dtype=np.dtype("float32"))
+                }),
+                optimization_profile=OptimizationProfile(
+                    concurrency=[1, 4], request_rates=[100.0], profile_memory=True, trace_python_allocations=True
+                ),
+                batch_dim=0,
+                verbose=True,
+            )
+
+        assert result.status == CommandStatus.OK
+        optimization_profile = OptimizationProfile.from_dict(
+            parse_kwargs_to_cmd.call_args[0][0]["optimization_profile"]
+        )
+        assert optimization_profile.concurrency is None
+        assert optimization_profile.request_rates is None
+        assert optimization_profile.profile_memory is False
+        assert optimization_profile.trace_python_allocations is False
@@ -0,0 +1,126 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+import tempfile
+
+import numpy as np
+
+from model_navigator.commands.performance.cache import (
+    ProfilingCache,
+    get_path_fingerprint,
+    get_sample_fingerprint,
+    profiling_cache_dir,
+)
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.runners.base import InferenceTime
+
+
+def _profiling_results(sample_id=0):
+    return [ProfilingResults.from_measurements([InferenceTime(total=1.5)], [1500], batch_size=1, sample_id=sample_id)]
+
+
+def test_profiling_cache_dir_return_path_from_env_when_env_variable_set(mocker):
+    mocker.patch.dict(os.environ, {"MODEL_NAVIGATOR_PROFILING_CACHE_DIR": "/tmp/profiling_cache"})
+
+    assert profiling_cache_dir() == pathlib.Path("/tmp/profiling_cache")
+
+
+def test_get_key_return_same_key_when_components_are_equal_in_different_order():
+    key1 = ProfilingCache.get_key(model="abc", runner_name="OnnxCUDA", optimization_profile={"a": 1, "b": 2})
+    key2 = ProfilingCache.get_key(runner_name="OnnxCUDA", optimization_profile={"b": 2, "a": 1}, model="abc")
+    key3 = ProfilingCache.get_key(model="abc", runner_name="OnnxCPU", optimization_profile={"a": 1, "b": 2})
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+def test_get_path_fingerprint_return_different_hash_when_file_content_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_dir = pathlib.Path(tmpdir) / "model"
+        model_dir.mkdir()
+        model_file = model_dir / "model.onnx"
+        model_file.write_bytes(b"weights")
+
+        file_fingerprint = get_path_fingerprint(model_file)
+        dir_fingerprint = get_path_fingerprint(model_dir)
+
+        model_file.write_bytes(b"other weights")
+
+        assert get_path_fingerprint(model_file) != file_fingerprint
+        assert get_path_fingerprint(model_dir) != dir_fingerprint
+
+
+def test_get_sample_fingerprint_return_different_hash_when_tensor_values_change():
+    sample = {"input__1": np.zeros((1, 3), dtype=np.float32), "input__2": np.arange(4, dtype=np.int64)}
+    same_sample = {"input__2": np.arange(4, dtype=np.int64), "input__1": np.zeros((1, 3), dtype=np.float32)}
+    other_values = {"input__1": np.ones((1, 3), dtype=np.float32), "input__2": np.arange(4, dtype=np.int64)}
+    other_dtype = {"input__1": np.zeros((1, 3), dtype=np.float16), "input__2": np.arange(4, dtype=np.int64)}
+
+    assert get_sample_fingerprint(sample) == get_sample_fingerprint(same_sample)
+    assert get_sample_fingerprint(sample) != get_sample_fingerprint(other_values)
+    assert get_sample_fingerprint(sample) != get_sample_fingerprint(other_dtype)
+
+
+def test_profiling_cache_get_return_stored_results_when_key_exists():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ProfilingCache(cache_dir=pathlib.Path(tmpdir))
+        profiling_results = _profiling_results()
+
+        assert cache.get("key") is None
+
+        cache.put("key", profiling_results)
+
+        assert cache.get("key") == profiling_results
+
+
+def test_profiling_cache_get_return_none_when_entry_invalidated_or_cleared():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ProfilingCache(cache_dir=pathlib.Path(tmpdir))
+        cache.put("key1", _profiling_results())
+        cache.put("key2", _profiling_results())
+
+        cache.invalidate("key1")
+
+        assert cache.get("key1") is None
+        assert cache.get("key2") is not None
+
+        cache.clear()
+
+        assert cache.get("key2") is None
+
+
+def test_profiling_cache_put_evict_least_recently_used_entry_when_max_entries_exceeded():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ProfilingCache(cache_dir=pathlib.Path(tmpdir), max_entries=2)
+        cache.put("key1", _profiling_results(0))
+        cache.put("key2", _profiling_results(1))
+        os.utime(cache.cache_dir / "key1.jsonl", (0, 0))
+        os.utime(cache.cache_dir / "key2.jsonl", (1, 1))
+
+        cache.put("key3", _profiling_results(2))
+
+        assert cache.get("key1") is None
+        assert cache.get("key2") is not None
+        assert cache.get("key3") is not None
+
+
+def test_profiling_cache_get_return_none_and_remove_entry_when_entry_is_corrupted():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ProfilingCache(cache_dir=pathlib.Path(tmpdir))
+        entry_path = cache.cache_dir / "key.jsonl"
+        entry_path.write_text("{not a json")
+
+        assert cache.get("key") is None
+        assert not entry_path.exists()
@@ -0,0 +1,131 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import numpy as np
+import pytest
+
+from model_navigator.commands.performance.cpu_threading import (
+    get_cpu_threading_candidates,
+    get_instances_cpu_affinity,
+    merge_instances_profiling_results,
+)
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import Format, OptimizationProfile
+from model_navigator.configuration.model.model_config import ModelConfig, ONNXModelConfig
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorConfigurationError
+from model_navigator.runners.base import InferenceTime
+from model_navigator.runners.onnx import OnnxrtCPURunner
+from tests.utils import get_assets_path
+
+
+def test_get_cpu_threading_candidates_return_defaults_and_pinned_configs_when_single_instance():
+    candidates = get_cpu_threading_candidates(threads=[2, 1], instances=None, available_cpus=[0, 1, 2], pinning=True)
+
+    assert candidates == [
+        {},
+        {"intra_op_threads": 1, "inter_op_threads": 1},
+        {"intra_op_threads": 1, "inter_op_threads": 1, "cpu_affinity": [0]},
+        {"intra_op_threads": 2, "inter_op_threads": 1},
+        {"intra_op_threads": 2, "inter_op_threads": 1, "cpu_affinity": [0, 1]},
+    ]
+
+
+def test_get_cpu_threading_candidates_skip_configs_when_not_enough_cpus_available():
+    candidates = get_cpu_threading_candidates(threads=[1, 2], instances=[1, 2], available_cpus=[0, 1, 2], pinning=True)
+
+    assert candidates == [
+        {},
+        {"intra_op_threads": 1, "inter_op_threads": 1},
+        {"intra_op_threads": 1, "inter_op_threads": 1, "cpu_affinity": [0]},
+        {"intra_op_threads": 2, "inter_op_threads": 1},
+        {"intra_op_threads": 2, "inter_op_threads": 1, "cpu_affinity": [0, 1]},
+        {"intra_op_threads": 1, "inter_op_threads": 1, "instance_count": 2, "cpu_affinity": [0, 1]},
+    ]
+
+
+def test_get_cpu_threading_candidates_return_unpinned_instances_when_pinning_not_supported():
+    candidates = get_cpu_threading_candidates(threads=[1], instances=[2], available_cpus=[0, 1], pinning=False)
+
+    assert candidates == [{}, {"intra_op_threads": 1, "inter_op_threads": 1, "instance_count": 2}]
+
+
+def test_get_instances_cpu_affinity_split_cpus_evenly_between_instances():
+    assert get_instances_cpu_affinity([0, 1, 2, 3, 4, 5], 3) == [[0, 1], [2, 3], [4, 5]]
+    assert get_instances_cpu_affinity(None, 2) == [None, None]
+
+
+def test_merge_instances_profiling_results_sum_throughput_when_results_collected_by_all_instances():
+    def _results(latency, batch_sizes):
+        return [
+            ProfilingResults.from_measurements(
+                [InferenceTime(total=latency)], [1500], batch_size=batch_size, sample_id=0
+            )
+            for batch_size in batch_sizes
+        ]
+
+    merged = merge_instances_profiling_results([_results(10.0, [1, 2]), _results(20.0, [1])])
+
+    assert len(merged) == 1
+    assert merged[0].batch_size == 1
+    assert merged[0].throughput == pytest.approx(150.0)
+    assert merged[0].avg_latency == pytest.approx(15.0, rel=0.01)
+
+
+def test_optimization_profile_raise_error_when_cpu_instances_provided_without_cpu_threads():
+    with pytest.raises(ModelNavigatorConfigurationError):
+        OptimizationProfile(cpu_instances=[2])
+
+    with pytest.raises(ModelNavigatorConfigurationError):
+        OptimizationProfile(cpu_threads=[0])
+
+
+def test_model_config_from_dict_restore_threading_config_when_stored_in_model_status():
+    model_config = ONNXModelConfig(opset=13, dynamic_axes=None, dynamo_export=False, graph_surgeon_optimization=True)
+    model_config.runner_config.update_threading(intra_op_threads=4, inter_op_threads=1, cpu_affinity=[0, 1, 2, 3])
+
+    restored = ModelConfig.from_dict(model_config.to_dict())
+
+    assert restored.format == Format.ONNX
+    assert restored.runner_config.get_threading_dict() == {
+        "intra_op_threads": 4,
+        "inter_op_threads": 1,
+        "cpu_affinity": [0, 1, 2, 3],
+    }
+
+
+def test_onnxrt_cpu_runner_use_threading_config_when_activated():
+    model_path = get_assets_path() / "models" / "identity.onnx"
+    input_metadata = TensorMetadata().add("X", shape=(-1, 3, -1, -1), dtype=np.float32)
+    cpu_affinity = sorted(os.sched_getaffinity(0))[:1] if hasattr(os, "sched_getaffinity") else None
+    previous_cpu_affinity = os.sched_getaffinity(0) if cpu_affinity else None
+
+    runner = OnnxrtCPURunner(
+        model=model_path,
+        input_metadata=input_metadata,
+        output_metadata=None,
+        intra_op_threads=2,
+        inter_op_threads=1,
+        cpu_affinity=cpu_affinity,
+    )
+    with runner:
+        session_options = runner.sess.get_session_options()
+        assert session_options.intra_op_num_threads == 2
+        assert session_options.inter_op_num_threads == 1
+        if cpu_affinity:
+            assert sorted(os.sched_getaffinity(0)) == cpu_affinity
+
+    if cpu_affinity:
+        assert os.sched_getaffinity(0) == previous_cpu_affinity
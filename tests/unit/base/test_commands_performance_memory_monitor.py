@@ -0,0 +1,48 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+import tracemalloc
+
+import numpy as np
+
+from model_navigator.commands.performance.memory_monitor import MemoryMonitor
+
+
+def test_memory_monitor_return_peak_above_steady_state_when_memory_allocated_temporarily():
+    with MemoryMonitor(sampling_interval=0.001) as memory_monitor:
+        buffer = np.ones(64 * 1024**2, dtype=np.uint8)
+        time.sleep(0.05)
+        del buffer
+
+    assert memory_monitor.peak_rss_memory > memory_monitor.avg_rss_memory > 0
+    assert memory_monitor.uss_memory > 0
+    assert memory_monitor.peak_python_memory is None
+
+
+def test_memory_monitor_return_peak_python_memory_when_tracing_python_allocations():
+    with MemoryMonitor(trace_python_allocations=True) as memory_monitor:
+        data = [str(idx) for idx in range(100000)]
+        del data
+
+    assert memory_monitor.peak_python_memory > 1.0
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_monitor_return_no_values_when_disabled():
+    with MemoryMonitor(enabled=False) as memory_monitor:
+        pass
+
+    assert memory_monitor.peak_rss_memory is None
+    assert memory_monitor.avg_rss_memory is None
+    assert memory_monitor.uss_memory is None
@@ -21,7 +21,8 @@ from jsonlines import jsonlines
 import model_navigator as nav
 from model_navigator.commands.performance.performance import Performance
 from model_navigator.commands.performance.profiler import ProfilingResults
-from model_navigator.configuration import OptimizationProfile
+from model_navigator.configuration import DeviceKind, OptimizationProfile
+from model_navigator.configuration.runner.runner_config import DeviceRunnerConfig
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorProfilingError
 from model_navigator.runners.base import InferenceTime
@@ -132,3 +133,174 @@ def test_performance_command_raises_error_when_no_profiling_results_and_profiler
                 verbose=True,
                 runner_cls=MagicMock(),
             )
+
+
+def test_performance_command_returns_cached_results_when_cache_results_enabled_and_model_not_changed(mocker):
+    mocker.patch("subprocess.Popen.poll", return_value=0)
+    mocker.patch(
+        "model_navigator.commands.performance.performance.get_environment_fingerprint", return_value="environment"
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        mocker.patch.dict("os.environ", {"MODEL_NAVIGATOR_PROFILING_CACHE_DIR": (tmpdir / "cache").as_posix()})
+        workspace = tmpdir / "navigator_workspace"
+        workspace.mkdir()
+
+        model_file = workspace / "model.pt"
+        model_file.touch()
+
+        sample_file = workspace / "model_input" / "profiling" / "1.npz"
+        sample_file.parent.mkdir(parents=True)
+        sample_file.touch()
+
+        input_metadata = MagicMock()
+        input_metadata.to_json.return_value = {}
+        runner_cls = MagicMock()
+        runner_cls.name.return_value = "TorchScriptCUDA"
+        optimization_profile = OptimizationProfile(cache_results=True)
+
+        with tempfile.NamedTemporaryFile() as tmpfile:
+            mock_tempfile = MagicMock()
+            mock_tempfile.__enter__.return_value.name = tmpfile.name
+            mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_tempfile)
+            with jsonlines.open(tmpfile.name, "w") as f:
+                f.write(
+                    ProfilingResults.from_measurements(
+                        [InferenceTime(total=1.5)], [1500], batch_size=1, sample_id=0
+                    ).to_dict(parse=True)
+                )
+
+            command_output = Performance().run(
+                workspace=Workspace(workspace),
+                path=model_file,
+                format=nav.Format.TORCHSCRIPT,
+                optimization_profile=optimization_profile,
+                input_metadata=input_metadata,
+                output_metadata=MagicMock(),
+                batch_dim=0,
+                verbose=True,
+                runner_cls=runner_cls,
+            )
+
+        execution_context = mocker.patch("model_navigator.commands.performance.performance.ExecutionContext")
+        cached_output = Performance().run(
+            workspace=Workspace(workspace),
+            path=model_file,
+            format=nav.Format.TORCHSCRIPT,
+            optimization_profile=optimization_profile,
+            input_metadata=input_metadata,
+            output_metadata=MagicMock(),
+            batch_dim=0,
+            verbose=True,
+            runner_cls=runner_cls,
+        )
+
+    assert execution_context.call_count == 0
+    assert cached_output.status == nav.CommandStatus.OK
+    assert cached_output.output["profiling_results"] == command_output.output["profiling_results"]
+
+
+def test_performance_command_stores_best_threading_config_when_cpu_threads_sweep_enabled(mocker):
+    mocker.patch("model_navigator.commands.performance.performance.get_available_cpus", return_value=[0, 1, 2, 3])
+    mocker.patch("model_navigator.commands.performance.performance.is_cpu_pinning_supported", return_value=True)
+
+    def _profile_instance(runner_config, optimization_profile, **_):
+        # Pinned configurations are faster and latency drops with the number of threads
+        threads = runner_config.get("intra_op_threads") or 1
+        latency = (8.0 if runner_config.get("cpu_affinity") else 10.0) / threads
+        return [
+            ProfilingResults.from_measurements(
+                [InferenceTime(total=latency)], [1500], batch_size=optimization_profile.batch_sizes[0], sample_id=0
+            )
+        ]
+
+    profile_instance = mocker.patch.object(Performance, "_profile_instance", side_effect=_profile_instance)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        workspace.mkdir()
+
+        model_file = workspace / "model.onnx"
+        model_file.touch()
+
+        sample_file = workspace / "model_input" / "profiling" / "1.npz"
+        sample_file.parent.mkdir(parents=True)
+        sample_file.touch()
+
+        runner_cls = MagicMock()
+        runner_cls.devices_kind.return_value = [DeviceKind.CPU]
+        runner_config = DeviceRunnerConfig(device=None)
+
+        command_output = Performance().run(
+            workspace=Workspace(workspace),
+            path=model_file,
+            format=nav.Format.ONNX,
+            optimization_profile=OptimizationProfile(batch_sizes=[1, 8], cpu_threads=[1, 2]),
+            input_metadata=MagicMock(),
+            output_metadata=MagicMock(),
+            batch_dim=0,
+            verbose=True,
+            runner_cls=runner_cls,
+            runner_config=runner_config,
+        )
+
+    assert command_output.status == nav.CommandStatus.OK
+    assert runner_config.intra_op_threads == 2
+    assert runner_config.inter_op_threads == 1
+    assert runner_config.cpu_affinity == [0, 1]
+    assert runner_config.instance_count is None
+
+    # defaults, 2 threads configurations with and without pinning and final profiling
+    assert profile_instance.call_count == 6
+    sweep_call = profile_instance.call_args_list[0]
+    assert sweep_call.kwargs["optimization_profile"].batch_sizes == [8]
+    final_call = profile_instance.call_args_list[-1]
+    assert final_call.kwargs["optimization_profile"].batch_sizes == [1, 8]
+    assert final_call.kwargs["runner_config"]["intra_op_threads"] == 2
+    assert final_call.kwargs["runner_config"]["cpu_affinity"] == [0, 1]
+
+
+def test_performance_command_merges_instances_results_when_instance_count_configured(mocker):
+    def _profile_instance(runner_config, instance, **_):
+        return [ProfilingResults.from_measurements([InferenceTime(total=10.0)], [1500], batch_size=1, sample_id=0)]
+
+    profile_instance = mocker.patch.object(Performance, "_profile_instance", side_effect=_profile_instance)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        workspace.mkdir()
+
+        model_file = workspace / "model.onnx"
+        model_file.touch()
+
+        sample_file = workspace / "model_input" / "profiling" / "1.npz"
+        sample_file.parent.mkdir(parents=True)
+        sample_file.touch()
+
+        command_output = Performance().run(
+            workspace=Workspace(workspace),
+            path=model_file,
+            format=nav.Format.ONNX,
+            optimization_profile=OptimizationProfile(batch_sizes=[1]),
+            input_metadata=MagicMock(),
+            output_metadata=MagicMock(),
+            batch_dim=0,
+            verbose=True,
+            runner_cls=MagicMock(),
+            runner_config=DeviceRunnerConfig(
+                device=None, intra_op_threads=2, cpu_affinity=[0, 1, 2, 3], instance_count=2
+            ),
+        )
+
+    assert profile_instance.call_count == 2
+    instances_cpu_affinity = sorted(
+        call.kwargs["runner_config"]["cpu_affinity"] for call in profile_instance.call_args_list
+    )
+    assert instances_cpu_affinity == [[0, 1], [2, 3]]
+
+    profiling_results = command_output.output["profiling_results"]
+    assert len(profiling_results) == 1
+    assert profiling_results[0].throughput == pytest.approx(200.0)
@@ -0,0 +1,176 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from jsonlines import jsonlines
+
+import model_navigator as nav
+from model_navigator.commands.data_dump.samples import samples_to_npz
+from model_navigator.commands.performance import profile_script
+from model_navigator.commands.performance.profile import Profile
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import OptimizationProfile
+from model_navigator.core.dataloader import load_samples
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks import Framework
+from model_navigator.runners.base import InferenceTime
+
+
+def test_profile_command_profiles_all_samples_in_single_execution_when_dataloader_has_multiple_samples(mocker):
+    mocker.patch(
+        "model_navigator.commands.performance.profile.extract_sample",
+        side_effect=lambda sample, *_: {"input__0": sample},
+    )
+    dataloader = [np.ones((batch_size, 3), dtype=np.float32) for batch_size in [1, 2, 4]]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir) / "navigator_workspace"
+        workspace.mkdir()
+        model_file = workspace / "model.onnx"
+        model_file.touch()
+
+        with tempfile.NamedTemporaryFile() as tmpfile:
+            mock_tempfile = MagicMock()
+            mock_tempfile.__enter__.return_value.name = tmpfile.name
+            mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_tempfile)
+            with jsonlines.open(tmpfile.name, "w") as f:
+                for sample_id in [2, 0, 1]:
+                    f.write(
+                        ProfilingResults.from_measurements(
+                            [InferenceTime(total=1.5)], [1500], batch_size=1, sample_id=sample_id
+                        ).to_dict(parse=True)
+                    )
+
+            execution_context = mocker.patch("model_navigator.commands.performance.profile.ExecutionContext")
+            command_output = Profile().run(
+                workspace=Workspace(workspace),
+                path=model_file,
+                framework=Framework.ONNX,
+                format=nav.Format.ONNX,
+                dataloader=dataloader,
+                optimization_profile=OptimizationProfile(),
+                input_metadata=TensorMetadata(),
+                output_metadata=TensorMetadata(),
+                batch_dim=0,
+                verbose=True,
+                runner_cls=MagicMock(),
+            )
+
+        profiler_samples = load_samples("profiler_sample", workspace, batch_dim=0)
+
+    execute_python_script = execution_context.return_value.__enter__.return_value.execute_python_script
+    assert execute_python_script.call_count == 1
+    args = execute_python_script.call_args.kwargs["args"]
+    assert args[args.index("--sample_ids") + 1] == "'[0, 1, 2]'"
+    assert len(profiler_samples) == 3
+
+    assert command_output.status == nav.CommandStatus.OK
+    assert [result.sample_id for result in command_output.output["profiling_results"]] == [0, 1, 2]
+    assert command_output.output["profiling_samples"] == [
+        {"input__0": (1, 3)},
+        {"input__0": (2, 3)},
+        {"input__0": (4, 3)},
+    ]
+
+
+def test_profile_script_activates_runner_once_when_multiple_sample_ids_passed(mocker):
+    runner = MagicMock()
+    mocker.patch("model_navigator.commands.performance.profile_script.get_runner", return_value=lambda **_: runner)
+    profiler = mocker.patch("model_navigator.commands.performance.profile_script.Profiler")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples = [{"input__0": np.full((1, 3), idx, dtype=np.float32)} for idx in range(2)]
+        samples_to_npz(samples, workspace / "model_input" / "profiler", batch_dim=0)
+
+        profile_script.profile(
+            batch_dim=0,
+            results_path=(workspace / "results.jsonl").as_posix(),
+            runner_name="OnnxCUDA",
+            optimization_profile=OptimizationProfile().to_dict(parse=True),
+            input_metadata=TensorMetadata().to_json(),
+            output_metadata=TensorMetadata().to_json(),
+            sample_ids=[3, 5],
+            navigator_workspace=workspace.as_posix(),
+            model_path="model.onnx",
+        )
+
+    assert runner.__enter__.call_count == 1
+    run_calls = profiler.return_value.run.call_args_list
+    assert [call.kwargs["sample_id"] for call in run_calls] == [3, 5]
+    assert [call.kwargs["profiling_sample"]["input__0"][0, 0] for call in run_calls] == [0, 1]
+
+
+def test_profile_script_profiles_remaining_samples_when_profiling_of_sample_fails(mocker):
+    runner = MagicMock()
+    mocker.patch("model_navigator.commands.performance.profile_script.get_runner", return_value=lambda **_: runner)
+    profiler = mocker.patch("model_navigator.commands.performance.profile_script.Profiler")
+    profiler.return_value.run.side_effect = [RuntimeError("Out of memory"), []]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples = [{"input__0": np.full((1, 3), idx, dtype=np.float32)} for idx in range(2)]
+        samples_to_npz(samples, workspace / "model_input" / "profiler", batch_dim=0)
+        failures_path = workspace / "failures.jsonl"
+
+        profile_script.profile(
+            batch_dim=0,
+            results_path=(workspace / "results.jsonl").as_posix(),
+            runner_name="OnnxCUDA",
+            optimization_profile=OptimizationProfile().to_dict(parse=True),
+            input_metadata=TensorMetadata().to_json(),
+            output_metadata=TensorMetadata().to_json(),
+            sample_ids=[3, 5],
+            navigator_workspace=workspace.as_posix(),
+            model_path="model.onnx",
+            failures_path=failures_path.as_posix(),
+        )
+
+        with jsonlines.open(failures_path, "r") as f:
+            failures = list(f)
+
+    assert [call.kwargs["sample_id"] for call in profiler.return_value.run.call_args_list] == [3, 5]
+    assert failures == [{"sample_id": 3, "error": "Out of memory"}]
+
+
+def test_profile_script_raises_error_when_profiling_of_all_samples_fails(mocker):
+    runner = MagicMock()
+    mocker.patch("model_navigator.commands.performance.profile_script.get_runner", return_value=lambda **_: runner)
+    profiler = mocker.patch("model_navigator.commands.performance.profile_script.Profiler")
+    profiler.return_value.run.side_effect = RuntimeError("Out of memory")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples = [{"input__0": np.full((1, 3), idx, dtype=np.float32)} for idx in range(2)]
+        samples_to_npz(samples, workspace / "model_input" / "profiler", batch_dim=0)
+
+        with pytest.raises(RuntimeError, match="Out of memory"):
+            profile_script.profile(
+                batch_dim=0,
+                results_path=(workspace / "results.jsonl").as_posix(),
+                runner_name="OnnxCUDA",
+                optimization_profile=OptimizationProfile().to_dict(parse=True),
+                input_metadata=TensorMetadata().to_json(),
+                output_metadata=TensorMetadata().to_json(),
+                sample_ids=[3, 5],
+                navigator_workspace=workspace.as_posix(),
+                model_path="model.onnx",
+            )
+
+    assert profiler.return_value.run.call_count == 2
@@ -13,13 +13,25 @@
 # limitations under the License.
 import pathlib
 import tempfile
+import threading
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from model_navigator.commands.performance.profiler import OptimizationProfile, Profiler, ProfilingResults
-from model_navigator.commands.performance.utils import is_measurement_stable
-from model_navigator.runners.base import InferenceTime
+from model_navigator.commands.performance.utils import (
+    get_arrival_times,
+    get_bootstrap_median_ci,
+    get_knee_batch_size,
+    get_measurement_stability,
+    get_pruning_reference,
+    is_measurement_stable,
+    is_request_rate_sustained,
+    is_throughput_dominated,
+)
+from model_navigator.configuration import ArrivalDistribution, StabilityCriterion
+from model_navigator.runners.base import InferenceStep, InferenceTime
 
 
 def test_batch_size_is_set_correctly_when_no_max_or_batch_sizes_passed():
@@ -330,3 +342,448 @@ def test_profiler_run_return_batch_sizes_upto_16_when_batch_size_16_saturates_th
 
     assert len(results) == 5
     assert results[-1].batch_size == 16
+
+
+def test_profiler_run_return_results_for_each_concurrency_when_concurrency_passed(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    runner.is_thread_safe = True
+    runner.last_inference_time.return_value = InferenceTime(total=10)
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1, 2],
+        concurrency=[2, 1],
+        window_size=2,
+        min_trials=1,
+        max_trials=1,
+        stabilization_windows=1,
+        throughput_cutoff_threshold=None,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert [(result.concurrency, result.batch_size) for result in results] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    assert [result.request_count for result in results] == [2, 2, 4, 4]
+    assert runner.infer.call_count == 12
+
+
+def test_profiler_run_skip_concurrency_when_runner_is_not_thread_safe(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    runner.is_thread_safe = False
+    runner.last_inference_time.return_value = InferenceTime(total=10)
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        concurrency=[1, 4],
+        window_size=2,
+        min_trials=1,
+        max_trials=1,
+        stabilization_windows=1,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert len(results) == 1
+    assert results[0].concurrency == 1
+
+
+def test_profiling_results_from_measurements_return_throughput_from_duration_when_duration_passed():
+    measurements = [InferenceTime(total=10), InferenceTime(total=10), InferenceTime(total=10), InferenceTime(total=10)]
+
+    result = ProfilingResults.from_measurements(measurements, [None], 2, 0, concurrency=2, duration=20)
+
+    assert result.concurrency == 2
+    assert result.avg_latency == 10
+    assert result.throughput == 400
+
+
+def test_get_arrival_times_return_evenly_spaced_times_when_distribution_is_constant():
+    arrival_times = get_arrival_times(
+        request_rate=100.0, request_count=4, arrival_distribution=ArrivalDistribution.CONSTANT
+    )
+
+    assert np.allclose(arrival_times, [0.0, 0.01, 0.02, 0.03])
+
+
+def test_get_arrival_times_return_sorted_times_within_period_when_distribution_is_poisson():
+    arrival_times = get_arrival_times(
+        request_rate=100.0,
+        request_count=1000,
+        arrival_distribution=ArrivalDistribution.POISSON,
+        rng=np.random.default_rng(0),
+    )
+
+    assert len(arrival_times) == 1000
+    assert np.all(np.diff(arrival_times) >= 0)
+    assert arrival_times[0] >= 0.0
+    assert arrival_times[-1] <= 10.0
+
+
+def test_is_request_rate_sustained_return_false_when_throughput_below_request_rate():
+    measurements = [InferenceTime(total=10), InferenceTime(total=10)]
+    sustained = ProfilingResults.from_measurements(measurements, [None], 1, 0, duration=20, request_rate=100.0)
+    not_sustained = ProfilingResults.from_measurements(measurements, [None], 1, 0, duration=40, request_rate=100.0)
+
+    assert is_request_rate_sustained(sustained, request_rate_tolerance=0.1) is True
+    assert is_request_rate_sustained(not_sustained, request_rate_tolerance=0.1) is False
+
+
+def test_profiling_results_from_measurements_include_queue_delay_in_latency_when_queue_delays_passed():
+    measurements = [InferenceTime(total=10), InferenceTime(total=10)]
+
+    result = ProfilingResults.from_measurements(
+        measurements, [None], 1, 0, duration=20, queue_delays=[0.0, 4.0], request_rate=100.0
+    )
+
+    assert result.request_rate == 100.0
+    assert result.avg_latency == 12
+    assert result.throughput == 100
+    assert result.detailed_results[InferenceStep.QUEUEING.value].avg_time == 2
+    assert result.detailed_results[InferenceStep.TOTAL.value].avg_time == 10
+
+
+def test_profiler_run_stop_request_rates_when_request_rate_is_not_sustained(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    mocker.patch("model_navigator.commands.performance.profiler.time.sleep")
+    mocker.patch("model_navigator.commands.performance.profiler.is_request_rate_sustained", side_effect=[True, False])
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    runner.is_thread_safe = True
+    runner.last_inference_time.return_value = InferenceTime(total=10)
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        request_rates=[1000.0, 10.0, 100.0],
+        arrival_distribution=ArrivalDistribution.CONSTANT,
+        window_size=2,
+        min_trials=1,
+        max_trials=1,
+        stabilization_windows=1,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert [result.request_rate for result in results] == [None, 10.0, 100.0]
+    assert all(InferenceStep.QUEUEING.value in result.detailed_results for result in results[1:])
+
+
+def test_profiler_run_send_open_loop_requests_from_executor_when_concurrency_is_1(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    mocker.patch("model_navigator.commands.performance.profiler.time.sleep")
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    runner.is_thread_safe = False
+    runner.last_inference_time.return_value = InferenceTime(total=10)
+    infer_threads = []
+    runner.infer.side_effect = lambda _: infer_threads.append(threading.current_thread())
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        request_rates=[100.0],
+        arrival_distribution=ArrivalDistribution.CONSTANT,
+        window_size=2,
+        min_trials=1,
+        max_trials=1,
+        stabilization_windows=1,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert [result.request_rate for result in results] == [None, 100.0]
+    # closed-loop requests are sent from the profiling thread, open-loop requests do not block the arrivals loop
+    assert infer_threads[:2] == [threading.main_thread()] * 2
+    assert all(thread is not threading.main_thread() for thread in infer_threads[2:])
+    assert len(infer_threads) == 4
+
+
+def test_get_knee_batch_size_return_batch_size_where_throughput_saturates_when_curve_saturates():
+    batch_sizes = [1, 2, 4, 8, 16, 32, 64]
+    throughputs = [1000 * batch_size / (batch_size + 4) for batch_size in batch_sizes]
+
+    knee_batch_size = get_knee_batch_size(batch_sizes, throughputs, throughput_cutoff_threshold=0.05)
+
+    assert knee_batch_size == 38
+
+
+def test_get_knee_batch_size_return_none_when_throughput_does_not_saturate():
+    batch_sizes = [1, 2, 4, 8]
+    throughputs = [100.0 * batch_size for batch_size in batch_sizes]
+
+    assert get_knee_batch_size(batch_sizes, throughputs, throughput_cutoff_threshold=0.05) is None
+
+
+def test_profiler_run_bisect_failure_boundary_and_probe_knee_when_adaptive_batch_sizes_enabled(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+
+    def _run_measurement(runner, nvml_handler, sample, batch_size, sample_id, *args, **kwargs):
+        if batch_size >= 50:
+            raise RuntimeError("Out of memory")
+        latency = 1 + batch_size / 4
+        return ProfilingResults.from_measurements(
+            [InferenceTime(total=latency)], [None], batch_size=batch_size, sample_id=sample_id
+        )
+
+    optimization_profile = OptimizationProfile(adaptive_batch_sizes=True, throughput_cutoff_threshold=0.1)
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        mocker.patch.object(profiler, "_run_measurement", side_effect=_run_measurement)
+        results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    batch_sizes = [result.batch_size for result in results]
+    # Grid fails at 64, failure boundary is bisected to 48 and throughput knee is probed at 18
+    assert batch_sizes == [1, 2, 4, 8, 16, 18, 32, 48]
+
+
+def test_profiler_run_raise_error_when_first_batch_size_fails_and_adaptive_batch_sizes_enabled(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+
+    optimization_profile = OptimizationProfile(adaptive_batch_sizes=True, throughput_cutoff_threshold=0.1)
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+        mocker.patch.object(profiler, "_run_measurement", side_effect=RuntimeError("Invalid input shape"))
+        with pytest.raises(RuntimeError, match="Invalid input shape"):
+            profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+
+def _profile_with_pruning_reference(mocker, pruning_reference):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+
+    def _run_measurement(runner, nvml_handler, sample, batch_size, sample_id, *args, **kwargs):
+        return ProfilingResults.from_measurements(
+            [InferenceTime(total=1 + batch_size / 4)], [None], batch_size=batch_size, sample_id=sample_id
+        )
+
+    optimization_profile = OptimizationProfile(batch_sizes=[1, 2, 4, 8], throughput_cutoff_threshold=None)
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+            pruning_reference=pruning_reference,
+        )
+        mocker.patch.object(profiler, "_run_measurement", side_effect=_run_measurement)
+        return profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+
+def test_profiler_run_stop_after_first_batch_sizes_when_throughput_dominated_by_pruning_reference(mocker):
+    pruning_reference = [{"batch_size": 1, "throughput": 10_000.0}, {"batch_size": 2, "throughput": 20_000.0}]
+
+    results = _profile_with_pruning_reference(mocker, pruning_reference)
+
+    assert [result.batch_size for result in results] == [1, 2]
+    assert is_throughput_dominated(results, pruning_reference)
+
+
+def test_profiler_run_profile_all_batch_sizes_when_throughput_not_dominated_by_pruning_reference(mocker):
+    pruning_reference = [{"batch_size": 1, "throughput": 10_000.0}, {"batch_size": 2, "throughput": 1.0}]
+
+    results = _profile_with_pruning_reference(mocker, pruning_reference)
+
+    assert [result.batch_size for result in results] == [1, 2, 4, 8]
+    assert not is_throughput_dominated(results, pruning_reference)
+
+
+def test_get_pruning_reference_return_highest_closed_loop_throughput_per_batch_size():
+    def _result(batch_size, latency, concurrency=1, request_rate=None):
+        result = ProfilingResults.from_measurements([InferenceTime(total=latency)], [None], batch_size, 0)
+        result.concurrency = concurrency
+        result.request_rate = request_rate
+        return result
+
+    profiling_results = [
+        _result(2, 10.0),
+        _result(1, 10.0),
+        _result(1, 5.0),
+        _result(1, 1.0, concurrency=2),
+        _result(1, 1.0, request_rate=100.0),
+    ]
+
+    pruning_reference = get_pruning_reference(profiling_results)
+
+    assert pruning_reference == [{"batch_size": 1, "throughput": 200.0}, {"batch_size": 2, "throughput": 200.0}]
+
+
+def test_is_throughput_dominated_return_false_when_not_enough_points_or_no_reference():
+    results = [ProfilingResults.from_measurements([InferenceTime(total=10.0)], [None], 1, 0)]
+
+    assert not is_throughput_dominated(results, [{"batch_size": 1, "throughput": 1000.0}])
+    assert not is_throughput_dominated(results, [], min_points=1)
+    assert is_throughput_dominated(results, [{"batch_size": 1, "throughput": 1000.0}], min_points=1)
+
+
+def _windows(latencies):
+    return [
+        ProfilingResults.from_measurements([InferenceTime(total=latency) for latency in window], [1500, None], 1, 0)
+        for window in latencies
+    ]
+
+
+def test_get_measurement_stability_reject_warm_up_windows_when_criterion_is_coefficient_of_variation():
+    windows = _windows([[250, 220, 200], [50, 49, 48], [52, 49, 47], [51, 50, 49]])
+
+    stability = get_measurement_stability(
+        windows,
+        last_n=3,
+        stability_percentage=10.0,
+        stability_criterion=StabilityCriterion.COEFFICIENT_OF_VARIATION,
+    )
+
+    assert stability.is_stable is True
+    assert stability.first_window == 1
+    assert stability.stability_value < 10.0
+    assert stability.median_latency_ci is None
+
+
+def test_get_measurement_stability_return_false_when_not_enough_windows_after_warm_up():
+    windows = _windows([[250, 220, 200], [50, 49, 48], [52, 49, 47]])
+
+    stability = get_measurement_stability(
+        windows,
+        last_n=3,
+        stability_percentage=10.0,
+        stability_criterion=StabilityCriterion.COEFFICIENT_OF_VARIATION,
+    )
+
+    assert stability.is_stable is False
+    assert stability.first_window == 1
+
+
+def test_get_measurement_stability_return_median_ci_when_criterion_is_bootstrap_median():
+    windows = _windows([[50, 49, 48, 51], [52, 49, 47, 50], [51, 50, 49, 50]])
+
+    stability = get_measurement_stability(
+        windows,
+        last_n=3,
+        stability_percentage=10.0,
+        stability_criterion=StabilityCriterion.BOOTSTRAP_MEDIAN,
+        rng=np.random.default_rng(0),
+    )
+
+    assert stability.is_stable is True
+    ci_low, ci_high = stability.median_latency_ci
+    assert 47 <= ci_low <= 50 <= ci_high <= 52
+
+
+def test_get_bootstrap_median_ci_return_narrower_interval_when_more_samples_passed():
+    rng = np.random.default_rng(0)
+    short_latencies = rng.normal(100.0, 10.0, size=20)
+    long_latencies = rng.normal(100.0, 10.0, size=2000)
+
+    short_low, short_high = get_bootstrap_median_ci(short_latencies, 0.95, 500, np.random.default_rng(1))
+    long_low, long_high = get_bootstrap_median_ci(long_latencies, 0.95, 500, np.random.default_rng(1))
+
+    assert long_high - long_low < short_high - short_low
+    assert long_low < 100.0 < long_high
+
+
+def test_profiler_run_record_stability_criterion_when_bootstrap_median_selected(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_window_measurement",
+        side_effect=_windows([[250, 220, 200], [50, 49, 48], [52, 49, 47], [51, 50, 49]]),
+    )
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        stability_criterion=StabilityCriterion.BOOTSTRAP_MEDIAN,
+        stability_percentage=10.0,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert len(results) == 1
+    assert results[0].stability_criterion == StabilityCriterion.BOOTSTRAP_MEDIAN
+    assert results[0].avg_latency < 60.0
+    assert results[0].p50_latency_ci is not None
+    assert ProfilingResults.from_dict(results[0].to_dict(parse=True)) == results[0]
+
+
+def test_profiling_results_from_profiling_results_return_percentiles_of_all_measurements_when_windows_merged():
+    windows = _windows([[10] * 99 + [100], [10] * 100, [10] * 100])
+
+    result = ProfilingResults.from_profiling_results(windows)
+
+    assert result.p99_latency == 10.0
+    assert result.avg_latency == np.mean([10] * 299 + [100])
+    assert result.latency_histogram.count == 300
+    assert result.detailed_results[InferenceStep.TOTAL.value].p99_time == 10.0
+
+
+def test_profiling_results_from_dict_restore_latency_histogram_when_serialized():
+    result = ProfilingResults.from_profiling_results(_windows([[10, 11, 12], [10, 11, 13]]))
+
+    restored = ProfilingResults.from_dict(result.to_dict(parse=True))
+
+    assert restored == result
+    assert restored.latency_histogram == result.latency_histogram
+    assert "histogram" not in result.to_dict(parse=True)["detailed_results"][InferenceStep.TOTAL.value]
+
+
+def test_profiler_run_record_memory_usage_when_profile_memory_enabled(mocker):
+    mocker.patch("model_navigator.core.dataloader.expand_sample", return_value=MagicMock())
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_window_measurement",
+        side_effect=_windows([[10, 10, 10], [10, 10, 10], [10, 10, 10]]),
+    )
+
+    optimization_profile = OptimizationProfile(batch_sizes=[1], profile_memory=True, trace_python_allocations=True)
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+    runner = MagicMock()
+    runner.is_stabilized.return_value = False
+    results = profiler.run(runner=runner, profiling_sample=MagicMock(), sample_id=0)
+
+    assert len(results) == 1
+    assert results[0].peak_rss_memory >= results[0].avg_rss_memory > 0
+    assert results[0].peak_python_memory is not None
+    assert ProfilingResults.from_dict(results[0].to_dict(parse=True)) == results[0]
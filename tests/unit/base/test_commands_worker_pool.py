@@ -0,0 +1,164 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+
+import pytest
+
+from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.commands.worker_pool import WorkerPool, get_preload_modules
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+
+
+def _write_pid(path):
+    pathlib.Path(path).write_text(str(os.getpid()))
+
+
+def _fail(path):
+    _write_pid(path)
+    raise RuntimeError("Task failed")
+
+
+def _crash(path):
+    _write_pid(path)
+    os._exit(3)
+
+
+def _exit(code):
+    raise SystemExit(code)
+
+
+def _read_pid(path):
+    return int(pathlib.Path(path).read_text())
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(max_idle_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_execute_reuses_worker_between_tasks(pool, tmp_path):
+    pid_path = tmp_path / "pid"
+
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+    first_pid = _read_pid(pid_path)
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+
+    assert _read_pid(pid_path) == first_pid
+    assert first_pid != os.getpid()
+
+
+def test_execute_recycles_worker_when_task_failed(pool, tmp_path):
+    pid_path = tmp_path / "pid"
+
+    assert pool.execute(_fail, (pid_path,)) == 1
+    failed_pid = _read_pid(pid_path)
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+
+    assert _read_pid(pid_path) != failed_pid
+
+
+def test_execute_returns_exitcode_when_worker_crashed(pool, tmp_path):
+    pid_path = tmp_path / "pid"
+
+    assert pool.execute(_crash, (pid_path,)) == 3
+    crashed_pid = _read_pid(pid_path)
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+
+    assert _read_pid(pid_path) != crashed_pid
+
+
+@pytest.mark.parametrize("code,exitcode", [(0, 0), (None, 0), (5, 5), ("error", 1)])
+def test_execute_returns_exitcode_when_task_exited(pool, code, exitcode):
+    assert pool.execute(_exit, (code,)) == exitcode
+
+
+def test_execute_recycles_worker_after_max_tasks(tmp_path):
+    pid_path = tmp_path / "pid"
+    pool = WorkerPool(max_idle_workers=1, max_tasks=2)
+    try:
+        pids = []
+        for _ in range(3):
+            assert pool.execute(_write_pid, (pid_path,)) == 0
+            pids.append(_read_pid(pid_path))
+    finally:
+        pool.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]
+
+
+def test_execute_recycles_worker_exceeding_max_memory(tmp_path):
+    pid_path = tmp_path / "pid"
+    pool = WorkerPool(max_idle_workers=1, max_memory=0)
+    try:
+        assert pool.execute(_write_pid, (pid_path,)) == 0
+        first_pid = _read_pid(pid_path)
+        assert pool.execute(_write_pid, (pid_path,)) == 0
+    finally:
+        pool.shutdown()
+
+    assert _read_pid(pid_path) != first_pid
+
+
+def test_execute_recycles_worker_holding_cuda_context(pool, tmp_path, mocker):
+    pid_path = tmp_path / "pid"
+    mocker.patch("model_navigator.commands.worker_pool._Worker.uses_gpu", return_value=True)
+
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+    first_pid = _read_pid(pid_path)
+    assert pool.execute(_write_pid, (pid_path,)) == 0
+
+    assert _read_pid(pid_path) != first_pid
+
+
+def test_prewarm_starts_idle_workers_up_to_limit():
+    pool = WorkerPool(max_idle_workers=2)
+    try:
+        pool.prewarm(num_workers=3, preload_modules=["json"])
+
+        assert len(pool._idle) == 2
+        assert all(worker.is_alive() for worker in pool._idle)
+    finally:
+        pool.shutdown()
+
+    assert pool._idle == []
+
+
+def test_get_preload_modules_returns_installed_modules_only():
+    assert "onnx" in get_preload_modules(Framework.ONNX)
+    assert all(not module.startswith("model_navigator") for module in get_preload_modules(Framework.NONE))
+
+
+def test_execute_python_script_raises_error_when_isolated_function_failed_in_worker(tmp_path, mocker):
+    mocker.patch("model_navigator.commands.execution_context.use_worker_pool", return_value=True)
+    workspace = Workspace(tmp_path / "workspace")
+    workspace.initialize()
+    script_path = tmp_path / "script.py"
+    script_path.write_text("")
+    pid_path = tmp_path / "pid"
+
+    with ExecutionContext(
+        workspace=workspace,
+        script_path=workspace.path / "reproduce.py",
+        cmd_path=workspace.path / "reproduce.sh",
+    ) as context:
+        with pytest.raises(ModelNavigatorUserInputError, match="Process exited with 1"):
+            context.execute_python_script(script_path, _fail, [pid_path.as_posix()], run_in_isolation=True)
+
+    assert _read_pid(pid_path) != os.getpid()
@@ -14,11 +14,22 @@
 
 import pathlib
 import tempfile
+import threading
 
 import numpy
 import pytest
 
-from model_navigator.core.dataloader import _sample_filename, _validate_tensor, load_samples, samples_to_npz
+from model_navigator.core.dataloader import (
+    PrefetchingDataloader,
+    SampleExpander,
+    _sample_filename,
+    _validate_tensor,
+    expand_sample,
+    load_samples,
+    samples_to_npz,
+    samples_to_store,
+)
+from model_navigator.core.tensor import TensorMetadata
 from model_navigator.exceptions import ModelNavigatorUserInputError
 
 
@@ -99,6 +110,144 @@ def test_samples_are_saved_and_loaded_in_the_same_order():
                 assert (v1 == v2).all()
 
 
+def test_samples_are_saved_to_store_and_loaded_with_batch_dim_when_samples_to_store_used():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir) / "model_input" / "correctness"
+
+        batch_dim = 0
+        samples = [
+            {"input_0": numpy.full(shape=(1, fill_value + 1), fill_value=fill_value)} for fill_value in range(10)
+        ]
+        samples_to_store(samples=samples, path=sample_filepath, batch_dim=batch_dim)
+        loaded_samples = load_samples(samples_name="correctness_samples", workspace=tmpdir, batch_dim=batch_dim)
+
+        assert not list(sample_filepath.glob("*.npz"))
+        assert len(samples) == len(loaded_samples)
+        for s, l_s in zip(samples, loaded_samples):
+            assert s["input_0"].shape == l_s["input_0"].shape
+            assert (s["input_0"] == l_s["input_0"]).all()
+
+
+def test_sample_expander_return_same_values_as_expand_sample_when_batch_sizes_change():
+    input_metadata = (
+        TensorMetadata()
+        .add("input_0", shape=(-1, 3), dtype=numpy.float32)
+        .add("input_1", shape=(-1, 2), dtype=numpy.int64)
+        .add("input_2", shape=(), dtype=numpy.float32)
+    )
+    sample = {
+        "input_0": numpy.arange(3, dtype=numpy.float32).reshape(1, 3),
+        "input_1": numpy.arange(4).reshape(2, 2),
+        "input_2": numpy.array(1.0, dtype=numpy.float32),
+    }
+    sample_expander = SampleExpander(sample, input_metadata, batch_dim=0)
+
+    for batch_size in [1, 4, 2, 7, 3]:
+        expanded_sample = sample_expander.expand(batch_size)
+        expected_sample = expand_sample(sample, input_metadata, batch_dim=0, batch_size=batch_size)
+        assert expanded_sample.keys() == expected_sample.keys()
+        for name in expected_sample:
+            assert (expanded_sample[name] == expected_sample[name]).all()
+
+
+def test_sample_expander_reuse_buffer_when_smaller_batch_size_requested():
+    input_metadata = TensorMetadata().add("input_0", shape=(-1, 3), dtype=numpy.float32)
+    sample_expander = SampleExpander({"input_0": numpy.ones((1, 3), dtype=numpy.float32)}, input_metadata, batch_dim=0)
+
+    large = sample_expander.expand(8)["input_0"]
+    small = sample_expander.expand(2)["input_0"]
+
+    assert small.shape == (2, 3)
+    assert numpy.shares_memory(small, large)
+    assert sample_expander.expand(2) is sample_expander.expand(2)
+
+
+def test_prefetching_dataloader_yield_samples_in_order_when_loaded_by_multiple_workers():
+    samples = [{"input_0": numpy.full((1, 2), idx)} for idx in range(20)]
+
+    dataloader = PrefetchingDataloader(samples, prefetch_depth=4, num_workers=3)
+
+    assert len(dataloader) == len(samples)
+    assert [sample["input_0"][0, 0] for sample in dataloader] == list(range(20))
+
+
+def test_prefetching_dataloader_iterate_in_background_thread_when_dataloader_is_not_indexable():
+    threads = []
+
+    class Dataloader:
+        def __iter__(self):
+            for idx in range(5):
+                threads.append(threading.current_thread())
+                yield idx
+
+        def __len__(self):
+            return 5
+
+    dataloader = PrefetchingDataloader(Dataloader(), prefetch_depth=2, num_workers=3)
+
+    assert list(dataloader) == list(range(5))
+    assert threading.current_thread() not in threads
+
+
+def test_prefetching_dataloader_stop_loading_when_consumer_stops_early():
+    loaded = []
+
+    def _samples():
+        for idx in range(100):
+            loaded.append(idx)
+            yield idx
+
+    samples = _samples()
+    dataloader = PrefetchingDataloader(samples, prefetch_depth=2)
+    assert next(iter(dataloader)) == 0
+
+    assert len(loaded) <= 4
+
+
+def test_prefetching_dataloader_raise_error_when_dataloader_fails():
+    def _samples():
+        yield 0
+        raise ValueError("Dataloader failed")
+
+    with pytest.raises(ValueError, match="Dataloader failed"):
+        list(PrefetchingDataloader(_samples(), prefetch_depth=2))
+
+    with pytest.raises(ModelNavigatorUserInputError):
+        PrefetchingDataloader([], prefetch_depth=-1)
+
+
+@pytest.mark.parametrize("writer", [samples_to_store, samples_to_npz])
+def test_sorted_samples_loader_return_subsets_and_metadata_when_sliced_or_sharded(writer):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir) / "model_input" / "correctness"
+        samples = [{"input_0": numpy.full(shape=(1, idx + 1), fill_value=idx)} for idx in range(7)]
+        writer(samples=samples, path=sample_filepath, batch_dim=0)
+
+        loaded_samples = load_samples(samples_name="correctness_samples", workspace=tmpdir, batch_dim=0)
+        sliced = loaded_samples[2:6:2]
+        shards = [loaded_samples.shard(worker_id, 3) for worker_id in range(3)]
+
+        assert [sample["input_0"][0, 0] for sample in sliced] == [2, 4]
+        assert [len(shard) for shard in shards] == [3, 2, 2]
+        assert sorted(sample["input_0"][0, 0] for shard in shards for sample in shard) == list(range(7))
+        assert shards[1][-1]["input_0"][0, 0] == 4
+
+        metadata = sliced.get_sample_metadata(1)
+        assert metadata["input_0"].shape == (1, 5)
+        assert metadata["input_0"].dtype == samples[4]["input_0"].dtype
+
+
+def test_load_samples_return_statistics_when_samples_written_to_store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir) / "model_input" / "correctness"
+        samples = [{"input_0": numpy.full(shape=(1, 2), fill_value=value, dtype=numpy.float32)} for value in [-4, 2]]
+        samples_to_store(samples=samples, path=sample_filepath, batch_dim=0)
+
+        statistics = load_samples("correctness_samples", tmpdir, batch_dim=0).get_statistics()["input_0"]
+
+        assert (statistics.min, statistics.max, statistics.mean, statistics.abs_max) == (-4.0, 2.0, -1.0, 4.0)
+
+
 def test_sample_filename_raise_error_when_idx_larger_than_num_samples():
     with pytest.raises(ValueError):
         _sample_filename(idx=11, num_samples=10)
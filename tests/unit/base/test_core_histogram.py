@@ -0,0 +1,88 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import numpy as np
+import pytest
+
+from model_navigator.core.histogram import LatencyHistogram
+
+
+def test_latency_histogram_return_percentiles_within_precision_when_values_recorded():
+    values = np.random.default_rng(0).lognormal(mean=2.0, sigma=0.5, size=10000)
+    histogram = LatencyHistogram.from_values(values, precision=0.005)
+
+    for q in [50, 90, 95, 99]:
+        expected = np.percentile(values, q, method="inverted_cdf")
+        assert histogram.percentile(q) == pytest.approx(expected, rel=0.005)
+
+    assert histogram.count == len(values)
+    assert histogram.mean == pytest.approx(np.mean(values))
+    assert histogram.std == pytest.approx(np.std(values))
+
+
+def test_latency_histogram_return_exact_value_when_all_values_are_equal():
+    histogram = LatencyHistogram.from_values([10.0, 10.0, 10.0])
+
+    assert histogram.percentiles([50, 99]) == [10.0, 10.0]
+
+
+def test_latency_histogram_return_percentiles_of_all_values_when_histograms_merged():
+    rng = np.random.default_rng(0)
+    fast_values = rng.normal(10.0, 0.1, size=990)
+    slow_values = rng.normal(100.0, 1.0, size=10)
+    all_values = np.concatenate([fast_values, slow_values])
+
+    histogram = LatencyHistogram.merged([
+        LatencyHistogram.from_values(fast_values),
+        LatencyHistogram.from_values(slow_values),
+    ])
+
+    assert histogram.percentile(99.5) == pytest.approx(
+        np.percentile(all_values, 99.5, method="inverted_cdf"), rel=0.005
+    )
+    assert histogram.count == 1000
+    assert histogram.min == np.min(all_values)
+    assert histogram.max == np.max(all_values)
+
+
+def test_latency_histogram_count_out_of_range_values_in_edge_buckets():
+    histogram = LatencyHistogram.from_values([0.0, 1e-6, 5.0, 1e9], lowest=1e-3, highest=1e3)
+
+    assert histogram.count == 4
+    assert histogram.percentile(0) == 0.0
+    assert histogram.percentile(100) == 1e9
+
+
+def test_latency_histogram_raise_error_when_histograms_with_different_configuration_merged():
+    histogram = LatencyHistogram(precision=0.01)
+
+    with pytest.raises(ValueError):
+        histogram.merge(LatencyHistogram(precision=0.001))
+
+
+def test_latency_histogram_raise_error_when_percentile_of_empty_histogram_requested():
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(50)
+
+
+def test_latency_histogram_from_dict_return_same_histogram_when_serialized_to_json():
+    histogram = LatencyHistogram.from_values(np.random.default_rng(0).uniform(1.0, 2.0, size=100))
+
+    data = json.loads(json.dumps(histogram.to_json()))
+    restored = LatencyHistogram.from_dict(data)
+
+    assert restored == histogram
+    assert restored.percentiles([50, 99]) == histogram.percentiles([50, 99])
+    assert len(data["bucket_indices"]) <= 100
@@ -0,0 +1,141 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import pickle
+import tempfile
+
+import numpy as np
+import pytest
+
+from model_navigator.core.samples_store import (
+    SAMPLES_INDEX_FILENAME,
+    SAMPLES_TABLE_FILENAME,
+    SamplesStoreReader,
+    SamplesStoreWriter,
+    TensorStatistics,
+    is_samples_store,
+)
+
+
+def test_samples_store_write_tensors_of_each_name_to_single_file_when_samples_have_different_shapes():
+    samples = [
+        {"input__0": np.arange(6, dtype=np.float32).reshape(2, 3), "input__1": np.array(idx)} for idx in range(3)
+    ]
+    samples.append({"input__0": np.ones((4, 3), dtype=np.float32), "input__1": np.array(3)})
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with SamplesStoreWriter(path) as writer:
+            for sample in samples:
+                writer.append(sample)
+
+        assert sorted(f.name for f in path.iterdir()) == [
+            SAMPLES_INDEX_FILENAME,
+            SAMPLES_TABLE_FILENAME,
+            "tensor_0.npy",
+            "tensor_1.npy",
+        ]
+        assert np.load(path / "tensor_0.npy").shape == (30,)
+
+        reader = SamplesStoreReader(path)
+        assert len(reader) == 4
+        for sample, loaded_sample in zip(samples, [reader[idx] for idx in range(len(reader))]):
+            assert list(sample) == list(loaded_sample)
+            for name, tensor in sample.items():
+                assert loaded_sample[name].dtype == tensor.dtype
+                assert np.array_equal(loaded_sample[name], tensor)
+
+
+def test_samples_store_reader_return_writable_views_when_sample_loaded():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with SamplesStoreWriter(path) as writer:
+            writer.append({"input__0": np.zeros((2, 2), dtype=np.float32)})
+
+        reader = SamplesStoreReader(path)
+        tensor = reader[0]["input__0"]
+        tensor[0, 0] = 1.0
+
+        assert type(tensor) is np.ndarray
+        assert not tensor.flags.owndata
+        assert SamplesStoreReader(path)[0]["input__0"][0, 0] == 0.0
+        assert len(pickle.loads(pickle.dumps(reader))) == 1
+
+
+def test_samples_store_writer_does_not_write_index_when_error_raised():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with pytest.raises(ValueError):
+            with SamplesStoreWriter(path) as writer:
+                writer.append({"input__0": np.zeros((2,), dtype=np.float32)})
+                writer.append({"input__0": np.array([None], dtype=object)})
+
+        assert not is_samples_store(path)
+
+
+def test_samples_store_reader_return_metadata_without_reading_arenas_when_metadata_requested():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with SamplesStoreWriter(path) as writer:
+            writer.append({"input__0": np.zeros((2, 3), dtype=np.float16), "input__1": np.array(1)})
+            writer.append({"input__0": np.zeros((4, 3), dtype=np.float16)})
+
+        reader = SamplesStoreReader(path)
+        metadata = reader.get_metadata(-1)
+
+        assert list(metadata) == ["input__0"]
+        assert metadata["input__0"].shape == (4, 3)
+        assert metadata["input__0"].dtype == np.float16
+        assert reader.get_metadata(0)["input__1"].shape == ()
+        assert not reader._arenas
+        with pytest.raises(IndexError):
+            reader.get_metadata(2)
+
+
+def test_samples_store_writer_raise_error_when_tensor_dimensions_change():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with pytest.raises(ValueError):
+            with SamplesStoreWriter(path) as writer:
+                writer.append({"input__0": np.zeros((2,), dtype=np.float32)})
+                writer.append({"input__0": np.zeros((2, 2), dtype=np.float32)})
+
+
+def test_tensor_statistics_return_statistics_of_all_values_when_merged():
+    first = np.array([[-3.0, 1.0], [2.0, 0.0]], dtype=np.float32)
+    second = np.array([5.0, 1.0], dtype=np.float32)
+
+    statistics = TensorStatistics.from_tensor(first).merge(TensorStatistics.from_tensor(second))
+    values = np.concatenate([first.ravel(), second])
+
+    assert statistics.count == values.size
+    assert (statistics.min, statistics.max, statistics.abs_max) == (-3.0, 5.0, 5.0)
+    assert statistics.mean == pytest.approx(values.mean())
+    assert statistics.is_finite
+    assert not TensorStatistics.from_tensor(np.array([1.0, np.nan])).is_finite
+    assert not TensorStatistics.from_tensor(np.array([-np.inf, 1.0])).is_finite
+    assert TensorStatistics.from_tensor(np.zeros((0, 2))) is None
+
+
+def test_samples_store_reader_return_statistics_when_written_with_samples():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        with SamplesStoreWriter(path) as writer:
+            for value in [1, 3]:
+                tensor = np.full((2,), value, dtype=np.int32)
+                writer.append({"input__0": tensor}, statistics={"input__0": TensorStatistics.from_tensor(tensor)})
+
+        statistics = SamplesStoreReader(path).get_statistics()
+
+        assert statistics == {"input__0": TensorStatistics(count=4, min=1.0, max=3.0, mean=2.0)}
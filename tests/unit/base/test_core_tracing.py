@@ -0,0 +1,149 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import threading
+
+from model_navigator.core.tracing import Tracer, get_tracer, save_trace, timestamp
+from model_navigator.runners.base import InferenceStep, InferenceStepTimer, InferenceTime
+
+
+def _get_events(events, phase):
+    return [event for event in events if event["ph"] == phase]
+
+
+def test_span_records_nested_complete_events_when_tracer_started():
+    tracer = Tracer()
+    tracer.start(process_name="Optimize")
+
+    with tracer.span("pipeline", category="pipeline"):
+        with tracer.span("command", category="command", args={"status": "OK"}):
+            pass
+
+    events = tracer.stop()
+
+    spans = _get_events(events, "X")
+    assert [span["name"] for span in spans] == ["command", "pipeline"]
+    command, pipeline = spans
+    assert command["args"] == {"status": "OK"}
+    assert command["pid"] == pipeline["pid"] == os.getpid()
+    assert command["tid"] == pipeline["tid"]
+    assert pipeline["ts"] <= command["ts"]
+    assert command["ts"] + command["dur"] <= pipeline["ts"] + pipeline["dur"]
+
+    metadata = {event["name"]: event["args"]["name"] for event in _get_events(events, "M")}
+    assert metadata == {"process_name": "Optimize", "thread_name": threading.current_thread().name}
+
+
+def test_span_does_not_record_events_when_tracer_not_started():
+    tracer = Tracer()
+
+    with tracer.span("command", category="command"):
+        pass
+    tracer.counter("memory", {"rss": 1.0})
+
+    tracer.start()
+    assert tracer.stop() == []
+
+
+def test_counter_omits_missing_values():
+    tracer = Tracer()
+    tracer.start()
+
+    tracer.counter("gpu clock", {"avg": None})
+    tracer.counter("memory", {"rss": 10, "uss": None})
+
+    events = tracer.stop()
+    assert len(events) == 1
+    assert events[0]["ph"] == "C"
+    assert events[0]["args"] == {"rss": 10.0}
+
+
+def test_tracer_drops_events_exceeding_max_events():
+    tracer = Tracer(max_events=3)
+    tracer.start()
+
+    for idx in range(5):
+        tracer.counter("counter", {"value": idx})
+
+    events = tracer.stop()
+    assert [event["args"]["value"] for event in events] == [0.0, 1.0, 2.0]
+
+
+def test_load_merges_saved_events_and_removes_file(tmp_path):
+    child_tracer = Tracer()
+    child_tracer.start(process_name="NavigatorWorker")
+    child_tracer.complete("total", category="inference", start=timestamp(), duration=10.0)
+    trace_path = tmp_path / "trace.json"
+    save_trace(trace_path, child_tracer.stop())
+
+    with trace_path.open("r") as f:
+        trace = json.load(f)
+    assert trace["displayTimeUnit"] == "ms"
+
+    tracer = Tracer()
+    tracer.start()
+    tracer.load(trace_path)
+    events = tracer.stop()
+
+    assert not trace_path.exists()
+    assert events == trace["traceEvents"]
+
+
+def test_load_ignores_empty_file(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    trace_path.touch()
+
+    tracer = Tracer()
+    tracer.start()
+    tracer.load(trace_path)
+
+    assert tracer.stop() == []
+    assert not trace_path.exists()
+
+
+def test_inference_step_timer_records_steps_when_tracing_enabled():
+    tracer = get_tracer()
+    timer = InferenceStepTimer(InferenceTime(), enabled=True)
+
+    tracer.start()
+    try:
+        with timer.measure_step(InferenceStep.TOTAL):
+            with timer.measure_step(InferenceStep.COMPUTE):
+                pass
+    finally:
+        events = tracer.stop()
+
+    spans = _get_events(events, "X")
+    assert [(span["name"], span["cat"]) for span in spans] == [("compute", "inference"), ("total", "inference")]
+    compute, total = spans
+    assert total["ts"] <= compute["ts"]
+    assert compute["ts"] + compute["dur"] <= total["ts"] + total["dur"] + 1  # clocks conversion rounding
+    assert set(timer.inference_time) == {"compute", "total"}
+
+
+def test_inference_step_timer_does_not_record_steps_when_tracer_paused():
+    tracer = get_tracer()
+    timer = InferenceStepTimer(InferenceTime(), enabled=True)
+
+    tracer.start()
+    try:
+        with tracer.span("measurement", category="profiling"), tracer.paused():
+            with timer.measure_step(InferenceStep.TOTAL):
+                pass
+    finally:
+        events = tracer.stop()
+
+    assert [span["name"] for span in _get_events(events, "X")] == ["measurement"]
+    assert set(timer.inference_time) == {"total"}
@@ -0,0 +1,103 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+import threading
+import time
+
+import pytest
+
+from model_navigator.core.writer_pool import WriterPool, write_file
+
+
+def test_writer_pool_commit_results_in_submission_order_when_serialization_finish_out_of_order():
+    committed = []
+
+    def _serialize(idx):
+        time.sleep(0.01 * (5 - idx))
+        return idx
+
+    with WriterPool(num_workers=4, max_pending=8) as pool:
+        for idx in range(5):
+            pool.submit(lambda idx=idx: _serialize(idx), committed.append)
+
+    assert committed == [0, 1, 2, 3, 4]
+
+
+def test_writer_pool_block_submission_when_max_pending_tasks_reached():
+    release = threading.Event()
+    started = []
+
+    def _serialize(idx):
+        started.append(idx)
+        release.wait()
+
+    pool = WriterPool(num_workers=2, max_pending=2)
+    pool.submit(lambda: _serialize(0))
+    pool.submit(lambda: _serialize(1))
+
+    submitter = threading.Thread(target=pool.submit, args=(lambda: _serialize(2),))
+    submitter.start()
+    submitter.join(timeout=0.1)
+    assert submitter.is_alive()
+
+    release.set()
+    submitter.join()
+    pool.wait()
+    pool.shutdown()
+
+    assert sorted(started) == [0, 1, 2]
+
+
+def test_writer_pool_raise_error_when_task_failed():
+    def _serialize():
+        raise ValueError("Serialization failed")
+
+    with pytest.raises(ValueError, match="Serialization failed"):
+        with WriterPool() as pool:
+            pool.submit(_serialize, lambda _: None)
+
+
+def test_writer_pool_shutdown_skip_tasks_not_started_when_cancel_requested():
+    release = threading.Event()
+    serialized = []
+    committed = []
+
+    def _serialize(idx):
+        if idx == 0:
+            release.wait()
+        serialized.append(idx)
+        return idx
+
+    pool = WriterPool(num_workers=1, max_pending=4)
+    for idx in range(3):
+        pool.submit(lambda idx=idx: _serialize(idx), committed.append)
+
+    canceller = threading.Thread(target=pool.shutdown, kwargs={"cancel": True})
+    canceller.start()
+    time.sleep(0.05)
+    release.set()
+    canceller.join()
+
+    # the first task was already started and is finished
+    assert serialized == [0]
+    assert committed == [0]
+
+
+def test_write_file_write_data_when_fsync_enabled():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "sample.pt"
+        write_file(path, memoryview(b"data"), fsync=True)
+
+        assert path.read_bytes() == b"data"
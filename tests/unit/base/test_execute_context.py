@@ -13,13 +13,20 @@
 # limitations under the License.
 
 
+import os
+
 import pytest
 
 from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.core.tracing import get_tracer
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
 
 
+def _noop():
+    pass
+
+
 @pytest.mark.parametrize("verbose", [False, True])
 def test_execute_context_external_cmd_success(tmp_path, mocker, verbose):
     cmd_path = tmp_path / "test_command.sh"
@@ -54,3 +61,28 @@ def test_execute_context_external_cmd_not_allowed_error(tmp_path, mocker):
         with pytest.raises(ModelNavigatorUserInputError):
             exec_ctx.execute_cmd(["---"], allow_failure=False)
     assert mock_logger.info.call_count == 2  # bake_cmd + log output
+
+
+def test_execute_python_script_merges_trace_of_isolated_function(tmp_path):
+    workspace = Workspace(tmp_path / "workspace")
+    workspace.initialize()
+    script_path = tmp_path / "script.py"
+    script_path.write_text("")
+
+    tracer = get_tracer()
+    tracer.start()
+    try:
+        with ExecutionContext(
+            workspace=workspace,
+            script_path=workspace.path / "reproduce.py",
+            cmd_path=workspace.path / "reproduce.sh",
+        ) as context:
+            context.execute_python_script(script_path, _noop, [], run_in_isolation=True, reuse_process=False)
+    finally:
+        events = tracer.stop()
+
+    spans = [event for event in events if event["ph"] == "X" and event["name"] == "_noop"]
+    assert len(spans) == 1
+    assert spans[0]["cat"] == "script"
+    assert spans[0]["pid"] != os.getpid()
+    assert any(event["ph"] == "C" and event["pid"] == spans[0]["pid"] for event in events)
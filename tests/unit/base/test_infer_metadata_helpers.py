@@ -17,6 +17,8 @@ import pytest
 
 from model_navigator.commands.infer_metadata import (
     _assert_all_inputs_have_same_pytree_metadata,
+    _AxisStatistics,
+    _collect_axes_statistics,
     _extract_max_batch_size,
     _get_metadata_from_axes_shapes,
     _get_trt_profile_from_axes_shapes,
@@ -24,6 +26,7 @@ from model_navigator.commands.infer_metadata import (
 from model_navigator.configuration import TensorRTProfile, TensorType
 from model_navigator.core.tensor import PyTreeMetadata, TensorSpec
 from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
 from model_navigator.utils.common import optimal_batch_size
 
 
@@ -169,3 +172,44 @@ def test_assert_all_inputs_have_same_pytree_metadata_raise_exception_when_inputs
 
         with pytest.raises(ModelNavigatorUserInputError):
             _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
+
+
+def test_axis_statistics_return_same_median_as_numpy_when_sizes_are_streamed():
+    rng = numpy.random.default_rng(0)
+    for count in [1, 2, 7, 10]:
+        sizes = rng.integers(1, 10, size=count).tolist()
+
+        statistics = _AxisStatistics.from_sizes(sizes)
+
+        assert statistics.min == min(sizes)
+        assert statistics.max == max(sizes)
+        assert statistics.median == int(numpy.median(sizes))
+
+
+def test_collect_axes_statistics_iterate_dataloader_once_when_structure_is_validated():
+    class Dataloader:
+        def __init__(self):
+            self.iterations = 0
+            self.samples = [{"input_0": numpy.zeros((bs, 3))} for bs in [1, 4, 2]]
+
+        def __iter__(self):
+            self.iterations += 1
+            return iter(self.samples)
+
+        def __len__(self):
+            return len(self.samples)
+
+    dataloader = Dataloader()
+    pytree_metadata = PyTreeMetadata.from_sample(dataloader.samples[0], TensorType.NUMPY, prefix="input")
+
+    axes_statistics = _collect_axes_statistics(
+        dataloader, pytree_metadata, ["input__0"], [2], len(dataloader), Framework.NONE
+    )
+
+    assert dataloader.iterations == 1
+    assert (axes_statistics["input__0"][0].min, axes_statistics["input__0"][0].max) == (1, 4)
+    assert axes_statistics["input__0"][1].median == 3
+
+    dataloader.samples.append((numpy.zeros((1, 3)),))
+    with pytest.raises(ModelNavigatorUserInputError):
+        _collect_axes_statistics(dataloader, pytree_metadata, ["input__0"], [2], len(dataloader), Framework.NONE)
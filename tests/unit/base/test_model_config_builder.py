@@ -17,6 +17,8 @@ from model_navigator.configuration import (
     Format,
     JitType,
     OnnxConfig,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
     TensorFlowConfig,
     TensorFlowTensorRTConfig,
     TensorRTCompatibilityLevel,
@@ -370,6 +372,41 @@ def test_get_onnx_config_for_tensorflow_framework_returns_model_configs_matching
         assert model_configuration.parent_key == savedmodel_model_configuration.key
 
 
+def test_get_onnx_config_returns_model_config_per_graph_optimization_level_when_levels_provided():
+    onnx_config = OnnxConfig(
+        graph_optimization_levels=["basic", OnnxGraphOptimizationLevel.ALL],
+        execution_mode="parallel",
+        enable_mem_pattern=False,
+        cache_optimized_model=True,
+    )
+    model_configs = {Format.ONNX: [], Format.TENSORRT: []}
+    custom_configs = [onnx_config, TensorRTConfig(precision=TensorRTPrecision.FP16)]
+    ModelConfigBuilder().get_onnx_config(Framework.ONNX, custom_configs, model_configs)
+    ModelConfigBuilder().get_trt_config(Framework.ONNX, custom_configs, model_configs)
+
+    assert [model_configuration.key for model_configuration in model_configs[Format.ONNX]] == [
+        "onnx-ort-basic",
+        "onnx-ort-all",
+    ]
+    for model_configuration, level in zip(
+        model_configs[Format.ONNX], [OnnxGraphOptimizationLevel.BASIC, OnnxGraphOptimizationLevel.ALL]
+    ):
+        runner_config = model_configuration.runner_config
+        assert runner_config.graph_optimization_level == level
+        assert runner_config.execution_mode == OnnxExecutionMode.PARALLEL
+        assert runner_config.enable_mem_arena is None
+        assert runner_config.enable_mem_pattern is False
+        assert runner_config.cache_optimized_model is True
+
+        restored = model_config.ModelConfig.from_dict(model_configuration.to_dict())
+        assert restored.key == model_configuration.key
+        assert restored.runner_config.to_dict() == runner_config.to_dict()
+
+    # TensorRT is converted only from the first ONNX variant
+    assert len(model_configs[Format.TENSORRT]) == 1
+    assert model_configs[Format.TENSORRT][0].parent_key == "onnx-ort-basic"
+
+
 def test_get_trt_config_returns_model_configs_matching_custom_config():
     onnx_config = OnnxConfig()
     trt_config = TensorRTConfig(
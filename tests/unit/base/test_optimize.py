@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -27,7 +26,7 @@ from model_navigator.runtime_analyzer.analyzer import RuntimeAnalyzerResult
 from tests.unit.base.mocks.fixtures import mock_event_emitter  # noqa: F401
 
 
-def test_optimize_pipeline_emits_events_no_results(mocker, mock_event_emitter):  # noqa: F811
+def test_optimize_pipeline_emits_events_no_results(mocker, mock_event_emitter, tmp_path):  # noqa: F811
     # given
     empty_mock_package = MagicMock()
     empty_mock_package.get_best_runtime.side_effect = ModelNavigatorRuntimeAnalyzerError("test_exception")
@@ -39,7 +38,7 @@ def test_optimize_pipeline_emits_events_no_results(mocker, mock_event_emitter):
             ):
                 # when
                 optimize_pipeline(
-                    workspace=Path("test_path"),
+                    workspace=tmp_path / "test_path",
                     builders=MagicMock(),
                     config=MagicMock(),
                     model=MagicMock(),
@@ -50,7 +49,7 @@ def test_optimize_pipeline_emits_events_no_results(mocker, mock_event_emitter):
     # then
     events = mock_event_emitter.history
     assert len(events) == 4
-    assert events[0] == (OptimizeEvent.WORKSPACE_INITIALIZED, (), {"path": Path("test_path")})
+    assert events[0] == (OptimizeEvent.WORKSPACE_INITIALIZED, (), {"path": tmp_path / "test_path"})
     assert events[1] == (OptimizeEvent.OPTIMIZATION_STARTED, (), {})
     assert events[2] == (OptimizeEvent.MODEL_NOT_OPTIMIZED_ERROR, (), {})
     assert events[3] == (OptimizeEvent.OPTIMIZATION_FINISHED, (), {})
@@ -84,7 +83,7 @@ def test_optimize_pipeline_emits_events_correct_opt_results(is_source_model, moc
             ):
                 # when
                 optimize_pipeline(
-                    workspace=Path("test_path"),
+                    workspace=tmp_path / "test_path",
                     builders=MagicMock(),
                     config=MagicMock(),
                     model=MagicMock(),
@@ -95,7 +94,7 @@ def test_optimize_pipeline_emits_events_correct_opt_results(is_source_model, moc
     # then
     events = mock_event_emitter.history
     assert len(events) == 4
-    assert events[0] == (OptimizeEvent.WORKSPACE_INITIALIZED, (), {"path": Path("test_path")})
+    assert events[0] == (OptimizeEvent.WORKSPACE_INITIALIZED, (), {"path": tmp_path / "test_path"})
     assert events[1] == (OptimizeEvent.OPTIMIZATION_STARTED, (), {})
     assert events[2] == (
         OptimizeEvent.BEST_MODEL_PICKED,
@@ -16,7 +16,9 @@ import pathlib
 import tempfile
 import zipfile
 
+from model_navigator.commands.base import CommandOutput, CommandStatus
 from model_navigator.package.builder import PackageBuilder
+from model_navigator.pipelines.pipeline_context import PipelineCommands
 from tests.unit.base.mocks.packages import (
     tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file,
     tensorflow_package_with_tensorflow_tensorrt,
@@ -95,3 +97,43 @@ def test_save_store_expected_files_with_tensorflow_tensorrt_optimal_model():
             assert len(zf.namelist()) == 4
             for filename in zf.namelist():
                 assert filename in expected_archive_content
+
+
+def test_save_store_trace_only_when_requested():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "workspace"
+        package = tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file(
+            workspace
+        )
+        (workspace / "trace.json").write_text('{"traceEvents": []}')
+
+        package_path = pathlib.Path(tmp_dir) / "nav_package.nav"
+        builder = PackageBuilder()
+        builder.save(package=package, path=package_path)
+
+        with zipfile.ZipFile(package_path) as zf:
+            assert "trace.json" not in zf.namelist()
+
+        builder.save(package=package, path=package_path, override=True, save_trace=True)
+
+        with zipfile.ZipFile(package_path) as zf:
+            assert len(zf.namelist()) == 5
+            assert "trace.json" in zf.namelist()
+
+
+def test_get_command_status_and_result_store_skip_reason_when_command_skipped():
+    commands = PipelineCommands(
+        models_commands={},
+        commands={
+            "Preprocess": CommandOutput(status=CommandStatus.OK, output={"samples": 10}, execution_time=1.0),
+            "Profile": CommandOutput(status=CommandStatus.SKIPPED, execution_time=0.0, skip_reason="Budget exceeded."),
+        },
+    )
+
+    status, result = PackageBuilder()._get_command_status_and_result(commands)
+
+    assert status == {"Preprocess": CommandStatus.OK, "Profile": CommandStatus.SKIPPED}
+    assert result == {
+        "Preprocess": {"execution_time": 1.0, "samples": 10},
+        "Profile": {"execution_time": 0.0, "skip_reason": "Budget exceeded."},
+    }
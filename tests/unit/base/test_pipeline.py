@@ -49,3 +49,44 @@ def test_pipeline_run_emits_events(mock_event_emitter):  # noqa: F811
     )
     assert events[2] == (OptimizeEvent.COMMAND_FINISHED, (), {"status": CommandStatus.OK})
     assert events[3] == (OptimizeEvent.PIPELINE_FINISHED, (), {})
+
+
+def test_pipeline_run_concurrently_emits_events_in_units_order(mock_event_emitter):  # noqa: F811
+    # given
+    pipelines = []
+    for pipeline_idx in range(2):
+        execution_units = []
+        for unit_idx in range(2):
+            mock_exec_unit = MagicMock()
+            mock_exec_unit.model_config = None
+            mock_exec_unit.runner_cls = None
+            mock_exec_unit.results_lookup_runner_cls = None
+            mock_exec_unit.command.name = f"test_command_{pipeline_idx}_{unit_idx}"
+            mock_exec_unit.command.return_value.run.return_value = CommandOutput(CommandStatus.OK)
+            execution_units.append(mock_exec_unit)
+        pipeline = Pipeline(f"test_pipeline_{pipeline_idx}", execution_units=execution_units)
+        pipeline.event_emitter = mock_event_emitter
+        pipelines.append(pipeline)
+    mock_config = MagicMock()
+    mock_config.debug = False
+    mock_config.pipeline_workers = 2
+    mock_context = MagicMock()
+    # when
+    Pipeline.run_concurrently(pipelines=pipelines, workspace=MagicMock(), config=mock_config, context=mock_context)
+    # then
+    events = [(event, kwargs.get("name", kwargs.get("command"))) for event, _, kwargs in mock_event_emitter.history]
+    assert events == [
+        (OptimizeEvent.PIPELINE_STARTED, "test_pipeline_0"),
+        (OptimizeEvent.COMMAND_STARTED, "test_command_0_0"),
+        (OptimizeEvent.COMMAND_FINISHED, None),
+        (OptimizeEvent.COMMAND_STARTED, "test_command_0_1"),
+        (OptimizeEvent.COMMAND_FINISHED, None),
+        (OptimizeEvent.PIPELINE_FINISHED, None),
+        (OptimizeEvent.PIPELINE_STARTED, "test_pipeline_1"),
+        (OptimizeEvent.COMMAND_STARTED, "test_command_1_0"),
+        (OptimizeEvent.COMMAND_FINISHED, None),
+        (OptimizeEvent.COMMAND_STARTED, "test_command_1_1"),
+        (OptimizeEvent.COMMAND_FINISHED, None),
+        (OptimizeEvent.PIPELINE_FINISHED, None),
+    ]
+    assert mock_context.update.call_count == 4
@@ -0,0 +1,219 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.performance import Performance
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import Format
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorTimeBudgetExceeded
+from model_navigator.pipelines.budget import CommandCostEstimator, TimeBudget
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.runners.base import InferenceTime
+
+
+class _Command(Command):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _OtherCommand(Command):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _RequiredCommand(Command, is_required=True):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _ExclusiveCommand(Command, is_exclusive=True):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+def _model_config(key, parent=None, format=Format.ONNX):
+    return SimpleNamespace(key=key, parent=parent, format=format, path=pathlib.Path(key) / "model")
+
+
+def _runner(name):
+    return SimpleNamespace(name=lambda: name)
+
+
+def _unit(command=_Command, model_config=None, runner_cls=None):
+    return ExecutionUnit(command=command, model_config=model_config, runner_cls=runner_cls)
+
+
+def _output(execution_time, status=CommandStatus.OK, output=None):
+    return CommandOutput(status=status, output=output, execution_time=execution_time)
+
+
+def test_estimate_return_mean_execution_time_of_the_most_specific_key():
+    onnx, trt = _model_config("onnx"), _model_config("trt", format=Format.TENSORRT)
+    cpu, cuda = _runner("OnnxCPU"), _runner("OnnxCUDA")
+    estimator = CommandCostEstimator()
+    estimator.record(_unit(model_config=onnx, runner_cls=cpu), _output(2.0))
+    estimator.record(_unit(model_config=onnx, runner_cls=cpu), _output(4.0))
+    estimator.record(_unit(model_config=onnx, runner_cls=cuda), _output(10.0))
+    estimator.record(_unit(model_config=trt), _output(30.0))
+
+    assert estimator.estimate(_unit(model_config=onnx, runner_cls=cpu)) == 3.0
+    assert estimator.estimate(_unit(model_config=_model_config("onnx-2"), runner_cls=cuda)) == 10.0
+    assert estimator.estimate(_unit(model_config=_model_config("trt-2", format=Format.TENSORRT))) == 30.0
+    assert estimator.estimate(_unit(model_config=_model_config("torchscript", format=Format.TORCHSCRIPT))) == 11.5
+    assert estimator.estimate(_unit(command=_OtherCommand, model_config=onnx)) is None
+
+
+def test_estimate_ignore_execution_time_of_skipped_commands():
+    estimator = CommandCostEstimator()
+    estimator.record(_unit(), _output(5.0, status=CommandStatus.SKIPPED))
+
+    assert estimator.estimate(_unit()) is None
+
+
+def test_update_from_commands_collect_execution_times_from_previous_context(tmp_path):
+    onnx, cpu = _model_config("onnx"), _runner("OnnxCPU")
+    context = PipelineContext(workspace=Workspace(tmp_path))
+    context.update(_unit(), _output(1.0))
+    context.update(_unit(model_config=onnx), _output(2.0))
+    context.update(_unit(model_config=onnx, runner_cls=cpu), _output(3.0))
+
+    estimator = CommandCostEstimator()
+    estimator.update_from_commands(context.commands)
+
+    assert estimator.estimate(_unit()) == 1.0
+    assert estimator.estimate(_unit(model_config=onnx)) == 2.0
+    assert estimator.estimate(_unit(model_config=onnx, runner_cls=cpu)) == 3.0
+
+
+def test_order_execute_cheap_units_first_when_units_are_independent():
+    estimator = CommandCostEstimator()
+    execution_units = [_unit(command=_ExclusiveCommand, model_config=_model_config(key)) for key in ("a", "b", "c")]
+    for execution_unit, execution_time in zip(execution_units, (30.0, 10.0, 20.0)):
+        estimator.record(execution_unit, _output(execution_time))
+
+    ordered = TimeBudget(time_budget=100.0, estimator=estimator).order(execution_units)
+
+    assert [execution_unit.model_config.key for execution_unit in ordered] == ["b", "c", "a"]
+
+
+def test_order_execute_units_never_executed_after_cheap_units_when_units_are_independent():
+    estimator = CommandCostEstimator()
+    execution_units = [_unit(command=_ExclusiveCommand, model_config=_model_config(key)) for key in ("a", "b", "c")]
+    estimator.record(execution_units[1], _output(10.0))
+    estimator.record(execution_units[2], _output(20.0))
+
+    ordered = TimeBudget(time_budget=100.0, estimator=estimator).order(execution_units)
+
+    assert [execution_unit.model_config.key for execution_unit in ordered] == ["b", "a", "c"]
+
+
+def test_order_keep_dependencies_and_barriers():
+    onnx = _model_config("onnx")
+    trt = _model_config("trt", parent=onnx, format=Format.TENSORRT)
+    estimator = CommandCostEstimator()
+    execution_units = [
+        _unit(command=_OtherCommand),
+        _unit(model_config=onnx),
+        _unit(model_config=trt),
+        _unit(model_config=_model_config("torchscript", format=Format.TORCHSCRIPT)),
+    ]
+    for execution_unit, execution_time in zip(execution_units, (1.0, 50.0, 1.0, 10.0)):
+        estimator.record(execution_unit, _output(execution_time))
+
+    ordered = TimeBudget(time_budget=100.0, estimator=estimator).order(execution_units)
+
+    # ONNX unlocks the TensorRT unit, so its cost per value is lower than for TorchScript
+    assert ordered == [execution_units[0], execution_units[3], execution_units[1], execution_units[2]]
+
+
+def test_validate_execution_raise_error_when_budget_exceeded_or_unit_does_not_fit():
+    onnx = _model_config("onnx")
+    estimator = CommandCostEstimator()
+    estimator.record(_unit(model_config=onnx), _output(1000.0))
+
+    with pytest.raises(ModelNavigatorTimeBudgetExceeded, match="exceeds remaining time budget"):
+        TimeBudget(time_budget=100.0, estimator=estimator).validate_execution(_unit(model_config=onnx))
+
+    budget = TimeBudget(time_budget=1e-9)
+    with pytest.raises(ModelNavigatorTimeBudgetExceeded, match="exceeded"):
+        budget.validate_execution(_unit(model_config=onnx))
+
+    budget.validate_execution(_unit())
+    budget.validate_execution(_unit(command=_RequiredCommand, model_config=onnx))
+
+
+def test_command_args_return_pruning_reference_from_profiled_runtimes(tmp_path):
+    context = PipelineContext(workspace=Workspace(tmp_path))
+    assert TimeBudget(time_budget=100.0).command_args(context) == {}
+
+    profiling_results = [ProfilingResults.from_measurements([InferenceTime(total=10.0)], [None], 1, 0)]
+    context.update(
+        _unit(command=Performance, model_config=_model_config("onnx"), runner_cls=_runner("OnnxCPU")),
+        _output(1.0, output={"profiling_results": profiling_results}),
+    )
+
+    budget = TimeBudget(time_budget=100.0)
+    command_args = budget.command_args(context)
+
+    assert command_args == {"pruning_reference": [{"batch_size": 1, "throughput": 100.0}]}
+
+    profiling_results = [ProfilingResults.from_measurements([InferenceTime(total=5.0)], [None], 1, 0)]
+    budget.record(
+        _unit(command=Performance, model_config=_model_config("trt"), runner_cls=_runner("TensorRT")),
+        _output(1.0, output={"profiling_results": profiling_results}),
+    )
+
+    assert budget.command_args(context) == {"pruning_reference": [{"batch_size": 1, "throughput": 200.0}]}
+
+
+def test_command_args_raise_error_when_budget_argument_already_defined_in_context(tmp_path):
+    context = PipelineContext(workspace=Workspace(tmp_path))
+    config = SimpleNamespace(dataloader_prefetch_depth=0, pruning_reference=[])
+
+    with pytest.raises(ModelNavigatorRuntimeError, match="pruning_reference already defined"):
+        context.command_args(
+            workspace=Workspace(tmp_path),
+            config=config,
+            execution_unit=_unit(),
+            extra_args={"pruning_reference": [{"batch_size": 1, "throughput": 100.0}]},
+        )
+
+
+def test_pipeline_run_skip_units_with_reason_when_budget_exceeded(tmp_path):
+    workspace = Workspace(tmp_path)
+    execution_units = [
+        _unit(command=_RequiredCommand, model_config=_model_config("onnx")),
+        _unit(model_config=_model_config("torchscript")),
+    ]
+    pipeline = Pipeline("test_pipeline", execution_units=execution_units)
+    pipeline.event_emitter = MagicMock()
+    config = MagicMock()
+    config.debug = False
+    context = MagicMock()
+    context.command_args.return_value = {}
+
+    pipeline.run(workspace=workspace, config=config, context=context, budget=TimeBudget(time_budget=1e-9))
+
+    outputs = [call.kwargs["command_output"] for call in context.update.call_args_list]
+    assert outputs[0].status == CommandStatus.OK
+    assert outputs[0].skip_reason is None
+    assert outputs[1].status == CommandStatus.SKIPPED
+    assert outputs[1].skip_reason == "Time budget of 0.00[s] exceeded."
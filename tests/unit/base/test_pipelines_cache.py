@@ -0,0 +1,174 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+from types import SimpleNamespace
+
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration import Format
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.cache import PipelineCache
+
+
+class _Export(Command):
+    def _run(self, workspace, path, content):
+        model_path = workspace.path / path
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        if not model_path.exists():
+            model_path.write_text(content)
+        return CommandOutput(status=CommandStatus.OK, output={"content": content})
+
+
+class _Correctness(Command):
+    def _run(self, workspace, path):
+        return CommandOutput(status=CommandStatus.OK, output={"content": (workspace.path / path).read_text()})
+
+
+class _Fetch(Command):
+    def _run(self, workspace, content):
+        return CommandOutput(status=CommandStatus.OK, output={"samples": content})
+
+
+class _Runner:
+    @classmethod
+    def name(cls):
+        return "Runner"
+
+
+def _model_config(key="onnx", parent=None):
+    return SimpleNamespace(key=key, parent=parent, path=pathlib.Path(key) / "model.onnx", format=Format.ONNX)
+
+
+def _run(workspace, execution_units, parameters, replay=True):
+    executed = []
+    outputs = []
+    cache = PipelineCache(workspace=workspace, execution_units=execution_units, replay=replay)
+    for execution_unit, unit_parameters in zip(execution_units, parameters):
+        input_parameters = {"workspace": workspace, **unit_parameters}
+
+        def run_command(execution_unit=execution_unit, input_parameters=input_parameters):
+            executed.append(execution_unit.command.name)
+            return execution_unit.command().run(**input_parameters)
+
+        command_output = cache.run(
+            execution_unit=execution_unit,
+            input_parameters=input_parameters,
+            run_command=run_command,
+        )
+        outputs.append(command_output.output)
+
+    return executed, outputs
+
+
+def _units():
+    model_config = _model_config()
+    return [
+        ExecutionUnit(command=_Fetch),
+        ExecutionUnit(command=_Export, model_config=model_config),
+        ExecutionUnit(command=_Correctness, model_config=model_config, runner_cls=_Runner),
+    ]
+
+
+def _parameters(samples="samples", content="model"):
+    path = pathlib.Path("onnx") / "model.onnx"
+    return [{"content": samples}, {"path": path, "content": content}, {"path": path}]
+
+
+def test_pipeline_cache_replays_outputs_of_unchanged_commands(tmp_path):
+    workspace = Workspace(tmp_path)
+
+    executed, _ = _run(workspace, _units(), _parameters())
+    assert executed == ["_Fetch", "_Export", "_Correctness"]
+
+    executed, outputs = _run(workspace, _units(), _parameters())
+    assert executed == ["_Fetch"]
+    assert outputs == [{"samples": "samples"}, {"content": "model"}, {"content": "model"}]
+
+
+def test_pipeline_cache_executes_commands_with_changed_parameters_and_their_dependents(tmp_path):
+    workspace = Workspace(tmp_path)
+    _run(workspace, _units(), _parameters())
+
+    executed, outputs = _run(workspace, _units(), _parameters(content="new model"))
+
+    assert executed == ["_Fetch", "_Export", "_Correctness"]
+    assert outputs[2] == {"content": "new model"}
+
+
+def test_pipeline_cache_executes_all_commands_when_output_of_command_without_model_config_changed(tmp_path):
+    workspace = Workspace(tmp_path)
+    _run(workspace, _units(), _parameters())
+
+    executed, _ = _run(workspace, _units(), _parameters(samples="new samples"))
+
+    assert executed == ["_Fetch", "_Export", "_Correctness"]
+
+
+def test_pipeline_cache_executes_producer_when_model_changed(tmp_path):
+    workspace = Workspace(tmp_path)
+    _run(workspace, _units(), _parameters())
+    (tmp_path / "onnx" / "model.onnx").unlink()
+
+    executed, _ = _run(workspace, _units(), _parameters())
+
+    assert executed == ["_Fetch", "_Export"]
+    assert (tmp_path / "onnx" / "model.onnx").read_text() == "model"
+
+
+def test_pipeline_cache_does_not_replay_outputs_when_replay_is_disabled(tmp_path):
+    workspace = Workspace(tmp_path)
+    _run(workspace, _units(), _parameters(), replay=False)
+
+    executed, _ = _run(workspace, _units(), _parameters(), replay=False)
+    assert executed == ["_Fetch", "_Export", "_Correctness"]
+
+    executed, _ = _run(workspace, _units(), _parameters())
+    assert executed == ["_Fetch"]
+
+
+def test_pipeline_cache_does_not_store_failed_outputs(tmp_path):
+    class _FailingCorrectness(Command):
+        def _run(self):
+            return CommandOutput(status=CommandStatus.FAIL)
+
+    workspace = Workspace(tmp_path)
+    execution_units = _units()
+    execution_units[2] = ExecutionUnit(
+        command=_FailingCorrectness, model_config=execution_units[1].model_config, runner_cls=_Runner
+    )
+    _run(workspace, execution_units, _parameters())
+
+    executed, _ = _run(workspace, execution_units, _parameters())
+
+    assert executed == ["_Fetch", "_FailingCorrectness"]
+
+
+def test_pipeline_cache_replays_commands_modifying_model_produced_by_preceding_command(tmp_path):
+    class _Optimize(Command):
+        def _run(self, workspace, path):
+            model_path = workspace.path / path
+            model_path.write_text(model_path.read_text() + " optimized")
+            return CommandOutput(status=CommandStatus.OK)
+
+    workspace = Workspace(tmp_path)
+    execution_units = _units()
+    execution_units.insert(2, ExecutionUnit(command=_Optimize, model_config=execution_units[1].model_config))
+    parameters = _parameters()
+    parameters.insert(2, {"path": parameters[1]["path"]})
+    _run(workspace, execution_units, parameters)
+
+    executed, outputs = _run(workspace, execution_units, parameters)
+
+    assert executed == ["_Fetch"]
+    assert outputs[3] == {"content": "model optimized"}
+    assert (tmp_path / "onnx" / "model.onnx").read_text() == "model optimized"
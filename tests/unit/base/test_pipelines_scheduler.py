@@ -0,0 +1,246 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration import DeviceKind, Format
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.pipelines.scheduler import (
+    ExecutionUnitsScheduler,
+    get_execution_unit_device,
+    get_execution_units_dependencies,
+    uses_source_model,
+)
+
+
+class _Command(Command):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _RequiredCommand(Command, is_required=True):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _ExclusiveCommand(Command, is_exclusive=True):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class _ModelCommand(Command):
+    def _run(self, model=None):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+def _model_config(key, parent=None, format=Format.ONNX):
+    return SimpleNamespace(key=key, parent=parent, format=format)
+
+
+def _unit(command=_Command, model_config=None, runner_cls=None):
+    return ExecutionUnit(command=command, model_config=model_config, runner_cls=runner_cls)
+
+
+def test_get_execution_units_dependencies_return_barriers_for_units_without_model_config():
+    onnx = _model_config("onnx")
+    torchscript = _model_config("torchscript")
+    execution_units = [_unit(), _unit(model_config=onnx), _unit(model_config=torchscript), _unit()]
+
+    dependencies = get_execution_units_dependencies(execution_units)
+
+    assert dependencies == [set(), {0}, {0}, {0, 1, 2}]
+
+
+def test_get_execution_units_dependencies_return_units_for_same_model_and_parents():
+    onnx = _model_config("onnx")
+    trt = _model_config("trt-fp16", parent=onnx, format=Format.TENSORRT)
+    torchscript = _model_config("torchscript")
+    execution_units = [
+        _unit(model_config=onnx),
+        _unit(model_config=torchscript),
+        _unit(model_config=trt),
+        _unit(model_config=onnx),
+        _unit(model_config=torchscript),
+    ]
+
+    dependencies = get_execution_units_dependencies(execution_units)
+
+    assert dependencies == [set(), set(), {0}, {0, 2}, {1}]
+
+
+def test_get_execution_units_dependencies_return_barriers_for_required_and_exclusive_commands():
+    onnx = _model_config("onnx")
+    torchscript = _model_config("torchscript")
+    execution_units = [
+        _unit(model_config=onnx),
+        _unit(command=_RequiredCommand, model_config=torchscript),
+        _unit(model_config=onnx),
+        _unit(command=_ExclusiveCommand, model_config=torchscript),
+        _unit(model_config=onnx),
+    ]
+
+    dependencies = get_execution_units_dependencies(execution_units)
+
+    assert dependencies == [set(), {0}, {0, 1}, {0, 1, 2}, {0, 1, 2, 3}]
+
+
+def test_get_execution_unit_device_return_cuda_only_for_cuda_target_device():
+    runner_cls = SimpleNamespace(devices_kind=lambda: [DeviceKind.CUDA])
+    cuda_unit = _unit(model_config=_model_config("onnx"), runner_cls=runner_cls)
+    trt_unit = _unit(model_config=_model_config("trt-fp16", format=Format.TENSORRT))
+    onnx_unit = _unit(model_config=_model_config("onnx"))
+
+    assert get_execution_unit_device(cuda_unit, DeviceKind.CUDA) == DeviceKind.CUDA
+    assert get_execution_unit_device(trt_unit, DeviceKind.CUDA) == DeviceKind.CUDA
+    assert get_execution_unit_device(onnx_unit, DeviceKind.CUDA) == DeviceKind.CPU
+    assert get_execution_unit_device(cuda_unit, DeviceKind.CPU) == DeviceKind.CPU
+
+
+def test_scheduler_run_executes_independent_units_concurrently():
+    execution_units = [_unit(), _unit(model_config=_model_config("onnx")), _unit(model_config=_model_config("ts"))]
+    barrier = threading.Barrier(2, timeout=10)
+
+    def execute(idx):
+        if idx > 0:
+            barrier.wait()  # raises BrokenBarrierError when units are not executed concurrently
+        return idx
+
+    committed = []
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=2)
+    scheduler.run(execute=execute, commit=lambda idx, result: committed.append((idx, result)))
+
+    assert committed == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_scheduler_run_commits_results_in_units_order():
+    execution_units = [_unit(model_config=_model_config(f"model_{idx}")) for idx in range(4)]
+    finished = []
+
+    def execute(idx):
+        time.sleep(0.05 * (4 - idx))
+        finished.append(idx)
+        return idx
+
+    committed = []
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=4)
+    scheduler.run(execute=execute, commit=lambda idx, result: committed.append(result))
+
+    assert finished == [3, 2, 1, 0]
+    assert committed == [0, 1, 2, 3]
+
+
+def test_scheduler_run_executes_dependent_units_after_commit():
+    onnx = _model_config("onnx")
+    execution_units = [_unit(model_config=onnx), _unit(model_config=onnx)]
+    committed = []
+    results = []
+
+    def execute(idx):
+        return list(committed)
+
+    def commit(idx, result):
+        committed.append(idx)
+        results.append(result)
+
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=2)
+    scheduler.run(execute=execute, commit=commit)
+
+    assert results == [[], [0]]
+
+
+def test_scheduler_run_does_not_execute_units_concurrently_on_single_cuda_device():
+    runner_cls = SimpleNamespace(devices_kind=lambda: [DeviceKind.CUDA])
+    execution_units = [_unit(model_config=_model_config(f"model_{idx}"), runner_cls=runner_cls) for idx in range(3)]
+    lock = threading.Lock()
+    running = []
+
+    def execute(idx):
+        with lock:
+            running.append(idx)
+            concurrent = len(running)
+        time.sleep(0.01)
+        with lock:
+            running.remove(idx)
+        return concurrent
+
+    committed = []
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=3, target_device=DeviceKind.CUDA)
+    scheduler.run(execute=execute, commit=lambda idx, result: committed.append(result))
+
+    assert committed == [1, 1, 1]
+
+
+def test_uses_source_model_return_true_for_exporters_and_source_format_runners():
+    runner_cls = SimpleNamespace(devices_kind=lambda: [DeviceKind.CPU])
+    torchscript = _model_config("torchscript", format=Format.TORCHSCRIPT)
+    torch = _model_config("torch", format=Format.TORCH)
+
+    assert uses_source_model(_unit(command=_ModelCommand, model_config=torchscript))
+    assert uses_source_model(_unit(command=_ModelCommand, model_config=torch, runner_cls=runner_cls))
+    assert not uses_source_model(_unit(command=_ModelCommand, model_config=torchscript, runner_cls=runner_cls))
+    assert not uses_source_model(_unit(model_config=torchscript))
+
+
+def test_scheduler_run_does_not_execute_units_using_source_model_concurrently():
+    execution_units = [
+        _unit(command=_ModelCommand, model_config=_model_config(f"model_{idx}", format=Format.TORCHSCRIPT))
+        for idx in range(3)
+    ]
+    lock = threading.Lock()
+    running = []
+
+    def execute(idx):
+        with lock:
+            running.append(idx)
+            concurrent = len(running)
+        time.sleep(0.01)
+        with lock:
+            running.remove(idx)
+        return concurrent
+
+    committed = []
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=3)
+    scheduler.run(execute=execute, commit=lambda idx, result: committed.append(result))
+
+    assert committed == [1, 1, 1]
+
+
+def test_scheduler_run_raises_error_after_preceding_units_are_committed():
+    execution_units = [_unit(model_config=_model_config(f"model_{idx}")) for idx in range(3)]
+
+    executed = []
+
+    def execute(idx):
+        executed.append(idx)
+        if idx == 1:
+            raise RuntimeError("Unit failed")
+        time.sleep(0.05)
+        return idx
+
+    committed = []
+    scheduler = ExecutionUnitsScheduler(execution_units=execution_units, max_workers=1)
+    with pytest.raises(RuntimeError, match="Unit failed"):
+        scheduler.run(execute=execute, commit=lambda idx, result: committed.append(result))
+
+    assert executed == [0, 1]
+    assert committed == [0]
+
+
+def test_scheduler_raises_error_when_number_of_workers_is_not_positive():
+    with pytest.raises(ModelNavigatorUserInputError):
+        ExecutionUnitsScheduler(execution_units=[], max_workers=0)
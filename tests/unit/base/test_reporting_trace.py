@@ -0,0 +1,108 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+from pyee import EventEmitter
+
+from model_navigator.commands.base import CommandStatus
+from model_navigator.configuration.constants import NAVIGATOR_PROFILING_TRACE_FILENAME, NAVIGATOR_TRACE_FILENAME
+from model_navigator.core.tracing import Tracer
+from model_navigator.reporting.optimize.events import OptimizeEvent
+from model_navigator.reporting.profile.events import ProfileEvent
+from model_navigator.reporting.trace import TraceReport
+
+
+@pytest.fixture(autouse=True)
+def use_tracing(monkeypatch):
+    monkeypatch.setenv("NAVIGATOR_USE_TRACING", "True")
+
+
+def _load_spans(path):
+    with path.open("r") as f:
+        events = json.load(f)["traceEvents"]
+
+    return {event["name"]: event for event in events if event["ph"] == "X"}
+
+
+def _create_report(tracer):
+    return TraceReport(optimize_emitter=EventEmitter(), profile_emitter=EventEmitter(), tracer=tracer)
+
+
+def test_trace_report_saves_optimize_trace_in_workspace(tmp_path):
+    tracer = Tracer()
+    report = _create_report(tracer)
+    emitter = report.optimize_emitter
+
+    emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=tmp_path)
+    emitter.emit(OptimizeEvent.OPTIMIZATION_STARTED)
+    emitter.emit(OptimizeEvent.PIPELINE_STARTED, name="Preprocessing")
+    with tracer.span("InferInputMetadata", category="command"):
+        pass
+    emitter.emit(OptimizeEvent.COMMAND_FINISHED, status=CommandStatus.OK)
+    emitter.emit(OptimizeEvent.PIPELINE_FINISHED)
+    emitter.emit(OptimizeEvent.OPTIMIZATION_FINISHED)
+
+    assert not tracer.enabled
+    spans = _load_spans(tmp_path / NAVIGATOR_TRACE_FILENAME)
+    assert set(spans) == {"optimize", "Preprocessing", "InferInputMetadata"}
+    optimize, pipeline, command = spans["optimize"], spans["Preprocessing"], spans["InferInputMetadata"]
+    assert optimize["ts"] <= pipeline["ts"] <= command["ts"]
+    assert command["ts"] + command["dur"] <= pipeline["ts"] + pipeline["dur"]
+    assert pipeline["ts"] + pipeline["dur"] <= optimize["ts"] + optimize["dur"]
+
+
+def test_trace_report_closes_open_spans_when_optimization_finished(tmp_path):
+    report = _create_report(Tracer())
+    emitter = report.optimize_emitter
+
+    emitter.emit(OptimizeEvent.MODULE_PICKED_FOR_OPTIMIZATION, name="model.encoder")
+    emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=tmp_path)
+    emitter.emit(OptimizeEvent.OPTIMIZATION_STARTED)
+    emitter.emit(OptimizeEvent.PIPELINE_STARTED, name="Preprocessing")
+    emitter.emit(OptimizeEvent.OPTIMIZATION_FINISHED)
+
+    spans = _load_spans(tmp_path / NAVIGATOR_TRACE_FILENAME)
+    assert set(spans) == {"optimize", "Preprocessing"}
+    assert spans["optimize"]["args"] == {"module": "model.encoder"}
+
+
+def test_trace_report_saves_profiling_trace_with_runtime_spans(tmp_path):
+    report = _create_report(Tracer())
+    emitter = report.profile_emitter
+
+    emitter.emit(ProfileEvent.WORKSPACE_INITIALIZED, path=tmp_path)
+    emitter.emit(ProfileEvent.PROFILING_STARTED)
+    emitter.emit(ProfileEvent.RUNTIME_PROFILING_STARTED, name="python on eager")
+    emitter.emit(ProfileEvent.RUNTIME_PROFILING_FINISHED)
+    emitter.emit(ProfileEvent.RUNTIME_PROFILING_STARTED, name="trt-fp16 on TensorRT")
+    emitter.emit(ProfileEvent.RUNTIME_PROFILING_ERROR)
+    emitter.emit(ProfileEvent.PROFILING_FINISHED)
+
+    spans = _load_spans(tmp_path / NAVIGATOR_PROFILING_TRACE_FILENAME)
+    assert set(spans) == {"profile", "python on eager", "trt-fp16 on TensorRT"}
+    assert spans["python on eager"]["args"] == {"status": "OK"}
+    assert spans["trt-fp16 on TensorRT"]["args"] == {"status": "FAIL"}
+
+
+def test_trace_report_does_not_save_trace_when_tracing_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("NAVIGATOR_USE_TRACING", "False")
+    report = _create_report(Tracer())
+    emitter = report.optimize_emitter
+
+    emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=tmp_path)
+    emitter.emit(OptimizeEvent.OPTIMIZATION_STARTED)
+    emitter.emit(OptimizeEvent.OPTIMIZATION_FINISHED)
+
+    assert not (tmp_path / NAVIGATOR_TRACE_FILENAME).exists()
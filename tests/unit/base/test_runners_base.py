@@ -0,0 +1,38 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from model_navigator.runners.base import InferenceStepTimer, InferenceTime
+
+
+def test_inference_step_timer_stores_time_measured_in_each_thread_separately():
+    timer = InferenceStepTimer(InferenceTime(), enabled=True)
+    barrier = threading.Barrier(2, timeout=10)
+    results = {}
+
+    def _measure(step_name):
+        timer.inference_time = InferenceTime()
+        with timer.measure_step(step_name):
+            barrier.wait()  # both steps are measured at the same time
+        results[step_name] = timer.inference_time
+
+    threads = [threading.Thread(target=_measure, args=(step_name,)) for step_name in ("compute", "postprocessing")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(results["compute"]) == {"compute"}
+    assert set(results["postprocessing"]) == {"postprocessing"}
+    assert not timer.inference_time
@@ -0,0 +1,82 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import shutil
+import tempfile
+
+import numpy as np
+import onnxruntime as onnxrt
+
+from model_navigator.configuration import OnnxExecutionMode, OnnxGraphOptimizationLevel
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.runners.onnx import OnnxrtCPURunner
+from tests.utils import get_assets_path
+
+
+def _get_runner(model_path: pathlib.Path, **kwargs) -> OnnxrtCPURunner:
+    input_metadata = TensorMetadata().add("X", shape=(-1, 3, -1, -1), dtype=np.float32)
+    return OnnxrtCPURunner(model=model_path, input_metadata=input_metadata, output_metadata=None, **kwargs)
+
+
+def test_onnxrt_runner_use_session_options_when_provided():
+    runner = _get_runner(
+        get_assets_path() / "models" / "identity.onnx",
+        graph_optimization_level=OnnxGraphOptimizationLevel.BASIC,
+        execution_mode="parallel",
+        enable_mem_arena=False,
+        enable_mem_pattern=False,
+    )
+    assert runner._graph_optimization_level == OnnxGraphOptimizationLevel.BASIC
+    assert runner._execution_mode == OnnxExecutionMode.PARALLEL
+    # ONNX Runtime may fallback to sequential execution for graphs without parallel branches
+    assert runner._sess.session_options["execution_mode"] == onnxrt.ExecutionMode.ORT_PARALLEL
+
+    with runner:
+        session_options = runner.sess.get_session_options()
+        assert session_options.graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_ENABLE_BASIC
+        assert session_options.enable_cpu_mem_arena is False
+        assert session_options.enable_mem_pattern is False
+
+
+def test_onnxrt_runner_store_and_reuse_optimized_model_when_cache_optimized_model_enabled():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = pathlib.Path(tmpdir) / "onnx" / "model.onnx"
+        model_path.parent.mkdir()
+        shutil.copy(get_assets_path() / "models" / "identity.onnx", model_path)
+
+        runner = _get_runner(
+            model_path, graph_optimization_level=OnnxGraphOptimizationLevel.EXTENDED, cache_optimized_model=True
+        )
+        optimized_model_path = runner._get_optimized_model_path()
+        assert optimized_model_path.parent == model_path.parent / "ort_optimized"
+        assert optimized_model_path.name.startswith("onnxrtcpurunner-extended-")
+
+        sample = {"X": np.ones((1, 3, 2, 2), dtype=np.float32)}
+        with runner:
+            session_options = runner.sess.get_session_options()
+            assert session_options.graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+            expected_output = runner.infer(sample)
+
+        assert optimized_model_path.exists()
+        assert list(optimized_model_path.parent.glob("*.tmp")) == []
+
+        runner = _get_runner(
+            model_path, graph_optimization_level=OnnxGraphOptimizationLevel.EXTENDED, cache_optimized_model=True
+        )
+        with runner:
+            session_options = runner.sess.get_session_options()
+            assert session_options.graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL
+            output = runner.infer(sample)
+
+        assert np.array_equal(output["Y"], expected_output["Y"])
@@ -0,0 +1,116 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import tempfile
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from model_navigator.commands.correctness import correctness_script
+from model_navigator.core.dataloader import get_inference_batch_size, samples_to_store
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.runners.utils import infer_batched, infer_batches
+
+
+class DoubleRunner:
+    def __init__(self, reduce_batch=False):
+        self.batch_sizes = []
+        self.reduce_batch = reduce_batch
+
+    def infer(self, sample):
+        self.batch_sizes.append(sample["input__0"].shape[0])
+        output = sample["input__0"] * 2
+        if self.reduce_batch:
+            output = output.sum(axis=0, keepdims=True)
+        return {"output__0": output}
+
+
+def _samples(shapes):
+    return [{"input__0": np.full(shape, idx, dtype=np.float32)} for idx, shape in enumerate(shapes)]
+
+
+def test_infer_batched_return_outputs_equal_to_per_sample_inference_when_samples_concatenated():
+    samples = _samples([(1, 3), (1, 3), (1, 3), (1, 4), (1, 4), (2, 4)])
+    runner = DoubleRunner()
+
+    outputs = list(infer_batched(runner, samples, batch_dim=0, batch_size=3))
+
+    assert runner.batch_sizes == [3, 2, 2]
+    assert len(outputs) == len(samples)
+    for sample, output in zip(samples, outputs):
+        assert np.array_equal(output["output__0"], sample["input__0"] * 2)
+
+
+def test_infer_batches_run_inference_per_sample_when_outputs_do_not_share_batch_dimension():
+    samples = _samples([(1, 3), (1, 3)])
+    runner = DoubleRunner(reduce_batch=True)
+
+    batches = list(infer_batches(runner, samples, batch_dim=0, batch_size=2))
+
+    assert runner.batch_sizes == [2, 1, 1]
+    assert [indices for indices, _ in batches] == [[0], [1]]
+
+
+def test_infer_batches_run_inference_per_sample_when_batching_disabled():
+    samples = _samples([(1, 3), (1, 3)])
+    runner = DoubleRunner()
+
+    batches = list(infer_batches(runner, samples, batch_dim=None, batch_size=2))
+
+    assert runner.batch_sizes == [1, 1]
+    assert [indices for indices, _ in batches] == [[0], [1]]
+
+
+def test_get_inference_batch_size_return_batch_size_limited_by_dataloader_when_batching_enabled():
+    assert get_inference_batch_size(8, batch_dim=0, dataloader_max_batch_size=4) == 4
+    assert get_inference_batch_size(8, batch_dim=0) == 8
+    assert get_inference_batch_size(8, batch_dim=None) is None
+    assert get_inference_batch_size(None, batch_dim=0) is None
+    assert get_inference_batch_size(8, batch_dim=0, dataloader_max_batch_size=1) is None
+
+
+def test_correctness_script_return_same_tolerance_when_samples_inferred_in_batches(mocker):
+    input_metadata = TensorMetadata().add("X", shape=(-1, 3, -1, -1), dtype=np.float32)
+    output_metadata = TensorMetadata().add("Y", shape=(-1, 3, -1, -1), dtype=np.float32)
+    samples = [{"X": np.random.rand(1, 3, 4, 4).astype(np.float32) + 1} for _ in range(5)]
+    outputs = [{"Y": sample["X"] + 0.1 * idx} for idx, sample in enumerate(samples)]
+    runner_cls = mocker.patch("model_navigator.commands.correctness.correctness_script.get_runner")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples_to_store(samples, workspace / "model_input" / "correctness", batch_dim=0)
+        samples_to_store(outputs, workspace / "model_output" / "correctness", batch_dim=0)
+
+        tolerances = []
+        for batch_size in [None, 2]:
+            runner = MagicMock()
+            runner.infer.side_effect = lambda sample: {"Y": sample["X"]}
+            runner_cls.return_value = MagicMock(return_value=runner)
+            results_path = workspace / f"results_{batch_size}.json"
+            correctness_script.correctness(
+                batch_dim=0,
+                results_path=results_path.as_posix(),
+                runner_name="OnnxCPU",
+                input_metadata=input_metadata.to_json(),
+                output_metadata=output_metadata.to_json(),
+                navigator_workspace=workspace.as_posix(),
+                model_path="model.onnx",
+                batch_size=batch_size,
+            )
+            tolerances.append(json.loads(results_path.read_text()))
+            assert runner.infer.call_count == (5 if batch_size is None else 3)
+
+    assert tolerances[0] == tolerances[1]
+    assert tolerances[0][0]["atol"] > 0.39
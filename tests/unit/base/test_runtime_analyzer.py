@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+
 import pytest
 
 from model_navigator.commands.correctness.correctness import Tolerance
@@ -20,6 +22,7 @@ from model_navigator.configuration import (
     MaxThroughputAndMinLatencyStrategy,
     MaxThroughputStrategy,
     MaxThroughputWithLatencyBudgetStrategy,
+    MaxThroughputWithMemoryBudgetStrategy,
     MinLatencyStrategy,
     TensorRTPrecision,
     TensorRTPrecisionMode,
@@ -333,3 +336,84 @@ def test_get_runtime_returns_min_latency_runner_when_strategy_is_min_latency_and
 
     assert isinstance(runtime_result.model_status.model_config, TorchScriptModelConfig)
     assert runtime_result.runner_status.runner_name == "TorchScriptCUDA"
+
+
+def _open_loop_result(request_rate, throughput, p99_latency):
+    return ProfilingResults(
+        sample_id=0,
+        batch_size=1,
+        avg_latency=p99_latency,
+        std_latency=0.0,
+        p50_latency=p99_latency,
+        p90_latency=p99_latency,
+        p95_latency=p99_latency,
+        p99_latency=p99_latency,
+        throughput=throughput,
+        avg_gpu_clock=1500.0,
+        request_count=50,
+        request_rate=request_rate,
+    )
+
+
+def test_get_runtime_returns_max_sustained_rate_runner_when_strategy_is_max_throughput_with_lat_budget_and_open_loop():
+    model_statuses = copy.deepcopy(model_statuses1)
+    onnx_results = model_statuses[onnx_config.key].runners_status["OnnxCUDA"].result["Performance"]
+    onnx_results["profiling_results"] += [_open_loop_result(200.0, 200.0, 2.5), _open_loop_result(400.0, 400.0, 3.0)]
+    trt_results = model_statuses[tensorrt_config.key].runners_status["TensorRT"].result["Performance"]
+    trt_results["profiling_results"] += [_open_loop_result(200.0, 200.0, 1.5), _open_loop_result(400.0, 400.0, 10.0)]
+
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses,
+        strategy=MaxThroughputWithLatencyBudgetStrategy(latency_budget=5.0),
+    )
+    assert isinstance(runtime_result.model_status.model_config, ONNXModelConfig)
+    assert runtime_result.runner_status.runner_name == "OnnxCUDA"
+
+
+def test_get_runtime_rank_runner_without_open_loop_results_on_tail_latency_when_strategy_is_max_throughput_with_lat_budget():
+    model_statuses = copy.deepcopy(model_statuses1)
+    onnx_results = model_statuses[onnx_config.key].runners_status["OnnxCUDA"].result["Performance"]
+    onnx_results["profiling_results"] += [_open_loop_result(400.0, 400.0, 3.0)]
+    trt_results = model_statuses[tensorrt_config.key].runners_status["TensorRT"].result["Performance"]
+    trt_results["profiling_results"][0].p99_latency = 10.0
+
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses,
+        strategy=MaxThroughputWithLatencyBudgetStrategy(latency_budget=5.0),
+    )
+    assert runtime_result.runner_status.runner_name == "OnnxCUDA"
+    assert runtime_result.latency == 3.0
+
+
+def test_get_runtime_ignore_open_loop_results_when_strategy_is_max_throughput_or_min_latency():
+    model_statuses = copy.deepcopy(model_statuses1)
+    onnx_results = model_statuses[onnx_config.key].runners_status["OnnxCUDA"].result["Performance"]
+    onnx_results["profiling_results"] += [_open_loop_result(5000.0, 5000.0, 0.1)]
+
+    for strategy in (MaxThroughputStrategy(), MinLatencyStrategy()):
+        runtime_result = RuntimeAnalyzer.get_runtime(model_statuses, strategy=strategy)
+        assert runtime_result.runner_status.runner_name == "TensorRT"
+
+
+def test_get_runtime_returns_max_thr_within_memory_budget_runner_when_strategy_is_max_throughput_with_memory_budget():
+    model_statuses = copy.deepcopy(model_statuses1)
+    for perf in model_statuses[onnx_config.key].runners_status["OnnxCUDA"].result["Performance"]["profiling_results"]:
+        perf.peak_rss_memory = 512.0
+    for perf in (
+        model_statuses[tensorrt_config.key].runners_status["TensorRT"].result["Performance"]["profiling_results"]
+    ):
+        perf.peak_rss_memory = 2048.0
+
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses,
+        strategy=MaxThroughputWithMemoryBudgetStrategy(memory_budget=1024.0),
+    )
+    assert isinstance(runtime_result.model_status.model_config, ONNXModelConfig)
+    assert runtime_result.runner_status.runner_name == "OnnxCUDA"
+
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses,
+        strategy=MaxThroughputWithMemoryBudgetStrategy(memory_budget=4096.0),
+    )
+    assert isinstance(runtime_result.model_status.model_config, TensorRTModelConfig)
+    assert runtime_result.runner_status.runner_name == "TensorRT"
@@ -1310,3 +1310,32 @@ def test_output_tensor_from_metadata_return_input_tensor_when_batching():
     assert tensors[1].reshape == ()
     assert tensors[1].is_shape_tensor is False
     assert tensors[1].label_filename is None
+
+
+def test_add_model_from_package_use_threading_config_when_cpu_runner_selected_after_threading_sweep(mocker):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace_path = pathlib.Path(tmp_dir) / "workspace"
+        model_repository_path = pathlib.Path(tmp_dir) / "model_repository"
+
+        package = onnx_package_with_cpu_runner_only(workspace_path)
+        for model_status in package.status.models_status.values():
+            model_status.model_config.runner_config.update_threading(
+                intra_op_threads=4, inter_op_threads=1, cpu_affinity=[0, 1, 2, 3, 4, 5, 6, 7], instance_count=2
+            )
+
+        spy_add_model = mocker.spy(model_repository, "add_model")
+
+        add_model_from_package(
+            model_repository_path,
+            model_name="Model",
+            model_version=1,
+            package=package,
+        )
+
+        config = spy_add_model.call_args.kwargs["config"]
+
+        assert isinstance(config, ONNXModelConfig) is True
+        assert len(config.instance_groups) == 1
+        assert config.instance_groups[0].kind == DeviceKind.KIND_CPU
+        assert config.instance_groups[0].count == 2
+        assert config.parameters == {"intra_op_thread_count": "4", "inter_op_thread_count": "1"}